@@ -0,0 +1,333 @@
+"""
+Moteur de récupération HTTP asynchrone pour les scrapers
+
+Permet d'avoir plusieurs pages (et plusieurs recherches) en vol simultanément
+au lieu de les enchaîner avec des pauses, tout en bornant la concurrence par
+hôte pour rester poli envers les job boards.
+
+Un wrapper synchrone (`run_sync`) permet aux appelants existants, qui ne
+tournent pas dans une boucle asyncio, d'en profiter sans changement.
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import (
+    Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, List,
+    Optional, TypeVar, Union
+)
+from urllib.parse import urlsplit
+
+import httpx
+from tenacity import retry, stop_after_attempt, wait_exponential
+
+from .rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+@dataclass
+class FetchRequest:
+    """Une requête GET à exécuter par le moteur"""
+    url: str
+    params: Optional[Dict[str, Any]] = None
+
+
+def run_sync(coro: Awaitable[T]) -> T:
+    """
+    Exécute une coroutine depuis du code synchrone
+
+    Si aucune boucle ne tourne dans le thread courant, on utilise simplement
+    `asyncio.run`. Sinon (ex: appel depuis un notebook ou un handler FastAPI),
+    la coroutine est exécutée dans un thread dédié, seul moyen d'éviter
+    l'erreur "asyncio.run() cannot be called from a running event loop".
+    Le thread appelant attend quand même le résultat: la boucle existante
+    reste bloquée pendant toute l'exécution. Depuis du code async, faire
+    `await` directement sur la coroutine (`ascrape`, `ascrape_many`...).
+
+    Args:
+        coro: Coroutine à exécuter
+
+    Returns:
+        Le résultat de la coroutine
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    result: Dict[str, Any] = {}
+
+    def runner():
+        try:
+            result['value'] = asyncio.run(coro)
+        except BaseException as e:  # Propagé dans le thread appelant
+            result['error'] = e
+
+    thread = threading.Thread(target=runner, name="run-sync", daemon=True)
+    thread.start()
+    thread.join()
+
+    if 'error' in result:
+        raise result['error']
+    return result['value']
+
+
+def iterate_sync(
+    agen: AsyncIterator[T],
+    on_close: Optional[Callable[[], Awaitable[None]]] = None
+) -> Iterator[T]:
+    """
+    Consomme un itérateur asynchrone depuis du code synchrone
+
+    L'itérateur tourne dans sa propre boucle, dans un thread dédié; chaque
+    élément est transmis dès qu'il est produit. Si l'appelant arrête
+    l'itération, la production s'arrête à l'élément suivant.
+
+    Args:
+        agen: Itérateur asynchrone à consommer
+        on_close: Coroutine de nettoyage exécutée dans la boucle du thread
+            (ex: fermeture du client HTTP lié à cette boucle)
+
+    Yields:
+        Les éléments de l'itérateur, dans l'ordre de production
+    """
+    items: queue.Queue = queue.Queue()
+    stop = threading.Event()
+    done = object()
+
+    async def consume():
+        try:
+            async for item in agen:
+                items.put(('item', item))
+                if stop.is_set():
+                    break
+        finally:
+            if on_close is not None:
+                await on_close()
+
+    def runner():
+        try:
+            asyncio.run(consume())
+        except BaseException as e:  # Propagé dans le thread appelant
+            items.put(('error', e))
+        finally:
+            items.put(('done', done))
+
+    thread = threading.Thread(target=runner, name="iterate-sync", daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            kind, value = items.get()
+            if kind == 'done':
+                break
+            if kind == 'error':
+                raise value
+            yield value
+    finally:
+        stop.set()
+
+
+async def iterate_async(iterable: Iterable[T]) -> AsyncIterator[T]:
+    """
+    Consomme un itérateur synchrone (bloquant) depuis une boucle asyncio
+
+    Inverse de `iterate_sync`: chaque `next()` s'exécute dans un thread
+    dédié, toujours le même (un driver Selenium ou une connexion SQLite ne
+    changent donc pas de thread en cours de route), sans bloquer la boucle.
+
+    Args:
+        iterable: Itérable à consommer (typiquement un générateur de scraper)
+
+    Yields:
+        Les éléments de l'itérable, dès qu'ils sont produits
+    """
+    iterator = iter(iterable)
+    done = object()
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="iterate-async")
+
+    try:
+        while True:
+            item = await loop.run_in_executor(executor, next, iterator, done)
+            if item is done:
+                break
+            yield item
+    finally:
+        # Fermer le générateur dans son thread (exécute ses blocs finally)
+        close = getattr(iterator, 'close', None)
+        if close is not None:
+            await loop.run_in_executor(executor, close)
+        executor.shutdown(wait=False)
+
+
+class AsyncFetchEngine:
+    """
+    Client HTTP asynchrone avec concurrence bornée par hôte
+
+    - Un seul `httpx.AsyncClient` (keep-alive, pool de connexions)
+    - Un sémaphore par hôte: au plus `per_host_limit` requêtes en vol
+    - Un jeton du limiteur de débit par requête (optionnel)
+    - Retry avec exponential backoff (même politique que `_fetch_page`)
+
+    Le client et les sémaphores sont liés à la boucle asyncio qui les a créés;
+    ils sont recréés automatiquement si le moteur est réutilisé depuis une
+    autre boucle (cas typique de `run_sync` appelé plusieurs fois).
+    """
+
+    def __init__(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 30,
+        max_connections: int = 20,
+        per_host_limit: int = 2,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        rate_limiter: Optional[RateLimiter] = None
+    ):
+        """
+        Initialise le moteur
+
+        Args:
+            headers: Headers HTTP envoyés avec chaque requête
+            timeout: Timeout des requêtes en secondes
+            max_connections: Nombre maximum de connexions ouvertes au total
+            per_host_limit: Nombre maximum de requêtes simultanées par hôte
+            transport: Transport httpx alternatif (tests, replay)
+            rate_limiter: Limiteur de débit par hôte (None = pas de limite)
+        """
+        self.headers = dict(headers or {})
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.per_host_limit = max(1, per_host_limit)
+        self.transport = transport
+        self.rate_limiter = rate_limiter
+
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Retourne le client lié à la boucle courante (le crée si besoin)"""
+        loop = asyncio.get_running_loop()
+
+        if self._client is None or self._loop is not loop:
+            self._client = httpx.AsyncClient(
+                headers=self.headers,
+                timeout=self.timeout,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=self.max_connections),
+                transport=self.transport
+            )
+            self._loop = loop
+            self._host_semaphores = {}
+
+        return self._client
+
+    def _get_host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """Retourne le sémaphore de l'hôte de l'URL"""
+        host = urlsplit(url).netloc.lower()
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.per_host_limit)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        reraise=True
+    )
+    async def _request(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]] = None
+    ) -> httpx.Response:
+        """Exécute une requête GET (avec retry)"""
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(url)
+
+        client = self._get_client()
+        response = await client.get(url, params=params, headers=headers)
+        if response.status_code == 304 and headers:
+            # Réponse à un GET conditionnel: traitée par le cache HTTP
+            return response
+        response.raise_for_status()
+        return response
+
+    async def fetch(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> httpx.Response:
+        """
+        Récupère une page en respectant la limite de concurrence de l'hôte
+
+        Args:
+            url: URL à récupérer
+            params: Paramètres de requête
+            headers: Headers supplémentaires (ex: GET conditionnel du cache
+                HTTP, auquel cas un 304 est retourné sans erreur)
+
+        Returns:
+            Response httpx
+
+        Raises:
+            httpx.HTTPError: En cas d'erreur de requête (après retries)
+        """
+        # Créer le client avant le sémaphore pour lier les deux à la même boucle
+        self._get_client()
+
+        async with self._get_host_semaphore(url):
+            try:
+                return await self._request(url, params, headers)
+            except httpx.HTTPError as e:
+                logger.error(f"Error fetching {url}: {e}")
+                raise
+
+    async def fetch_all(
+        self,
+        requests: Iterable[Union[FetchRequest, str]],
+        return_exceptions: bool = True
+    ) -> List[Union[httpx.Response, BaseException]]:
+        """
+        Récupère plusieurs pages en parallèle
+
+        Args:
+            requests: Requêtes à exécuter (FetchRequest ou URL simple)
+            return_exceptions: Retourner les exceptions à la place des
+                réponses au lieu de lever la première erreur
+
+        Returns:
+            Réponses (ou exceptions) dans l'ordre des requêtes
+        """
+        tasks = []
+        for request in requests:
+            if isinstance(request, str):
+                request = FetchRequest(url=request)
+            tasks.append(self.fetch(request.url, params=request.params))
+
+        return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+
+    async def aclose(self):
+        """Ferme le client HTTP"""
+        if self._client is not None:
+            await self._client.aclose()
+        self._client = None
+        self._loop = None
+        self._host_semaphores = {}
+
+    async def __aenter__(self):
+        """Support du context manager async"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Cleanup du context manager async"""
+        await self.aclose()
@@ -5,15 +5,35 @@ Combine plusieurs sources:
 - API VDAB (Flandre) - Officielle et gratuite
 - Indeed Belgique - Scraping avec bypass Cloudflare
 - Future: StepStone, Jobat, Forem, etc.
+
+Les sources sont déclarées dans `sources.SOURCES`: leur scraper n'est
+importé et créé qu'à la première recherche qui les sélectionne.
 """
 
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, List, Dict, Any, AsyncIterator, Iterable, Iterator, Optional, Set, Tuple, Union
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 
-from .vdab_api import VDABScraper, VDABJobOffer
-from .indeed_bypass import IndeedBypassScraper, JobOffer as IndeedJobOffer
+from .async_fetcher import iterate_async
+from .description_store import DescriptionRef, DescriptionStore, full_text
+from .identity import stable_offer_id
+from .near_duplicates import NearDuplicateIndex
+from .settings import load_integrations_config
+from .sources import SOURCES, SourceRegistry
+
+if TYPE_CHECKING:
+    # Importés à la demande (sources.py): Selenium n'est chargé que si Indeed est interrogé
+    from .driver_pool import ChromeDriverPool
+    from .indeed_bypass import IndeedBypassScraper, JobOffer as IndeedJobOffer
+    from .quota import QuotaLedger
+    from .recording import FixtureStore
+    from .result_cache import ResultCache
+    from .vdab_api import VDABScraper, VDABJobOffer
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +45,7 @@ class AggregatedJobOffer:
 
     Permet d'avoir un format uniforme quelle que soit la source
     """
-    id: str
+    id: str  # Identifiant stable (`identity.stable_offer_id`), clé des caches et exports
     title: str
     company: str
     location: str
@@ -40,11 +60,17 @@ class AggregatedJobOffer:
 
     # Métadonnées
     raw_data: Optional[Dict[str, Any]] = None  # Données originales
+    description_ref: Optional[DescriptionRef] = None  # Description complète (DescriptionStore)
 
     def __post_init__(self):
         if self.scraped_at is None:
             self.scraped_at = datetime.now()
 
+    @property
+    def full_description(self) -> str:
+        """Description complète (chargée à la demande), sinon l'aperçu"""
+        return full_text(self.description, self.description_ref)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convertit en dictionnaire"""
         return {
@@ -59,10 +85,259 @@ class AggregatedJobOffer:
             'salary': self.salary,
             'contract_type': self.contract_type,
             'remote': self.remote,
-            'scraped_at': self.scraped_at.isoformat() if self.scraped_at else None
+            'scraped_at': self.scraped_at.isoformat() if self.scraped_at else None,
+            'description_id': self.description_ref.digest if self.description_ref else None
+        }
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: Dict[str, Any],
+        description_store: Optional[DescriptionStore] = None
+    ) -> 'AggregatedJobOffer':
+        """
+        Reconstruit une offre depuis `to_dict` (cache de résultats)
+
+        Args:
+            data: Dictionnaire produit par `to_dict`
+            description_store: Store où retrouver la description complète
+        """
+        digest = data.get('description_id')
+        scraped_at = data.get('scraped_at')
+        return cls(
+            id=data['id'],
+            title=data['title'],
+            company=data['company'],
+            location=data['location'],
+            description=data['description'],
+            url=data['url'],
+            source=data['source'],
+            posted_date=data.get('posted_date'),
+            salary=data.get('salary'),
+            contract_type=data.get('contract_type'),
+            remote=data.get('remote', False),
+            scraped_at=datetime.fromisoformat(scraped_at) if scraped_at else None,
+            description_ref=description_store.ref(digest) if description_store and digest else None
+        )
+
+
+@dataclass
+class FanOutSettings:
+    """
+    Délais de la recherche agrégée (section `aggregator.fanout`
+    d'integrations.json)
+    """
+    deadline: Optional[float] = None     # Délai global (secondes, None = illimité)
+    source_timeouts: Dict[str, float] = field(default_factory=dict)  # Délai par source
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]] = None) -> 'FanOutSettings':
+        """
+        Lit les délais depuis integrations.json
+
+        Args:
+            config: Configuration déjà chargée (défaut: integrations.json)
+        """
+        if config is None:
+            config = load_integrations_config()
+
+        section = config.get('aggregator', {}).get('fanout') or {}
+        deadline = section.get('deadline')
+        return cls(
+            deadline=float(deadline) if deadline is not None else None,
+            source_timeouts={
+                name: float(timeout) for name, timeout in (section.get('source_timeouts') or {}).items()
+            }
+        )
+
+    def timeout_for(self, source: str, timeout: Optional[float] = None) -> Optional[float]:
+        """Délai effectif d'une source: le plus court entre le sien et le délai global"""
+        limits = [
+            limit for limit in (timeout, self.source_timeouts.get(source), self.deadline)
+            if limit is not None
+        ]
+        return min(limits) if limits else None
+
+
+@dataclass
+class SourceStatus:
+    """Bilan d'une source lors d'une recherche agrégée"""
+    source: str
+    status: str = 'running'          # 'ok', 'timeout', 'error', 'preempted', 'busy' ou 'unavailable'
+    offers: int = 0                  # Offres retenues (avant déduplication)
+    duration: float = 0.0            # Secondes jusqu'à la fin ou la coupure
+    timeout: Optional[float] = None  # Délai appliqué
+    error: Optional[str] = None
+
+    @property
+    def partial(self) -> bool:
+        """La source n'a pas terminé: ses offres sont incomplètes"""
+        return self.status != 'ok'
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convertit le bilan en dictionnaire"""
+        data = asdict(self)
+        data['partial'] = self.partial
+        return data
+
+
+@dataclass
+class SearchReport:
+    """Bilan de la dernière recherche agrégée (`aggregator.last_search_report`)"""
+    sources: Dict[str, SourceStatus] = field(default_factory=dict)
+    offers: int = 0                  # Offres retournées (après déduplication)
+    duration: float = 0.0
+    cache: Optional[str] = None      # 'hit', 'stale', 'miss' (None = sans cache de résultats)
+
+    @property
+    def partial(self) -> bool:
+        """Au moins une source a été coupée, a échoué ou n'a pas été interrogée"""
+        return any(status.partial for status in self.sources.values())
+
+    @property
+    def complete(self) -> bool:
+        """
+        Toutes les sources interrogées ont terminé (résultat à mettre en cache)
+
+        Une source indisponible (paquet absent, scraper en échec) n'est pas
+        attendue: elle le restera aux recherches suivantes.
+        """
+        return all(status.status == 'ok' for status in self.sources.values() if status.status != 'unavailable')
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convertit le bilan en dictionnaire"""
+        return {
+            'sources': {name: status.to_dict() for name, status in self.sources.items()},
+            'offers': self.offers,
+            'duration': self.duration,
+            'partial': self.partial,
+            'complete': self.complete,
+            'cache': self.cache
         }
 
 
+class _SourceRun:
+    """Collecte des offres d'une source dans son thread, arrêtable de l'extérieur"""
+
+    def __init__(self, status: SourceStatus, stream: Iterator[AggregatedJobOffer], background: bool = False):
+        self.status = status
+        self.stream = stream
+        self.background = background     # Rafraîchissement du cache de résultats
+        self.offers: List[AggregatedJobOffer] = []
+        self.started = time.monotonic()
+        self._stop = threading.Event()
+        self._done = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def finished(self) -> bool:
+        """Le thread a rendu la main (le scraper est libre)"""
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Attend que le thread rende la main; True s'il l'a fait"""
+        return self._done.wait(timeout)
+
+    def drain(self):
+        """Consomme le flux jusqu'à sa fin, une erreur ou une demande d'arrêt"""
+        try:
+            for offer in self.stream:
+                with self._lock:
+                    if self._stop.is_set():
+                        break
+                    self.offers.append(offer)
+            else:
+                self._finish('ok')
+        except Exception as e:
+            self._finish('error', str(e))
+        finally:
+            # Libère la source (navigateur, session) dès qu'elle rend la main
+            close = getattr(self.stream, 'close', None)
+            try:
+                if close is not None:
+                    close()
+            finally:
+                self._done.set()
+
+    def release(self):
+        """Rend la source sans `drain` (flux consommé par `search_iter`)"""
+        self._done.set()
+
+    def cut(self, status: str = 'timeout') -> List[AggregatedJobOffer]:
+        """Coupe une source en retard: ses offres déjà reçues sont gardées"""
+        self._finish(status)
+        with self._lock:
+            return list(self.offers)
+
+    def _finish(self, status: str, error: Optional[str] = None):
+        with self._lock:
+            if self._stop.is_set():
+                return
+            self._stop.set()
+            self.status.status = status
+            self.status.error = error
+            self.status.offers = len(self.offers)
+            self.status.duration = time.monotonic() - self.started
+
+
+class StreamingDeduplicator:
+    """
+    Déduplication incrémentale d'un flux d'offres (titre + entreprise)
+
+    Seules les clés normalisées sont gardées en mémoire, pas les offres:
+    une offre peut être livrée au consommateur dès qu'elle arrive. Avec un
+    index de quasi-doublons, les variantes ("Python Developer (m/v/x)" chez
+    "Acme NV" / "Python developer" chez "ACME") sont aussi retirées.
+    """
+
+    def __init__(self, near_duplicates: Optional[NearDuplicateIndex] = None):
+        """
+        Args:
+            near_duplicates: Index MinHash/LSH des offres déjà vues (None =
+                doublons exacts seulement)
+        """
+        self._seen: Set[Tuple[str, str]] = set()
+        self.near_duplicates = near_duplicates
+        self.duplicates = 0
+        self.near_duplicate_count = 0
+
+    @staticmethod
+    def key(offer: AggregatedJobOffer) -> Tuple[str, str]:
+        """Clé normalisée (titre, entreprise) en minuscules, sans espaces superflus"""
+        return (offer.title.lower().strip(), offer.company.lower().strip())
+
+    def is_new(self, offer: AggregatedJobOffer) -> bool:
+        """Retourne True à la première occurrence d'une clé, False ensuite"""
+        key = self.key(offer)
+        if key in self._seen:
+            self.duplicates += 1
+            logger.debug(f"Doublon ignoré: {offer.title} @ {offer.company}")
+            return False
+
+        self._seen.add(key)
+
+        if self.near_duplicates is not None:
+            match = self.near_duplicates.find_or_add(offer.id, offer.title, offer.company, offer.description)
+            if match is not None:
+                self.duplicates += 1
+                self.near_duplicate_count += 1
+                logger.debug(f"Quasi-doublon ignoré: {offer.title} @ {offer.company} ~ {match[0]} ({match[1]:.2f})")
+                return False
+
+        return True
+
+    @property
+    def unique_count(self) -> int:
+        """Nombre d'offres uniques vues jusqu'ici"""
+        return len(self._seen) - self.near_duplicate_count
+
+    def filter(self, offers: Iterable[AggregatedJobOffer]) -> Iterator[AggregatedJobOffer]:
+        """Ne laisse passer que la première occurrence de chaque offre"""
+        for offer in offers:
+            if self.is_new(offer):
+                yield offer
+
+
 class BelgianJobAggregator:
     """
     Agrégateur multi-sources pour le marché belge
@@ -81,7 +356,15 @@ class BelgianJobAggregator:
         self,
         vdab_client_id: Optional[str] = None,
         indeed_headless: bool = False,
-        enable_deduplication: bool = True
+        enable_deduplication: bool = True,
+        driver_pool: Optional['ChromeDriverPool'] = None,
+        fixtures: Optional['FixtureStore'] = None,
+        vdab_quota: Union['QuotaLedger', bool, None] = None,
+        description_store: Optional[DescriptionStore] = None,
+        fanout: Optional[FanOutSettings] = None,
+        near_duplicates: Optional[NearDuplicateIndex] = None,
+        registry: Optional[SourceRegistry] = None,
+        result_cache: Optional['ResultCache'] = None
     ):
         """
         Initialise l'agrégateur
@@ -90,81 +373,496 @@ class BelgianJobAggregator:
             vdab_client_id: Client ID VDAB (optionnel si dans .env)
             indeed_headless: Mode headless pour Indeed (False recommandé)
             enable_deduplication: Activer la déduplication des offres
+            driver_pool: Pool de navigateurs partagé pour Indeed (évite un
+                démarrage de Chrome par agrégateur)
+            fixtures: Enregistrement ou rejeu hors ligne des réponses de
+                toutes les sources (tests, benchmarks)
+            vdab_quota: Décompte journalier des requêtes VDAB (défaut: décompte
+                partagé configuré par integrations.json; False = pas de quota)
+            description_store: Descriptions complètes de toutes les sources,
+                chargées à la demande via `offer.full_description`
+            fanout: Délais de `search` par source et global (défaut:
+                integrations.json)
+            near_duplicates: Index persistant des offres vues; la
+                déduplication retire alors aussi les quasi-doublons, entre
+                sources et avec l'historique
+            registry: Sources disponibles (défaut: `sources.SOURCES`)
+            result_cache: Cache des résultats de `search` (None = désactivé)
+
+        Les scrapers ne sont pas créés ici mais à la première recherche qui
+        sélectionne leur source: une recherche VDAB seule n'importe ni ne
+        démarre rien de Selenium.
         """
         self.enable_deduplication = enable_deduplication
+        self.near_duplicates = near_duplicates
+        self.fanout = fanout or FanOutSettings.from_config()
+        self.last_search_report: Optional[SearchReport] = None
+        self.result_cache = result_cache
 
-        # Initialiser les scrapers
-        try:
-            self.vdab_scraper = VDABScraper(client_id=vdab_client_id)
-            self.vdab_available = True
-            logger.info("✅ VDAB API disponible")
-        except Exception as e:
-            logger.warning(f"⚠️ VDAB API non disponible: {e}")
-            self.vdab_scraper = None
-            self.vdab_available = False
+        # Options transmises aux scrapers (chaque source prend les siennes)
+        self.registry = registry if registry is not None else SOURCES
+        self.source_options: Dict[str, Any] = {
+            'vdab_client_id': vdab_client_id,
+            'indeed_headless': indeed_headless,
+            'driver_pool': driver_pool,
+            'fixtures': fixtures,
+            'vdab_quota': vdab_quota,
+            'description_store': description_store,
+        }
+        self._scrapers: Dict[str, Any] = {}
+        self._scraper_errors: Dict[str, str] = {}
+        self._scrapers_lock = threading.Lock()
+        # Dernière exécution de chaque source: tant que son thread n'a pas
+        # rendu la main (même coupé), le scraper n'est pas réutilisé
+        self._runs: Dict[str, _SourceRun] = {}
 
-        self.indeed_scraper = IndeedBypassScraper(
-            headless=indeed_headless,
-            country='be'
-        )
-        logger.info("✅ Indeed BE scraper initialisé")
+    def scraper(self, name: str) -> Optional[Any]:
+        """
+        Scraper d'une source, importé et créé au premier appel
+
+        Returns:
+            Le scraper, ou None si la source est indisponible (dépendance
+            manquante, identifiants absents); l'échec est mémorisé
+        """
+        with self._scrapers_lock:
+            if name in self._scrapers:
+                return self._scrapers[name]
+
+            spec = self.registry.get(name)
+            try:
+                scraper = spec.create(self.source_options)
+                logger.info(f"✅ {spec.label} disponible")
+            except Exception as e:
+                logger.warning(f"⚠️ {spec.label} non disponible: {e}")
+                self._scraper_errors[name] = str(e)
+                scraper = None
+
+            self._scrapers[name] = scraper
+            return scraper
+
+    @property
+    def vdab_scraper(self) -> Optional['VDABScraper']:
+        """Scraper VDAB (créé à la demande)"""
+        return self.scraper('vdab')
+
+    @vdab_scraper.setter
+    def vdab_scraper(self, scraper: Optional['VDABScraper']):
+        self._scrapers['vdab'] = scraper
+
+    @property
+    def vdab_available(self) -> bool:
+        """L'API VDAB est utilisable (crée le scraper au besoin)"""
+        return self.vdab_scraper is not None
+
+    @property
+    def indeed_scraper(self) -> Optional['IndeedBypassScraper']:
+        """Scraper Indeed BE (créé à la demande, importe Selenium)"""
+        return self.scraper('indeed')
+
+    @indeed_scraper.setter
+    def indeed_scraper(self, scraper: Optional['IndeedBypassScraper']):
+        self._scrapers['indeed'] = scraper
 
     def search(
         self,
         query: str,
         location: str = "Belgique",
         max_results_per_source: int = 50,
-        sources: Optional[List[str]] = None
+        sources: Optional[List[str]] = None,
+        source_timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        use_cache: bool = True
     ) -> List[AggregatedJobOffer]:
         """
-        Recherche d'offres sur toutes les sources disponibles
+        Recherche d'offres sur toutes les sources disponibles, en parallèle
+
+        Chaque source tourne dans son thread: la durée totale est celle de
+        la source la plus lente, pas leur somme. Une source qui dépasse son
+        délai est coupée et ses offres déjà reçues sont gardées; le bilan
+        par source (statut, offres, durée) est dans `last_search_report`.
+        Les offres sont rendues dans l'ordre des sources (VDAB puis Indeed),
+        comme `search_iter`.
+
+        Avec un `result_cache`, une recherche déjà faite est servie par le
+        cache; périmée, elle est servie quand même et rafraîchie en
+        arrière-plan (`last_search_report.cache` indique la provenance).
+        Un rafraîchissement cède ses sources à une recherche au premier
+        plan: celle-ci n'attend pas qu'il se termine.
 
         Args:
             query: Mots-clés de recherche
             location: Localisation (ex: "Bruxelles", "Belgique")
             max_results_per_source: Nombre max de résultats par source
             sources: Liste des sources à utiliser (None = toutes)
+            source_timeout: Délai de chaque source (secondes, défaut:
+                `fanout.source_timeouts`)
+            deadline: Délai global (secondes, défaut: `fanout.deadline`)
+            use_cache: Passer par `result_cache` (False = recherche forcée,
+                dont le résultat remplace l'entrée du cache)
 
         Returns:
             Liste d'offres normalisées et éventuellement dédupliquées
         """
-        all_offers = []
+        if self.result_cache is None:
+            offers, self.last_search_report = self._search_sources(
+                query, location, max_results_per_source, sources, source_timeout, deadline
+            )
+            return offers
 
-        # Sources par défaut
-        if sources is None:
-            sources = []
-            if self.vdab_available:
-                sources.append('vdab')
-            sources.append('indeed')
+        started = time.monotonic()
+        searched: List[Tuple[List[AggregatedJobOffer], SearchReport]] = []
 
-        logger.info(f"🔍 Recherche agrégée: '{query}' à {location}")
-        logger.info(f"📊 Sources actives: {', '.join(sources)}")
+        def run(background: bool = False) -> Tuple[List[Dict[str, Any]], bool]:
+            offers, report = self._search_sources(
+                query, location, max_results_per_source, sources, source_timeout, deadline, background
+            )
+            if not background:
+                searched.append((offers, report))
+            return [offer.to_dict() for offer in offers], report.complete
 
-        # VDAB
-        if 'vdab' in sources and self.vdab_available:
-            try:
-                vdab_offers = self._search_vdab(query, location, max_results_per_source)
-                all_offers.extend(vdab_offers)
-                logger.info(f"  ✅ VDAB: {len(vdab_offers)} offres")
-            except Exception as e:
-                logger.error(f"  ❌ Erreur VDAB: {e}")
+        key = self.result_cache.key(query, location, max_results_per_source, sources)
+        if not use_cache:
+            self.result_cache.invalidate(key)
+        result = self.result_cache.get_or_search(key, run, refresh=lambda: run(background=True))
+
+        if searched:
+            # Recherche faite par cet appel: offres d'origine et bilan complet
+            offers, report = searched[0]
+        else:
+            store = self.source_options.get('description_store')
+            offers = [AggregatedJobOffer.from_dict(data, store) for data in result.offers]
+            report = SearchReport(offers=len(offers), duration=time.monotonic() - started)
+            logger.info(f"💾 {len(offers)} offres depuis le cache ({result.status}, {result.age:.0f}s)")
+        report.cache = result.status
+        self.last_search_report = report
+        return offers
+
+    def _search_sources(
+        self,
+        query: str,
+        location: str,
+        max_results_per_source: int,
+        sources: Optional[List[str]],
+        source_timeout: Optional[float],
+        deadline: Optional[float],
+        background: bool = False
+    ) -> Tuple[List[AggregatedJobOffer], SearchReport]:
+        """
+        Recherche sur les sources en parallèle, sans cache de résultats (voir `search`)
+
+        Chaque source n'a qu'une exécution à la fois: une source encore
+        occupée (recherche concurrente, ou coupée mais pas encore rendue) est
+        attendue dans la limite de son délai, puis ignorée ('busy'). Une
+        recherche au premier plan coupe d'abord les sources occupées par un
+        rafraîchissement en arrière-plan (`background`).
+        """
+        settings = self.fanout if deadline is None else FanOutSettings(deadline, self.fanout.source_timeouts)
+        report = SearchReport()
+        started = time.monotonic()
+
+        with self._scrapers_lock:
+            holders = [
+                run for name, run in self._runs.items()
+                if not run.finished and (sources is None or name in sources)
+            ]
+        for holder in holders:
+            if holder.background and not background:
+                holder.cut('preempted')
+            limit = settings.timeout_for(holder.status.source, source_timeout)
+            holder.wait(None if limit is None else max(0.0, started + limit - time.monotonic()))
+
+        skipped: List[SourceStatus] = []
+        runs = []
+        for name, stream in self._named_streams(query, location, max_results_per_source, sources, skipped):
+            run = _SourceRun(SourceStatus(name, timeout=settings.timeout_for(name, source_timeout)), stream, background)
+            if self._claim(run):
+                runs.append(run)
+            else:
+                stream.close()
+                skipped.append(SourceStatus(name, status='busy', error="source occupée par une autre recherche"))
+        statuses = {status.source: status for status in [run.status for run in runs] + skipped}
+        report.sources = {spec.name: statuses[spec.name] for spec in self.registry if spec.name in statuses}
+
+        collected = self._fan_out(runs, started)
+
+        offers = [offer for run in runs for offer in collected[run.status.source]]
+        if self.enable_deduplication:
+            offers = self._deduplicate(offers)
+
+        report.offers = len(offers)
+        report.duration = time.monotonic() - started
+
+        for status in report.sources.values():
+            icon = {'ok': '✅', 'timeout': '⏱️', 'preempted': '⏱️', 'busy': '⏳'}.get(status.status, '❌')
+            detail = f" ({status.error})" if status.error else ""
+            logger.info(
+                f"  {icon} {status.source}: {status.status}, {status.offers} offres "
+                f"en {status.duration:.1f}s{detail}"
+            )
+        logger.info(f"🎉 Total: {len(offers)} offres en {report.duration:.1f}s")
+        return offers, report
+
+    @staticmethod
+    def _fan_out(runs: List['_SourceRun'], started: float) -> Dict[str, List[AggregatedJobOffer]]:
+        """
+        Fait tourner les sources en parallèle jusqu'à leur fin ou leur délai
+
+        Une source coupée n'est pas attendue: son thread s'arrête à la
+        prochaine offre (un navigateur bloqué ne retarde pas le résultat).
+        Son exécution reste dans `_runs` jusqu'à ce qu'il rende la main: la
+        recherche suivante ne réutilise pas le scraper qu'il occupe encore.
+
+        Returns:
+            Offres reçues par source
+        """
+        collected: Dict[str, List[AggregatedJobOffer]] = {}
+        if not runs:
+            return collected
+
+        executor = ThreadPoolExecutor(max_workers=len(runs), thread_name_prefix='aggregator')
+        pending: Dict[Future, _SourceRun] = {executor.submit(run.drain): run for run in runs}
+
+        try:
+            while pending:
+                expiries = [
+                    started + run.status.timeout for run in pending.values()
+                    if run.status.timeout is not None
+                ]
+                wait_for = max(0.0, min(expiries) - time.monotonic()) if expiries else None
+                done, _ = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    run = pending.pop(future)
+                    collected[run.status.source] = run.offers
+
+                now = time.monotonic()
+                for future, run in list(pending.items()):
+                    if run.status.timeout is not None and now >= started + run.status.timeout:
+                        collected[run.status.source] = run.cut()
+                        del pending[future]
+        finally:
+            executor.shutdown(wait=False)
+
+        return collected
+
+    def _claim(self, run: '_SourceRun') -> bool:
+        """Réserve le scraper d'une source pour `run` (False s'il est occupé)"""
+        with self._scrapers_lock:
+            current = self._runs.get(run.status.source)
+            if current is not None and not current.finished:
+                return False
+            self._runs[run.status.source] = run
+            return True
+
+    def _source_busy(self, name: str) -> bool:
+        """Le scraper de la source est encore occupé par une autre exécution"""
+        with self._scrapers_lock:
+            run = self._runs.get(name)
+        return run is not None and not run.finished
+
+    def search_iter(
+        self,
+        query: str,
+        location: str = "Belgique",
+        max_results_per_source: int = 50,
+        sources: Optional[List[str]] = None
+    ) -> Iterator[AggregatedJobOffer]:
+        """
+        Recherche d'offres sur toutes les sources, en flux
+
+        Les sources sont interrogées l'une après l'autre; chaque offre est
+        normalisée et dédupliquée dès qu'elle est parsée, ce qui permet au
+        consommateur de traiter (scorer, stocker) les offres au fil de l'eau.
+        Les sources restent réservées jusqu'à la fin (ou la fermeture) du
+        flux: une recherche concurrente les attend ou les ignore ('busy').
+
+        Args:
+            query: Mots-clés de recherche
+            location: Localisation (ex: "Bruxelles", "Belgique")
+            max_results_per_source: Nombre max de résultats par source
+            sources: Liste des sources à utiliser (None = toutes)
+
+        Yields:
+            Offres normalisées et éventuellement dédupliquées
+        """
+        dedup = StreamingDeduplicator(self.near_duplicates) if self.enable_deduplication else None
+        runs = self._claim_streams(query, location, max_results_per_source, sources)
+
+        try:
+            for run in runs:
+                stream = self._guarded(run)
+                yield from (dedup.filter(stream) if dedup else stream)
+        finally:
+            for run in runs:
+                run.release()
+
+        self._log_deduplication(dedup)
+
+    async def asearch_iter(
+        self,
+        query: str,
+        location: str = "Belgique",
+        max_results_per_source: int = 50,
+        sources: Optional[List[str]] = None
+    ) -> AsyncIterator[AggregatedJobOffer]:
+        """
+        Version itérateur async de `search_iter`
 
-        # Indeed BE
-        if 'indeed' in sources:
+        Les sources tournent en parallèle (chacune dans son thread) et leurs
+        offres sont entrelacées dans l'ordre d'arrivée. La file d'attente est
+        bornée: une source rapide est freinée si le consommateur ne suit pas.
+        Chaque source est rendue quand son thread a refermé son flux.
+
+        Yields:
+            Offres normalisées et éventuellement dédupliquées
+        """
+        dedup = StreamingDeduplicator(self.near_duplicates) if self.enable_deduplication else None
+        runs = self._claim_streams(query, location, max_results_per_source, sources)
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=100)
+        done = object()
+
+        async def pump(run: _SourceRun):
+            offers = iterate_async(self._guarded(run))
             try:
-                indeed_offers = self._search_indeed(query, location, max_results_per_source)
-                all_offers.extend(indeed_offers)
-                logger.info(f"  ✅ Indeed: {len(indeed_offers)} offres")
+                async for offer in offers:
+                    await queue.put(offer)
             except Exception as e:
-                logger.error(f"  ❌ Erreur Indeed: {e}")
+                logger.error(f"  ❌ Erreur source: {e}")
+            finally:
+                # Ferme le flux dans son thread avant de rendre la source
+                await offers.aclose()
+            await queue.put(done)
+
+        tasks = [asyncio.ensure_future(pump(run)) for run in runs]
+        remaining = len(tasks)
+
+        try:
+            while remaining:
+                offer = await queue.get()
+                if offer is done:
+                    remaining -= 1
+                    continue
+                if dedup is None or dedup.is_new(offer):
+                    yield offer
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            for run in runs:
+                run.release()
+
+        self._log_deduplication(dedup)
+
+    def _claim_streams(
+        self,
+        query: str,
+        location: str,
+        max_results_per_source: int,
+        sources: Optional[List[str]]
+    ) -> List[_SourceRun]:
+        """
+        Prépare et réserve un flux d'offres normalisées par source active
 
-        # Déduplication
-        if self.enable_deduplication and len(all_offers) > 0:
-            all_offers = self._deduplicate(all_offers)
-            logger.info(f"🔄 Après déduplication: {len(all_offers)} offres uniques")
+        Chaque source reste réservée (`_runs`) jusqu'à `release()`; une
+        source prise entre-temps par une autre exécution est ignorée.
+        """
+        runs = []
+        for name, stream in self._named_streams(query, location, max_results_per_source, sources):
+            run = _SourceRun(SourceStatus(name), stream)
+            if self._claim(run):
+                runs.append(run)
+            else:
+                stream.close()
+                logger.warning(f"⚠️ {self.registry.get(name).label} ignorée: source occupée par une autre recherche")
+        return runs
+
+    def _guarded(self, run: _SourceRun) -> Iterator[AggregatedJobOffer]:
+        """Flux d'une source réservée, erreurs isolées"""
+        return self._guard_stream(self.registry.get(run.status.source).label, run.stream)
+
+    def _named_streams(
+        self,
+        query: str,
+        location: str,
+        max_results_per_source: int,
+        sources: Optional[List[str]],
+        skipped: Optional[List[SourceStatus]] = None
+    ) -> List[Tuple[str, Iterator[AggregatedJobOffer]]]:
+        """
+        Prépare un flux d'offres normalisées par source active, avec son nom
+
+        Seules les sources sélectionnées sont importées et créées; une source
+        indisponible ('unavailable'), ou encore occupée par une autre
+        exécution ('busy'), est ignorée et ajoutée à `skipped`; les autres
+        sont interrogées.
+        """
+        if sources is not None:
+            unknown = [name for name in sources if name not in self.registry]
+            if unknown:
+                logger.warning(f"⚠️ Sources inconnues ignorées: {', '.join(unknown)}")
+            sources = [name for name in sources if name in self.registry]
+
+        logger.info(f"🔍 Recherche agrégée: '{query}' à {location}")
 
-        logger.info(f"🎉 Total: {len(all_offers)} offres")
-        return all_offers
+        streams = []
+        for spec in self.registry.select(sources):
+            if self.scraper(spec.name) is None:
+                if skipped is not None:
+                    skipped.append(SourceStatus(spec.name, status='unavailable',
+                                                error=self._scraper_errors.get(spec.name, "scraper non disponible")))
+                continue
+            if self._source_busy(spec.name):
+                logger.warning(f"⚠️ {spec.label} ignorée: source occupée par une autre recherche")
+                if skipped is not None:
+                    skipped.append(SourceStatus(spec.name, status='busy',
+                                                error="source occupée par une autre recherche"))
+                continue
+            iterate = getattr(self, f"_iter_{spec.name}")
+            streams.append((spec.name, iterate(query, location, max_results_per_source)))
+
+        logger.info(f"📊 Sources actives: {', '.join(name for name, _ in streams)}")
+        return streams
+
+    @staticmethod
+    def _guard_stream(
+        label: str,
+        stream: Iterator[AggregatedJobOffer]
+    ) -> Iterator[AggregatedJobOffer]:
+        """
+        Isole les erreurs d'une source: une source en échec termine son flux
+        (les offres déjà produites restent acquises) sans interrompre les autres
+
+        Fermer ce flux ferme aussi celui de la source (navigateur, session).
+        """
+        count = 0
+        try:
+            while True:
+                try:
+                    offer = next(stream)
+                except StopIteration:
+                    logger.info(f"  ✅ {label}: {count} offres")
+                    return
+                except Exception as e:
+                    logger.error(f"  ❌ Erreur {label}: {e}")
+                    return
+
+                count += 1
+                yield offer
+        finally:
+            close = getattr(stream, 'close', None)
+            if close is not None:
+                close()
+
+    @staticmethod
+    def _log_deduplication(dedup: Optional[StreamingDeduplicator]):
+        """Bilan de la déduplication en fin de flux"""
+        if dedup is not None and dedup.near_duplicates is not None:
+            dedup.near_duplicates.flush()
+        if dedup is not None and dedup.duplicates > 0:
+            near = f" dont {dedup.near_duplicate_count} quasi-doublons" if dedup.near_duplicate_count else ""
+            logger.info(f"  🗑️ {dedup.duplicates} doublons supprimés{near}")
+            logger.info(f"🔄 Après déduplication: {dedup.unique_count} offres uniques")
 
     def _search_vdab(
         self,
@@ -173,17 +871,27 @@ class BelgianJobAggregator:
         max_results: int
     ) -> List[AggregatedJobOffer]:
         """Recherche sur VDAB"""
+        return list(self._iter_vdab(query, location, max_results))
+
+    def _iter_vdab(
+        self,
+        query: str,
+        location: str,
+        max_results: int
+    ) -> Iterator[AggregatedJobOffer]:
+        """Recherche sur VDAB, en flux"""
         # Adapter la localisation pour VDAB (néerlandais)
         vdab_location = self._adapt_location_for_vdab(location)
 
-        vdab_offers = self.vdab_scraper.search(
+        vdab_offers = self.vdab_scraper.search_iter(
             query=query,
             location=vdab_location,
             max_results=max_results
         )
 
         # Normaliser au format AggregatedJobOffer
-        return [self._normalize_vdab_offer(offer) for offer in vdab_offers]
+        for offer in vdab_offers:
+            yield self._normalize_vdab_offer(offer)
 
     def _search_indeed(
         self,
@@ -192,22 +900,32 @@ class BelgianJobAggregator:
         max_results: int
     ) -> List[AggregatedJobOffer]:
         """Recherche sur Indeed BE"""
+        return list(self._iter_indeed(query, location, max_results))
+
+    def _iter_indeed(
+        self,
+        query: str,
+        location: str,
+        max_results: int
+    ) -> Iterator[AggregatedJobOffer]:
+        """Recherche sur Indeed BE, en flux"""
         # Calculer le nombre de pages
         max_pages = max(1, max_results // 16)  # ~16 offres/page
 
-        indeed_offers = self.indeed_scraper.scrape(
+        indeed_offers = self.indeed_scraper.scrape_iter(
             query=query,
             location=location,
             max_pages=max_pages
         )
 
         # Normaliser au format AggregatedJobOffer
-        return [self._normalize_indeed_offer(offer) for offer in indeed_offers]
+        for offer in indeed_offers:
+            yield self._normalize_indeed_offer(offer)
 
-    def _normalize_vdab_offer(self, offer: VDABJobOffer) -> AggregatedJobOffer:
+    def _normalize_vdab_offer(self, offer: 'VDABJobOffer') -> AggregatedJobOffer:
         """Normalise une offre VDAB"""
         return AggregatedJobOffer(
-            id=f"vdab_{offer.id}",
+            id=stable_offer_id('vdab', offer.url, natural_key=offer.id),
             title=offer.title,
             company=offer.company,
             location=offer.location,
@@ -219,13 +937,14 @@ class BelgianJobAggregator:
             contract_type=offer.contract_type,
             remote=offer.remote,
             scraped_at=offer.scraped_at,
-            raw_data=offer.to_dict()
+            raw_data=offer.to_dict(),
+            description_ref=offer.description_ref
         )
 
-    def _normalize_indeed_offer(self, offer: IndeedJobOffer) -> AggregatedJobOffer:
+    def _normalize_indeed_offer(self, offer: 'IndeedJobOffer') -> AggregatedJobOffer:
         """Normalise une offre Indeed"""
         return AggregatedJobOffer(
-            id=f"indeed_{hash(offer.url)}",  # Utiliser hash de l'URL comme ID
+            id=stable_offer_id('indeed', offer.url),  # Même ID d'un run à l'autre
             title=offer.title,
             company=offer.company,
             location=offer.location,
@@ -234,9 +953,10 @@ class BelgianJobAggregator:
             source="Indeed BE",
             posted_date=offer.posted_date,
             salary=offer.salary,
-            contract_type=None,  # Indeed n'a pas toujours cette info
+            contract_type=offer.contract_type,  # Seulement avec le parser 'json'
             remote=offer.remote,
-            scraped_at=offer.scraped_at
+            scraped_at=offer.scraped_at,
+            description_ref=offer.description_ref
         )
 
     def _deduplicate(self, offers: List[AggregatedJobOffer]) -> List[AggregatedJobOffer]:
@@ -247,25 +967,14 @@ class BelgianJobAggregator:
         1. Normaliser titre et entreprise (lowercase, trim)
         2. Créer une clé (titre, entreprise)
         3. Garder la première occurrence de chaque clé
-        """
-        seen = set()
-        unique_offers = []
-
-        for offer in offers:
-            # Créer une clé normalisée
-            title_norm = offer.title.lower().strip()
-            company_norm = offer.company.lower().strip()
-            key = (title_norm, company_norm)
-
-            if key not in seen:
-                seen.add(key)
-                unique_offers.append(offer)
-            else:
-                logger.debug(f"Doublon ignoré: {offer.title} @ {offer.company}")
+        4. Avec `near_duplicates`: retirer aussi les quasi-doublons (MinHash/LSH)
 
-        duplicates_count = len(offers) - len(unique_offers)
-        if duplicates_count > 0:
-            logger.info(f"  🗑️ {duplicates_count} doublons supprimés")
+        Voir `StreamingDeduplicator` pour la version incrémentale utilisée par
+        `search_iter`.
+        """
+        dedup = StreamingDeduplicator(self.near_duplicates)
+        unique_offers = list(dedup.filter(offers))
+        self._log_deduplication(dedup)
 
         return unique_offers
 
@@ -294,11 +1003,10 @@ class BelgianJobAggregator:
         return mapping.get(location_lower, location)
 
     def close(self):
-        """Ferme les connections"""
-        if self.vdab_scraper:
-            self.vdab_scraper.close()
-        if self.indeed_scraper:
-            self.indeed_scraper.close()
+        """Ferme les connections (des seuls scrapers créés)"""
+        for scraper in self._scrapers.values():
+            if scraper is not None:
+                scraper.close()
 
     def __enter__(self):
         """Support context manager"""
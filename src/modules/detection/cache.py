@@ -0,0 +1,175 @@
+"""
+Caches persistants du module de détection
+
+Stockage clé/valeur JSON avec TTL dans un fichier SQLite, partageable entre
+threads et entre exécutions (le scheduler relance les scrapes toutes les 2h).
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from .identity import canonical_job_url
+
+logger = logging.getLogger(__name__)
+
+# Dossier par défaut des caches (relatif au répertoire de travail)
+DEFAULT_CACHE_DIR = Path('cache')
+
+# TTL par défaut des détails d'offres (cache_ttl.job_offers dans integrations.json)
+DEFAULT_DETAIL_TTL = 86400
+
+
+class SQLiteTTLCache:
+    """
+    Cache clé/valeur persistant avec expiration
+
+    Les valeurs doivent être sérialisables en JSON. Les entrées expirées sont
+    ignorées à la lecture et supprimées par `purge_expired()`.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        default_ttl: Optional[float] = None,
+        table: str = 'cache'
+    ):
+        """
+        Initialise le cache
+
+        Args:
+            path: Chemin du fichier SQLite (":memory:" pour un cache volatile)
+            default_ttl: Durée de vie par défaut en secondes (None = illimitée)
+            table: Nom de la table (plusieurs caches peuvent partager un fichier)
+        """
+        self.path = str(path)
+        self.default_ttl = default_ttl
+        self.table = table
+
+        if self.path != ':memory:':
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table} ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "stored_at REAL NOT NULL, expires_at REAL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Retourne la valeur associée à `key` si elle n'a pas expiré"""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT value, expires_at FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+
+        if row is None:
+            return default
+
+        value, expires_at = row
+        if expires_at is not None and expires_at <= time.time():
+            return default
+
+        return json.loads(value)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """
+        Enregistre une valeur
+
+        Args:
+            key: Clé
+            value: Valeur sérialisable en JSON
+            ttl: Durée de vie en secondes (défaut: `default_ttl`)
+        """
+        ttl = self.default_ttl if ttl is None else ttl
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+
+        with self._lock:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, stored_at, expires_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), now, expires_at)
+            )
+            self._conn.commit()
+
+    def delete(self, key: str):
+        """Supprime une entrée"""
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def purge_expired(self) -> int:
+        """
+        Supprime les entrées expirées
+
+        Returns:
+            Nombre d'entrées supprimées
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                f"DELETE FROM {self.table} WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (time.time(),)
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                f"SELECT COUNT(*) FROM {self.table} WHERE expires_at IS NULL OR expires_at > ?",
+                (time.time(),)
+            ).fetchone()[0]
+
+    def close(self):
+        """Ferme la connexion SQLite"""
+        with self._lock:
+            self._conn.close()
+
+
+class JobDetailCache(SQLiteTTLCache):
+    """
+    Cache des détails d'offres, indexé par URL canonique
+
+    Deux URLs pointant vers la même offre (paramètres de tracking, lien
+    `/rc/clk` vs `/viewjob`) partagent la même entrée.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = DEFAULT_CACHE_DIR / 'job_details.db',
+        ttl: float = DEFAULT_DETAIL_TTL
+    ):
+        super().__init__(path, default_ttl=ttl, table='job_details')
+
+    def get_details(self, job_url: str) -> Optional[Dict[str, Any]]:
+        """Retourne les détails en cache pour une offre (ou None)"""
+        return self.get(canonical_job_url(job_url))
+
+    def set_details(self, job_url: str, details: Dict[str, Any]):
+        """Enregistre les détails d'une offre"""
+        self.set(canonical_job_url(job_url), details)
+
+
+class VacancyCache(SQLiteTTLCache):
+    """
+    Cache des vacatures VDAB parsées, indexé par identifiant de vacature
+
+    Partage par défaut le fichier du cache des détails d'offres (table séparée).
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = DEFAULT_CACHE_DIR / 'job_details.db',
+        ttl: float = DEFAULT_DETAIL_TTL
+    ):
+        super().__init__(path, default_ttl=ttl, table='vdab_vacancies')
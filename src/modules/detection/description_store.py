@@ -0,0 +1,250 @@
+"""
+Stockage des descriptions complètes des offres, hors des objets en mémoire
+
+Les scrapers tronquaient les descriptions à 500 caractères pour garder des
+offres légères; le scoring et l'adaptation du CV travaillaient alors sur un
+texte incomplet. Avec un `DescriptionStore`, le texte complet est compressé
+(zlib) et rangé dans SQLite, indexé par son empreinte: une description
+republiée à l'identique (même offre vue par plusieurs recherches ou
+plusieurs runs) n'est stockée qu'une fois. L'offre garde un aperçu de 500
+caractères dans `description` et une poignée `description_ref`, chargée à
+la demande:
+
+    store = DescriptionStore()                # cache/descriptions.db
+    vdab = VDABScraper(description_store=store)
+    offer = vdab.search("Python")[0]
+    offer.description                         # aperçu (500 caractères)
+    offer.full_description                    # texte complet, lu dans le store
+
+Les écritures d'une page de résultats sont regroupées en une transaction
+(`with store.batch(): ...`) au lieu d'un commit par description.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+
+from .cache import DEFAULT_CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+# Longueur de l'aperçu gardé dans les offres
+PREVIEW_LENGTH = 500
+
+
+class DescriptionRef:
+    """
+    Poignée vers une description complète (empreinte + longueur)
+
+    Immuable et légère: copier une offre (`dataclasses.asdict`, deepcopy)
+    copie la poignée, pas le texte.
+    """
+
+    __slots__ = ('digest', 'length', '_store')
+
+    def __init__(self, digest: str, length: int, store: 'DescriptionStore'):
+        self.digest = digest
+        self.length = length
+        self._store = store
+
+    @property
+    def text(self) -> str:
+        """Texte complet (chargé depuis le store à chaque accès, avec cache LRU)"""
+        return self._store.get(self.digest)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __repr__(self) -> str:
+        return f"DescriptionRef({self.digest[:12]}…, {self.length} car.)"
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, DescriptionRef) and other.digest == self.digest
+
+    def __hash__(self) -> int:
+        return hash(self.digest)
+
+    def __copy__(self) -> 'DescriptionRef':
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'DescriptionRef':
+        return self
+
+
+class DescriptionStore:
+    """
+    Descriptions complètes compressées et dédupliquées, persistées dans SQLite
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = DEFAULT_CACHE_DIR / 'descriptions.db',
+        compression_level: int = 6,
+        cache_size: int = 128,
+        known_size: int = 4096
+    ):
+        """
+        Args:
+            path: Chemin du fichier SQLite (":memory:" pour les tests)
+            compression_level: Niveau zlib (1 = rapide, 9 = compact)
+            cache_size: Descriptions décompressées gardées en mémoire (LRU)
+            known_size: Empreintes déjà stockées retenues en mémoire (LRU),
+                pour ne pas recompresser une description republiée
+        """
+        self.path = str(path)
+        self.compression_level = compression_level
+        self.cache_size = cache_size
+        self.known_size = known_size
+
+        if self.path != ':memory:':
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._cache: 'OrderedDict[str, str]' = OrderedDict()
+        self._known: 'OrderedDict[str, None]' = OrderedDict()
+        self._batch_depth = 0
+        self._pending = 0
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS descriptions ("
+            "  digest TEXT PRIMARY KEY, data BLOB NOT NULL, length INTEGER NOT NULL,"
+            "  stored_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def digest(text: str) -> str:
+        """Empreinte d'un texte (clé de déduplication)"""
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+    def put(self, text: str) -> DescriptionRef:
+        """
+        Enregistre une description (une seule fois par contenu)
+
+        Returns:
+            Poignée vers le texte
+        """
+        digest = self.digest(text)
+        with self._lock:
+            if digest in self._known:
+                self._known.move_to_end(digest)
+            else:
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO descriptions (digest, data, length, stored_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (digest, zlib.compress(text.encode('utf-8'), self.compression_level),
+                     len(text), time.time())
+                )
+                self._pending += 1
+                if not self._batch_depth:
+                    self._commit()
+                self._known[digest] = None
+                while len(self._known) > self.known_size:
+                    self._known.popitem(last=False)
+        return DescriptionRef(digest, len(text), self)
+
+    @contextmanager
+    def batch(self) -> Iterator['DescriptionStore']:
+        """
+        Regroupe les `put` du bloc en une seule transaction (commit à la
+        sortie du bloc le plus externe)
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self._commit()
+
+    def _commit(self):
+        """Valide les écritures en attente (verrou tenu)"""
+        if self._pending:
+            self._conn.commit()
+            self._pending = 0
+
+    def ref(self, digest: str) -> Optional[DescriptionRef]:
+        """Poignée d'une description déjà stockée (None si inconnue)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT length FROM descriptions WHERE digest = ?", (digest,)
+            ).fetchone()
+        return DescriptionRef(digest, row[0], self) if row else None
+
+    def get(self, digest: str) -> str:
+        """
+        Texte complet d'une description
+
+        Raises:
+            KeyError: Si l'empreinte est inconnue
+        """
+        with self._lock:
+            text = self._cache.get(digest)
+            if text is not None:
+                self._cache.move_to_end(digest)
+                return text
+
+            row = self._conn.execute(
+                "SELECT data FROM descriptions WHERE digest = ?", (digest,)
+            ).fetchone()
+            if row is None:
+                raise KeyError(digest)
+
+            text = zlib.decompress(row[0]).decode('utf-8')
+            if self.cache_size > 0:
+                self._cache[digest] = text
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return text
+
+    def split(self, text: Optional[str]) -> Tuple[str, Optional[DescriptionRef]]:
+        """
+        Sépare une description en aperçu et poignée vers le texte complet
+
+        Returns:
+            (aperçu de `PREVIEW_LENGTH` caractères, poignée ou None si vide)
+        """
+        if not text:
+            return text or '', None
+        return text[:PREVIEW_LENGTH], self.put(text)
+
+    def stats(self) -> Dict[str, Any]:
+        """Nombre de descriptions, taille brute et taille compressée (octets)"""
+        with self._lock:
+            count, raw, stored = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(length), 0), COALESCE(SUM(LENGTH(data)), 0) "
+                "FROM descriptions"
+            ).fetchone()
+        return {
+            'descriptions': count,
+            'raw_chars': raw,
+            'stored_bytes': stored,
+            'ratio': round(stored / raw, 3) if raw else None
+        }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM descriptions").fetchone()[0]
+
+    def close(self):
+        """Valide les écritures en attente et ferme la connexion SQLite"""
+        with self._lock:
+            self._commit()
+            self._conn.close()
+
+
+def full_text(description: str, ref: Optional[DescriptionRef]) -> str:
+    """Description complète si une poignée est disponible, sinon l'aperçu"""
+    return ref.text if ref is not None else description
@@ -0,0 +1,463 @@
+"""
+Pool de navigateurs Chrome (undetected-chromedriver) réutilisables
+
+Démarrer un Chrome prend plusieurs secondes et quelques centaines de Mo.
+Le pool garde N navigateurs chauds, déjà configurés (options anti-détection
+et stealth), et les prête aux scrapes successifs, quels que soient la
+requête et le pays. Un navigateur est recyclé (fermé puis recréé à la
+demande) après un nombre de pages configurable, si sa mémoire dépasse un
+seuil, ou s'il ne répond plus.
+
+Usage:
+    with ChromeDriverPool(size=2) as pool:
+        fr = IndeedBypassScraper(country='fr', driver_pool=pool)
+        be = IndeedBypassScraper(country='be', driver_pool=pool)
+        # Chaque scrape emprunte un navigateur et le rend à la fin
+"""
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from .resource_blocking import ResourceBlockingConfig, apply_resource_blocking
+
+try:
+    import undetected_chromedriver as uc
+except ImportError:
+    uc = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+# Masque navigator.webdriver sur chaque document chargé par le navigateur
+STEALTH_SCRIPT = "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+
+
+def apply_stealth(driver: Any):
+    """
+    Applique les techniques de stealth à un driver
+
+    Le script est enregistré via CDP pour s'exécuter avant chaque nouveau
+    document (un navigateur du pool sert de nombreuses pages); à défaut, il
+    est exécuté sur la page courante.
+    """
+    try:
+        driver.execute_cdp_cmd(
+            'Page.addScriptToEvaluateOnNewDocument', {'source': STEALTH_SCRIPT}
+        )
+    except Exception as e:
+        logger.debug(f"CDP indisponible, stealth appliqué à la page courante: {e}")
+        driver.execute_script(STEALTH_SCRIPT)
+
+
+def create_stealth_driver(
+    headless: bool = True,
+    verbose: bool = False,
+    resource_blocking: Optional[ResourceBlockingConfig] = None,
+    user_data_dir: Optional[str] = None
+) -> Any:
+    """
+    Crée un driver Chrome non détectable, configuré pour le scraping
+
+    Args:
+        headless: Exécuter Chrome en mode invisible
+        verbose: Garder les logs de Chrome
+        resource_blocking: Ressources à ne pas charger (None = tout charger)
+        user_data_dir: Répertoire de profil persistant (None = profil
+            temporaire, supprimé à la fermeture)
+
+    Returns:
+        Driver undetected-chromedriver prêt à l'emploi
+
+    Raises:
+        ImportError: Si undetected-chromedriver n'est pas installé
+    """
+    if uc is None:
+        raise ImportError(
+            "undetected-chromedriver non installé. "
+            "Installez-le avec : pip install undetected-chromedriver"
+        )
+
+    logger.info("Initialisation du driver Chrome...")
+
+    options = uc.ChromeOptions()
+
+    if headless:
+        options.add_argument('--headless=new')  # Nouveau mode headless
+
+    # Arguments anti-détection
+    options.add_argument('--disable-blink-features=AutomationControlled')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-gpu')
+    options.add_argument('--window-size=1920,1080')
+
+    # Désactiver les logs si pas verbose
+    if not verbose:
+        options.add_argument('--log-level=3')
+        options.add_argument('--silent')
+
+    prefs = resource_blocking.chrome_prefs() if resource_blocking else {}
+    if prefs:
+        options.add_experimental_option('prefs', prefs)
+
+    driver = uc.Chrome(options=options, user_data_dir=user_data_dir)
+    apply_stealth(driver)
+    if resource_blocking is not None:
+        apply_resource_blocking(driver, resource_blocking)
+
+    logger.info("✅ Driver Chrome initialisé")
+    return driver
+
+
+def _proc_rss_bytes(pid: int) -> int:
+    """RSS d'un processus lu dans /proc (0 si introuvable)"""
+    try:
+        with open(f'/proc/{pid}/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    return 0
+
+
+def _proc_children(root_pid: int) -> List[int]:
+    """Descendants d'un processus, via les ppid de /proc/<pid>/stat"""
+    parents: Dict[int, int] = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as f:
+                # Le nom du processus (2e champ) peut contenir des espaces
+                fields = f.read().rsplit(')', 1)[1].split()
+            parents[int(entry)] = int(fields[1])
+        except (OSError, IndexError, ValueError):
+            continue
+
+    descendants = []
+    frontier = [root_pid]
+    while frontier:
+        pid = frontier.pop()
+        children = [child for child, parent in parents.items() if parent == pid]
+        descendants.extend(children)
+        frontier.extend(children)
+    return descendants
+
+
+def process_tree_memory(pid: int) -> Optional[int]:
+    """
+    Mémoire résidente d'un processus et de ses descendants (octets)
+
+    Chrome répartit son travail sur de nombreux processus (renderers, GPU,
+    etc.): c'est la somme qui compte. Utilise psutil s'il est installé,
+    sinon /proc (Linux).
+
+    Returns:
+        RSS total en octets, ou None si la mesure est impossible
+    """
+    if psutil is not None:
+        try:
+            process = psutil.Process(pid)
+            processes = [process, *process.children(recursive=True)]
+            total = 0
+            for p in processes:
+                try:
+                    total += p.memory_info().rss
+                except psutil.Error:
+                    continue
+            return total
+        except psutil.Error:
+            return None
+
+    if not os.path.isdir(f'/proc/{pid}'):
+        return None
+
+    return sum(_proc_rss_bytes(p) for p in [pid, *_proc_children(pid)])
+
+
+def driver_memory(driver: Any) -> Optional[int]:
+    """
+    Mémoire résidente du navigateur piloté par `driver` (octets)
+
+    Returns:
+        RSS total de Chrome et de ses processus fils, ou None si inconnu
+    """
+    pid = getattr(driver, 'browser_pid', None)
+    if pid is None:
+        service = getattr(driver, 'service', None)
+        process = getattr(service, 'process', None)
+        pid = getattr(process, 'pid', None)
+    if not isinstance(pid, int):
+        return None
+    return process_tree_memory(pid)
+
+
+@dataclass
+class PooledDriver:
+    """Un navigateur du pool et son usage"""
+    driver: Any
+    created_at: float = field(default_factory=time.monotonic)
+    pages: int = 0    # Pages chargées depuis la création
+    leases: int = 0   # Nombre de prêts
+
+    def record_page(self, count: int = 1):
+        """Compte une page chargée (pour le recyclage)"""
+        self.pages += count
+
+
+@dataclass
+class DriverPoolStats:
+    """Compteurs du pool"""
+    created: int = 0     # Démarrages de Chrome (à froid)
+    leases: int = 0
+    reuses: int = 0      # Prêts servis par un navigateur déjà chaud
+    recycled: int = 0    # Navigateurs fermés (pages, mémoire ou panne)
+    wait_time: float = 0.0  # Attente cumulée d'un navigateur libre (secondes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convertit les compteurs en dictionnaire"""
+        return asdict(self)
+
+
+class ChromeDriverPool:
+    """
+    Pool de navigateurs Chrome partagé entre scrapers (thread-safe)
+
+    Au plus `size` navigateurs existent à la fois; un scrape qui n'en trouve
+    pas de libre attend qu'un autre soit rendu.
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        max_pages_per_driver: Optional[int] = 50,
+        max_memory_mb: Optional[float] = 1024,
+        headless: bool = True,
+        verbose: bool = False,
+        resource_blocking: Optional[ResourceBlockingConfig] = None,
+        driver_factory: Optional[Callable[[], Any]] = None
+    ):
+        """
+        Initialise le pool (aucun navigateur n'est démarré, voir `warm_up`)
+
+        Args:
+            size: Nombre maximum de navigateurs simultanés
+            max_pages_per_driver: Recycler un navigateur après ce nombre de
+                pages (None = jamais)
+            max_memory_mb: Recycler un navigateur dont la mémoire (Chrome et
+                ses processus fils) dépasse ce seuil (None = jamais)
+            headless: Mode headless des navigateurs créés
+            verbose: Garder les logs de Chrome
+            resource_blocking: Blocage de ressources des navigateurs créés
+                (le blocage par URL peut ensuite être ajusté à chaque prêt)
+            driver_factory: Fonction de création d'un driver (défaut:
+                `create_stealth_driver`)
+        """
+        if size < 1:
+            raise ValueError("La taille du pool doit être au moins 1")
+
+        self.size = size
+        self.max_pages_per_driver = max_pages_per_driver
+        self.max_memory_mb = max_memory_mb
+        self.driver_factory = driver_factory or (
+            lambda: create_stealth_driver(
+                headless=headless, verbose=verbose, resource_blocking=resource_blocking
+            )
+        )
+        self.stats = DriverPoolStats()
+
+        self._idle: List[PooledDriver] = []
+        self._total = 0  # Navigateurs existants ou en cours de création
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def warm_up(self, count: Optional[int] = None):
+        """
+        Démarre des navigateurs à l'avance
+
+        Args:
+            count: Nombre de navigateurs chauds souhaités (défaut: `size`)
+        """
+        count = min(count or self.size, self.size)
+
+        while True:
+            with self._condition:
+                if self._closed or len(self._idle) >= count or self._total >= self.size:
+                    break
+                self._total += 1
+
+            pooled = self._create()
+            with self._condition:
+                self._idle.append(pooled)
+                self._condition.notify()
+
+        logger.info(f"🔥 Pool Chrome: {self.idle_count} navigateur(s) prêt(s)")
+
+    def acquire(self, timeout: Optional[float] = None) -> PooledDriver:
+        """
+        Emprunte un navigateur (chaud si possible, sinon en démarre un)
+
+        Args:
+            timeout: Attente maximale d'un navigateur libre (None = illimitée)
+
+        Returns:
+            Navigateur emprunté, à rendre avec `release`
+
+        Raises:
+            TimeoutError: Si aucun navigateur ne s'est libéré à temps
+            RuntimeError: Si le pool est fermé
+        """
+        started = time.monotonic()
+        deadline = None if timeout is None else started + timeout
+
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Pool de navigateurs fermé")
+
+                if self._idle:
+                    pooled = self._idle.pop()
+                    self.stats.reuses += 1
+                    break
+
+                if self._total < self.size:
+                    self._total += 1  # Place réservée, création hors verrou
+                    pooled = None
+                    break
+
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"Aucun navigateur libre après {timeout}s")
+                self._condition.wait(remaining)
+
+            self.stats.wait_time += time.monotonic() - started
+
+        if pooled is None:
+            pooled = self._create()
+
+        pooled.leases += 1
+        with self._condition:
+            self.stats.leases += 1
+        return pooled
+
+    def release(self, pooled: PooledDriver, broken: bool = False):
+        """
+        Rend un navigateur au pool
+
+        Le navigateur est fermé au lieu d'être remis en service s'il est en
+        panne ou a atteint une limite de recyclage.
+
+        Args:
+            pooled: Navigateur emprunté
+            broken: Le scrape a constaté une panne du navigateur
+        """
+        reason = 'panne' if broken else self._recycle_reason(pooled)
+
+        with self._condition:
+            if reason is None and not self._closed:
+                self._idle.append(pooled)
+                self._condition.notify()
+                return
+
+            self._total -= 1
+            self._condition.notify()
+
+        if reason:
+            self.stats.recycled += 1
+            logger.info(f"♻️ Recyclage d'un navigateur ({reason}, {pooled.pages} pages)")
+        self._quit(pooled)
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None) -> Iterator[PooledDriver]:
+        """
+        Emprunte un navigateur le temps d'un bloc `with`
+
+        Une exception levée dans le bloc ne ferme pas le navigateur: sa
+        santé est vérifiée au retour.
+        """
+        pooled = self.acquire(timeout=timeout)
+        try:
+            yield pooled
+        finally:
+            self.release(pooled)
+
+    def _recycle_reason(self, pooled: PooledDriver) -> Optional[str]:
+        """Retourne la raison de recycler un navigateur (None = le garder)"""
+        if self.max_pages_per_driver is not None and pooled.pages >= self.max_pages_per_driver:
+            return f"{pooled.pages} pages"
+
+        if not self._is_alive(pooled.driver):
+            return 'ne répond plus'
+
+        if self.max_memory_mb is not None:
+            memory = driver_memory(pooled.driver)
+            if memory is not None and memory > self.max_memory_mb * 1024 * 1024:
+                return f"{memory / 1024 / 1024:.0f} Mo"
+
+        return None
+
+    @staticmethod
+    def _is_alive(driver: Any) -> bool:
+        """Vérifie que le navigateur répond encore"""
+        try:
+            driver.window_handles
+            return True
+        except Exception:
+            return False
+
+    def _create(self) -> PooledDriver:
+        """Démarre un navigateur (sa place dans le pool est déjà réservée)"""
+        try:
+            driver = self.driver_factory()
+        except BaseException:
+            with self._condition:
+                self._total -= 1
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            self.stats.created += 1
+        return PooledDriver(driver=driver)
+
+    @staticmethod
+    def _quit(pooled: PooledDriver):
+        try:
+            pooled.driver.quit()
+        except Exception as e:
+            logger.debug(f"Erreur à la fermeture du navigateur: {e}")
+
+    @property
+    def idle_count(self) -> int:
+        """Nombre de navigateurs chauds disponibles"""
+        with self._condition:
+            return len(self._idle)
+
+    def close(self):
+        """Ferme tous les navigateurs libres; les navigateurs prêtés seront fermés à leur retour"""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._total -= len(idle)
+            self._condition.notify_all()
+
+        for pooled in idle:
+            self._quit(pooled)
+        logger.info("Pool Chrome fermé")
+
+    def __enter__(self):
+        """Support context manager"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Cleanup context manager"""
+        self.close()
@@ -0,0 +1,275 @@
+"""
+Extraction des offres depuis le JSON embarqué des pages de résultats Indeed
+
+Les pages de recherche Indeed embarquent les données des cartes d'offres
+dans un script:
+
+    window.mosaic.providerData["mosaic-provider-jobcards"]={
+        "metaData": {"mosaicProviderJobCardsModel": {"results": [...]}}
+    };
+
+Plutôt que de construire l'arbre DOM et de parcourir chaque carte avec une
+série de sélecteurs de repli, on localise l'affectation par expression
+régulière sur le HTML brut et on décode l'objet avec `raw_decode` (le JSON
+est lu sur place, sans chercher la fin du script). Chaque résultat donne
+directement les champs d'une `JobOffer`, souvent plus complets que le DOM:
+extrait non tronqué, type de contrat, télétravail explicite.
+
+Si le payload est absent ou illisible, `parse_embedded_cards` retourne
+None et l'appelant repasse par le parser DOM (`fast_parser`).
+"""
+
+import html as html_lib
+import json
+import logging
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+from .identity import canonical_job_url
+
+logger = logging.getLogger(__name__)
+
+# Affectation du payload des cartes (guillemets simples ou doubles)
+_PAYLOAD_RE = re.compile(
+    r"""window\.mosaic\.providerData\[\s*["']mosaic-provider-jobcards["']\s*\]\s*=\s*"""
+)
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_SPACES_RE = re.compile(r'\s+')
+
+_DECODER = json.JSONDecoder()
+
+REMOTE_KEYWORDS = ['remote', 'télétravail', 'teletravail', 'distance']
+
+# Champs mesurés pour comparer la complétude des moteurs de parsing
+OFFER_FIELDS = (
+    'title', 'company', 'location', 'description', 'url',
+    'posted_date', 'salary', 'contract_type', 'remote'
+)
+
+
+def extract_jobcards_payload(html: str) -> Optional[Dict[str, Any]]:
+    """
+    Localise et décode le payload `mosaic-provider-jobcards`
+
+    Args:
+        html: HTML brut de la page
+
+    Returns:
+        Objet JSON décodé, ou None si absent ou illisible
+    """
+    if not html:
+        return None
+
+    match = _PAYLOAD_RE.search(html)
+    if match is None:
+        return None
+
+    try:
+        payload, _ = _DECODER.raw_decode(html, match.end())
+    except ValueError as e:
+        logger.debug(f"Payload JSON illisible: {e}")
+        return None
+
+    return payload if isinstance(payload, dict) else None
+
+
+def jobcards_results(payload: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+    """Liste `metaData.mosaicProviderJobCardsModel.results` du payload"""
+    model = (payload.get('metaData') or {}).get('mosaicProviderJobCardsModel') or {}
+    results = model.get('results')
+    return results if isinstance(results, list) else None
+
+
+def _strip_html(fragment: Optional[str]) -> str:
+    """Texte d'un fragment HTML (extrait d'offre), espaces normalisés"""
+    if not fragment:
+        return ''
+    text = html_lib.unescape(_TAG_RE.sub(' ', fragment))
+    return _SPACES_RE.sub(' ', text).strip()
+
+
+def _format_salary(result: Dict[str, Any]) -> Optional[str]:
+    """Salaire affiché, ou reconstruit depuis `extractedSalary`"""
+    snippet = result.get('salarySnippet') or {}
+    if snippet.get('text'):
+        return snippet['text']
+
+    extracted = result.get('extractedSalary') or {}
+    low, high = extracted.get('min'), extracted.get('max')
+    if not low and not high:
+        return None
+
+    amount = f"{low:g} - {high:g}" if low and high and low != high else f"{(low or high):g}"
+    currency = snippet.get('currency') or ''
+    period = extracted.get('type') or ''
+    return ' '.join(part for part in (amount, currency, period) if part)
+
+
+def _contract_type(result: Dict[str, Any]) -> Optional[str]:
+    """Type(s) de contrat: `jobTypes`, sinon l'attribut de taxonomie `job-types`"""
+    job_types = [t for t in result.get('jobTypes') or [] if isinstance(t, str)]
+    if not job_types:
+        for taxonomy in result.get('taxonomyAttributes') or []:
+            if taxonomy.get('label') == 'job-types':
+                job_types = [a.get('label') for a in taxonomy.get('attributes') or [] if a.get('label')]
+                break
+    return ', '.join(job_types) or None
+
+
+def _job_url(result: Dict[str, Any], base_url: str) -> Optional[str]:
+    """URL canonique de l'offre (`/viewjob?jk=`), ou lien fourni à défaut de clé"""
+    job_key = result.get('jobkey')
+    if job_key:
+        return f"{base_url}/viewjob?jk={job_key}"
+
+    link = result.get('viewJobLink') or result.get('link')
+    if not link:
+        return None
+    return canonical_job_url(f"{base_url}{link}" if link.startswith('/') else link)
+
+
+def result_to_fields(result: Dict[str, Any], base_url: str) -> Optional[Dict[str, Any]]:
+    """
+    Convertit un résultat du payload en champs de `JobOffer`
+
+    Args:
+        result: Élément de `mosaicProviderJobCardsModel.results`
+        base_url: Domaine Indeed du pays
+
+    Returns:
+        Champs de l'offre (sans `source`), ou None si titre ou URL manquent
+    """
+    title = _strip_html(result.get('displayTitle') or result.get('title'))
+    job_url = _job_url(result, base_url)
+    if not title or not job_url:
+        logger.debug("Résultat JSON sans titre ou URL, ignoré")
+        return None
+
+    location = result.get('formattedLocation') or result.get('jobLocationCity') or 'N/A'
+    description = _strip_html(result.get('snippet'))
+
+    remote_model = result.get('remoteWorkModel') or {}
+    remote = bool(result.get('remoteLocation')) or remote_model.get('type') in (
+        'REMOTE_ALWAYS', 'REMOTE_HYBRID'
+    )
+    if not remote:
+        text_to_check = (title + ' ' + description + ' ' + location).lower()
+        remote = any(keyword in text_to_check for keyword in REMOTE_KEYWORDS)
+
+    return {
+        'title': title,
+        'company': result.get('company') or result.get('companyName') or 'N/A',
+        'location': location,
+        'description': description,
+        'url': job_url,
+        'posted_date': result.get('formattedRelativeTime') or None,
+        'salary': _format_salary(result),
+        'contract_type': _contract_type(result),
+        'remote': remote
+    }
+
+
+def parse_embedded_cards(html: str, base_url: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    Extrait les offres du JSON embarqué d'une page de résultats
+
+    Args:
+        html: HTML brut de la page
+        base_url: Domaine Indeed du pays
+
+    Returns:
+        Champs de chaque offre valide, ou None si le payload est absent
+        (l'appelant doit alors utiliser le parser DOM)
+    """
+    payload = extract_jobcards_payload(html)
+    if payload is None:
+        return None
+
+    results = jobcards_results(payload)
+    if results is None:
+        logger.debug("Payload JSON sans liste de résultats")
+        return None
+
+    offers = []
+    for result in results:
+        if not isinstance(result, dict):
+            continue
+        try:
+            fields = result_to_fields(result, base_url)
+        except Exception as e:
+            logger.debug(f"Erreur conversion résultat JSON: {e}")
+            continue
+        if fields:
+            offers.append(fields)
+    return offers
+
+
+def field_completeness(offers: Iterable[Any]) -> Dict[str, float]:
+    """
+    Proportion d'offres dont chaque champ est renseigné
+
+    Un champ vide, "N/A" ou None compte comme absent; `remote` compte comme
+    renseigné s'il est vrai.
+
+    Args:
+        offers: JobOffer ou dictionnaires de champs
+
+    Returns:
+        {champ: ratio entre 0 et 1}
+    """
+    offers = [o if isinstance(o, dict) else vars(o) for o in offers]
+    if not offers:
+        return {name: 0.0 for name in OFFER_FIELDS}
+
+    return {
+        name: sum(1 for o in offers if o.get(name) not in (None, '', 'N/A', False)) / len(offers)
+        for name in OFFER_FIELDS
+    }
+
+
+# Benchmark: python -m src.modules.detection.embedded_json
+if __name__ == "__main__":
+    import time
+    from pathlib import Path
+
+    from .indeed_bypass import IndeedBypassScraper
+    from .jobboard_scraper import IndeedScraper
+    from .rate_limiter import RateLimiter
+
+    logging.basicConfig(level=logging.ERROR)
+
+    fixtures = Path(__file__).parent / 'tests' / 'fixtures'
+    runs = 50
+
+    print("=" * 80)
+    print("⏱️  BENCHMARK EXTRACTION INDEED (DOM vs JSON embarqué)")
+    print("=" * 80)
+
+    for fixture in sorted(fixtures.glob('indeed_search_*.html')):
+        html = fixture.read_text(encoding='utf-8')
+        embedded = extract_jobcards_payload(html) is not None
+        print(f"\n📄 {fixture.name} ({len(html) / 1024:.1f} Ko, "
+              f"JSON embarqué: {'oui' if embedded else 'non -> repli DOM'})")
+
+        for label, scraper_class, method in (
+            ('IndeedScraper', IndeedScraper, '_parse_search_page'),
+            ('IndeedBypassScraper', IndeedBypassScraper, '_parse_page'),
+        ):
+            print(f"   {label}")
+            for name in scraper_class.PARSERS:
+                parse = getattr(scraper_class(parser=name, rate_limiter=RateLimiter()), method)
+
+                start = time.process_time()
+                for _ in range(runs):
+                    offers = parse(html)
+                cpu_ms = (time.process_time() - start) / runs * 1000
+
+                completeness = field_completeness(offers)
+                average = sum(completeness.values()) / len(completeness)
+                description = sum(len(o.description) for o in offers) / max(len(offers), 1)
+                print(f"     {name:<5}: {cpu_ms:6.2f} ms CPU/page, {len(offers):>2} offres, "
+                      f"complétude {average:.0%}, description {description:.0f} car.")
+                print("            " + ", ".join(
+                    f"{field} {ratio:.0%}" for field, ratio in completeness.items()
+                ))
@@ -0,0 +1,363 @@
+"""
+Parser rapide des pages de résultats Indeed, basé directement sur lxml
+
+Les parsers BeautifulSoup construisent un arbre complet puis lancent une
+dizaine de `find` par carte, dont plusieurs avec des lambdas Python évaluées
+sur chaque élément. Ici, l'arbre lxml natif est interrogé avec des XPath
+précompilés, évalués en C.
+
+Les deux fonctions de parsing reproduisent exactement les règles
+d'extraction (sélecteurs, fallbacks, nettoyage des URLs) de:
+- `IndeedScraper._parse_job_card` -> `parse_search_cards`
+- `IndeedBypassScraper._parse_job_card` -> `parse_bypass_cards`
+
+et retournent les champs de chaque offre sous forme de dictionnaire.
+L'équivalence est vérifiée sur des pages sauvegardées
+(tests/test_fast_parser.py).
+"""
+
+import logging
+from typing import Any, Dict, Iterator, List, Optional
+from urllib.parse import urljoin
+
+from lxml import etree
+
+from .identity import canonical_job_url
+
+logger = logging.getLogger(__name__)
+
+# Éléments dont le contenu n'est pas du texte visible (ignorés par get_text)
+_NON_TEXT_TAGS = frozenset(['script', 'style', 'template'])
+
+_HTML_PARSER = etree.HTMLParser()
+
+
+def _has_class(name: str) -> str:
+    """Prédicat XPath équivalent à `class_=name` de BeautifulSoup"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _class_contains(fragment: str) -> str:
+    """Prédicat XPath équivalent à `lambda x: x and fragment in x.lower()`"""
+    return (
+        "contains(translate(@class, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', "
+        f"'abcdefghijklmnopqrstuvwxyz'), '{fragment}')"
+    )
+
+
+def _first(expression: str) -> etree.XPath:
+    """XPath précompilé qui retourne le premier élément en ordre du document"""
+    return etree.XPath(f"({expression})[1]")
+
+
+# Cartes d'offres
+CARDS = etree.XPath(f"//div[{_has_class('job_seen_beacon')}]")
+CARDS_FALLBACK = etree.XPath(f"//td[{_has_class('resultContent')}]")
+
+# Sélecteurs relatifs à une carte
+TITLE_H2 = _first(f".//h2[{_has_class('jobTitle')}]")
+TITLE_LINK = _first(f".//a[{_has_class('jcs-JobTitle')}]")
+FIRST_LINK = _first(".//a")
+FIRST_SPAN = _first(".//span")
+FIRST_LINK_WITH_HREF = _first(".//a[@href]")
+COMPANY = _first(f".//span[{_has_class('companyName')}]")
+COMPANY_TESTID = _first(".//span[@data-testid='company-name']")
+LOCATION = _first(f".//div[{_has_class('companyLocation')}]")
+LOCATION_TESTID = _first(".//div[@data-testid='text-location']")
+SNIPPET = _first(f".//div[{_has_class('job-snippet')}]")
+SNIPPET_ANY = _first(f".//div[{_class_contains('snippet')}]")
+SALARY = _first(f".//div[{_has_class('salary-snippet')}]")
+SALARY_ANY = _first(f".//div[{_class_contains('salary')}]")
+DATE = _first(f".//span[{_has_class('date')}]")
+DATE_ANY = _first(f".//span[{_class_contains('date')}]")
+
+REMOTE_KEYWORDS = ['remote', 'télétravail', 'teletravail', 'distance']
+
+
+def _iter_strings(element) -> Iterator[str]:
+    """Chaînes de texte d'un sous-arbre, sans commentaires ni scripts"""
+    if element.tag not in _NON_TEXT_TAGS and element.text:
+        yield element.text
+    for child in element:
+        # Les commentaires et instructions n'ont pas de tag de type str
+        if isinstance(child.tag, str):
+            yield from _iter_strings(child)
+        if child.tail:
+            yield child.tail
+
+
+def _join_stripped(strings) -> str:
+    """Concatène des chaînes nettoyées (équivalent de get_text(strip=True))"""
+    return ''.join(s for s in (string.strip() for string in strings) if s)
+
+
+def text_of(element) -> str:
+    """Texte d'un élément, équivalent de `get_text(strip=True)`"""
+    return _join_stripped(_iter_strings(element))
+
+
+def _iter_strings_flattening_li(element) -> Iterator[str]:
+    """
+    Chaînes d'un sous-arbre où chaque <li> (le plus externe) forme une seule
+    chaîne suivie d'un espace, comme après `li.replace_with(li.get_text() + ' ')`
+    """
+    if element.tag not in _NON_TEXT_TAGS and element.text:
+        yield element.text
+    for child in element:
+        if isinstance(child.tag, str):
+            if child.tag == 'li':
+                yield ''.join(_iter_strings(child)) + ' '
+            else:
+                yield from _iter_strings_flattening_li(child)
+        if child.tail:
+            yield child.tail
+
+
+def _first_or_none(xpath: etree.XPath, element):
+    result = xpath(element)
+    return result[0] if result else None
+
+
+def _find_cards(html: str) -> List[Any]:
+    """Parse le HTML et retourne les cartes d'offres"""
+    if not html or not html.strip():
+        return []
+
+    root = etree.fromstring(html, _HTML_PARSER)
+    if root is None:
+        return []
+
+    return CARDS(root) or CARDS_FALLBACK(root)
+
+
+def parse_search_cards(html: str, base_url: str) -> List[Dict[str, Any]]:
+    """
+    Parse une page de résultats avec les règles de `IndeedScraper`
+
+    Args:
+        html: HTML de la page
+        base_url: URL de base pour résoudre les liens relatifs
+
+    Returns:
+        Champs de chaque offre valide (title, company, location,
+        description, url, posted_date, salary, remote)
+    """
+    offers = []
+    for card in _find_cards(html):
+        try:
+            fields = _parse_search_card(card, base_url)
+        except Exception as e:
+            logger.error(f"Error parsing job card: {e}")
+            continue
+        if fields:
+            offers.append(fields)
+    return offers
+
+
+def _parse_search_card(card, base_url: str) -> Optional[Dict[str, Any]]:
+    """Équivalent lxml de `IndeedScraper._parse_job_card`"""
+    title_elem = _first_or_none(TITLE_H2, card)
+    if title_elem is None:
+        title_elem = _first_or_none(TITLE_LINK, card)
+    title = text_of(title_elem) if title_elem is not None else None
+
+    link_elem = _first_or_none(FIRST_LINK, title_elem) if title_elem is not None else None
+    if link_elem is None:
+        if title_elem is None:
+            return None  # IndeedScraper échoue aussi dans ce cas
+        if title_elem.tag == 'a':
+            link_elem = title_elem
+    if link_elem is not None and link_elem.get('href') is None:
+        return None
+    job_url = urljoin(base_url, link_elem.get('href')) if link_elem is not None else None
+
+    company_elem = _first_or_none(COMPANY, card)
+    company = text_of(company_elem) if company_elem is not None else "N/A"
+
+    location_elem = _first_or_none(LOCATION, card)
+    location = text_of(location_elem) if location_elem is not None else "N/A"
+
+    description_elem = _first_or_none(SNIPPET, card)
+    description = text_of(description_elem) if description_elem is not None else ""
+
+    salary_elem = _first_or_none(SALARY, card)
+    salary = text_of(salary_elem) if salary_elem is not None else None
+
+    date_elem = _first_or_none(DATE, card)
+    posted_date = text_of(date_elem) if date_elem is not None else None
+
+    remote = 'remote' in description.lower() or 'télétravail' in description.lower()
+
+    if not title or not job_url:
+        logger.warning("Missing required fields (title or URL)")
+        return None
+
+    return {
+        'title': title,
+        'company': company,
+        'location': location,
+        'description': description,
+        'url': job_url,
+        'posted_date': posted_date,
+        'salary': salary,
+        'remote': remote
+    }
+
+
+def parse_bypass_cards(html: str, base_url: str) -> List[Dict[str, Any]]:
+    """
+    Parse une page de résultats avec les règles de `IndeedBypassScraper`
+
+    Args:
+        html: HTML de la page (page_source du navigateur)
+        base_url: Domaine Indeed du pays
+
+    Returns:
+        Champs de chaque offre valide (title, company, location,
+        description non tronquée, url, posted_date, salary, remote)
+    """
+    offers = []
+    for card in _find_cards(html):
+        try:
+            fields = _parse_bypass_card(card, base_url)
+        except Exception as e:
+            logger.debug(f"Erreur parsing carte: {e}")
+            continue
+        if fields:
+            offers.append(fields)
+    return offers
+
+
+def _clean_href(href: str, base_url: str) -> Optional[str]:
+    """Nettoyage d'URL de `IndeedBypassScraper` (seul `jk` est conservé)"""
+    if href.startswith('/'):
+        return canonical_job_url(f"{base_url}{href}")
+    if href.startswith('http'):
+        return canonical_job_url(href)
+    return None
+
+
+def _parse_bypass_card(card, base_url: str) -> Optional[Dict[str, Any]]:
+    """Équivalent lxml de `IndeedBypassScraper._parse_job_card`"""
+    # Titre
+    title = None
+    title_h2 = _first_or_none(TITLE_H2, card)
+    if title_h2 is not None:
+        inner = _first_or_none(FIRST_LINK, title_h2)
+        if inner is None:
+            inner = _first_or_none(FIRST_SPAN, title_h2)
+        title = text_of(inner if inner is not None else title_h2)
+
+    if not title:
+        title_elem = _first_or_none(TITLE_LINK, card)
+        title = text_of(title_elem) if title_elem is not None else None
+
+    # URL
+    job_url = None
+    if title_h2 is not None:
+        link = _first_or_none(FIRST_LINK, title_h2)
+        if link is not None and link.get('href'):
+            job_url = _clean_href(link.get('href'), base_url)
+
+    if not job_url:
+        link = _first_or_none(FIRST_LINK_WITH_HREF, card)
+        if link is not None:
+            href = link.get('href')
+            if '/rc/clk' in href or '/viewjob' in href or '/company' in href:
+                job_url = canonical_job_url(f"{base_url}{href}" if href.startswith('/') else href)
+
+    # Entreprise
+    company = "N/A"
+    company_elem = _first_or_none(COMPANY_TESTID, card)
+    if company_elem is None:
+        company_elem = _first_or_none(COMPANY, card)
+    if company_elem is not None:
+        company = text_of(company_elem)
+
+    # Localisation
+    location = "N/A"
+    location_elem = _first_or_none(LOCATION_TESTID, card)
+    if location_elem is None:
+        location_elem = _first_or_none(LOCATION, card)
+    if location_elem is not None:
+        location = text_of(location_elem)
+
+    # Description (les <li> sont aplatis comme dans le parser BeautifulSoup)
+    description = ""
+    desc_elem = _first_or_none(SNIPPET, card)
+    if desc_elem is None:
+        desc_elem = _first_or_none(SNIPPET_ANY, card)
+    if desc_elem is not None:
+        description = _join_stripped(_iter_strings_flattening_li(desc_elem))
+
+    # Salaire
+    salary = None
+    salary_elem = _first_or_none(SALARY, card)
+    if salary_elem is None:
+        salary_elem = _first_or_none(SALARY_ANY, card)
+    if salary_elem is not None:
+        salary = text_of(salary_elem)
+
+    # Date
+    posted_date = None
+    date_elem = _first_or_none(DATE, card)
+    if date_elem is None:
+        date_elem = _first_or_none(DATE_ANY, card)
+    if date_elem is not None:
+        posted_date = text_of(date_elem)
+
+    if not title:
+        logger.debug("Carte sans titre, ignorée")
+        return None
+
+    if not job_url:
+        logger.debug(f"Pas d'URL pour: {title}, ignorée")
+        return None
+
+    text_to_check = (title + ' ' + description + ' ' + location).lower()
+    remote = any(keyword in text_to_check for keyword in REMOTE_KEYWORDS)
+
+    return {
+        'title': title,
+        'company': company,
+        'location': location,
+        'description': description,
+        'url': job_url,
+        'posted_date': posted_date,
+        'salary': salary,
+        'remote': remote
+    }
+
+
+# Benchmark: python -m src.modules.detection.fast_parser
+if __name__ == "__main__":
+    import timeit
+    from pathlib import Path
+
+    from .jobboard_scraper import IndeedScraper
+    from .rate_limiter import RateLimiter
+
+    fixtures = Path(__file__).parent / 'tests' / 'fixtures'
+    runs = 50
+
+    print("=" * 80)
+    print("⏱️  BENCHMARK PARSERS INDEED (BeautifulSoup vs lxml)")
+    print("=" * 80)
+
+    for fixture in sorted(fixtures.glob('indeed_search_*.html')):
+        html = fixture.read_text(encoding='utf-8')
+        scrapers = {
+            name: IndeedScraper(parser=name, rate_limiter=RateLimiter())
+            for name in IndeedScraper.PARSERS
+        }
+
+        timings = {
+            name: timeit.timeit(lambda: scraper._parse_search_page(html), number=runs) / runs
+            for name, scraper in scrapers.items()
+        }
+        offers = len(scrapers['lxml']._parse_search_page(html))
+
+        print(f"\n📄 {fixture.name} ({len(html) / 1024:.1f} Ko, {offers} offres)")
+        for name, seconds in timings.items():
+            print(f"   {name:<5}: {seconds * 1000:.2f} ms/page")
+        print(f"   Accélération: x{timings['bs4'] / timings['lxml']:.1f}")
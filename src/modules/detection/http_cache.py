@@ -0,0 +1,517 @@
+"""
+Cache HTTP sur disque avec requêtes conditionnelles
+
+Les scrapes planifiés (toutes les 2h) retéléchargent souvent des pages
+identiques. Ce cache se place sous `BaseJobBoardScraper._fetch_page` et
+`VDABScraper.search`:
+
+- entrée fraîche (âge < TTL): servie sans aucun aller-retour réseau
+- entrée expirée avec ETag / Last-Modified: GET conditionnel, un 304
+  revalide l'entrée sans retransférer le corps
+- sinon: requête normale, réponse 200 stockée (une réponse `stream=True`
+  est compressée au fil de sa lecture et stockée une fois lue en entier)
+
+Les chemins asynchrones (`_afetch_page`, `aget_job_details_many`) passent
+par `afetch`, qui fait les accès SQLite hors de la boucle d'événements.
+
+Les TTL par type de contenu viennent du bloc `cache_ttl` de
+config/settings/integrations.json (`scraping_results` pour les pages de
+recherche, `job_offers` pour les pages d'offre); chaque job board peut les
+surcharger dans `job_boards.<board>.cache_ttl`. La taille totale est
+bornée: les entrées les moins récemment utilisées sont évincées.
+
+Le cache est partagé par tous les scrapers du processus (`get_http_cache`)
+et configuré par le bloc `http_cache` (`enabled`, `path`, `max_size_mb`).
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
+
+import httpx
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from .cache import DEFAULT_CACHE_DIR
+from .recording import FixtureStore
+from .settings import load_integrations_config
+
+logger = logging.getLogger(__name__)
+
+# TTL par défaut si la configuration est absente (secondes)
+DEFAULT_TTLS = {
+    'scraping_results': 7200,
+    'job_offers': 86400
+}
+
+
+@dataclass
+class HTTPCacheStats:
+    """Compteurs d'utilisation du cache"""
+    hits: int = 0             # Servies sans réseau
+    misses: int = 0           # Téléchargement complet
+    revalidations: int = 0    # 304 Not Modified
+    stores: int = 0
+    evictions: int = 0
+    bytes_saved: int = 0      # Octets de corps non retransférés
+
+    def to_dict(self) -> Dict[str, int]:
+        """Convertit les compteurs en dictionnaire"""
+        return asdict(self)
+
+
+class HTTPCache:
+    """
+    Cache HTTP persistant (SQLite), avec revalidation et éviction LRU
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = DEFAULT_CACHE_DIR / 'http_cache.db',
+        max_size_bytes: int = 100 * 1024 * 1024,
+        ttls: Optional[Dict[str, float]] = None,
+        source_ttls: Optional[Dict[str, Dict[str, float]]] = None
+    ):
+        """
+        Initialise le cache
+
+        Args:
+            path: Chemin du fichier SQLite
+            max_size_bytes: Taille maximale des corps stockés (compressés)
+            ttls: TTL en secondes par type de contenu (clés de `cache_ttl`)
+            source_ttls: TTL propres à une source, {source: {type: TTL}}
+                (prioritaires sur `ttls`)
+        """
+        self.path = str(path)
+        self.max_size_bytes = max_size_bytes
+        self.ttls = dict(DEFAULT_TTLS)
+        self.ttls.update(ttls or {})
+        self.source_ttls = {
+            source.lower(): dict(values) for source, values in (source_ttls or {}).items()
+        }
+        self.stats = HTTPCacheStats()
+
+        if self.path != ':memory:':
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        # Compteurs sous leur propre verrou (`_evict` compte avec `_lock` tenu)
+        self._stats_lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, status INTEGER NOT NULL, headers TEXT NOT NULL, "
+            "body BLOB NOT NULL, etag TEXT, last_modified TEXT, "
+            "stored_at REAL NOT NULL, last_access REAL NOT NULL, size INTEGER NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access)"
+        )
+        self._conn.commit()
+
+    @classmethod
+    def from_config(
+        cls,
+        config: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> 'HTTPCache':
+        """
+        Crée un cache depuis integrations.json
+
+        TTL du bloc `cache_ttl`, surchargés par `job_boards.<board>.cache_ttl`;
+        emplacement et taille du bloc `http_cache`.
+
+        Args:
+            config: Configuration déjà chargée (défaut: integrations.json)
+            **kwargs: Autres options de HTTPCache
+        """
+        if config is None:
+            config = load_integrations_config()
+
+        section = config.get('http_cache') or {}
+        options = {
+            'ttls': config.get('redis', {}).get('cache_ttl', {}),
+            'source_ttls': {
+                name: board['cache_ttl']
+                for name, board in config.get('job_boards', {}).items()
+                if isinstance(board, dict) and board.get('cache_ttl')
+            },
+        }
+        if section.get('path'):
+            options['path'] = section['path']
+        if section.get('max_size_mb'):
+            options['max_size_bytes'] = int(float(section['max_size_mb']) * 1024 * 1024)
+        options.update(kwargs)
+        return cls(**options)
+
+    @staticmethod
+    def cache_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Clé de cache: URL complète avec les paramètres encodés"""
+        return requests.Request('GET', url, params=params).prepare().url
+
+    def ttl_for(self, kind: str, source: Optional[str] = None) -> float:
+        """TTL d'un type de contenu pour une source (défaut: scraping_results)"""
+        overrides = self.source_ttls.get(source.lower(), {}) if source else {}
+        if kind in overrides:
+            return overrides[kind]
+        return self.ttls.get(kind, self.ttls['scraping_results'])
+
+    def fetch(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        send: Callable[[Dict[str, str]], requests.Response],
+        kind: str = 'scraping_results',
+        source: Optional[str] = None
+    ) -> requests.Response:
+        """
+        Récupère une ressource en passant par le cache
+
+        Args:
+            url: URL à récupérer
+            params: Paramètres de requête
+            send: Fonction qui exécute réellement la requête avec les headers
+                conditionnels fournis (rate limiting, retry, etc. inclus)
+            kind: Type de contenu, détermine le TTL
+            source: Source de la ressource ('vdab', 'indeed'...), pour ses TTL
+
+        Returns:
+            Response requests (attribut `from_cache` à True si servie
+            depuis le cache, y compris après un 304)
+        """
+        key = self.cache_key(url, params)
+        entry = self._load(key)
+        now = time.time()
+
+        if self._is_fresh(entry, now, kind, source):
+            self._hit(key, entry, now)
+            return self._build_response(key, entry)
+
+        response = send(self._conditional_headers(entry))
+        return self._complete(key, entry, response, now, self._build_response)
+
+    async def afetch(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        send: Callable[[Dict[str, str]], Awaitable[httpx.Response]],
+        kind: str = 'scraping_results',
+        source: Optional[str] = None
+    ) -> httpx.Response:
+        """
+        Version asynchrone de `fetch` (réponses httpx)
+
+        Les accès SQLite s'exécutent dans un thread: la boucle continue de
+        servir les autres requêtes pendant les lectures et écritures.
+
+        Args:
+            url: URL à récupérer
+            params: Paramètres de requête
+            send: Coroutine qui exécute la requête avec les headers
+                conditionnels fournis (un 304 ne doit pas lever d'erreur)
+            kind: Type de contenu, détermine le TTL
+            source: Source de la ressource, pour ses TTL
+
+        Returns:
+            Response httpx (attribut `from_cache` comme pour `fetch`)
+        """
+        key = self.cache_key(url, params)
+        entry = await asyncio.to_thread(self._load, key)
+        now = time.time()
+
+        if self._is_fresh(entry, now, kind, source):
+            await asyncio.to_thread(self._hit, key, entry, now)
+            return self._build_async_response(key, entry)
+
+        response = await send(self._conditional_headers(entry))
+        return await asyncio.to_thread(
+            self._complete, key, entry, response, now, self._build_async_response
+        )
+
+    def _is_fresh(
+        self,
+        entry: Optional[Dict[str, Any]],
+        now: float,
+        kind: str,
+        source: Optional[str]
+    ) -> bool:
+        return entry is not None and now - entry['stored_at'] < self.ttl_for(kind, source)
+
+    @staticmethod
+    def _conditional_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Headers du GET conditionnel (vides sans entrée ni validateur)"""
+        headers = {}
+        if entry and entry['etag']:
+            headers['If-None-Match'] = entry['etag']
+        if entry and entry['last_modified']:
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def _hit(self, key: str, entry: Dict[str, Any], now: float):
+        self._count(hits=1, bytes_saved=len(entry['body']))
+        self._touch(key, now)
+        logger.debug(f"HTTP cache hit: {key}")
+
+    def _complete(
+        self,
+        key: str,
+        entry: Optional[Dict[str, Any]],
+        response: Any,
+        now: float,
+        build: Callable[[str, Dict[str, Any]], Any]
+    ) -> Any:
+        """Traite la réponse du réseau: revalidation (304) ou stockage (200)"""
+        if response.status_code == 304 and entry:
+            self._count(revalidations=1, bytes_saved=len(entry['body']))
+            self._revalidate(key, response, now)
+            logger.debug(f"HTTP cache revalidated: {key}")
+            return build(key, entry)
+
+        self._count(misses=1)
+        if response.status_code == 200 and self._is_storable(response):
+            if self._is_streamed(response):
+                self._store_when_read(key, response, now)
+            else:
+                self._store(key, response, now)
+
+        response.from_cache = False
+        return response
+
+    def _count(self, **increments: int):
+        """Incrémente les compteurs (appelé depuis plusieurs threads)"""
+        with self._stats_lock:
+            for name, value in increments.items():
+                setattr(self.stats, name, getattr(self.stats, name) + value)
+
+    @staticmethod
+    def _is_storable(response: requests.Response) -> bool:
+        """Respecte Cache-Control: no-store"""
+        cache_control = response.headers.get('Cache-Control', '').lower()
+        return 'no-store' not in cache_control
+
+    @staticmethod
+    def _is_streamed(response: Any) -> bool:
+        """Réponse requests `stream=True` dont le corps n'est pas encore lu"""
+        return isinstance(response, requests.Response) and response._content is False
+
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, headers, body, etag, last_modified, stored_at "
+                "FROM responses WHERE key = ?",
+                (key,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        status, headers, body, etag, last_modified, stored_at = row
+        return {
+            'status': status,
+            'headers': json.loads(headers),
+            'body': zlib.decompress(body),
+            'etag': etag,
+            'last_modified': last_modified,
+            'stored_at': stored_at
+        }
+
+    def _store(self, key: str, response: Any, now: float):
+        self._insert(key, response, zlib.compress(response.content), now)
+
+    def _store_when_read(self, key: str, response: requests.Response, now: float):
+        """
+        Stocke une réponse lue en flux, une fois son corps lu en entier
+
+        Les morceaux sont compressés au passage dans `iter_content` (que
+        `content` utilise aussi): seule la version compressée du corps est
+        gardée. Une lecture interrompue (arrêt anticipé, erreur) ne stocke rien.
+        """
+        iter_content = response.iter_content
+
+        def tee(chunk_size: int = 1, decode_unicode: bool = False):
+            if decode_unicode:
+                yield from iter_content(chunk_size, decode_unicode)
+                return
+            compressor = zlib.compressobj()
+            parts = []
+            for chunk in iter_content(chunk_size):
+                parts.append(compressor.compress(chunk))
+                yield chunk
+            parts.append(compressor.flush())
+            self._insert(key, response, b''.join(parts), now)
+
+        response.iter_content = tee
+
+    def _insert(self, key: str, response: Any, body: bytes, now: float):
+        """Enregistre un corps déjà compressé"""
+        headers = {
+            k: v for k, v in response.headers.items()
+            # Le corps est stocké décodé
+            if k.lower() not in ('content-encoding', 'content-length', 'transfer-encoding')
+        }
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, status, headers, body, etag, last_modified, stored_at, last_access, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key, response.status_code, json.dumps(headers), body,
+                    response.headers.get('ETag'), response.headers.get('Last-Modified'),
+                    now, now, len(body)
+                )
+            )
+            self._conn.commit()
+            self._count(stores=1)
+            self._evict()
+
+    def _touch(self, key: str, now: float):
+        with self._lock:
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+
+    def _revalidate(self, key: str, response: Any, now: float):
+        """Remet l'entrée à neuf après un 304 (nouveaux validateurs éventuels)"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET stored_at = ?, last_access = ?, "
+                "etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified) "
+                "WHERE key = ?",
+                (now, now, response.headers.get('ETag'), response.headers.get('Last-Modified'), key)
+            )
+            self._conn.commit()
+
+    def _evict(self):
+        """Évince les entrées les moins récemment utilisées (verrou tenu)"""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_size_bytes:
+            return
+
+        to_delete = []
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_access ASC"
+        ):
+            if total <= self.max_size_bytes:
+                break
+            to_delete.append((key,))
+            total -= size
+
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", to_delete)
+        self._conn.commit()
+        self._count(evictions=len(to_delete))
+        logger.debug(f"HTTP cache: {len(to_delete)} entrées évincées")
+
+    @staticmethod
+    def _build_response(url: str, entry: Dict[str, Any]) -> requests.Response:
+        """Reconstruit une Response requests à partir d'une entrée"""
+        response = requests.Response()
+        response.status_code = entry['status']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response._content = entry['body']
+        response._content_consumed = True
+        response.url = url
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.from_cache = True
+        return response
+
+    @staticmethod
+    def _build_async_response(url: str, entry: Dict[str, Any]) -> httpx.Response:
+        """Reconstruit une Response httpx à partir d'une entrée"""
+        response = httpx.Response(
+            entry['status'],
+            headers=entry['headers'],
+            content=entry['body'],
+            request=httpx.Request('GET', url)
+        )
+        response.from_cache = True
+        return response
+
+    @property
+    def size_bytes(self) -> int:
+        """Taille totale des corps stockés (compressés)"""
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def clear(self):
+        """Vide le cache"""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self):
+        """Ferme la connexion SQLite"""
+        with self._lock:
+            self._conn.close()
+
+
+_http_cache: Optional[HTTPCache] = None
+_http_cache_loaded = False
+_http_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> Optional[HTTPCache]:
+    """
+    Retourne le cache HTTP partagé du processus (créé depuis la config)
+
+    Returns:
+        Le cache, ou None si le bloc `http_cache` le désactive
+    """
+    global _http_cache, _http_cache_loaded
+    with _http_cache_lock:
+        if not _http_cache_loaded:
+            config = load_integrations_config()
+            if (config.get('http_cache') or {}).get('enabled', False):
+                _http_cache = HTTPCache.from_config(config)
+            _http_cache_loaded = True
+        return _http_cache
+
+
+def set_http_cache(cache: Optional[HTTPCache]):
+    """
+    Remplace le cache HTTP partagé du processus
+
+    Args:
+        cache: Nouveau cache (None = pas de cache HTTP)
+    """
+    global _http_cache, _http_cache_loaded
+    with _http_cache_lock:
+        _http_cache = cache
+        _http_cache_loaded = True
+
+
+def reset_http_cache():
+    """Oublie le cache partagé: il sera recréé depuis la config au prochain appel"""
+    global _http_cache, _http_cache_loaded
+    with _http_cache_lock:
+        _http_cache = None
+        _http_cache_loaded = False
+
+
+def default_http_cache(
+    http_cache: Union[HTTPCache, bool, None],
+    fixtures: Optional[FixtureStore] = None
+) -> Optional[HTTPCache]:
+    """
+    Cache HTTP d'un scraper
+
+    Args:
+        http_cache: Cache explicite, False pour aucun cache, None pour le
+            cache partagé du processus
+        fixtures: Fixtures du scraper; elles servent ou enregistrent les
+            réponses telles quelles, le cache partagé n'est donc pas utilisé
+    """
+    if http_cache is False:
+        return None
+    if http_cache is not None:
+        return http_cache
+    if fixtures is not None:
+        return None
+    return get_http_cache()
@@ -0,0 +1,187 @@
+"""
+Identité des offres d'emploi
+
+Une même offre peut apparaître sous plusieurs URLs (paramètres de tracking,
+lien de redirection `/rc/clk` d'Indeed, etc.). Ce module fournit une forme
+canonique servant de clé aux caches, et un identifiant stable dérivé de
+cette clé (`stable_offer_id`), le même d'un run à l'autre.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import shutil
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+from urllib.parse import parse_qs, urlsplit, urlunsplit
+
+logger = logging.getLogger(__name__)
+
+
+def canonical_job_url(url: str) -> str:
+    """
+    Retourne la forme canonique de l'URL d'une offre
+
+    - Indeed: `https://<domaine>/viewjob?jk=<clé>` (l'identifiant `jk`
+      est le seul paramètre significatif)
+    - Autres sources: schéma et hôte en minuscules, sans query ni fragment,
+      sans slash final
+
+    Args:
+        url: URL de l'offre
+
+    Returns:
+        URL canonique
+    """
+    parts = urlsplit(url.strip())
+    scheme = (parts.scheme or 'https').lower()
+    host = parts.netloc.lower()
+
+    if 'indeed.' in host:
+        job_key = parse_qs(parts.query).get('jk')
+        if job_key:
+            return f"{scheme}://{host}/viewjob?jk={job_key[0]}"
+
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((scheme, host, path, '', ''))
+
+
+# Identifiants stables: "<source>-<16 hex>" (les anciens, "<source>_<hash()>",
+# changeaient à chaque processus: voir `migrate_offers`)
+_STABLE_ID = re.compile(r'^[a-z0-9]+-[0-9a-f]{16}$')
+
+
+def stable_offer_id(source: str, url: Optional[str] = None, natural_key: Optional[str] = None) -> str:
+    """
+    Identifiant d'offre déterministe, identique d'un processus à l'autre
+
+    L'empreinte (blake2b, 64 bits) porte sur la clé naturelle de la source
+    si elle en a une (numéro de vacature VDAB), sinon sur l'URL canonique
+    (celle des caches et des offres déjà vues).
+
+    Args:
+        source: Préfixe de la source ('vdab', 'indeed')
+        url: URL de l'offre
+        natural_key: Identifiant propre à la source
+
+    Returns:
+        Identifiant "<source>-<16 hex>"
+
+    Raises:
+        ValueError: Si ni URL ni clé naturelle ne sont fournies
+    """
+    if natural_key:
+        key = f"{source}:{natural_key}"
+    elif url:
+        key = canonical_job_url(url)
+    else:
+        raise ValueError("URL ou clé naturelle requise pour identifier une offre")
+
+    return f"{source}-{hashlib.blake2b(key.encode('utf-8'), digest_size=8).hexdigest()}"
+
+
+def is_stable_offer_id(offer_id: str) -> bool:
+    """True si l'identifiant suit le schéma de `stable_offer_id`"""
+    return bool(_STABLE_ID.match(offer_id or ''))
+
+
+def migrate_offer_id(offer: Dict[str, Any]) -> str:
+    """
+    Nouvel identifiant d'une offre exportée avec un ancien identifiant
+
+    - "vdab_<numéro>": le numéro de vacature est la clé naturelle
+    - "<source>_<hash()>": l'empreinte n'est pas reproductible, l'URL
+      de l'offre est utilisée
+
+    Returns:
+        Identifiant stable (inchangé s'il l'est déjà)
+
+    Raises:
+        ValueError: Si l'ancien identifiant n'est pas reproductible et que
+            l'offre n'a pas d'URL
+    """
+    offer_id = offer.get('id') or ''
+    if is_stable_offer_id(offer_id):
+        return offer_id
+
+    source, _, legacy_key = offer_id.partition('_')
+    source = source.lower() or (offer.get('source') or '').split()[0].lower()
+    if source == 'vdab' and legacy_key:
+        return stable_offer_id('vdab', natural_key=legacy_key)
+    return stable_offer_id(source, url=offer.get('url'))
+
+
+def migrate_offers(
+    offers: Iterable[Dict[str, Any]],
+    skipped: Optional[List[Dict[str, Any]]] = None
+) -> Dict[str, str]:
+    """
+    Réécrit en place les identifiants d'offres exportées (`to_dict()`)
+
+    L'ancien identifiant est conservé dans `legacy_id`. Idempotent: les
+    offres déjà migrées sont laissées telles quelles. Une offre impossible
+    à identifier (ancien identifiant haché, sans URL) est gardée telle
+    quelle et signalée, sans interrompre la migration des autres.
+
+    Args:
+        offers: Offres à migrer
+        skipped: Reçoit les offres laissées avec leur ancien identifiant
+
+    Returns:
+        Correspondance ancien -> nouvel identifiant
+    """
+    mapping = {}
+    for offer in offers:
+        try:
+            new_id = migrate_offer_id(offer)
+        except ValueError:
+            logger.warning(f"⚠️ Offre sans URL, identifiant conservé: {offer.get('id')}")
+            if skipped is not None:
+                skipped.append(offer)
+            continue
+        if new_id != offer.get('id'):
+            mapping[offer.get('id')] = new_id
+            offer['legacy_id'] = offer.get('id')
+            offer['id'] = new_id
+    return mapping
+
+
+def migrate_export_file(
+    path: Union[str, Path],
+    backup: bool = True,
+    skipped: Optional[List[Dict[str, Any]]] = None
+) -> Dict[str, str]:
+    """
+    Migre un export JSON (`{'offers': [...]}` ou liste d'offres)
+
+    Args:
+        path: Fichier à réécrire
+        backup: Garder une copie `<fichier>.bak` de l'original
+        skipped: Reçoit les offres non migrées (voir `migrate_offers`)
+
+    Returns:
+        Correspondance ancien -> nouvel identifiant
+    """
+    path = Path(path)
+    data = json.loads(path.read_text(encoding='utf-8'))
+    offers = data.get('offers', []) if isinstance(data, dict) else data
+
+    mapping = migrate_offers(offers, skipped)
+    if mapping:
+        if backup:
+            shutil.copyfile(path, path.with_name(path.name + '.bak'))
+        path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding='utf-8')
+    return mapping
+
+
+# Migration des exports: python -m src.modules.detection.identity results/belgium_jobs.json
+if __name__ == "__main__":
+    import sys
+
+    for export in sys.argv[1:] or ['results/belgium_jobs.json']:
+        unidentified: List[Dict[str, Any]] = []
+        migrated = migrate_export_file(export, skipped=unidentified)
+        print(f"✅ {export}: {len(migrated)} identifiants migrés")
+        if unidentified:
+            print(f"⚠️ {export}: {len(unidentified)} offres sans URL gardées avec leur ancien identifiant")
@@ -0,0 +1,272 @@
+"""
+Scraping incrémental: offres déjà vues et arrêt anticipé de la pagination
+
+Les recherches sont triées par date (`sort=date`): dès qu'une page contient
+surtout des offres déjà ingérées lors d'un run précédent, les pages suivantes
+ne contiennent que des offres plus anciennes, donc déjà vues. On arrête alors
+de paginer.
+
+L'ensemble des URLs vues est persisté par (source, requête, localisation),
+avec un watermark (date et offre la plus récente du dernier run). Une page
+qui contient l'offre du watermark, suivie uniquement d'offres déjà vues,
+marque la frontière avec le run précédent: on s'arrête sans attendre le
+ratio d'offres vues.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from .cache import DEFAULT_CACHE_DIR
+from .identity import canonical_job_url
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ScrapeStats:
+    """Bilan d'un scrape (exposé via `scraper.last_scrape_stats`)"""
+    pages_fetched: int = 0
+    pages_skipped: int = 0     # Pages non visitées grâce à l'arrêt anticipé
+    requests_skipped: int = 0  # Requêtes économisées (une par page)
+    offers_new: int = 0
+    offers_seen: int = 0       # Offres déjà ingérées, filtrées
+    stopped_early: bool = False
+    reached_watermark: bool = False  # Arrêt sur l'offre la plus récente du run précédent
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convertit le bilan en dictionnaire"""
+        return asdict(self)
+
+
+class SeenOfferStore:
+    """
+    Offres déjà vues et watermarks, persistés dans SQLite
+    """
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_CACHE_DIR / 'seen_offers.db'):
+        """
+        Args:
+            path: Chemin du fichier SQLite (":memory:" pour les tests)
+        """
+        self.path = str(path)
+        if self.path != ':memory:':
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS seen_offers ("
+            "  scope TEXT NOT NULL, offer_key TEXT NOT NULL, first_seen REAL NOT NULL,"
+            "  PRIMARY KEY (scope, offer_key));"
+            "CREATE TABLE IF NOT EXISTS watermarks ("
+            "  scope TEXT PRIMARY KEY, last_run_at REAL NOT NULL, newest_offer_key TEXT);"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def scope(source: str, query: str, location: str) -> str:
+        """Clé de portée normalisée d'une recherche"""
+        return '|'.join(part.strip().lower() for part in (source, query or '', location or ''))
+
+    @staticmethod
+    def offer_key(url: str) -> str:
+        """Clé d'une offre (URL canonique)"""
+        return canonical_job_url(url)
+
+    def seen_keys(self, scope: str, keys: Iterable[str]) -> Set[str]:
+        """Retourne le sous-ensemble de `keys` déjà vu dans cette portée"""
+        keys = list(keys)
+        if not keys:
+            return set()
+
+        placeholders = ','.join('?' * len(keys))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT offer_key FROM seen_offers WHERE scope = ? AND offer_key IN ({placeholders})",
+                [scope, *keys]
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def mark_seen(self, scope: str, keys: Iterable[str], newest_key: Optional[str] = None):
+        """
+        Enregistre des offres comme vues et met à jour le watermark
+
+        Args:
+            scope: Portée de la recherche
+            keys: Clés des offres
+            newest_key: Offre la plus récente du run (défaut: première de
+                `keys`, supposées de la plus récente à la plus ancienne)
+        """
+        keys = list(keys)
+        if newest_key is None and keys:
+            newest_key = keys[0]
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO seen_offers (scope, offer_key, first_seen) VALUES (?, ?, ?)",
+                [(scope, key, now) for key in keys]
+            )
+            self._conn.execute(
+                "INSERT INTO watermarks (scope, last_run_at, newest_offer_key) VALUES (?, ?, ?) "
+                "ON CONFLICT(scope) DO UPDATE SET last_run_at = excluded.last_run_at, "
+                "newest_offer_key = COALESCE(excluded.newest_offer_key, newest_offer_key)",
+                (scope, now, newest_key)
+            )
+            self._conn.commit()
+
+    def get_watermark(self, scope: str) -> Optional[Dict[str, Any]]:
+        """Retourne le watermark d'une portée (None si jamais scrapée)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_run_at, newest_offer_key FROM watermarks WHERE scope = ?", (scope,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {'last_run_at': row[0], 'newest_offer_key': row[1]}
+
+    def purge(self, max_age_days: float = 60) -> int:
+        """
+        Oublie les offres vues il y a plus de `max_age_days` jours
+
+        Returns:
+            Nombre d'entrées supprimées
+        """
+        cutoff = time.time() - max_age_days * 86400
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM seen_offers WHERE first_seen < ?", (cutoff,))
+            self._conn.commit()
+            return cursor.rowcount
+
+    def close(self):
+        """Ferme la connexion SQLite"""
+        with self._lock:
+            self._conn.close()
+
+
+class IncrementalTracker:
+    """
+    Suivi d'un scrape paginé: filtre les offres déjà vues et décide de
+    l'arrêt anticipé
+
+    Sans store, toutes les offres passent et seules les statistiques sont
+    tenues à jour.
+    """
+
+    def __init__(
+        self,
+        store: Optional[SeenOfferStore],
+        source: str,
+        query: str,
+        location: str,
+        max_pages: int,
+        stop_ratio: float = 0.5
+    ):
+        """
+        Args:
+            store: Store des offres vues (None = scrape complet)
+            source: Nom de la source (ex: "Indeed BE")
+            query: Requête
+            location: Localisation
+            max_pages: Nombre maximum de pages prévu
+            stop_ratio: Proportion d'offres déjà vues sur une page à partir de
+                laquelle on arrête de paginer (les offres sponsorisées,
+                épinglées en tête, empêchent d'exiger 100%)
+        """
+        self.store = store
+        self.scope = SeenOfferStore.scope(source, query, location)
+        self.max_pages = max_pages
+        self.stop_ratio = stop_ratio
+        self.stats = ScrapeStats()
+        self._new_keys: Set[str] = set()
+        self._newest_key: Optional[str] = None
+        self._watermark_key: Optional[str] = None
+        self._watermark_loaded = False
+
+    def page_fetched(self):
+        """Compte une page (requête) effectivement envoyée"""
+        self.stats.pages_fetched += 1
+
+    def filter_page(self, offers: List[Any]) -> Tuple[List[Any], bool]:
+        """
+        Filtre les offres d'une page
+
+        Args:
+            offers: Offres parsées (attribut `url`)
+
+        Returns:
+            Tuple (offres nouvelles, arrêter la pagination)
+        """
+        if self.store is None or not offers:
+            self.stats.offers_new += len(offers)
+            return offers, False
+
+        keys = [SeenOfferStore.offer_key(offer.url) for offer in offers]
+        already_seen = self.store.seen_keys(self.scope, keys)
+
+        new_offers = []
+        for offer, key in zip(offers, keys):
+            if key in already_seen or key in self._new_keys:
+                continue
+            new_offers.append(offer)
+            self._new_keys.add(key)
+            if self._newest_key is None:
+                self._newest_key = key
+
+        seen_count = len(offers) - len(new_offers)
+        self.stats.offers_new += len(new_offers)
+        self.stats.offers_seen += seen_count
+
+        reached = self._reached_watermark(keys, already_seen)
+        stop = reached or seen_count / len(offers) >= self.stop_ratio
+        if stop:
+            self.stats.stopped_early = True
+            self.stats.reached_watermark = reached
+        return new_offers, stop
+
+    def _reached_watermark(self, keys: List[str], already_seen: Set[str]) -> bool:
+        """
+        La page contient l'offre la plus récente du run précédent, et tout ce
+        qui la suit est déjà vu (une offre sponsorisée épinglée qui serait le
+        watermark ne suffit donc pas à arrêter)
+        """
+        if not self._watermark_loaded:
+            watermark = self.store.get_watermark(self.scope)
+            self._watermark_key = watermark['newest_offer_key'] if watermark else None
+            self._watermark_loaded = True
+
+        if self._watermark_key is None or self._watermark_key not in keys:
+            return False
+        position = keys.index(self._watermark_key)
+        return all(key in already_seen for key in keys[position + 1:])
+
+    def finish(self, commit: bool = True) -> ScrapeStats:
+        """
+        Termine le scrape: enregistre les nouvelles offres et calcule les
+        pages économisées
+
+        Args:
+            commit: Enregistrer les nouvelles offres comme vues. À False
+                quand le consommateur d'un flux s'est arrêté avant la fin:
+                les offres filtrées mais pas encore livrées seront reproposées
+                au prochain run plutôt que perdues.
+
+        Returns:
+            Bilan du scrape
+        """
+        if self.stats.stopped_early:
+            self.stats.pages_skipped = max(0, self.max_pages - self.stats.pages_fetched)
+            self.stats.requests_skipped = self.stats.pages_skipped
+
+        if self.store is not None and commit:
+            self.store.mark_seen(self.scope, self._new_keys, newest_key=self._newest_key)
+            logger.info(
+                f"Incremental scrape: {self.stats.offers_new} new, {self.stats.offers_seen} already seen, "
+                f"{self.stats.pages_skipped} pages skipped"
+            )
+
+        return self.stats
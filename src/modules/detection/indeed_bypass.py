@@ -10,23 +10,39 @@ Pour un usage légal, préférez l'API Pole Emploi ou le parsing d'emails.
 import logging
 import time
 import random
-from typing import List, Optional
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, List, Optional
 from dataclasses import dataclass
 from datetime import datetime
 
+# undetected-chromedriver est importé par driver_pool, à la création du navigateur
 try:
-    import undetected_chromedriver as uc
     from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-    from selenium.common.exceptions import TimeoutException, NoSuchElementException
 except ImportError:
-    print("❌ undetected-chromedriver non installé")
+    print("❌ selenium non installé")
     print("Installez-le avec : pip install undetected-chromedriver")
     raise
 
+import requests
 from bs4 import BeautifulSoup
 
+from . import embedded_json, fast_parser
+from .async_fetcher import iterate_async
+from .description_store import PREVIEW_LENGTH, DescriptionRef, DescriptionStore, full_text
+from .driver_pool import ChromeDriverPool, PooledDriver, apply_stealth, create_stealth_driver
+from .identity import canonical_job_url
+from .incremental import IncrementalTracker, ScrapeStats, SeenOfferStore
+from .rate_limiter import RateLimiter
+from .readiness import PageTimings, ReadinessPolicy, summarize_timings
+from .recording import FixtureStore, default_rate_limiter
+from .resource_blocking import (
+    ResourceBlockingConfig, TransferLog, apply_resource_blocking, measure_page_transfer
+)
+from .session_handoff import (
+    ChallengeDetected, HandoffStats, HTTPSessionHandoff, capture_browser_session
+)
+from .session_store import SessionStateStore, restore_session_state
+
 logger = logging.getLogger(__name__)
 
 
@@ -41,13 +57,20 @@ class JobOffer:
     source: str = "Indeed"
     posted_date: Optional[str] = None
     salary: Optional[str] = None
+    contract_type: Optional[str] = None  # Fourni par le JSON embarqué uniquement
     remote: bool = False
     scraped_at: datetime = None
+    description_ref: Optional[DescriptionRef] = None  # Si le scraper a un DescriptionStore
 
     def __post_init__(self):
         if self.scraped_at is None:
             self.scraped_at = datetime.now()
 
+    @property
+    def full_description(self) -> str:
+        """Description complète (chargée à la demande), sinon l'aperçu"""
+        return full_text(self.description, self.description_ref)
+
 
 class IndeedBypassScraper:
     """
@@ -67,7 +90,24 @@ class IndeedBypassScraper:
         'uk': 'https://uk.indeed.com',      # Royaume-Uni
     }
 
-    def __init__(self, headless: bool = True, verbose: bool = False, country: str = 'fr'):
+    PARSERS = ('bs4', 'lxml', 'json')
+
+    def __init__(
+        self,
+        headless: bool = True,
+        verbose: bool = False,
+        country: str = 'fr',
+        rate_limiter: Optional[RateLimiter] = None,
+        parser: str = 'bs4',
+        seen_store: Optional[SeenOfferStore] = None,
+        driver_pool: Optional[ChromeDriverPool] = None,
+        resource_blocking: Optional[ResourceBlockingConfig] = None,
+        readiness: Optional[ReadinessPolicy] = None,
+        hybrid: bool = False,
+        session_store: Optional[SessionStateStore] = None,
+        fixtures: Optional[FixtureStore] = None,
+        description_store: Optional[DescriptionStore] = None
+    ):
         """
         Initialise le scraper avec bypass Cloudflare
 
@@ -75,10 +115,61 @@ class IndeedBypassScraper:
             headless: Exécuter Chrome en mode invisible (True recommandé)
             verbose: Activer les logs détaillés
             country: Code pays (fr, be, lu, ch, ca, uk)
+            rate_limiter: Limiteur de débit par hôte (défaut: limiteur partagé
+                du processus, configuré par integrations.json)
+            parser: Moteur de parsing des pages: 'bs4' (BeautifulSoup),
+                'lxml' (XPath précompilés, plus rapide, même résultat) ou
+                'json' (JSON embarqué: extraits complets et type de contrat,
+                repli sur 'lxml' s'il est absent)
+            seen_store: Offres déjà ingérées; si fourni, le scrape devient
+                incrémental (seules les nouvelles offres sont retournées et la
+                pagination s'arrête dès qu'on atteint des offres déjà vues)
+            driver_pool: Pool de navigateurs partagé; si fourni, chaque scrape
+                emprunte un navigateur chaud au lieu d'en démarrer un
+                (`headless` et `verbose` sont alors ceux du pool)
+            resource_blocking: Ressources à ne pas charger (images, polices,
+                CSS, trackers), ex: `ResourceBlockingConfig.from_config()`.
+                None = pages complètes
+            readiness: Règles d'attente des pages (conditions DOM et timeouts
+                adaptatifs); mesures par page dans `page_timings`
+            hybrid: Mode hybride: le navigateur n'établit que la session,
+                dont les cookies sont transmis à un client HTTP pour les
+                pages suivantes et les pages de détail (retour au navigateur
+                sur challenge); répartition dans `handoff_stats`
+            session_store: Sessions persistées par pays (cookies,
+                localStorage, profil Chrome), réutilisées d'un run et d'un
+                navigateur du pool à l'autre
+            fixtures: Enregistrement des pages (mode record: page_source du
+                navigateur et réponses HTTP du mode hybride) ou rejeu hors
+                ligne, sans navigateur (mode replay)
+            description_store: Stockage des extraits complets; les offres
+                gardent un aperçu et une poignée `description_ref` (None =
+                extraits DOM tronqués à 500 caractères)
         """
+        if parser not in self.PARSERS:
+            raise ValueError(f"Parser inconnu: {parser} (choix: {', '.join(self.PARSERS)})")
+
         self.headless = headless
         self.verbose = verbose
         self.country = country.lower()
+        self.rate_limiter = rate_limiter or default_rate_limiter(fixtures)
+        self.parser = parser
+        self.seen_store = seen_store
+        self.driver_pool = driver_pool
+        self.resource_blocking = resource_blocking
+        self.transfer_log = TransferLog()
+        self.readiness = readiness or ReadinessPolicy()
+        self.page_timings: Deque[PageTimings] = deque(maxlen=500)
+        self.hybrid = hybrid
+        self.handoff_stats = HandoffStats()
+        self._http: Optional[HTTPSessionHandoff] = None
+        self._lease: Optional[PooledDriver] = None
+        self.session_store = session_store
+        self._session_restored = False
+        self._session_captured = False
+        self.fixtures = fixtures
+        self.last_scrape_stats: Optional[ScrapeStats] = None
+        self.description_store = description_store
 
         # Définir l'URL de base selon le pays
         self.BASE_URL = self.DOMAINS.get(self.country, self.DOMAINS['fr'])
@@ -90,35 +181,25 @@ class IndeedBypassScraper:
 
     def _init_driver(self):
         """Initialise le driver Chrome non détectable"""
-        logger.info("Initialisation du driver Chrome...")
-
-        options = uc.ChromeOptions()
-
-        if self.headless:
-            options.add_argument('--headless=new')  # Nouveau mode headless
-
-        # Arguments anti-détection
-        options.add_argument('--disable-blink-features=AutomationControlled')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--window-size=1920,1080')
-
-        # Désactiver les logs si pas verbose
-        if not self.verbose:
-            options.add_argument('--log-level=3')
-            options.add_argument('--silent')
-
-        # Créer le driver
-        self.driver = uc.Chrome(options=options)
-        logger.info("✅ Driver Chrome initialisé")
+        profile_dir = None
+        if self.session_store is not None:
+            profile_dir = str(self.session_store.profile_dir(self.country))
+
+        self.driver = create_stealth_driver(
+            headless=self.headless,
+            verbose=self.verbose,
+            resource_blocking=self.resource_blocking,
+            user_data_dir=profile_dir
+        )
 
     def _apply_stealth(self):
-        """Applique des techniques de stealth supplémentaires"""
-        # Supprimer les traces d'automation
-        self.driver.execute_script(
-            "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
-        )
+        """
+        Applique les techniques de stealth au driver courant
+
+        `create_stealth_driver` les applique déjà; conservé pour les scripts
+        qui pilotent le driver directement (ex: test_bypass_debug.py).
+        """
+        apply_stealth(self.driver)
 
     def _human_behavior(self):
         """Simule un comportement humain"""
@@ -126,8 +207,11 @@ class IndeedBypassScraper:
         scroll_amount = random.randint(100, 500)
         self.driver.execute_script(f"window.scrollBy(0, {scroll_amount})")
 
-        # Délai aléatoire
-        time.sleep(random.uniform(0.5, 1.5))
+        # Délai aléatoire (configurable, nul par défaut: l'attente de la page
+        # est déjà pilotée par le DOM)
+        low, high = self.readiness.human_pause
+        if high > 0:
+            time.sleep(random.uniform(low, high))
 
     def _accept_cookies(self):
         """Accepte automatiquement les cookies si la bannière apparaît"""
@@ -168,83 +252,320 @@ class IndeedBypassScraper:
             max_pages: Nombre maximum de pages
 
         Returns:
-            Liste d'offres d'emploi
+            Liste d'offres d'emploi (uniquement les nouvelles en mode
+            incrémental; bilan dans `last_scrape_stats`)
+        """
+        all_offers = list(self.scrape_iter(query, location, max_pages))
+        logger.info(f"🎉 Scraping terminé : {len(all_offers)} offres au total")
+        return all_offers
+
+    def scrape_iter(
+        self,
+        query: str,
+        location: str = "Paris",
+        max_pages: int = 3
+    ) -> Iterator[JobOffer]:
+        """
+        Scrape des offres sur Indeed, en flux
+
+        Les offres sont produites page par page, dès que chaque page est
+        parsée. Arrêter l'itération arrête la navigation.
+
+        Args:
+            query: Mots-clés de recherche
+            location: Localisation
+            max_pages: Nombre maximum de pages
+
+        Yields:
+            Offres d'emploi (uniquement les nouvelles en mode incrémental;
+            bilan dans `last_scrape_stats` une fois le flux épuisé)
         """
         logger.info(f"🚀 Démarrage scraping Indeed : '{query}' à {location}")
 
-        if self.driver is None:
+        tracker = IncrementalTracker(
+            self.seen_store, f"Indeed {self.country.upper()}", query, location, max_pages
+        )
+        completed = False
+        browser_pages = 0
+        previous_url = None
+
+        self._resume_stored_session()
+
+        try:
+            for page in range(max_pages):
+                try:
+                    # Construire l'URL
+                    start = page * 10
+                    url = f"{self.SEARCH_URL}?q={query}&l={location}&start={start}&sort=date"
+
+                    logger.info(f"📄 Page {page + 1}/{max_pages} : {url}")
+
+                    # Récupérer la page (au débit autorisé pour ce domaine):
+                    # en HTTP si une session navigateur a été transmise,
+                    # sinon (ou sur challenge) dans le navigateur
+                    self.rate_limiter.acquire(url)
+                    tracker.page_fetched()
+
+                    html = self._replay_page(url)
+                    if html is None:
+                        html = self._fetch_http(url, referer=previous_url)
+                    if html is None:
+                        # Accepter les cookies (première page navigateur seulement,
+                        # inutile si une session a été restaurée)
+                        html = self._load_in_browser(url, accept_cookies=browser_pages == 0)
+                        browser_pages += 1
+                    previous_url = url
+
+                    # Parser les offres
+                    offers = self._parse_page(html)
+
+                    if not offers:
+                        logger.warning(f"Aucune offre trouvée sur la page {page + 1}")
+                        # Ne pas break immédiatement, peut être un problème temporaire
+                        if page == 0:
+                            # Si première page sans résultats, arrêter
+                            break
+
+                    new_offers, stop = tracker.filter_page(offers)
+                    logger.info(f"✅ {len(offers)} offres trouvées sur page {page + 1} ({len(new_offers)} nouvelles)")
+
+                except Exception as e:
+                    logger.error(f"❌ Erreur page {page + 1}: {e}")
+                    continue
+
+                yield from new_offers
+
+                if stop:
+                    logger.info(f"⏹️ Offres déjà vues atteintes page {page + 1}, arrêt de la pagination")
+                    break
+
+            completed = True
+        finally:
+            self.last_scrape_stats = tracker.finish(commit=completed)
+            self._release_driver()
+
+    def _ensure_driver(self):
+        """Démarre le navigateur, ou en emprunte un au pool, s'il n'y en a pas déjà un"""
+        if self.driver is not None:
+            return
+
+        if self.driver_pool is not None:
+            self._lease = self.driver_pool.acquire()
+            self.driver = self._lease.driver
+            # Le navigateur a pu servir un scrape avec un autre réglage
+            apply_resource_blocking(self.driver, self.resource_blocking)
+        else:
             self._init_driver()
-            self._apply_stealth()
+        self._session_captured = False
+
+        # Reprendre la dernière session valide de ce pays
+        if self.session_store is not None:
+            state = self.session_store.load(self.country)
+            if state is not None:
+                self._session_restored = restore_session_state(self.driver, state)
+
+    def _release_driver(self):
+        """Rend le navigateur emprunté au pool (le pool vérifie sa santé)"""
+        if self._lease is not None:
+            lease, self._lease = self._lease, None
+            self.driver = None
+            self._session_restored = False
+            self._session_captured = False
+            self.driver_pool.release(lease)
+
+    def _resume_stored_session(self):
+        """Mode hybride: démarre le client HTTP avec la session stockée, sans navigateur"""
+        if not self.hybrid or self._http is not None or self.session_store is None:
+            return
+
+        state = self.session_store.load(self.country)
+        if state is not None:
+            self._http = HTTPSessionHandoff(state.browser_session())
+            logger.info(f"🔀 Session {self.country.upper()} stockée reprise en HTTP")
+
+    def _load_in_browser(self, url: str, accept_cookies: bool = False) -> str:
+        """
+        Charge une page dans le navigateur et attend qu'elle soit exploitable
 
-        all_offers = []
+        En mode hybride, la session obtenue est ensuite transmise au client
+        HTTP pour les pages suivantes.
 
-        for page in range(max_pages):
-            try:
-                # Construire l'URL
-                start = page * 10
-                url = f"{self.SEARCH_URL}?q={query}&l={location}&start={start}&sort=date"
+        Returns:
+            HTML de la page
+        """
+        self._ensure_driver()
+
+        navigation_start = time.monotonic()
+        self.driver.get(url)
+        navigation = time.monotonic() - navigation_start
+        if self._lease is not None:
+            self._lease.record_page()
+        self.handoff_stats.browser_pages += 1
+
+        # Attendre que la page soit exploitable (challenge résolu,
+        # cartes d'offres stables) au lieu de pauses fixes
+        timings = self.readiness.wait_until_ready(self.driver, url, navigation)
+        self.page_timings.append(timings)
+
+        if accept_cookies and not self._session_restored:
+            self._accept_cookies()
+
+        # Simuler comportement humain
+        self._human_behavior()
+
+        # Récupérer le HTML
+        html = self.driver.page_source
+        if self.fixtures is not None:
+            self.fixtures.record_page(url, html)
+        blocking = bool(self.resource_blocking and self.resource_blocking.enabled)
+        self.transfer_log.record(measure_page_transfer(self.driver, url, blocking))
+
+        if timings.challenge_cleared:
+            # Capture (script, cookies, écriture SQLite) à la première page
+            # du navigateur, puis seulement après un challenge passé
+            if self.session_store is not None and (timings.challenge_detected or not self._session_captured):
+                self._session_captured = self.session_store.capture(self.driver, self.country) is not None
+            if self.hybrid:
+                self._hand_off_session()
+
+        return html
+
+    def _hand_off_session(self):
+        """Transmet les cookies et l'identité du navigateur au client HTTP"""
+        try:
+            browser_session = capture_browser_session(self.driver)
+        except Exception as e:
+            logger.warning(f"⚠️ Session navigateur non transférable: {e}")
+            return
 
-                logger.info(f"📄 Page {page + 1}/{max_pages} : {url}")
+        if self._http is not None:
+            self._http.close()
+        self._http = HTTPSessionHandoff(browser_session)
+        self.handoff_stats.handoffs += 1
+        logger.debug(f"🔀 Session transmise au client HTTP ({len(browser_session.cookies)} cookies)")
 
-                # Naviguer vers la page
-                self.driver.get(url)
+    def _fetch_http(self, url: str, referer: Optional[str] = None) -> Optional[str]:
+        """
+        Récupère une page via le client HTTP du mode hybride
 
-                # Attendre le chargement initial
-                time.sleep(random.uniform(3, 5))
+        Returns:
+            HTML de la page, ou None s'il faut passer par le navigateur (pas
+            de session transmise, challenge ou erreur)
+        """
+        if not self.hybrid or self._http is None:
+            return None
 
-                # Accepter les cookies (première page seulement)
-                if page == 0:
-                    self._accept_cookies()
+        start = time.monotonic()
+        try:
+            html = self._http.fetch(url, referer=referer)
+        except ChallengeDetected as e:
+            self.handoff_stats.challenges += 1
+            logger.info(f"🛡️ {e}, retour au navigateur")
+            self._http.close()
+            self._http = None
+            if self.session_store is not None:
+                self.session_store.delete(self.country)
+            return None
+        except requests.RequestException as e:
+            logger.warning(f"⚠️ Échec HTTP ({e}), retour au navigateur")
+            return None
+        finally:
+            self.handoff_stats.http_time += time.monotonic() - start
 
-                # Attendre que les offres se chargent
-                try:
-                    WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.CLASS_NAME, "job_seen_beacon"))
-                    )
-                    logger.debug("✅ Offres chargées")
-                except TimeoutException:
-                    logger.warning("⏱️ Timeout: offres non chargées")
-
-                # Vérifier si Cloudflare nous bloque
-                page_text = self.driver.page_source.lower()
-                if "cloudflare" in page_text and "challenge" in page_text:
-                    logger.warning("⚠️ Cloudflare challenge détecté, attente...")
-                    time.sleep(8)  # Attendre que le challenge se résolve
-
-                # Simuler comportement humain
-                self._human_behavior()
-
-                # Récupérer le HTML
-                html = self.driver.page_source
-
-                # Parser les offres
-                offers = self._parse_page(html)
-
-                if not offers:
-                    logger.warning(f"Aucune offre trouvée sur la page {page + 1}")
-                    # Ne pas break immédiatement, peut être un problème temporaire
-                    if page == 0:
-                        # Si première page sans résultats, arrêter
-                        break
-
-                all_offers.extend(offers)
-                logger.info(f"✅ {len(offers)} offres trouvées sur page {page + 1}")
-
-                # Délai entre pages (important !)
-                if page < max_pages - 1:
-                    delay = random.uniform(4, 8)
-                    logger.debug(f"Attente de {delay:.1f}s avant page suivante...")
-                    time.sleep(delay)
+        self.handoff_stats.http_pages += 1
+        if self.fixtures is not None:
+            self.fixtures.record_page(url, html)
+        return html
 
-            except Exception as e:
-                logger.error(f"❌ Erreur page {page + 1}: {e}")
-                continue
+    def _replay_page(self, url: str) -> Optional[str]:
+        """
+        Mode replay: HTML enregistré de la page, sans navigateur ni réseau
 
-        logger.info(f"🎉 Scraping terminé : {len(all_offers)} offres au total")
-        return all_offers
+        Returns:
+            HTML de la page, ou None hors mode replay
+
+        Raises:
+            FixtureNotFound: Si la page n'a pas été enregistrée
+        """
+        if self.fixtures is None or not self.fixtures.replaying:
+            return None
+        return self.fixtures.replay_page(url)
+
+    def get_job_details(self, job_url: str) -> Dict[str, Any]:
+        """
+        Récupère les détails complets d'une offre
+
+        En mode hybride, la page est récupérée en HTTP avec la session du
+        navigateur; sinon (ou sur challenge) elle est chargée dans le
+        navigateur.
+
+        Args:
+            job_url: URL de l'offre
+
+        Returns:
+            Dictionnaire avec les détails de l'offre (vide en cas d'erreur)
+        """
+        try:
+            self.rate_limiter.acquire(job_url)
+            html = self._replay_page(job_url)
+            if html is None:
+                html = self._fetch_http(job_url)
+            if html is None:
+                html = self._load_in_browser(job_url)
+        except Exception as e:
+            logger.error(f"❌ Erreur détails {job_url}: {e}")
+            return {}
+        finally:
+            self._release_driver()
+
+        soup = BeautifulSoup(html, 'lxml')
+        description_elem = soup.find('div', id='jobDescriptionText')
+
+        return {
+            'full_description': description_elem.get_text(strip=True) if description_elem else "",
+            'url': job_url
+        }
+
+    async def ascrape_iter(
+        self,
+        query: str,
+        location: str = "Paris",
+        max_pages: int = 3
+    ) -> AsyncIterator[JobOffer]:
+        """
+        Version itérateur async de `scrape_iter`
+
+        Le navigateur est piloté depuis un thread dédié: la boucle asyncio
+        reste libre pendant les chargements de page.
+
+        Yields:
+            Offres d'emploi, page par page
+        """
+        async for offer in iterate_async(self.scrape_iter(query, location, max_pages)):
+            yield offer
 
     def _parse_page(self, html: str) -> List[JobOffer]:
-        """Parse une page de résultats"""
+        """Parse une page de résultats (descriptions stockées en une transaction)"""
+        if self.description_store is None:
+            return self._parse_cards(html)
+        with self.description_store.batch():
+            return self._parse_cards(html)
+
+    def _parse_cards(self, html: str) -> List[JobOffer]:
+        """Parse les cartes d'offres d'une page de résultats"""
+        if self.parser == 'json':
+            cards = embedded_json.parse_embedded_cards(html, self.BASE_URL)
+            if cards is not None:
+                return [self._keep_description(JobOffer(source='Indeed', **fields), truncate=False)
+                        for fields in cards]
+            logger.debug("Pas de JSON embarqué, repli sur le parser DOM")
+
+        if self.parser in ('lxml', 'json'):
+            offers = []
+            for fields in fast_parser.parse_bypass_cards(html, self.BASE_URL):
+                offers.append(self._keep_description(JobOffer(**fields)))
+            return offers
+
         soup = BeautifulSoup(html, 'lxml')
         offers = []
 
@@ -259,13 +580,24 @@ class IndeedBypassScraper:
             try:
                 offer = self._parse_job_card(card)
                 if offer:
-                    offers.append(offer)
+                    offers.append(self._keep_description(offer))
             except Exception as e:
                 logger.debug(f"Erreur parsing carte: {e}")
                 continue
 
         return offers
 
+    def _keep_description(self, offer: JobOffer, truncate: bool = True) -> JobOffer:
+        """
+        Range l'extrait complet dans le store (aperçu + poignée), sinon le
+        tronque à `PREVIEW_LENGTH` caractères (`truncate`)
+        """
+        if self.description_store is not None:
+            offer.description, offer.description_ref = self.description_store.split(offer.description)
+        elif truncate:
+            offer.description = offer.description[:PREVIEW_LENGTH]  # Limiter la taille
+        return offer
+
     def _parse_job_card(self, card) -> Optional[JobOffer]:
         """Parse une carte d'offre individuelle"""
         try:
@@ -290,11 +622,12 @@ class IndeedBypassScraper:
                 link = link_elem.find('a')
                 if link and link.get('href'):
                     href = link['href']
-                    # Nettoyer l'URL (Indeed ajoute parfois des paramètres)
+                    # Nettoyer l'URL (Indeed ajoute des paramètres de tracking,
+                    # seul l'identifiant jk est conservé)
                     if href.startswith('/'):
-                        job_url = f"{self.BASE_URL}{href.split('?')[0]}"
+                        job_url = canonical_job_url(f"{self.BASE_URL}{href}")
                     elif href.startswith('http'):
-                        job_url = href.split('?')[0]
+                        job_url = canonical_job_url(href)
 
             # Si pas trouvé, chercher autrement
             if not job_url:
@@ -302,7 +635,7 @@ class IndeedBypassScraper:
                 if link:
                     href = link['href']
                     if '/rc/clk' in href or '/viewjob' in href or '/company' in href:
-                        job_url = f"{self.BASE_URL}{href.split('?')[0]}" if href.startswith('/') else href
+                        job_url = canonical_job_url(f"{self.BASE_URL}{href}" if href.startswith('/') else href)
 
             # Entreprise
             company = "N/A"
@@ -365,7 +698,7 @@ class IndeedBypassScraper:
                 title=title,
                 company=company,
                 location=location,
-                description=description[:500],  # Limiter la taille
+                description=description,
                 url=job_url,
                 posted_date=posted_date,
                 salary=salary,
@@ -376,10 +709,19 @@ class IndeedBypassScraper:
             logger.debug(f"Erreur parsing carte: {e}")
             return None
 
+    def timing_summary(self) -> Dict[str, Any]:
+        """Durée moyenne et maximale de chaque phase d'attente, sur les pages récentes"""
+        return summarize_timings(self.page_timings)
+
     def close(self):
-        """Ferme le driver"""
+        """Ferme le driver (les navigateurs du pool restent gérés par le pool)"""
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+        self._release_driver()
         if self.driver:
             self.driver.quit()
+            self.driver = None
             logger.info("Driver fermé")
 
     def __enter__(self):
@@ -5,10 +5,11 @@ Ce module fournit des scrapers pour différentes plateformes d'emploi,
 avec gestion de pagination, rate limiting et error handling.
 """
 
+import asyncio
 import logging
 import time
 import random
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, AsyncIterator, Iterable, Iterator, Optional, Tuple, Union
 from urllib.parse import urlencode, urljoin
 from dataclasses import dataclass
 from datetime import datetime
@@ -17,6 +18,15 @@ import requests
 from bs4 import BeautifulSoup
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+from . import embedded_json, fast_parser
+from .async_fetcher import AsyncFetchEngine, FetchRequest, iterate_sync, run_sync
+from .cache import JobDetailCache
+from .http_cache import HTTPCache, default_http_cache
+from .identity import canonical_job_url
+from .incremental import IncrementalTracker, ScrapeStats, SeenOfferStore
+from .rate_limiter import RateLimiter
+from .recording import FixtureStore, default_rate_limiter
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,12 +70,19 @@ class JobOffer:
 class BaseJobBoardScraper:
     """Classe de base pour tous les scrapers de job boards"""
 
+    # Nom de la source (offres, TTL du cache HTTP), défini par chaque scraper
+    source: Optional[str] = None
+
     def __init__(
         self,
         user_agent: str = None,
         timeout: int = 30,
         max_retries: int = 3,
-        rate_limit_delay: tuple = (2, 5)
+        rate_limit_delay: Optional[tuple] = None,
+        max_concurrency: int = 2,
+        rate_limiter: Optional[RateLimiter] = None,
+        http_cache: Union[HTTPCache, bool, None] = None,
+        fixtures: Optional[FixtureStore] = None
     ):
         """
         Initialise le scraper
@@ -74,12 +91,26 @@ class BaseJobBoardScraper:
             user_agent: User agent à utiliser pour les requêtes
             timeout: Timeout des requêtes en secondes
             max_retries: Nombre maximum de tentatives
-            rate_limit_delay: Tuple (min, max) pour le délai aléatoire entre requêtes
+            rate_limit_delay: Tuple (min, max) pour un délai aléatoire fixe entre
+                pages, en plus du limiteur (None = limiteur seul)
+            max_concurrency: Nombre maximum de requêtes simultanées par hôte
+                (mode asynchrone)
+            rate_limiter: Limiteur de débit par hôte (défaut: limiteur partagé
+                du processus, configuré par integrations.json)
+            http_cache: Cache HTTP sur disque (défaut: cache partagé du
+                processus, configuré par integrations.json; False = pas de cache)
+            fixtures: Enregistrement (mode record) ou rejeu hors ligne
+                (mode replay) des réponses, pour tests et benchmarks
         """
         self.user_agent = user_agent or self._get_random_user_agent()
         self.timeout = timeout
         self.max_retries = max_retries
         self.rate_limit_delay = rate_limit_delay
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = rate_limiter or default_rate_limiter(fixtures)
+        self.http_cache = default_http_cache(http_cache, fixtures)
+        self.fixtures = fixtures
+        self._fetch_engine: Optional[AsyncFetchEngine] = None
 
         self.session = requests.Session()
         self.session.headers.update({
@@ -91,6 +122,8 @@ class BaseJobBoardScraper:
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
         })
+        if fixtures is not None:
+            fixtures.mount(self.session)
 
     @staticmethod
     def _get_random_user_agent() -> str:
@@ -105,7 +138,15 @@ class BaseJobBoardScraper:
         return random.choice(user_agents)
 
     def _apply_rate_limit(self):
-        """Applique un délai aléatoire pour respecter le rate limiting"""
+        """
+        Applique le délai aléatoire fixe entre pages, si configuré
+
+        Le débit par hôte est déjà garanti par `self.rate_limiter` à chaque
+        requête; ce délai n'est qu'une marge supplémentaire optionnelle.
+        """
+        if not self.rate_limit_delay:
+            return
+
         delay = random.uniform(*self.rate_limit_delay)
         logger.debug(f"Rate limiting: sleeping for {delay:.2f}s")
         time.sleep(delay)
@@ -114,13 +155,20 @@ class BaseJobBoardScraper:
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10)
     )
-    def _fetch_page(self, url: str, params: Dict = None) -> requests.Response:
+    def _fetch_page(
+        self,
+        url: str,
+        params: Dict = None,
+        cache_kind: str = 'scraping_results'
+    ) -> requests.Response:
         """
         Récupère une page web avec retry automatique
 
         Args:
             url: URL à récupérer
             params: Paramètres de requête
+            cache_kind: Type de contenu pour le TTL du cache HTTP
+                ('scraping_results' ou 'job_offers')
 
         Returns:
             Response object
@@ -128,10 +176,31 @@ class BaseJobBoardScraper:
         Raises:
             requests.RequestException: En cas d'erreur de requête
         """
+        if self.http_cache is not None:
+            return self.http_cache.fetch(
+                url,
+                params,
+                send=lambda headers: self._send_request(url, params, headers),
+                kind=cache_kind,
+                source=self.source
+            )
+
+        return self._send_request(url, params)
+
+    def _send_request(
+        self,
+        url: str,
+        params: Dict = None,
+        headers: Dict[str, str] = None
+    ) -> requests.Response:
+        """Envoie la requête GET sur le réseau (rate limiting inclus)"""
+        self.rate_limiter.acquire(url)
+
         try:
             response = self.session.get(
                 url,
                 params=params,
+                headers=headers,
                 timeout=self.timeout,
                 allow_redirects=True
             )
@@ -141,6 +210,99 @@ class BaseJobBoardScraper:
             logger.error(f"Error fetching {url}: {e}")
             raise
 
+    def _get_fetch_engine(self) -> AsyncFetchEngine:
+        """Retourne le moteur async (partage les headers de la session)"""
+        if self._fetch_engine is None:
+            headers = dict(self.session.headers)
+            # httpx ne décode pas brotli sans dépendance supplémentaire
+            headers['Accept-Encoding'] = 'gzip, deflate'
+            self._fetch_engine = AsyncFetchEngine(
+                headers=headers,
+                timeout=self.timeout,
+                per_host_limit=self.max_concurrency,
+                transport=self.fixtures.async_transport() if self.fixtures is not None else None,
+                rate_limiter=self.rate_limiter
+            )
+        return self._fetch_engine
+
+    async def _afetch_page(
+        self,
+        url: str,
+        params: Dict = None,
+        cache_kind: str = 'scraping_results'
+    ):
+        """
+        Version asynchrone de `_fetch_page`
+
+        Args:
+            url: URL à récupérer
+            params: Paramètres de requête
+            cache_kind: Type de contenu pour le TTL du cache HTTP
+
+        Returns:
+            Response httpx
+        """
+        engine = self._get_fetch_engine()
+
+        if self.http_cache is not None:
+            return await self.http_cache.afetch(
+                url,
+                params,
+                send=lambda headers: engine.fetch(url, params=params, headers=headers),
+                kind=cache_kind,
+                source=self.source
+            )
+
+        return await engine.fetch(url, params=params)
+
+    async def _afetch_pages(self, requests_: Iterable[FetchRequest]) -> AsyncIterator[Any]:
+        """
+        Récupère plusieurs pages en parallèle (concurrence bornée par hôte)
+
+        Toutes les requêtes sont lancées d'un coup, mais chaque page est
+        livrée dès qu'elle est disponible et que les précédentes l'ont été.
+        Si l'appelant arrête l'itération, les requêtes restantes sont
+        annulées.
+
+        Yields:
+            Réponses ou exceptions, dans l'ordre des requêtes
+        """
+        tasks = [
+            asyncio.ensure_future(self._afetch_page(request.url, params=request.params))
+            for request in requests_
+        ]
+
+        try:
+            for task in tasks:
+                try:
+                    yield await task
+                except Exception as e:
+                    yield e
+        finally:
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def _run_sync(self, coro):
+        """
+        Exécute une coroutine du scraper depuis du code synchrone
+
+        Le client async est fermé à la fin, car il est lié à la boucle
+        créée pour l'occasion.
+        """
+        async def runner():
+            try:
+                return await coro
+            finally:
+                await self._get_fetch_engine().aclose()
+
+        return run_sync(runner())
+
+    def _iterate_sync(self, agen: AsyncIterator) -> Iterator:
+        """Consomme un itérateur async du scraper depuis du code synchrone"""
+        return iterate_sync(agen, on_close=self._get_fetch_engine().aclose)
+
     def scrape(self, **kwargs) -> List[JobOffer]:
         """
         Méthode abstraite à implémenter par chaque scraper
@@ -157,16 +319,46 @@ class IndeedScraper(BaseJobBoardScraper):
     BASE_URL = "https://fr.indeed.com"
     SEARCH_URL = f"{BASE_URL}/jobs"
 
-    def __init__(self, **kwargs):
+    PARSERS = ('bs4', 'lxml', 'json')
+
+    def __init__(
+        self,
+        detail_cache: Optional[JobDetailCache] = None,
+        parser: str = 'bs4',
+        seen_store: Optional[SeenOfferStore] = None,
+        **kwargs
+    ):
+        """
+        Initialise le scraper Indeed
+
+        Args:
+            detail_cache: Cache persistant des détails d'offres (optionnel)
+            parser: Moteur de parsing des pages de résultats: 'bs4'
+                (BeautifulSoup), 'lxml' (XPath précompilés, plus rapide,
+                même résultat) ou 'json' (JSON embarqué dans la page, repli
+                sur 'lxml' s'il est absent)
+            seen_store: Offres déjà ingérées; si fourni, le scrape devient
+                incrémental (seules les nouvelles offres sont retournées et la
+                pagination s'arrête dès qu'on atteint des offres déjà vues)
+            **kwargs: Options de BaseJobBoardScraper
+        """
+        if parser not in self.PARSERS:
+            raise ValueError(f"Parser inconnu: {parser} (choix: {', '.join(self.PARSERS)})")
+
         super().__init__(**kwargs)
         self.source = "Indeed"
+        self.detail_cache = detail_cache
+        self.parser = parser
+        self.seen_store = seen_store
+        self.last_scrape_stats: Optional[ScrapeStats] = None
 
     def scrape(
         self,
         query: str,
         location: str = "Paris",
         max_pages: int = 5,
-        radius: int = 25
+        radius: int = 25,
+        concurrent: bool = False
     ) -> List[JobOffer]:
         """
         Scrape des offres sur Indeed
@@ -176,52 +368,239 @@ class IndeedScraper(BaseJobBoardScraper):
             location: Localisation (ex: "Paris")
             max_pages: Nombre maximum de pages à scraper
             radius: Rayon de recherche en km
+            concurrent: Récupérer toutes les pages en parallèle via le
+                moteur async (voir `ascrape`)
 
         Returns:
-            Liste d'offres d'emploi
+            Liste d'offres d'emploi (uniquement les nouvelles en mode
+            incrémental; bilan dans `last_scrape_stats`)
+        """
+        if concurrent:
+            return self._run_sync(self.ascrape(query, location, max_pages, radius))
+
+        all_offers = list(self.scrape_iter(query, location, max_pages, radius))
+        logger.info(f"Scraping complete: {len(all_offers)} total offers found")
+        return all_offers
+
+    def scrape_iter(
+        self,
+        query: str,
+        location: str = "Paris",
+        max_pages: int = 5,
+        radius: int = 25,
+        concurrent: bool = False
+    ) -> Iterator[JobOffer]:
+        """
+        Scrape des offres sur Indeed, en flux
+
+        Les offres sont produites page par page, dès que chaque page est
+        parsée: le consommateur peut commencer son traitement (scoring,
+        stockage) sans attendre la fin du scrape, et seule la page en cours
+        est gardée en mémoire. Arrêter l'itération arrête le scrape.
+
+        Args:
+            query: Mots-clés de recherche (ex: "Python Developer")
+            location: Localisation (ex: "Paris")
+            max_pages: Nombre maximum de pages à scraper
+            radius: Rayon de recherche en km
+            concurrent: Récupérer les pages en parallèle via le moteur async
+                (voir `ascrape_iter`)
+
+        Yields:
+            Offres d'emploi (uniquement les nouvelles en mode incrémental;
+            bilan dans `last_scrape_stats` une fois le flux épuisé)
         """
+        if concurrent:
+            yield from self._iterate_sync(self.ascrape_iter(query, location, max_pages, radius))
+            return
+
         logger.info(f"Starting Indeed scrape: query='{query}', location='{location}'")
 
-        all_offers = []
+        tracker = IncrementalTracker(self.seen_store, self.source, query, location, max_pages)
+        completed = False
 
-        for page in range(max_pages):
-            try:
-                # Construire les paramètres de recherche
-                start = page * 10  # Indeed affiche 10 résultats par page
-                params = {
-                    'q': query,
-                    'l': location,
-                    'radius': radius,
-                    'start': start,
-                    'sort': 'date'  # Trier par date
-                }
-
-                logger.info(f"Fetching page {page + 1}/{max_pages} (start={start})")
-
-                # Récupérer la page
-                response = self._fetch_page(self.SEARCH_URL, params=params)
-
-                # Parser les offres
-                offers = self._parse_search_page(response.text)
+        try:
+            for page in range(max_pages):
+                try:
+                    # Construire les paramètres de recherche
+                    params = self._build_search_params(query, location, page, radius)
+                    start = params['start']
 
-                if not offers:
-                    logger.info(f"No more offers found on page {page + 1}")
-                    break
+                    logger.info(f"Fetching page {page + 1}/{max_pages} (start={start})")
+
+                    # Récupérer la page
+                    tracker.page_fetched()
+                    response = self._fetch_page(self.SEARCH_URL, params=params)
+
+                    # Parser les offres
+                    offers = self._parse_search_page(response.text)
+
+                    if not offers:
+                        logger.info(f"No more offers found on page {page + 1}")
+                        break
+
+                    new_offers, stop = tracker.filter_page(offers)
+                    logger.info(f"Found {len(offers)} offers on page {page + 1} ({len(new_offers)} new)")
 
-                all_offers.extend(offers)
-                logger.info(f"Found {len(offers)} offers on page {page + 1}")
+                except Exception as e:
+                    logger.error(f"Error scraping page {page + 1}: {e}")
+                    continue
+
+                yield from new_offers
+
+                if stop:
+                    logger.info(f"Reached already seen offers on page {page + 1}, stopping")
+                    break
 
                 # Rate limiting entre les pages
                 if page < max_pages - 1:
                     self._apply_rate_limit()
 
-            except Exception as e:
-                logger.error(f"Error scraping page {page + 1}: {e}")
-                continue
+            completed = True
+        finally:
+            self.last_scrape_stats = tracker.finish(commit=completed)
 
-        logger.info(f"Scraping complete: {len(all_offers)} total offers found")
+    def _build_search_params(
+        self,
+        query: str,
+        location: str,
+        page: int,
+        radius: int
+    ) -> Dict[str, Any]:
+        """Construit les paramètres de recherche d'une page"""
+        return {
+            'q': query,
+            'l': location,
+            'radius': radius,
+            'start': page * 10,  # Indeed affiche 10 résultats par page
+            'sort': 'date'  # Trier par date
+        }
+
+    async def ascrape(
+        self,
+        query: str,
+        location: str = "Paris",
+        max_pages: int = 5,
+        radius: int = 25
+    ) -> List[JobOffer]:
+        """
+        Scrape des offres sur Indeed en récupérant les pages en parallèle
+
+        Les pages sont toutes lancées d'un coup; la concurrence réelle est
+        bornée par hôte par le moteur async. Comme en mode séquentiel, on
+        s'arrête à la première page sans offres. En mode incrémental
+        (`seen_store`), les pages sont récupérées une par une pour pouvoir
+        arrêter la pagination dès qu'on atteint des offres déjà vues.
+
+        Args:
+            query: Mots-clés de recherche
+            location: Localisation
+            max_pages: Nombre maximum de pages à scraper
+            radius: Rayon de recherche en km
+
+        Returns:
+            Liste d'offres d'emploi
+        """
+        all_offers = [offer async for offer in self.ascrape_iter(query, location, max_pages, radius)]
+        logger.info(f"Async scraping complete: {len(all_offers)} total offers found")
         return all_offers
 
+    async def ascrape_iter(
+        self,
+        query: str,
+        location: str = "Paris",
+        max_pages: int = 5,
+        radius: int = 25
+    ) -> AsyncIterator[JobOffer]:
+        """
+        Version itérateur async de `ascrape`
+
+        Les offres d'une page sont produites dès que cette page et les
+        précédentes sont parsées. Arrêter l'itération annule les requêtes
+        encore en vol.
+
+        Args:
+            query: Mots-clés de recherche
+            location: Localisation
+            max_pages: Nombre maximum de pages à scraper
+            radius: Rayon de recherche en km
+
+        Yields:
+            Offres d'emploi, dans l'ordre des pages
+        """
+        logger.info(f"Starting async Indeed scrape: query='{query}', location='{location}'")
+
+        tracker = IncrementalTracker(self.seen_store, self.source, query, location, max_pages)
+        requests_ = [
+            FetchRequest(
+                url=self.SEARCH_URL,
+                params=self._build_search_params(query, location, page, radius)
+            )
+            for page in range(max_pages)
+        ]
+
+        if self.seen_store is None:
+            responses = self._afetch_pages(requests_)
+        else:
+            # Mode incrémental: pages une par une pour pouvoir s'arrêter tôt
+            responses = self._afetch_pages_sequentially(requests_)
+
+        completed = False
+        try:
+            page = 0
+            async for response in responses:
+                tracker.page_fetched()
+                if isinstance(response, BaseException):
+                    logger.error(f"Error scraping page {page + 1}: {response}")
+                    page += 1
+                    continue
+
+                offers = self._parse_search_page(response.text)
+                if not offers:
+                    logger.info(f"No more offers found on page {page + 1}")
+                    break
+
+                # Requêtes SQLite du seen store hors de la boucle d'événements
+                new_offers, stop = await asyncio.to_thread(tracker.filter_page, offers)
+                logger.info(f"Found {len(offers)} offers on page {page + 1} ({len(new_offers)} new)")
+                for offer in new_offers:
+                    yield offer
+
+                if stop:
+                    logger.info(f"Reached already seen offers on page {page + 1}, stopping")
+                    break
+                page += 1
+
+            completed = True
+        finally:
+            await responses.aclose()
+            self.last_scrape_stats = await asyncio.to_thread(tracker.finish, completed)
+
+    async def _afetch_pages_sequentially(self, requests_: List[FetchRequest]) -> AsyncIterator[Any]:
+        """Récupère les pages une par une (réponse ou exception par page)"""
+        for request in requests_:
+            try:
+                yield await self._afetch_page(request.url, params=request.params)
+            except Exception as e:
+                yield e
+
+    async def ascrape_many(self, searches: Iterable[Dict[str, Any]]) -> List[List[JobOffer]]:
+        """
+        Exécute plusieurs recherches en parallèle
+
+        Args:
+            searches: Paramètres de `ascrape` pour chaque recherche
+                (ex: [{'query': 'Python', 'location': 'Lyon'}, ...])
+
+        Returns:
+            Une liste d'offres par recherche, dans le même ordre
+        """
+        return await asyncio.gather(*(self.ascrape(**search) for search in searches))
+
+    def scrape_many(self, searches: Iterable[Dict[str, Any]]) -> List[List[JobOffer]]:
+        """Wrapper synchrone de `ascrape_many`"""
+        return self._run_sync(self.ascrape_many(list(searches)))
+
     def _parse_search_page(self, html: str) -> List[JobOffer]:
         """
         Parse une page de résultats de recherche Indeed
@@ -232,6 +611,18 @@ class IndeedScraper(BaseJobBoardScraper):
         Returns:
             Liste d'offres d'emploi
         """
+        if self.parser == 'json':
+            cards = embedded_json.parse_embedded_cards(html, self.BASE_URL)
+            if cards is not None:
+                return [JobOffer(source=self.source, **fields) for fields in cards]
+            logger.debug("Pas de JSON embarqué, repli sur le parser DOM")
+
+        if self.parser in ('lxml', 'json'):
+            return [
+                JobOffer(source=self.source, **fields)
+                for fields in fast_parser.parse_search_cards(html, self.BASE_URL)
+            ]
+
         soup = BeautifulSoup(html, 'lxml')
         offers = []
 
@@ -330,25 +721,124 @@ class IndeedScraper(BaseJobBoardScraper):
         Returns:
             Dictionnaire avec les détails de l'offre
         """
-        try:
-            response = self._fetch_page(job_url)
-            soup = BeautifulSoup(response.text, 'lxml')
+        if self.detail_cache is not None:
+            cached = self.detail_cache.get_details(job_url)
+            if cached is not None:
+                return cached
 
-            # Description complète
-            description_elem = soup.find('div', id='jobDescriptionText')
-            full_description = description_elem.get_text(strip=True) if description_elem else ""
+        try:
+            response = self._fetch_page(job_url, cache_kind='job_offers')
+            details = self._parse_job_details(response.text, job_url)
 
-            # Autres détails peuvent être extraits ici
+            if self.detail_cache is not None:
+                self.detail_cache.set_details(job_url, details)
 
-            return {
-                'full_description': full_description,
-                'url': job_url
-            }
+            return details
 
         except Exception as e:
             logger.error(f"Error fetching job details from {job_url}: {e}")
             return {}
 
+    async def aget_job_details_many(
+        self,
+        job_urls: Iterable[str]
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Récupère les détails de plusieurs offres, au fil de l'eau
+
+        Les URLs sont dédupliquées par URL canonique. Chaque offre a sa tâche,
+        lancée d'emblée: lecture du cache (dans un thread), puis récupération
+        réseau si besoin (concurrence bornée par hôte). Les résultats sont
+        retournés dès qu'ils arrivent: les offres en cache d'abord, pendant
+        que les autres sont déjà en cours de récupération.
+
+        Args:
+            job_urls: URLs des offres
+
+        Yields:
+            Tuples (url, détails); détails vaut {} si la récupération échoue
+        """
+        unique = {}
+        for job_url in job_urls:
+            unique.setdefault(canonical_job_url(job_url), job_url)
+
+        fetched = 0
+
+        async def resolve(job_url: str) -> Tuple[str, Dict[str, Any]]:
+            nonlocal fetched
+            if self.detail_cache is not None:
+                # Lecture SQLite dans un thread: la boucle continue de servir les autres tâches
+                cached = await asyncio.to_thread(self.detail_cache.get_details, job_url)
+                if cached is not None:
+                    return job_url, cached
+
+            fetched += 1
+            try:
+                response = await self._afetch_page(job_url, cache_kind='job_offers')
+                details = self._parse_job_details(response.text, job_url)
+            except Exception as e:
+                logger.error(f"Error fetching job details from {job_url}: {e}")
+                return job_url, {}
+
+            if self.detail_cache is not None:
+                await asyncio.to_thread(self.detail_cache.set_details, job_url, details)
+            return job_url, details
+
+        tasks = [asyncio.ensure_future(resolve(job_url)) for job_url in unique.values()]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        if self.detail_cache is not None:
+            logger.info(f"Job details: {len(tasks) - fetched} cached, {fetched} fetched")
+
+    def get_job_details_many(self, job_urls: Iterable[str]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Wrapper synchrone de `aget_job_details_many`
+
+        Les résultats sont produits dès qu'ils arrivent, ce qui permet de
+        commencer l'enrichissement sans attendre la dernière offre:
+
+            for url, details in scraper.get_job_details_many(urls):
+                ...
+
+        Args:
+            job_urls: URLs des offres
+
+        Yields:
+            Tuples (url, détails)
+        """
+        return self._iterate_sync(self.aget_job_details_many(list(job_urls)))
+
+    def _parse_job_details(self, html: str, job_url: str) -> Dict[str, Any]:
+        """
+        Parse la page de détail d'une offre
+
+        Args:
+            html: HTML de la page
+            job_url: URL de l'offre
+
+        Returns:
+            Dictionnaire avec les détails de l'offre
+        """
+        soup = BeautifulSoup(html, 'lxml')
+
+        # Description complète
+        description_elem = soup.find('div', id='jobDescriptionText')
+        full_description = description_elem.get_text(strip=True) if description_elem else ""
+
+        # Autres détails peuvent être extraits ici
+
+        return {
+            'full_description': full_description,
+            'url': job_url
+        }
+
 
 # Exemple d'usage
 if __name__ == "__main__":
@@ -0,0 +1,246 @@
+"""
+Décodage JSON en flux des grandes réponses d'API
+
+`response.json()` construit l'arbre complet de la réponse: avec des pages
+de 100 vacatures et leurs descriptions complètes, toutes les vacatures
+existent en mémoire en même temps que le corps décodé, avant même que la
+première soit parsée. Ici, le corps est lu par morceaux et seul le tableau
+de résultats est parcouru élément par élément:
+
+    fields = {}
+    for vacancy in iter_json_array(response.iter_content(65536), ('vacatures', 'items'), fields):
+        ...                      # une seule vacature décodée à la fois
+    fields['totaal']             # autres champs de premier niveau
+
+Chaque élément est décodé par `json.JSONDecoder.raw_decode` (C) dès qu'il
+est complet dans le tampon; le tampon ne conserve que la fin non lue.
+Mesure mémoire (tracemalloc): `python -m src.modules.detection.json_stream`.
+"""
+
+import codecs
+import json
+import logging
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Union
+
+logger = logging.getLogger(__name__)
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = ' \t\n\r'
+
+# Taille de lecture du corps des réponses
+CHUNK_SIZE = 64 * 1024
+
+
+class _Buffer:
+    """Tampon de texte alimenté par morceaux (bytes décodés à la volée)"""
+
+    def __init__(self, chunks: Iterable[Union[str, bytes]], encoding: str):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors='strict')
+        self.text = ''
+        self.pos = 0
+        self.exhausted = False
+
+    def fill(self) -> bool:
+        """Ajoute le morceau suivant; False si le flux est terminé"""
+        if self.exhausted:
+            return False
+
+        # Libère la partie déjà lue avant d'agrandir le tampon
+        if self.pos:
+            self.text = self.text[self.pos:]
+            self.pos = 0
+
+        for chunk in self._chunks:
+            if isinstance(chunk, bytes):
+                chunk = self._decoder.decode(chunk)
+            if chunk:
+                self.text += chunk
+                return True
+
+        self.exhausted = True
+        self.text += self._decoder.decode(b'', final=True)
+        return False
+
+    def peek(self) -> str:
+        """Premier caractère non blanc (chaîne vide en fin de flux)"""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return ''
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            raise ValueError(f"JSON invalide: '{char}' attendu, '{self.peek() or 'EOF'}' trouvé")
+        self.pos += 1
+
+    def expect_end(self):
+        """
+        Lit le flux jusqu'au bout: seuls des blancs peuvent suivre le document
+
+        (le cache HTTP ne stocke un corps lu en flux qu'une fois lu en entier)
+        """
+        if self.peek():
+            raise ValueError("JSON invalide: contenu après le document")
+
+    def decode_value(self) -> Any:
+        """
+        Décode la valeur JSON suivante
+
+        Une valeur n'est acceptée que si elle est suivie d'au moins un
+        caractère (un nombre coupé en fin de morceau serait sinon tronqué).
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.text, self.pos)
+                if end < len(self.text) or self.exhausted:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.exhausted:
+                    raise
+            if not self.fill():
+                # Dernière tentative sur le flux complet
+                value, self.pos = _DECODER.raw_decode(self.text, self.pos)
+                return value
+
+
+def iter_json_array(
+    chunks: Iterable[Union[str, bytes]],
+    array_keys: Sequence[str],
+    fields: Optional[Dict[str, Any]] = None,
+    encoding: str = 'utf-8'
+) -> Iterator[Any]:
+    """
+    Parcourt le tableau de résultats d'un objet JSON, élément par élément
+
+    Args:
+        chunks: Morceaux du corps (bytes ou str), ex: `response.iter_content()`
+        array_keys: Clés de premier niveau possibles du tableau (la première
+            rencontrée non vide est parcourue)
+        fields: Dictionnaire rempli avec les autres champs de premier niveau
+            (ceux placés après le tableau sont disponibles en fin d'itération)
+        encoding: Encodage des morceaux bytes
+
+    Yields:
+        Éléments du tableau, dans l'ordre
+
+    Raises:
+        ValueError: Si le document n'est pas un objet JSON valide
+    """
+    fields = {} if fields is None else fields
+    buffer = _Buffer(chunks, encoding)
+    streamed = False
+
+    buffer.expect('{')
+    if buffer.peek() == '}':
+        buffer.pos += 1
+        buffer.expect_end()
+        return
+
+    while True:
+        key = buffer.decode_value()
+        if not isinstance(key, str):
+            raise ValueError("JSON invalide: clé d'objet attendue")
+        buffer.expect(':')
+
+        if key in array_keys and not streamed and buffer.peek() == '[':
+            buffer.pos += 1
+            if buffer.peek() == ']':
+                buffer.pos += 1
+                fields[key] = []
+            else:
+                streamed = True
+                while True:
+                    yield buffer.decode_value()
+                    separator = buffer.peek()
+                    buffer.pos += 1
+                    if separator == ']':
+                        break
+                    if separator != ',':
+                        raise ValueError(f"JSON invalide dans '{key}': ',' ou ']' attendu")
+        else:
+            fields[key] = buffer.decode_value()
+
+        separator = buffer.peek()
+        buffer.pos += 1
+        if separator == '}':
+            buffer.expect_end()
+            return
+        if separator != ',':
+            raise ValueError("JSON invalide: ',' ou '}' attendu")
+
+
+# Mesure mémoire: python -m src.modules.detection.json_stream [vacatures]
+if __name__ == "__main__":
+    import sys
+    import time
+    import tracemalloc
+
+    import io
+
+    import requests
+
+    from .http_cache import HTTPCache
+    from .rate_limiter import RateLimiter
+    from .vdab_api import VDABScraper
+
+    logging.basicConfig(level=logging.ERROR)
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    description = "Je werkt met Python, SQL en cloud in een agile team. " * 80
+    body = json.dumps({
+        'vacatures': [
+            {
+                'id': str(60000000 + i),
+                'titel': f"Backend Developer {i}",
+                'werkgever': {'naam': "Colruyt Group"},
+                'werklocatie': {'gemeente': "Gent"},
+                'omschrijving': description,
+                'publicatiedatum': '2026-10-01',
+                'competenties': [{'code': str(c), 'omschrijving': f"Competentie {c}"} for c in range(20)],
+            }
+            for i in range(count)
+        ],
+        'totaal': count,
+    }).encode('utf-8')
+
+    scraper = VDABScraper(client_id='benchmark', rate_limiter=RateLimiter())
+    chunks = [body[i:i + CHUNK_SIZE] for i in range(0, len(body), CHUNK_SIZE)]
+
+    def materialized():
+        return sum(1 for _ in scraper._iter_response(json.loads(body)))
+
+    def streamed():
+        return sum(1 for _ in scraper._iter_stream(iter(chunks)))
+
+    cache = HTTPCache(':memory:')
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(body)
+
+    def cached():
+        # Réponse `stream=True` manquée par le cache: stockée au fil de la lecture
+        page = scraper._read_search_page(cache.fetch("https://vdab.test/vacatures", None, lambda _: response))
+        return len(page.offers)
+
+    print("=" * 80)
+    print(f"🧠 MÉMOIRE DU DÉCODAGE VDAB ({count} vacatures, corps de {len(body) / 1024:.0f} Ko)")
+    print("=" * 80)
+
+    for label, decode in (
+        ("response.json() + parsing", materialized),
+        ("flux (raw_decode)", streamed),
+        ("flux + cache HTTP", cached),
+    ):
+        tracemalloc.start()
+        start = time.perf_counter()
+        offers = decode()
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"   {label:<26}: pic {peak / 1024:8.0f} Ko, {elapsed * 1000:6.1f} ms, {offers} offres")
@@ -0,0 +1,608 @@
+"""
+Détection des quasi-doublons (MinHash + LSH)
+
+`StreamingDeduplicator` ne retire que les couples (titre, entreprise)
+identiques en minuscules: "Python Developer (m/v/x)" chez "Acme NV" et
+"Python developer" chez "ACME" passent tous les deux. Ici, le titre de
+chaque offre est réduit à un ensemble de caractéristiques normalisées (mots
+et bigrammes), puis à une signature MinHash. Le découpage de la signature
+en bandes (LSH), propres à chaque entreprise normalisée (sans forme
+juridique), ne compare une offre qu'aux offres de la même entreprise qui
+partagent au moins une bande: pas de comparaison O(n²), l'index peut
+couvrir tout l'historique. Seul le premier exemplaire d'un groupe de
+doublons (son représentant) entre dans les bandes: les exemplaires
+suivants pointent vers lui, et une bande ne livre que ses
+`bucket_limit` offres les plus récentes.
+
+Deux offres ne sont doublons que si leur entreprise est la même et leur
+titre proche (Jaccard exact au-dessus de `threshold`): une description
+commune ne suffit pas ("Python Developer" / "Java Developer" chez Randstad,
+qui réutilise le même texte, restent distinctes). La description
+(signature MinHash de ses premiers shingles) n'est qu'un signal secondaire:
+elle départage les candidats qui passent ce critère.
+
+    index = NearDuplicateIndex()              # cache/near_duplicates.db
+    match = index.find_or_add(offer.id, offer.title, offer.company, offer.description)
+    if match:
+        duplicate_of, similarity = match
+
+Les signatures sont calculées en une passe (one permutation hashing):
+chaque caractéristique est hachée une seule fois, pas `num_perm` fois.
+Débit: `python -m src.modules.detection.near_duplicates [offres]`.
+"""
+
+import hashlib
+import json
+import logging
+import operator
+import random
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from array import array
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+from .cache import DEFAULT_CACHE_DIR
+from .settings import load_integrations_config
+
+logger = logging.getLogger(__name__)
+
+# Mentions de genre des intitulés ("(m/v/x)", "H/F", "m/f/d"...)
+_GENDER_MARKER = re.compile(r'\(?\b[mhfvxwd]\s*/\s*[mhfvxwd](?:\s*/\s*[mhfvxwd])?\b\)?')
+_NON_WORD = re.compile(r'[^a-z0-9]+')
+
+# Formes juridiques ignorées dans le nom des entreprises
+LEGAL_FORMS = frozenset({
+    'nv', 'sa', 'bv', 'bvba', 'sprl', 'srl', 'cv', 'cvba', 'scrl', 'vzw', 'asbl',
+    'sas', 'sarl', 'gmbh', 'ag', 'ltd', 'limited', 'inc', 'llc', 'plc', 'belgium', 'belgie',
+})
+
+
+@dataclass
+class MinHashSettings:
+    """
+    Réglages de la détection (section `aggregator.near_duplicates`
+    d'integrations.json)
+
+    Le seuil de collision LSH vaut environ (1 / bands) ** (1 / rows): avec
+    64 valeurs en 16 bandes de 4, des titres similaires à 50% ont
+    déjà de bonnes chances d'être comparés; `threshold` tranche ensuite.
+    """
+    num_perm: int = 64              # Taille des signatures
+    bands: int = 16                 # Bandes LSH (num_perm doit être un multiple)
+    threshold: float = 0.7          # Similarité minimale des titres d'un doublon
+    shingle_size: int = 3           # Mots par shingle de description
+    description_chars: int = 300    # Début de description pris en compte
+    seed: int = 1                   # Graine des fonctions de hachage
+    bucket_limit: int = 50          # Candidats lus par bande LSH (les plus récents)
+    max_age_days: int = 180         # Âge au-delà duquel `purge()` retire une offre
+
+    def __post_init__(self):
+        if self.num_perm % self.bands:
+            raise ValueError(f"num_perm ({self.num_perm}) doit être un multiple de bands ({self.bands})")
+
+    @property
+    def rows(self) -> int:
+        """Valeurs de signature par bande"""
+        return self.num_perm // self.bands
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]] = None) -> 'MinHashSettings':
+        """
+        Lit les réglages depuis integrations.json
+
+        Args:
+            config: Configuration déjà chargée (défaut: integrations.json)
+        """
+        if config is None:
+            config = load_integrations_config()
+
+        section = config.get('aggregator', {}).get('near_duplicates') or {}
+        defaults = asdict(cls())
+        return cls(**{
+            name: type(default)(section.get(name, default)) for name, default in defaults.items()
+        })
+
+
+def normalize_words(text: Optional[str], drop: frozenset = frozenset()) -> List[str]:
+    """
+    Mots normalisés d'un texte: minuscules, sans accents, sans mentions de
+    genre ni ponctuation
+
+    Args:
+        text: Texte à normaliser
+        drop: Mots ignorés (ex: `LEGAL_FORMS`)
+    """
+    text = text or ''
+    if not text.isascii():
+        # Accents retirés (é -> e), autres caractères non latins ignorés
+        text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+    text = _GENDER_MARKER.sub(' ', text.lower())
+    return [word for word in _NON_WORD.split(text) if word and word not in drop]
+
+
+def title_features(title: str) -> Set[str]:
+    """Caractéristiques du titre (critère obligatoire): mots et bigrammes"""
+    title_words = normalize_words(title)
+    features = {f"t:{word}" for word in title_words}
+    features.update(f"t:{a} {b}" for a, b in zip(title_words, title_words[1:]))
+    return features
+
+
+def company_key(company: str) -> str:
+    """Entreprise normalisée, sans forme juridique (critère obligatoire)"""
+    return ' '.join(normalize_words(company, drop=LEGAL_FORMS))
+
+
+def description_features(description: Optional[str], settings: Optional[MinHashSettings] = None) -> Set[str]:
+    """
+    Caractéristiques de la description (signal secondaire): shingles de
+    `shingle_size` mots sur ses `description_chars` premiers caractères
+    """
+    settings = settings or MinHashSettings()
+    if not description or not settings.description_chars:
+        return set()
+
+    words = normalize_words(description[:settings.description_chars])
+    size = settings.shingle_size
+    return {f"d:{' '.join(words[i:i + size])}" for i in range(max(1, len(words) - size + 1)) if words}
+
+
+def offer_features(
+    title: str,
+    company: str,
+    description: Optional[str] = None,
+    settings: Optional[MinHashSettings] = None
+) -> Set[str]:
+    """
+    Toutes les caractéristiques d'une offre: titre, entreprise
+    (`company_key`) et description
+    """
+    features = title_features(title) | description_features(description, settings)
+    company = company_key(company)
+    if company:
+        features.add(f"c:{company}")
+    return features
+
+
+def jaccard(first: Set[str], second: Set[str]) -> float:
+    """Similarité de Jaccard exacte de deux ensembles"""
+    if not first or not second:
+        return 0.0
+    shared = len(first & second)
+    return shared / (len(first) + len(second) - shared)
+
+
+class MinHasher:
+    """
+    Signatures MinHash en une passe (one permutation hashing)
+
+    Chaque caractéristique est hachée une fois (blake2b, 32 bits): le reste
+    de la division par `num_perm` choisit sa case, le quotient est sa
+    valeur, et chaque case garde le minimum. Une case vide reprend la
+    valeur de la première case pleine dans un ordre pseudo-aléatoire propre
+    à la case (densification "optimale"): l'estimateur de Jaccard reste
+    celui des signatures MinHash classiques sans corréler les cases
+    voisines, pour un coût en O(caractéristiques).
+    """
+
+    def __init__(self, settings: Optional[MinHashSettings] = None):
+        """
+        Args:
+            settings: Réglages (taille des signatures, graine)
+        """
+        self.settings = settings or MinHashSettings()
+        self._key = f"minhash:{self.settings.seed}".encode('utf-8')
+
+        # Ordre de recherche d'une case pleine, propre à chaque case
+        rng = random.Random(self.settings.seed)
+        self._donors = []
+        for position in range(self.settings.num_perm):
+            order = [other for other in range(self.settings.num_perm) if other != position]
+            rng.shuffle(order)
+            self._donors.append(order)
+
+    def signature(self, features: Set[str]) -> Optional[List[int]]:
+        """
+        Signature MinHash d'un ensemble de caractéristiques
+
+        Returns:
+            `num_perm` entiers 32 bits, ou None si l'ensemble est vide
+        """
+        if not features:
+            return None
+
+        size = self.settings.num_perm
+        empty = 1 << 32
+        signature = [empty] * size
+        key = self._key
+
+        for feature in features:
+            value = int.from_bytes(
+                hashlib.blake2b(feature.encode('utf-8'), digest_size=4, key=key).digest(), 'little'
+            )
+            position, value = value % size, value // size
+            if value < signature[position]:
+                signature[position] = value
+
+        # Densification: une case vide reprend une case pleine, choisie dans
+        # le même ordre pour toutes les signatures
+        if empty in signature:
+            filled = signature[:]
+            for position, value in enumerate(filled):
+                if value == empty:
+                    donor = next(other for other in self._donors[position] if filled[other] != empty)
+                    signature[position] = filled[donor]
+
+        return signature
+
+    def band_keys(self, signature: Sequence[int], scope: str = '') -> List[int]:
+        """
+        Clé LSH (entier 64 bits signé) de chaque bande de la signature
+
+        Args:
+            signature: Signature MinHash
+            scope: Ajouté à chaque clé: seules les signatures de même
+                `scope` (entreprise) partagent un bucket
+        """
+        rows = self.settings.rows
+        prefix = scope.encode('utf-8') + b'\0'
+        keys = []
+        for band in range(self.settings.bands):
+            chunk = prefix + array('I', signature[band * rows:(band + 1) * rows]).tobytes()
+            digest = hashlib.blake2b(chunk, digest_size=8, person=band.to_bytes(2, 'big')).digest()
+            keys.append(int.from_bytes(digest, 'big', signed=True))
+        return keys
+
+    @staticmethod
+    def similarity(first: Sequence[int], second: Sequence[int]) -> float:
+        """Similarité de Jaccard estimée (part des valeurs identiques)"""
+        return sum(map(operator.eq, first, second)) / len(first)
+
+
+class NearDuplicateIndex:
+    """
+    Index LSH persistant des offres déjà vues (SQLite)
+
+    Les bandes LSH portent sur le titre, par entreprise; chaque offre garde
+    aussi les caractéristiques de son titre (pour un Jaccard exact sur les
+    candidats) et la signature de sa description. Un doublon trouvé par
+    `find_or_add` est enregistré avec son représentant, sans entrer dans
+    les bandes: un groupe de doublons ne pèse qu'une offre par bande.
+    Les ajouts sont validés par lots (`commit_every`) ou par `flush()` /
+    `close()`; ils sont visibles des recherches immédiatement.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = DEFAULT_CACHE_DIR / 'near_duplicates.db',
+        settings: Optional[MinHashSettings] = None,
+        commit_every: int = 1000
+    ):
+        """
+        Args:
+            path: Chemin du fichier SQLite (":memory:" pour les tests)
+            settings: Réglages (défaut: integrations.json)
+            commit_every: Ajouts entre deux validations SQLite
+
+        Raises:
+            ValueError: Si l'index existant a été construit avec d'autres
+                réglages de signature
+        """
+        self.path = str(path)
+        self.settings = settings or MinHashSettings.from_config()
+        self.hasher = MinHasher(self.settings)
+        self.commit_every = commit_every
+        self._pending = 0
+
+        if self.path != ':memory:':
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        # Index volumineux (16 entrées LSH par représentant): cache de pages élargi,
+        # validations sans fsync complet (l'index se reconstruit au besoin)
+        self._conn.execute("PRAGMA cache_size = -65536")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        if self.path != ':memory:':
+            self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS signatures ("
+            "  id INTEGER PRIMARY KEY, offer_id TEXT NOT NULL UNIQUE, features TEXT NOT NULL,"
+            "  description BLOB, duplicate_of TEXT, similarity REAL, added_at REAL NOT NULL);"
+            # Entrées des bandes: identifiant (ordre d'ajout) des représentants
+            "CREATE TABLE IF NOT EXISTS buckets ("
+            "  key INTEGER NOT NULL, entry INTEGER NOT NULL, PRIMARY KEY (key, entry)"
+            ") WITHOUT ROWID;"
+        )
+        self._check_params()
+
+    def _check_params(self):
+        """Les signatures stockées ne sont comparables qu'à réglages identiques"""
+        params = {
+            name: getattr(self.settings, name)
+            for name in ('num_perm', 'bands', 'shingle_size', 'description_chars', 'seed')
+        }
+        # Bandes sur le titre par entreprise (les index antérieurs
+        # mélangeaient entreprise et description aux signatures), limitées
+        # aux représentants (les index antérieurs y mettaient chaque offre)
+        params['keys'] = 'title_by_company'
+        params['buckets'] = 'representatives'
+        params = json.dumps(params, sort_keys=True)
+
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'params'").fetchone()
+        if row is None:
+            self._conn.execute("INSERT INTO meta (key, value) VALUES ('params', ?)", (params,))
+            self._conn.commit()
+        elif row[0] != params:
+            raise ValueError(
+                f"Index {self.path} construit avec d'autres réglages ({row[0]}): "
+                "le supprimer pour le reconstruire"
+            )
+
+    def signature(self, title: str) -> Optional[List[int]]:
+        """Signature MinHash du titre (clés LSH, avec l'entreprise)"""
+        return self.hasher.signature(title_features(title))
+
+    def band_keys(self, title: str, company: str) -> List[int]:
+        """Clés LSH d'une offre (vide si son titre est vide)"""
+        signature = self.signature(title)
+        return self.hasher.band_keys(signature, company_key(company)) if signature is not None else []
+
+    def query(
+        self,
+        title: str,
+        company: str,
+        description: Optional[str] = None,
+        exclude: Optional[str] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Offres indexées proches d'une offre
+
+        Args:
+            exclude: Identifiant à ignorer (l'offre elle-même)
+
+        Returns:
+            (identifiant, similarité des titres) des offres de la même
+            entreprise au-dessus de `threshold`, plus similaires d'abord
+            (description à égalité)
+        """
+        entry = self._entry(title, company, description)
+        if entry is None:
+            return []
+        with self._lock:
+            return self._matches(*entry, exclude=exclude)
+
+    def add(self, offer_id: str, title: str, company: str, description: Optional[str] = None) -> bool:
+        """
+        Ajoute une offre à l'index
+
+        Returns:
+            False si l'offre est déjà indexée ou sans titre
+        """
+        entry = self._entry(title, company, description)
+        if entry is None:
+            return False
+        with self._lock:
+            return self._insert(offer_id, *entry)
+
+    def find_or_add(
+        self,
+        offer_id: str,
+        title: str,
+        company: str,
+        description: Optional[str] = None
+    ) -> Optional[Tuple[str, float]]:
+        """
+        Cherche un quasi-doublon puis indexe l'offre
+
+        Seules les offres indexées avant elle comptent: une offre revue d'un
+        run à l'autre garde le même verdict (la première d'un groupe de
+        doublons n'est jamais doublon des suivantes). Un doublon est
+        enregistré avec son représentant, hors des bandes LSH.
+
+        Returns:
+            (identifiant du doublon le plus proche, similarité des titres)
+            ou None
+        """
+        entry = self._entry(title, company, description)
+        if entry is None:
+            return None
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id, duplicate_of, similarity FROM signatures WHERE offer_id = ?", (offer_id,)
+            ).fetchone()
+            if row is None:
+                matches = self._matches(*entry, exclude=offer_id)
+                self._insert(offer_id, *entry, match=matches[0] if matches else None)
+            elif row[1] is not None:
+                # Doublon déjà vu: même représentant qu'au premier passage
+                return row[1], row[2]
+            else:
+                matches = self._matches(*entry, exclude=offer_id, before=row[0])
+        return matches[0] if matches else None
+
+    def _entry(
+        self,
+        title: str,
+        company: str,
+        description: Optional[str]
+    ) -> Optional[Tuple[Set[str], List[int], Optional[List[int]]]]:
+        """Caractéristiques du titre, clés LSH et signature de la description"""
+        features = title_features(title)
+        signature = self.hasher.signature(features)
+        if signature is None:
+            return None
+        description_signature = self.hasher.signature(description_features(description, self.settings))
+        return features, self.hasher.band_keys(signature, company_key(company)), description_signature
+
+    def _matches(
+        self,
+        features: Set[str],
+        keys: List[int],
+        description: Optional[List[int]],
+        exclude: Optional[str],
+        before: Optional[int] = None
+    ) -> List[Tuple[str, float]]:
+        # Par bande, les `bucket_limit` représentants les plus récents
+        # indexés avant `before`
+        bucket = "SELECT * FROM (SELECT entry FROM buckets WHERE key = ? AND entry < ? ORDER BY entry DESC LIMIT ?)"
+        bound = before if before is not None else 2 ** 63 - 1
+        params = [value for key in keys for value in (key, bound, self.settings.bucket_limit)]
+
+        matches = []
+        rows = self._conn.execute(
+            f"SELECT offer_id, features, description FROM signatures "
+            f"WHERE id IN ({' UNION '.join([bucket] * len(keys))})",
+            params
+        )
+        for offer_id, stored, blob in rows:
+            if offer_id == exclude:
+                continue
+            # Critère obligatoire: même entreprise (bucket), titres proches (Jaccard exact)
+            similarity = jaccard(features, set(stored.split('\n')))
+            if similarity < self.settings.threshold:
+                continue
+            # Signal secondaire: description, pour départager les candidats
+            shared = (
+                MinHasher.similarity(description, array('I', blob))
+                if description is not None and blob is not None else 0.0
+            )
+            matches.append((offer_id, similarity, shared))
+
+        matches.sort(key=lambda match: (-match[1], -match[2], match[0]))
+        return [(offer_id, similarity) for offer_id, similarity, _ in matches]
+
+    def _insert(
+        self,
+        offer_id: str,
+        features: Set[str],
+        keys: List[int],
+        description: Optional[List[int]],
+        match: Optional[Tuple[str, float]] = None
+    ) -> bool:
+        duplicate_of, similarity = match or (None, None)
+        cursor = self._conn.execute(
+            "INSERT OR IGNORE INTO signatures "
+            "(offer_id, features, description, duplicate_of, similarity, added_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (offer_id, '\n'.join(sorted(features)),
+             array('I', description).tobytes() if description is not None else None,
+             duplicate_of, similarity, time.time())
+        )
+        if not cursor.rowcount:
+            return False
+
+        if match is None:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO buckets (key, entry) VALUES (?, ?)",
+                [(key, cursor.lastrowid) for key in keys]
+            )
+        self._pending += 1
+        if self._pending >= self.commit_every:
+            self._conn.commit()
+            self._pending = 0
+        return True
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM signatures").fetchone()[0]
+
+    def purge(self, max_age_days: Optional[int] = None) -> int:
+        """
+        Retire les offres indexées depuis plus de `max_age_days`
+
+        Parcourt toute la table des bandes: opération de maintenance, à
+        lancer périodiquement plutôt qu'à chaque run.
+
+        Args:
+            max_age_days: Âge maximal (défaut: réglage `max_age_days`)
+
+        Returns:
+            Nombre d'offres retirées
+        """
+        days = self.settings.max_age_days if max_age_days is None else max_age_days
+        cutoff = time.time() - days * 86400
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM buckets WHERE entry IN (SELECT id FROM signatures WHERE added_at < ?)", (cutoff,)
+            )
+            removed = self._conn.execute("DELETE FROM signatures WHERE added_at < ?", (cutoff,)).rowcount
+            self._conn.commit()
+            self._pending = 0
+        return removed
+
+    def flush(self):
+        """Valide les ajouts en attente"""
+        with self._lock:
+            self._conn.commit()
+            self._pending = 0
+
+    def close(self):
+        """Valide les ajouts et ferme la connexion SQLite"""
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
+
+
+# Débit: python -m src.modules.detection.near_duplicates [offres] [chemin.db]
+if __name__ == "__main__":
+    import os
+    import sys
+    import tempfile
+
+    logging.basicConfig(level=logging.ERROR)
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    path = sys.argv[2] if len(sys.argv) > 2 else os.path.join(tempfile.mkdtemp(), 'near_duplicates.db')
+
+    titles = ["Python Developer", "Data Engineer", "DevOps Engineer", "Backend Developer",
+              "Java Developer", "Frontend Developer", "Data Analyst", "Cloud Architect"]
+    companies = ["Acme", "Colruyt Group", "KBC", "Proximus", "Barco", "Agfa", "UCB", "Umicore"]
+    words = ("python sql cloud kubernetes agile team scrum api docker data pipeline azure aws "
+             "spark kafka django react testing security linux gent brussel antwerpen leuven "
+             "senior junior medior ervaring opleiding contract voltijds thuiswerk").split()
+    rng = random.Random(7)
+
+    def synthetic_batch(start: int, size: int) -> List[Tuple[str, str, str, str]]:
+        """
+        Offres synthétiques; une sur dix reprend une offre récente sous une
+        autre forme (titre, entreprise et description réécrits)
+        """
+        batch = []
+        for i in range(start, start + size):
+            if batch and i % 10 == 0:
+                _, title, company, description = batch[rng.randrange(max(0, len(batch) - 10), len(batch))]
+                rewritten = ' '.join(description.split()[:20] + rng.choices(words, k=25))
+                batch.append((f"offer-{i}", f"{title} (m/v/x)", f"{company.upper()} NV", rewritten))
+            else:
+                batch.append((f"offer-{i}", f"{rng.choice(titles)} {i % 997}",
+                              f"{rng.choice(companies)} {i % 389}", ' '.join(rng.choices(words, k=45))))
+        return batch
+
+    index = NearDuplicateIndex(path, settings=MinHashSettings())
+    print("=" * 80)
+    print(f"🔎 QUASI-DOUBLONS MINHASH/LSH ({count:,} offres)")
+    print("=" * 80)
+
+    duplicates, elapsed, done = 0, 0.0, 0
+    while done < count:
+        batch = synthetic_batch(done, min(10_000, count - done))
+        start = time.perf_counter()
+        duplicates += sum(1 for offer in batch if index.find_or_add(*offer))
+        elapsed += time.perf_counter() - start
+        done += len(batch)
+        if done % 100_000 == 0:
+            print(f"   {done:>10,} offres: {done / elapsed:8,.0f} offres/s, {duplicates:,} doublons")
+
+    start = time.perf_counter()
+    index.flush()
+    elapsed += time.perf_counter() - start
+    print(f"   Total: {count / elapsed:,.0f} offres/s, {duplicates:,} doublons "
+          f"(~{count // 10:,} variantes injectées), {elapsed:.1f} s d'indexation")
+    print(f"   Index: {path} ({os.path.getsize(path) / 1024 ** 2:,.0f} Mo)")
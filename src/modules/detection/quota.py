@@ -0,0 +1,411 @@
+"""
+Quota journalier des API et regroupement des requêtes identiques
+
+L'API VDAB autorise environ 1000 requêtes par jour. Le `QuotaLedger` compte
+les requêtes réellement envoyées, par jour, dans SQLite (le décompte survit
+aux redémarrages et est partagé entre processus). Chaque appel a une
+priorité; à l'approche de la limite, les appels les moins prioritaires sont
+refusés en premier:
+
+    "quota": {
+        "daily_limit": 1000,
+        "thresholds": {"low": 0.8, "normal": 0.95, "high": 1.0}
+    }
+
+Ici, les appels 'low' sont abandonnés au-delà de 800 requêtes, les appels
+'normal' sont reportés au lendemain au-delà de 950 (`QuotaExceeded.retry_at`)
+et seuls les appels 'high' peuvent consommer les dernières requêtes.
+
+Le `RequestCoalescer` évite de dépenser du quota sur des doublons: des
+appels identiques en cours partagent une seule requête, et une réponse
+récente est réutilisée pendant `ttl` secondes.
+
+Par défaut, les scrapers utilisent le décompte partagé du processus
+(`get_quota_ledger`), créé depuis `job_boards.<board>.quota`
+(`"enabled": false` le désactive).
+"""
+
+import logging
+import math
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar, Union
+
+import requests
+
+from .cache import DEFAULT_CACHE_DIR
+from .recording import FixtureStore
+from .settings import load_integrations_config
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+PRIORITIES = ('low', 'normal', 'high')
+
+# Part du quota journalier utilisable par priorité
+DEFAULT_THRESHOLDS = {'low': 0.8, 'normal': 0.95, 'high': 1.0}
+
+
+class QuotaExceeded(requests.RequestException):
+    """
+    Requête refusée par le quota journalier
+
+    Attributes:
+        priority: Priorité de l'appel refusé
+        used: Requêtes déjà consommées aujourd'hui
+        limit: Plafond applicable à cette priorité
+        retry_at: Début du prochain jour de quota
+        dropped: True pour un appel 'low' (abandonné), False s'il est à
+            reporter à `retry_at`
+    """
+
+    def __init__(self, priority: str, used: int, limit: int, retry_at: datetime):
+        self.priority = priority
+        self.used = used
+        self.limit = limit
+        self.retry_at = retry_at
+        self.dropped = priority == 'low'
+        action = "abandonné" if self.dropped else f"reporté à {retry_at:%Y-%m-%d %H:%M}"
+        super().__init__(f"Quota atteint ({used}/{limit} pour '{priority}'): appel {action}")
+
+
+class QuotaLedger:
+    """
+    Décompte journalier des requêtes d'une API, persisté dans SQLite
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = DEFAULT_CACHE_DIR / 'api_quota.db',
+        daily_limit: int = 1000,
+        thresholds: Optional[Dict[str, float]] = None,
+        scope: str = 'vdab',
+        clock: Callable[[], datetime] = datetime.now
+    ):
+        """
+        Args:
+            path: Chemin du fichier SQLite (":memory:" pour les tests)
+            daily_limit: Requêtes autorisées par jour
+            thresholds: Part du quota utilisable par priorité
+            scope: API décomptée (plusieurs API peuvent partager le fichier)
+            clock: Heure locale courante (le jour de quota change à minuit)
+        """
+        self.path = str(path)
+        self.daily_limit = daily_limit
+        self.thresholds = dict(DEFAULT_THRESHOLDS, **(thresholds or {}))
+        self.scope = scope
+        self.clock = clock
+
+        if self.path != ':memory:':
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS quota_usage ("
+            "  scope TEXT NOT NULL, day TEXT NOT NULL, used INTEGER NOT NULL DEFAULT 0,"
+            "  PRIMARY KEY (scope, day))"
+        )
+        self._conn.commit()
+
+    @classmethod
+    def from_config(
+        cls,
+        config: Optional[Dict[str, Any]] = None,
+        board: str = 'vdab',
+        **kwargs
+    ) -> 'QuotaLedger':
+        """
+        Crée le décompte d'un job board depuis `job_boards.<board>.quota`
+
+        Args:
+            config: Configuration déjà chargée (défaut: integrations.json)
+            board: Nom du job board (sert aussi de portée)
+            **kwargs: Autres options de QuotaLedger
+        """
+        if config is None:
+            config = load_integrations_config()
+
+        section = config.get('job_boards', {}).get(board, {}).get('quota') or {}
+        kwargs.setdefault('daily_limit', int(section.get('daily_limit', 1000)))
+        kwargs.setdefault('thresholds', section.get('thresholds'))
+        if section.get('path'):
+            kwargs.setdefault('path', section['path'])
+        return cls(scope=board, **kwargs)
+
+    def _today(self) -> date:
+        return self.clock().date()
+
+    def limit_for(self, priority: str) -> int:
+        """Nombre de requêtes du jour utilisables par un appel de cette priorité"""
+        if priority not in self.thresholds:
+            raise ValueError(f"Priorité inconnue: {priority} (choix: {', '.join(PRIORITIES)})")
+        return min(self.daily_limit, math.floor(self.daily_limit * self.thresholds[priority]))
+
+    def used(self, day: Optional[date] = None) -> int:
+        """Requêtes consommées un jour donné (défaut: aujourd'hui)"""
+        day = day or self._today()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT used FROM quota_usage WHERE scope = ? AND day = ?",
+                (self.scope, day.isoformat())
+            ).fetchone()
+        return row[0] if row else 0
+
+    def remaining(self, priority: str = 'high') -> int:
+        """Requêtes encore disponibles aujourd'hui pour cette priorité"""
+        return max(0, self.limit_for(priority) - self.used())
+
+    def retry_at(self) -> datetime:
+        """Début du prochain jour de quota"""
+        return datetime.combine(self._today() + timedelta(days=1), datetime.min.time())
+
+    def acquire(self, priority: str = 'normal') -> int:
+        """
+        Réserve une requête dans le quota du jour
+
+        Le test et l'incrément sont une seule instruction SQL: deux
+        processus ne peuvent pas dépasser le plafond ensemble.
+
+        Returns:
+            Requêtes consommées aujourd'hui, celle-ci comprise
+
+        Raises:
+            QuotaExceeded: Si le plafond de cette priorité est atteint
+        """
+        limit = self.limit_for(priority)
+        day = self._today().isoformat()
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO quota_usage (scope, day, used) VALUES (?, ?, 0)",
+                (self.scope, day)
+            )
+            cursor = self._conn.execute(
+                "UPDATE quota_usage SET used = used + 1 WHERE scope = ? AND day = ? AND used < ?",
+                (self.scope, day, limit)
+            )
+            used = self._conn.execute(
+                "SELECT used FROM quota_usage WHERE scope = ? AND day = ?", (self.scope, day)
+            ).fetchone()[0]
+            self._conn.commit()
+
+        if cursor.rowcount == 0:
+            error = QuotaExceeded(priority, used, limit, self.retry_at())
+            logger.warning(f"⛔ {error}")
+            raise error
+
+        if used == self.limit_for('low') or used == self.limit_for('normal'):
+            logger.warning(f"⚠️ Quota {self.scope}: {used}/{self.daily_limit} requêtes utilisées aujourd'hui")
+        return used
+
+    def history(self, days: int = 7) -> Dict[str, int]:
+        """Requêtes consommées par jour sur les `days` derniers jours"""
+        since = (self._today() - timedelta(days=days - 1)).isoformat()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT day, used FROM quota_usage WHERE scope = ? AND day >= ? ORDER BY day",
+                (self.scope, since)
+            ).fetchall()
+        return dict(rows)
+
+    def close(self):
+        """Ferme la connexion SQLite"""
+        with self._lock:
+            self._conn.close()
+
+
+@dataclass
+class CoalescingStats:
+    """Compteurs du regroupement de requêtes"""
+    upstream: int = 0   # Requêtes réellement exécutées
+    joined: int = 0     # Appels rattachés à une requête identique en cours
+    reused: int = 0     # Appels servis par une réponse récente
+
+    @property
+    def saved(self) -> int:
+        """Requêtes économisées"""
+        return self.joined + self.reused
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convertit les compteurs en dictionnaire"""
+        data = asdict(self)
+        data['saved'] = self.saved
+        return data
+
+
+class RequestCoalescer:
+    """
+    Une seule exécution par clé pour les appels concurrents ou rapprochés
+
+    Le premier appel d'une clé exécute la fonction; les appels identiques
+    arrivés pendant l'exécution attendent son résultat (ou son exception).
+    Un succès est ensuite réutilisé pendant `ttl` secondes; une erreur ne
+    l'est jamais.
+    """
+
+    def __init__(self, ttl: float = 300.0, max_entries: int = 256):
+        """
+        Args:
+            ttl: Durée de réutilisation d'un résultat (0 = appels en cours uniquement)
+            max_entries: Nombre maximum de résultats récents conservés
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.stats = CoalescingStats()
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, Future] = {}
+        self._recent: 'OrderedDict[Hashable, Tuple[float, Any]]' = OrderedDict()
+
+    @classmethod
+    def from_config(
+        cls,
+        config: Optional[Dict[str, Any]] = None,
+        board: str = 'vdab'
+    ) -> 'RequestCoalescer':
+        """
+        Crée un regroupeur avec `job_boards.<board>.quota.coalesce_ttl`
+
+        Args:
+            config: Configuration déjà chargée (défaut: integrations.json)
+            board: Nom du job board
+        """
+        if config is None:
+            config = load_integrations_config()
+
+        section = config.get('job_boards', {}).get(board, {}).get('quota') or {}
+        return cls(ttl=float(section.get('coalesce_ttl', 300)))
+
+    def run(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """
+        Exécute `fn` ou rejoint une exécution identique
+
+        Args:
+            key: Identité de l'appel (ex: URL complète de la requête)
+            fn: Appel à exécuter si aucun résultat n'est disponible
+
+        Returns:
+            Résultat de `fn`, éventuellement partagé avec d'autres appelants
+        """
+        with self._lock:
+            now = time.monotonic()
+            recent = self._recent.get(key)
+            if recent is not None and recent[0] > now:
+                self._recent.move_to_end(key)
+                self.stats.reused += 1
+                return recent[1]
+
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._in_flight[key] = future
+                self.stats.upstream += 1
+            else:
+                self.stats.joined += 1
+
+        if not leader:
+            logger.debug(f"🔗 Requête regroupée: {key}")
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            with self._lock:
+                del self._in_flight[key]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            del self._in_flight[key]
+            if self.ttl > 0:
+                self._remember(key, result)
+        future.set_result(result)
+        return result
+
+    def _remember(self, key: Hashable, result: Any):
+        """Conserve un résultat récent (verrou tenu par l'appelant)"""
+        now = time.monotonic()
+        self._recent[key] = (now + self.ttl, result)
+        self._recent.move_to_end(key)
+
+        # Entrées expirées d'abord, puis les plus anciennes au-delà du plafond
+        for stale in [k for k, (expires, _) in self._recent.items() if expires <= now]:
+            del self._recent[stale]
+        while len(self._recent) > self.max_entries:
+            self._recent.popitem(last=False)
+
+    def clear(self):
+        """Oublie les résultats récents"""
+        with self._lock:
+            self._recent.clear()
+
+
+_ledgers: Dict[str, Optional[QuotaLedger]] = {}
+_ledgers_lock = threading.Lock()
+
+
+def get_quota_ledger(board: str = 'vdab') -> Optional[QuotaLedger]:
+    """
+    Retourne le décompte partagé d'un job board (créé depuis la config)
+
+    Returns:
+        Le décompte, ou None si `job_boards.<board>.quota` est absent ou
+        désactivé
+    """
+    with _ledgers_lock:
+        if board not in _ledgers:
+            config = load_integrations_config()
+            section = config.get('job_boards', {}).get(board, {}).get('quota')
+            enabled = bool(section) and section.get('enabled', True)
+            _ledgers[board] = QuotaLedger.from_config(config, board=board) if enabled else None
+        return _ledgers[board]
+
+
+def set_quota_ledger(ledger: Optional[QuotaLedger], board: str = 'vdab'):
+    """
+    Remplace le décompte partagé d'un job board
+
+    Args:
+        ledger: Nouveau décompte (None = pas de quota)
+        board: Nom du job board
+    """
+    with _ledgers_lock:
+        _ledgers[board] = ledger
+
+
+def reset_quota_ledgers():
+    """Oublie les décomptes partagés: ils seront recréés depuis la config"""
+    with _ledgers_lock:
+        _ledgers.clear()
+
+
+def default_quota_ledger(
+    quota: Union[QuotaLedger, bool, None],
+    fixtures: Optional[FixtureStore] = None,
+    board: str = 'vdab'
+) -> Optional[QuotaLedger]:
+    """
+    Décompte d'un scraper
+
+    Args:
+        quota: Décompte explicite, False pour aucun quota, None pour le
+            décompte partagé du job board
+        fixtures: Fixtures du scraper; en rejeu rien ne part sur le réseau,
+            aucun quota n'est donc décompté
+        board: Nom du job board
+    """
+    if quota is False:
+        return None
+    if quota is not None:
+        return quota
+    if fixtures is not None and fixtures.replaying:
+        return None
+    return get_quota_ledger(board)
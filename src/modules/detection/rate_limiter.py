@@ -0,0 +1,287 @@
+"""
+Rate limiting partagé entre scrapers (token bucket par hôte)
+
+Un seul limiteur par processus: tous les scrapers qui ciblent le même hôte
+puisent dans le même bucket, qu'ils tournent dans des threads différents ou
+dans une boucle asyncio. Les débits viennent de la section `job_boards` de
+config/settings/integrations.json:
+
+    "rate_limiting": {
+        "requests_per_minute": 10,
+        "delay_between_requests": 3,   # optionnel: intervalle minimum
+        "burst": 1                     # optionnel: requêtes autorisées d'affilée
+    }
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+from .settings import load_integrations_config
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RateLimitRule:
+    """Débit autorisé pour un ensemble d'hôtes"""
+    name: str
+    hosts: List[str]
+    rate: float  # Requêtes par seconde
+    burst: int = 1
+
+    def matches(self, host: str) -> bool:
+        """Vérifie si `host` est couvert par la règle (sous-domaines inclus)"""
+        return any(host == h or host.endswith('.' + h) for h in self.hosts)
+
+
+class TokenBucket:
+    """
+    Token bucket à réservation
+
+    Chaque appel réserve un jeton immédiatement (le solde peut devenir
+    négatif) puis attend hors verrou le temps nécessaire. Les appelants
+    concurrents sont donc servis dans l'ordre, au débit exact, sans jamais
+    dormir en tenant le verrou.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Args:
+            rate: Débit en jetons par seconde
+            burst: Capacité du bucket (requêtes autorisées d'affilée)
+        """
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+
+        self.acquisitions = 0
+        self.wait_time = 0.0
+        self.max_wait = 0.0
+
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Réserve un jeton et retourne le temps d'attente nécessaire"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+            self.acquisitions += 1
+            self.wait_time += wait
+            self.max_wait = max(self.max_wait, wait)
+            return wait
+
+    def _refund(self):
+        """Rend un jeton réservé mais jamais utilisé (attente annulée)"""
+        with self._lock:
+            self.tokens = min(self.capacity, self.tokens + 1)
+            self.acquisitions -= 1
+
+    def acquire(self) -> float:
+        """
+        Prend un jeton (bloquant)
+
+        Returns:
+            Temps attendu en secondes
+        """
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """
+        Prend un jeton sans bloquer la boucle asyncio
+
+        Si la tâche est annulée pendant l'attente, le jeton est rendu: une
+        requête annulée ne retarde pas les suivantes.
+
+        Returns:
+            Temps attendu en secondes
+        """
+        wait = self._reserve()
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self._refund()
+                raise
+        return wait
+
+
+class RateLimiter:
+    """
+    Registre de token buckets par hôte
+
+    Les hôtes sans règle ne sont pas limités (la concurrence reste bornée
+    par le moteur de récupération).
+    """
+
+    def __init__(self, rules: Optional[List[RateLimitRule]] = None):
+        """
+        Args:
+            rules: Règles de débit (la première qui correspond à l'hôte gagne)
+        """
+        self.rules = list(rules or [])
+        self._buckets: Dict[str, Optional[TokenBucket]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]] = None) -> 'RateLimiter':
+        """
+        Construit le limiteur depuis integrations.json
+
+        Args:
+            config: Configuration déjà chargée (défaut: integrations.json)
+
+        Returns:
+            RateLimiter configuré
+        """
+        if config is None:
+            config = load_integrations_config()
+
+        rules = []
+        for name, board in config.get('job_boards', {}).items():
+            rule = cls._rule_from_board(name, board)
+            if rule:
+                rules.append(rule)
+
+        return cls(rules)
+
+    @staticmethod
+    def _rule_from_board(name: str, board: Dict[str, Any]) -> Optional[RateLimitRule]:
+        """Convertit l'entrée d'un job board en règle (None si pas de limite)"""
+        limits = board.get('rate_limiting') or {}
+
+        rate = None
+        if limits.get('requests_per_minute'):
+            rate = limits['requests_per_minute'] / 60
+        elif limits.get('requests_per_hour'):
+            rate = limits['requests_per_hour'] / 3600
+
+        if limits.get('delay_between_requests'):
+            min_interval_rate = 1 / limits['delay_between_requests']
+            rate = min(rate, min_interval_rate) if rate else min_interval_rate
+
+        if not rate:
+            return None
+
+        hosts = board.get('hosts')
+        if not hosts:
+            url = board.get('base_url') or board.get('api_endpoint')
+            if not url:
+                return None
+            host = urlsplit(url).netloc.lower()
+            hosts = [host[4:] if host.startswith('www.') else host]
+
+        return RateLimitRule(
+            name=name,
+            hosts=[h.lower() for h in hosts],
+            rate=rate,
+            burst=int(limits.get('burst', 1))
+        )
+
+    def bucket_for(self, url: str) -> Optional[TokenBucket]:
+        """
+        Retourne le bucket de l'hôte de `url` (None si l'hôte n'est pas limité)
+
+        Args:
+            url: URL complète ou nom d'hôte
+        """
+        host = (urlsplit(url).netloc or url).lower()
+
+        with self._lock:
+            if host not in self._buckets:
+                rule = next((r for r in self.rules if r.matches(host)), None)
+                self._buckets[host] = TokenBucket(rule.rate, rule.burst) if rule else None
+                if rule:
+                    logger.debug(f"Rate limit {host}: {rule.rate * 60:.1f} req/min ({rule.name})")
+            return self._buckets[host]
+
+    def acquire(self, url: str) -> float:
+        """
+        Attend l'autorisation d'envoyer une requête vers `url`
+
+        Returns:
+            Temps attendu en secondes
+        """
+        bucket = self.bucket_for(url)
+        if bucket is None:
+            return 0.0
+
+        wait = bucket.acquire()
+        if wait > 0:
+            logger.debug(f"Rate limiting: waited {wait:.2f}s for {url}")
+        return wait
+
+    async def acquire_async(self, url: str) -> float:
+        """Version asyncio de `acquire`"""
+        bucket = self.bucket_for(url)
+        if bucket is None:
+            return 0.0
+
+        wait = await bucket.acquire_async()
+        if wait > 0:
+            logger.debug(f"Rate limiting: waited {wait:.2f}s for {url}")
+        return wait
+
+    @property
+    def total_wait_time(self) -> float:
+        """Temps total passé à attendre le limiteur (secondes)"""
+        with self._lock:
+            return sum(b.wait_time for b in self._buckets.values() if b)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Statistiques d'attente par hôte
+
+        Returns:
+            {hôte: {'acquisitions', 'wait_time', 'max_wait', 'rate_per_minute'}}
+        """
+        with self._lock:
+            return {
+                host: {
+                    'acquisitions': bucket.acquisitions,
+                    'wait_time': bucket.wait_time,
+                    'max_wait': bucket.max_wait,
+                    'rate_per_minute': bucket.rate * 60
+                }
+                for host, bucket in self._buckets.items()
+                if bucket is not None
+            }
+
+
+_rate_limiter: Optional[RateLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Retourne le limiteur partagé du processus (créé depuis la config)"""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = RateLimiter.from_config()
+        return _rate_limiter
+
+
+def set_rate_limiter(limiter: Optional[RateLimiter]):
+    """
+    Remplace le limiteur partagé du processus
+
+    Args:
+        limiter: Nouveau limiteur (None = recharger depuis la config au
+            prochain appel de `get_rate_limiter`)
+    """
+    global _rate_limiter
+    with _rate_limiter_lock:
+        _rate_limiter = limiter
@@ -0,0 +1,241 @@
+"""
+Attente de page pilotée par le DOM pour le scraping Selenium
+
+Au lieu de pauses fixes (3-5 s après chaque `driver.get`, 8 s sur un
+challenge Cloudflare), on interroge la page jusqu'à ce que des conditions
+concrètes soient remplies:
+
+1. challenge: plus aucun élément de challenge Cloudflare dans la page
+2. cartes: le nombre de cartes d'offres est non nul et stable sur plusieurs
+   relevés consécutifs (ou la page indique qu'il n'y a aucun résultat)
+
+Chaque phase a un timeout adaptatif, appris des chargements récents
+(percentile haut des durées observées, borné), et sa durée est enregistrée
+par page pour voir où part la latence.
+"""
+
+import logging
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Deque, Dict, Iterable, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Un seul aller-retour WebDriver par relevé
+_PROBE_SCRIPT = """
+const title = (document.title || '').toLowerCase();
+return {
+    challenge: !!document.querySelector(arguments[2])
+        || title.includes('just a moment') || title.includes('un instant'),
+    cards: document.querySelectorAll(arguments[0]).length,
+    no_results: !!document.querySelector(arguments[1])
+};
+"""
+
+
+class AdaptiveTimeout:
+    """
+    Timeout appris des durées récentes d'une phase
+
+    timeout = percentile(durées récentes) * marge, borné par [minimum, maximum].
+    Tant qu'il n'y a pas assez d'historique, la valeur initiale est utilisée.
+    """
+
+    def __init__(
+        self,
+        initial: float,
+        minimum: float,
+        maximum: float,
+        margin: float = 2.0,
+        percentile: float = 0.9,
+        window: int = 20,
+        min_samples: int = 3
+    ):
+        """
+        Args:
+            initial: Timeout utilisé sans historique (secondes)
+            minimum: Borne basse du timeout appris
+            maximum: Borne haute du timeout appris
+            margin: Multiplicateur appliqué au percentile observé
+            percentile: Percentile des durées récentes (0-1)
+            window: Nombre de durées récentes conservées
+            min_samples: Nombre de durées nécessaires pour adapter le timeout
+        """
+        self.initial = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.margin = margin
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.samples: Deque[float] = deque(maxlen=window)
+
+    def observe(self, duration: float):
+        """Enregistre la durée d'une phase réussie (secondes)"""
+        self.samples.append(duration)
+
+    @property
+    def value(self) -> float:
+        """Timeout courant (secondes)"""
+        if len(self.samples) < self.min_samples:
+            return self.initial
+
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(self.percentile * len(ordered)))
+        return max(self.minimum, min(self.maximum, ordered[index] * self.margin))
+
+
+@dataclass
+class PageTimings:
+    """Durée de chaque phase de chargement d'une page (secondes)"""
+    url: str = ''
+    navigation: float = 0.0   # driver.get
+    challenge: float = 0.0    # Attente de la fin du challenge Cloudflare
+    cards: float = 0.0        # Attente de cartes d'offres stables
+    card_count: int = 0
+    challenge_detected: bool = False
+    challenge_cleared: bool = True
+    cards_ready: bool = False
+    no_results: bool = False
+
+    @property
+    def total(self) -> float:
+        """Temps total passé sur la page"""
+        return self.navigation + self.challenge + self.cards
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convertit les mesures en dictionnaire"""
+        data = asdict(self)
+        data['total'] = self.total
+        return data
+
+
+def summarize_timings(timings: Iterable[PageTimings]) -> Dict[str, Any]:
+    """
+    Moyenne et maximum de chaque phase sur un ensemble de pages
+
+    Returns:
+        {'pages': n, 'navigation': {'avg', 'max'}, 'challenge': {...},
+         'cards': {...}, 'total': {...}, 'challenges': n, 'timeouts': n}
+    """
+    timings = list(timings)
+    summary: Dict[str, Any] = {'pages': len(timings)}
+
+    for phase in ('navigation', 'challenge', 'cards', 'total'):
+        values = [getattr(t, phase) for t in timings]
+        summary[phase] = {
+            'avg': sum(values) / len(values) if values else 0.0,
+            'max': max(values, default=0.0)
+        }
+
+    summary['challenges'] = sum(1 for t in timings if t.challenge_detected)
+    summary['timeouts'] = sum(
+        1 for t in timings if not t.challenge_cleared or not (t.cards_ready or t.no_results)
+    )
+    return summary
+
+
+@dataclass
+class ReadinessPolicy:
+    """
+    Règles d'attente d'une page de résultats
+
+    Les sélecteurs sont des sélecteurs CSS évalués dans la page.
+    """
+    card_selector: str = 'div.job_seen_beacon, td.resultContent'
+    no_results_selector: str = '.jobsearch-NoResult-messageContainer, .jobsearch-NoResult'
+    challenge_selector: str = (
+        '#challenge-form, #challenge-running, #challenge-stage, '
+        'iframe[src*="challenges.cloudflare.com"]'
+    )
+    stable_checks: int = 2        # Relevés identiques consécutifs exigés
+    poll_interval: float = 0.25
+    human_pause: Tuple[float, float] = (0.0, 0.0)  # Pause après le scroll simulé
+    challenge_timeout: AdaptiveTimeout = field(
+        default_factory=lambda: AdaptiveTimeout(initial=15, minimum=5, maximum=30)
+    )
+    cards_timeout: AdaptiveTimeout = field(
+        default_factory=lambda: AdaptiveTimeout(initial=10, minimum=2, maximum=20)
+    )
+    clock: Callable[[], float] = time.monotonic
+    sleep: Callable[[float], None] = time.sleep
+
+    def probe(self, driver: Any) -> Dict[str, Any]:
+        """Relève l'état de la page (challenge, nombre de cartes, aucun résultat)"""
+        try:
+            state = driver.execute_script(
+                _PROBE_SCRIPT, self.card_selector, self.no_results_selector, self.challenge_selector
+            )
+        except Exception as e:
+            logger.debug(f"Relevé de la page impossible: {e}")
+            state = None
+
+        if not isinstance(state, dict):
+            return {'challenge': False, 'cards': 0, 'no_results': False}
+        return state
+
+    def wait_until_ready(self, driver: Any, url: str = '', navigation: float = 0.0) -> PageTimings:
+        """
+        Attend que la page soit exploitable
+
+        Args:
+            driver: Driver Selenium, page déjà demandée
+            url: URL de la page (pour le rapport)
+            navigation: Durée du `driver.get` déjà mesurée par l'appelant
+
+        Returns:
+            Mesures de la page (les timeouts ne lèvent pas d'exception: le
+            HTML est exploité tel quel, comme avec l'ancienne attente fixe)
+        """
+        timings = PageTimings(url=url, navigation=navigation)
+
+        # Phase 1: challenge Cloudflare
+        start = self.clock()
+        state = self.probe(driver)
+        if state['challenge']:
+            timings.challenge_detected = True
+            logger.warning("⚠️ Cloudflare challenge détecté, attente de sa résolution...")
+            deadline = start + self.challenge_timeout.value
+            while state['challenge'] and self.clock() < deadline:
+                self.sleep(self.poll_interval)
+                state = self.probe(driver)
+
+            timings.challenge = self.clock() - start
+            timings.challenge_cleared = not state['challenge']
+            if timings.challenge_cleared:
+                self.challenge_timeout.observe(timings.challenge)
+                logger.info(f"✅ Challenge résolu en {timings.challenge:.1f}s")
+            else:
+                logger.warning(f"⏱️ Challenge toujours présent après {timings.challenge:.1f}s")
+
+        # Phase 2: cartes d'offres présentes et stables
+        start = self.clock()
+        deadline = start + self.cards_timeout.value
+        last_count = -1
+        stable = 0
+        while True:
+            count = state['cards']
+            if state['no_results']:
+                timings.no_results = True
+                break
+
+            stable = stable + 1 if count == last_count and count > 0 else 0
+            last_count = count
+            if count > 0 and stable >= self.stable_checks - 1:
+                timings.cards_ready = True
+                break
+
+            if self.clock() >= deadline:
+                logger.warning(f"⏱️ Timeout: offres non stabilisées ({count} cartes)")
+                break
+
+            self.sleep(self.poll_interval)
+            state = self.probe(driver)
+
+        timings.cards = self.clock() - start
+        timings.card_count = state['cards']
+        if timings.cards_ready:
+            self.cards_timeout.observe(timings.cards)
+            logger.debug(f"✅ {timings.card_count} offres chargées en {timings.cards:.2f}s")
+
+        return timings
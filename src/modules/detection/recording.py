@@ -0,0 +1,348 @@
+"""
+Enregistrement et rejeu des réponses des job boards (fixtures compressées)
+
+Les tests et benchmarks ne doivent pas dépendre du réseau ni de l'état du
+jour des sites. En mode `record`, chaque réponse HTTP (scrapers requests et
+httpx, API VDAB) et chaque page rendue par le navigateur (Indeed bypass) est
+enregistrée telle quelle dans un fichier JSON compressé (gzip). En mode
+`replay`, les mêmes scrapers sont servis depuis ces fichiers, sans réseau ni
+navigateur:
+
+    store = FixtureStore('tests/fixtures/recorded', mode='record')
+    IndeedScraper(fixtures=store).scrape("Python", "Paris")     # réseau + écriture
+
+    store = FixtureStore('tests/fixtures/recorded', mode='replay')
+    IndeedScraper(fixtures=store).scrape("Python", "Paris")     # hors ligne
+
+Une réponse est identifiée par sa méthode et son URL complète (paramètres
+triés). Une requête sans enregistrement lève `FixtureNotFound` en rejeu.
+"""
+
+import base64
+import gzip
+import hashlib
+import io
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, Mapping, Optional, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import httpx
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from .rate_limiter import RateLimiter, get_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+MODES = ('record', 'replay')
+
+# Headers non rejouables: le corps est stocké décompressé et entier
+_DROPPED_HEADERS = frozenset([
+    'content-encoding', 'content-length', 'transfer-encoding', 'connection',
+    'keep-alive', 'set-cookie', 'date'
+])
+
+
+class FixtureNotFound(requests.ConnectionError):
+    """Aucun enregistrement pour cette requête (mode replay)"""
+
+
+def normalize_url(url: str) -> str:
+    """URL avec schéma et hôte en minuscules et paramètres triés"""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or '/', query, ''))
+
+
+def _replayable_headers(headers: Mapping[str, str]) -> Dict[str, str]:
+    return {k: v for k, v in headers.items() if k.lower() not in _DROPPED_HEADERS}
+
+
+@dataclass
+class Fixture:
+    """Une réponse enregistrée"""
+    kind: str                   # 'http' (réponse brute) ou 'page' (page_source navigateur)
+    method: str
+    url: str
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+    recorded_at: float = field(default_factory=time.time)
+
+    @property
+    def text(self) -> str:
+        """Corps décodé (UTF-8 par défaut)"""
+        encoding = get_encoding_from_headers(CaseInsensitiveDict(self.headers)) or 'utf-8'
+        return self.body.decode(encoding, errors='replace')
+
+    def to_json(self) -> Dict[str, Any]:
+        data = asdict(self)
+        try:
+            data['body'] = self.body.decode('utf-8')
+            data['body_encoding'] = 'utf-8'
+        except UnicodeDecodeError:
+            data['body'] = base64.b64encode(self.body).decode('ascii')
+            data['body_encoding'] = 'base64'
+        return data
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'Fixture':
+        data = dict(data)
+        body_encoding = data.pop('body_encoding', 'utf-8')
+        body = data['body']
+        data['body'] = base64.b64decode(body) if body_encoding == 'base64' else body.encode('utf-8')
+        return cls(**data)
+
+
+class FixtureStore:
+    """
+    Répertoire de réponses enregistrées, un fichier `.json.gz` par réponse
+
+    Organisation: `<répertoire>/<hôte>/<kind>-<empreinte>.json.gz`
+    """
+
+    def __init__(self, directory: Union[str, Path], mode: str = 'replay'):
+        """
+        Args:
+            directory: Répertoire des fixtures (créé en mode record)
+            mode: 'record' (réseau + écriture) ou 'replay' (lecture seule, hors ligne)
+        """
+        if mode not in MODES:
+            raise ValueError(f"Mode inconnu: {mode} (choix: {', '.join(MODES)})")
+
+        self.directory = Path(directory)
+        self.mode = mode
+        self.hits = 0
+        self.misses = 0
+        self.recorded = 0
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == 'record'
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == 'replay'
+
+    def path_for(self, url: str, kind: str = 'http', method: str = 'GET') -> Path:
+        """Fichier de la fixture d'une requête"""
+        normalized = normalize_url(url)
+        digest = hashlib.sha1(f"{method.upper()} {normalized}".encode('utf-8')).hexdigest()[:20]
+        host = urlsplit(normalized).netloc or 'local'
+        return self.directory / host / f"{kind}-{digest}.json.gz"
+
+    def save(
+        self,
+        url: str,
+        body: Union[bytes, str],
+        status: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        kind: str = 'http',
+        method: str = 'GET'
+    ) -> Path:
+        """
+        Enregistre une réponse
+
+        Returns:
+            Chemin du fichier écrit
+        """
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+            headers = dict(headers or {})
+            headers.setdefault('Content-Type', 'text/html; charset=utf-8')
+
+        fixture = Fixture(
+            kind=kind,
+            method=method.upper(),
+            url=url,
+            status=status,
+            headers=_replayable_headers(headers or {}),
+            body=body
+        )
+
+        path = self.path_for(url, kind, method)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # mtime=0: un même contenu donne un même fichier (diffs propres)
+        with open(path, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb', mtime=0) as gz:
+            gz.write(json.dumps(fixture.to_json(), ensure_ascii=False, indent=1).encode('utf-8'))
+
+        self.recorded += 1
+        logger.debug(f"💾 Fixture enregistrée: {url} -> {path.name}")
+        return path
+
+    def load(self, url: str, kind: str = 'http', method: str = 'GET') -> Optional[Fixture]:
+        """Retourne la réponse enregistrée d'une requête (None si absente)"""
+        path = self.path_for(url, kind, method)
+        if not path.exists():
+            self.misses += 1
+            return None
+
+        with gzip.open(path, 'rb') as gz:
+            fixture = Fixture.from_json(json.loads(gz.read().decode('utf-8')))
+        self.hits += 1
+        return fixture
+
+    def record_page(self, url: str, html: str) -> Optional[Path]:
+        """Enregistre une page rendue par le navigateur (mode record uniquement)"""
+        if not self.recording:
+            return None
+        return self.save(url, html, kind='page')
+
+    def replay_page(self, url: str) -> str:
+        """
+        HTML enregistré d'une page (page navigateur, sinon réponse HTTP brute)
+
+        Raises:
+            FixtureNotFound: Si la page n'a pas été enregistrée
+        """
+        fixture = self.load(url, kind='page') or self.load(url, kind='http')
+        if fixture is None:
+            raise FixtureNotFound(f"Aucune fixture pour {url} dans {self.directory}")
+        return fixture.text
+
+    def entries(self) -> Iterator[Path]:
+        """Fichiers de fixtures du répertoire"""
+        if self.directory.exists():
+            yield from sorted(self.directory.rglob('*.json.gz'))
+
+    def mount(self, session: requests.Session) -> requests.Session:
+        """Fait passer toutes les requêtes d'une session par le store"""
+        adapter = FixtureAdapter(self)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def async_transport(self) -> 'FixtureAsyncTransport':
+        """Transport httpx équivalent (moteur asynchrone des scrapers)"""
+        return FixtureAsyncTransport(self)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.entries())
+
+
+def default_rate_limiter(fixtures: Optional[FixtureStore]) -> RateLimiter:
+    """
+    Limiteur par défaut d'un scraper: aucune limite en rejeu (rien ne part
+    sur le réseau), sinon le limiteur partagé du processus
+    """
+    if fixtures is not None and fixtures.replaying:
+        return RateLimiter()
+    return get_rate_limiter()
+
+
+class FixtureAdapter(BaseAdapter):
+    """
+    Adaptateur `requests`: enregistre (record) ou sert (replay) les réponses
+    """
+
+    def __init__(self, store: FixtureStore, inner: Optional[BaseAdapter] = None):
+        super().__init__()
+        self.store = store
+        self.inner = inner or (HTTPAdapter() if store.recording else None)
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        if self.store.recording:
+            response = self.inner.send(request, **kwargs)
+            self.store.save(
+                request.url, response.content, response.status_code,
+                response.headers, method=request.method
+            )
+            return response
+
+        fixture = self.store.load(request.url, method=request.method)
+        if fixture is None:
+            raise FixtureNotFound(f"Aucune fixture pour {request.method} {request.url}", request=request)
+
+        response = requests.Response()
+        response.status_code = fixture.status
+        response.headers = CaseInsensitiveDict(fixture.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        # Corps lu comme sur une connexion: `stream=True` et `iter_content` fonctionnent
+        response.raw = io.BytesIO(fixture.body)
+        response.url = request.url
+        response.request = request
+        response.reason = 'OK' if fixture.status < 400 else 'Replayed error'
+        return response
+
+    def close(self):
+        if self.inner is not None:
+            self.inner.close()
+
+
+class FixtureAsyncTransport(httpx.AsyncBaseTransport):
+    """
+    Transport httpx: enregistre (record) ou sert (replay) les réponses
+    """
+
+    def __init__(self, store: FixtureStore, inner: Optional[httpx.AsyncBaseTransport] = None):
+        self.store = store
+        self.inner = inner
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        url = str(request.url)
+
+        if self.store.recording:
+            # Transport réseau créé à la demande: le moteur async peut
+            # réutiliser ce transport depuis une nouvelle boucle après aclose()
+            if self.inner is None:
+                self.inner = httpx.AsyncHTTPTransport()
+            response = await self.inner.handle_async_request(request)
+            try:
+                # aread() décompresse: le corps est stocké et rejoué décodé
+                body = await httpx.Response(
+                    response.status_code, headers=response.headers, stream=response.stream
+                ).aread()
+            finally:
+                await response.aclose()
+            headers = _replayable_headers(response.headers)
+            self.store.save(url, body, response.status_code, headers, method=request.method)
+            return httpx.Response(response.status_code, headers=headers, content=body, request=request)
+
+        fixture = self.store.load(url, method=request.method)
+        if fixture is None:
+            raise httpx.ConnectError(f"Aucune fixture pour {request.method} {url}", request=request)
+
+        return httpx.Response(
+            fixture.status, headers=fixture.headers, content=fixture.body, request=request
+        )
+
+    async def aclose(self):
+        if self.inner is not None:
+            inner, self.inner = self.inner, None
+            await inner.aclose()
+
+
+# Enregistrement d'un corpus (réseau requis):
+#   python -m src.modules.detection.recording tests/fixtures/recorded "Python" Bruxelles
+if __name__ == "__main__":
+    import sys
+
+    from .belgian_job_aggregator import BelgianJobAggregator
+    from .jobboard_scraper import IndeedScraper
+
+    logging.basicConfig(level=logging.INFO)
+
+    if len(sys.argv) < 3:
+        print("Usage: python -m src.modules.detection.recording <répertoire> <requête> [lieu] [pages]")
+        sys.exit(1)
+
+    directory, query = sys.argv[1], sys.argv[2]
+    location = sys.argv[3] if len(sys.argv) > 3 else "Bruxelles"
+    pages = int(sys.argv[4]) if len(sys.argv) > 4 else 2
+    store = FixtureStore(directory, mode='record')
+
+    print("=" * 80)
+    print(f"💾 ENREGISTREMENT DES FIXTURES -> {store.directory}")
+    print("=" * 80)
+
+    IndeedScraper(fixtures=store).scrape(query, location, max_pages=pages)
+    with BelgianJobAggregator(indeed_headless=True, fixtures=store) as aggregator:
+        aggregator.search(query, location, max_results_per_source=pages * 16)
+
+    print(f"\n✅ {store.recorded} réponses enregistrées ({len(store)} fichiers au total)")
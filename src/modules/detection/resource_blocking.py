@@ -0,0 +1,261 @@
+"""
+Blocage de ressources et mesure du trafic pour le scraping Selenium
+
+`IndeedBypassScraper` n'a besoin que du HTML des cartes d'offres. Les
+images, polices, feuilles de style et trackers tiers ne font que ralentir
+le chargement et consommer de la bande passante. Le blocage passe par
+Chrome DevTools (`Network.setBlockedURLs`) et, pour les images, par les
+préférences de contenu de Chrome (appliquées à la création du driver).
+
+Le volume transféré par page est mesuré via l'API Performance du
+navigateur, avec et sans blocage, pour suivre le gain réel:
+
+    "scraping_config": {
+        "resource_blocking": {
+            "enabled": true,
+            "block_types": ["image", "font", "media", "stylesheet"],
+            "block_url_patterns": ["*google-analytics.com*", ...]
+        }
+    }
+"""
+
+import logging
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+from .settings import load_integrations_config
+
+logger = logging.getLogger(__name__)
+
+# Motifs d'URL (syntaxe Network.setBlockedURLs: `*` joker) par type de ressource.
+# Le domaine Network de CDP ne bloque que par URL: les types sont donc
+# traduits en extensions de fichiers.
+RESOURCE_TYPE_PATTERNS: Dict[str, List[str]] = {
+    'image': ['*.png*', '*.jpg*', '*.jpeg*', '*.gif*', '*.webp*', '*.svg*', '*.ico*', '*.avif*'],
+    'font': ['*.woff*', '*.woff2*', '*.ttf*', '*.otf*', '*.eot*'],
+    'media': ['*.mp4*', '*.webm*', '*.mp3*', '*.ogg*', '*.m4a*'],
+    'stylesheet': ['*.css*'],
+}
+
+# Trackers et publicités tiers bloqués par défaut
+DEFAULT_BLOCKED_URL_PATTERNS = [
+    '*google-analytics.com*',
+    '*googletagmanager.com*',
+    '*doubleclick.net*',
+    '*facebook.net*',
+    '*hotjar.com*',
+    '*bat.bing.com*',
+]
+
+# Script de mesure: document + sous-ressources de la page courante.
+# `transferSize` vaut 0 pour les ressources tierces sans Timing-Allow-Origin,
+# on retombe alors sur `encodedBodySize`, puis on compte la ressource sans taille.
+_TRANSFER_SCRIPT = """
+const size = e => e.transferSize || e.encodedBodySize || 0;
+const nav = performance.getEntriesByType('navigation')[0];
+const resources = performance.getEntriesByType('resource');
+return {
+    document_bytes: nav ? size(nav) : 0,
+    resource_bytes: resources.reduce((total, e) => total + size(e), 0),
+    resource_count: resources.length,
+    load_ms: nav ? nav.loadEventEnd - nav.startTime : null
+};
+"""
+
+
+@dataclass
+class ResourceBlockingConfig:
+    """Types de ressources et motifs d'URL à bloquer"""
+    enabled: bool = True
+    block_types: List[str] = field(
+        default_factory=lambda: ['image', 'font', 'media', 'stylesheet']
+    )
+    block_url_patterns: List[str] = field(
+        default_factory=lambda: list(DEFAULT_BLOCKED_URL_PATTERNS)
+    )
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]] = None) -> 'ResourceBlockingConfig':
+        """
+        Lit `job_boards.indeed.scraping_config.resource_blocking` d'integrations.json
+
+        Args:
+            config: Configuration déjà chargée (défaut: integrations.json)
+
+        Returns:
+            Configuration de blocage (valeurs par défaut si la section est absente)
+        """
+        if config is None:
+            config = load_integrations_config()
+
+        section = (
+            config.get('job_boards', {}).get('indeed', {})
+            .get('scraping_config', {}).get('resource_blocking')
+        )
+        if not section:
+            return cls()
+
+        defaults = cls()
+        return cls(
+            enabled=section.get('enabled', True),
+            block_types=list(section.get('block_types', defaults.block_types)),
+            block_url_patterns=list(section.get('block_url_patterns', defaults.block_url_patterns))
+        )
+
+    def url_patterns(self) -> List[str]:
+        """Motifs d'URL à transmettre à `Network.setBlockedURLs`"""
+        if not self.enabled:
+            return []
+
+        patterns = []
+        for resource_type in self.block_types:
+            if resource_type not in RESOURCE_TYPE_PATTERNS:
+                logger.warning(f"⚠️ Type de ressource inconnu ignoré: {resource_type}")
+                continue
+            patterns.extend(RESOURCE_TYPE_PATTERNS[resource_type])
+        patterns.extend(self.block_url_patterns)
+
+        # Dédupliquer en gardant l'ordre
+        return list(dict.fromkeys(patterns))
+
+    def chrome_prefs(self) -> Dict[str, Any]:
+        """
+        Préférences Chrome complémentaires (à passer à la création du driver)
+
+        Les images sans extension reconnaissable (CDN, redimensionneurs)
+        échappent aux motifs d'URL; la préférence de contenu les bloque toutes.
+        """
+        if self.enabled and 'image' in self.block_types:
+            return {'profile.managed_default_content_settings.images': 2}
+        return {}
+
+
+def apply_resource_blocking(driver: Any, config: Optional[ResourceBlockingConfig]) -> bool:
+    """
+    Active (ou désactive) le blocage des ressources sur un driver
+
+    Idempotent: peut être rappelé à chaque emprunt d'un navigateur du pool,
+    y compris avec `None` pour lever le blocage laissé par un scrape précédent.
+
+    Args:
+        driver: Driver Chrome (undetected-chromedriver / selenium)
+        config: Configuration de blocage (None = aucun blocage)
+
+    Returns:
+        True si le blocage est actif
+    """
+    patterns = config.url_patterns() if config is not None else []
+
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+    except Exception as e:
+        logger.warning(f"⚠️ Blocage des ressources indisponible (CDP): {e}")
+        return False
+
+    if patterns:
+        logger.debug(f"🚫 {len(patterns)} motifs de ressources bloqués")
+    return bool(patterns)
+
+
+@dataclass
+class PageTransfer:
+    """Volume transféré pour une page"""
+    url: str
+    blocking: bool
+    document_bytes: int = 0
+    resource_bytes: int = 0
+    resource_count: int = 0
+    load_ms: Optional[float] = None
+
+    @property
+    def total_bytes(self) -> int:
+        """Total transféré (document + sous-ressources)"""
+        return self.document_bytes + self.resource_bytes
+
+
+def measure_page_transfer(driver: Any, url: str, blocking: bool) -> Optional[PageTransfer]:
+    """
+    Mesure le volume transféré par la page courante (API Performance)
+
+    Args:
+        driver: Driver Chrome, après chargement de la page
+        url: URL de la page (pour le rapport)
+        blocking: Le blocage des ressources était-il actif
+
+    Returns:
+        Mesure de la page, ou None si le navigateur ne la fournit pas
+    """
+    try:
+        data = driver.execute_script(_TRANSFER_SCRIPT)
+    except Exception as e:
+        logger.debug(f"Mesure du trafic impossible: {e}")
+        return None
+
+    if not isinstance(data, dict):
+        return None
+
+    return PageTransfer(
+        url=url,
+        blocking=blocking,
+        document_bytes=int(data.get('document_bytes') or 0),
+        resource_bytes=int(data.get('resource_bytes') or 0),
+        resource_count=int(data.get('resource_count') or 0),
+        load_ms=data.get('load_ms')
+    )
+
+
+class TransferLog:
+    """
+    Historique des volumes par page, résumé avec et sans blocage
+    """
+
+    def __init__(self, max_pages: int = 500):
+        """
+        Args:
+            max_pages: Nombre de pages conservées (les plus anciennes sont oubliées)
+        """
+        self.max_pages = max_pages
+        self.pages: List[PageTransfer] = []
+
+    def record(self, transfer: Optional[PageTransfer]):
+        """Enregistre la mesure d'une page (ignore None)"""
+        if transfer is None:
+            return
+        self.pages.append(transfer)
+        if len(self.pages) > self.max_pages:
+            del self.pages[:len(self.pages) - self.max_pages]
+
+    @staticmethod
+    def _average(pages: Sequence[PageTransfer]) -> Dict[str, Any]:
+        count = len(pages)
+        if not count:
+            return {'pages': 0, 'avg_bytes': 0, 'avg_resources': 0, 'avg_load_ms': None}
+
+        load_times = [p.load_ms for p in pages if p.load_ms]
+        return {
+            'pages': count,
+            'avg_bytes': sum(p.total_bytes for p in pages) / count,
+            'avg_resources': sum(p.resource_count for p in pages) / count,
+            'avg_load_ms': sum(load_times) / len(load_times) if load_times else None
+        }
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Moyennes par page avec et sans blocage
+
+        Returns:
+            {'unblocked': {...}, 'blocked': {...}, 'bytes_saved_ratio': float | None}
+        """
+        unblocked = self._average([p for p in self.pages if not p.blocking])
+        blocked = self._average([p for p in self.pages if p.blocking])
+
+        ratio = None
+        if unblocked['pages'] and blocked['pages'] and unblocked['avg_bytes']:
+            ratio = 1 - blocked['avg_bytes'] / unblocked['avg_bytes']
+
+        return {'unblocked': unblocked, 'blocked': blocked, 'bytes_saved_ratio': ratio}
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Mesures brutes, page par page"""
+        return [asdict(p) for p in self.pages]
@@ -0,0 +1,358 @@
+"""
+Cache des résultats de recherche agrégée (stale-while-revalidate)
+
+Le scheduler, les scripts de démo et les lancements manuels répètent les
+mêmes recherches (requête, lieu, sources). Ce cache se place devant
+`BelgianJobAggregator.search`:
+
+- entrée fraîche (âge < `ttl`): servie immédiatement
+- entrée périmée mais encore utilisable (âge < `ttl + stale_ttl`): servie
+  immédiatement, et une recherche la rafraîchit en arrière-plan
+- sinon: recherche normale; les appels identiques simultanés attendent la
+  même recherche au lieu d'en lancer une chacun
+
+Deux niveaux: un LRU en mémoire, puis un second niveau optionnel partagé
+entre processus, sur disque (SQLite) ou dans Redis. Les TTL viennent de
+`redis.cache_ttl.scraping_results` et de la section
+`aggregator.result_cache` d'integrations.json. Seules les recherches
+complètes sont mises en cache (une source coupée, en erreur ou
+indisponible ne fige pas un résultat partiel).
+
+    cache = ResultCache.from_config()
+    aggregator = BelgianJobAggregator(result_cache=cache)
+    aggregator.search("Python", "Bruxelles")   # recherche
+    aggregator.search("python ", "bruxelles")  # servie par le cache
+"""
+
+import hashlib
+import json
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .cache import DEFAULT_CACHE_DIR, SQLiteTTLCache
+from .quota import RequestCoalescer
+from .settings import load_integrations_config
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+# TTL par défaut si la configuration est absente (secondes)
+DEFAULT_RESULT_TTL = 7200
+DEFAULT_STALE_TTL = 86400
+
+# Une recherche: offres sérialisées (`to_dict`) et complétude
+SearchFunction = Callable[[], Tuple[List[Dict[str, Any]], bool]]
+
+
+@dataclass
+class ResultCacheStats:
+    """Compteurs d'utilisation du cache de résultats"""
+    hits: int = 0             # Servies fraîches
+    stale_hits: int = 0       # Servies périmées (rafraîchies en arrière-plan)
+    misses: int = 0           # Recherche au premier plan
+    refreshes: int = 0        # Rafraîchissements en arrière-plan réussis
+    refresh_errors: int = 0
+    backend_errors: int = 0   # Second niveau injoignable (ignoré)
+
+    def to_dict(self) -> Dict[str, int]:
+        """Convertit les compteurs en dictionnaire"""
+        return asdict(self)
+
+
+@dataclass
+class CachedResult:
+    """Résultat d'une recherche passée par le cache"""
+    offers: List[Dict[str, Any]]
+    status: str                # 'hit', 'stale' ou 'miss'
+    age: float = 0.0           # Secondes depuis la recherche d'origine
+
+
+class RedisResultBackend:
+    """Second niveau dans Redis (partagé entre machines)"""
+
+    def __init__(self, client: Any, prefix: str = 'belgian_jobs:results:'):
+        """
+        Args:
+            client: Client `redis.Redis`
+            prefix: Préfixe des clés
+        """
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]] = None) -> 'RedisResultBackend':
+        """
+        Crée le backend depuis le bloc `redis` d'integrations.json
+
+        Raises:
+            ImportError: Si le paquet redis n'est pas installé
+        """
+        if redis is None:
+            raise ImportError("redis non installé (pip install redis)")
+        if config is None:
+            config = load_integrations_config()
+
+        section = config.get('redis', {})
+        client = redis.Redis(
+            host=section.get('host', 'localhost'),
+            port=int(section.get('port', 6379)),
+            db=int(section.get('db', 0)),
+            password=section.get('password'),
+            socket_timeout=2.0,
+            socket_connect_timeout=2.0
+        )
+        return cls(client)
+
+    def get(self, key: str) -> Any:
+        raw = self.client.get(self.prefix + key)
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        data = json.dumps(value, ensure_ascii=False)
+        self.client.set(self.prefix + key, data, ex=int(math.ceil(ttl)) if ttl else None)
+
+    def delete(self, key: str):
+        self.client.delete(self.prefix + key)
+
+    def close(self):
+        self.client.close()
+
+
+class ResultCache:
+    """
+    Cache à deux niveaux des résultats de recherche, avec rafraîchissement
+    en arrière-plan des entrées périmées
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_RESULT_TTL,
+        stale_ttl: float = DEFAULT_STALE_TTL,
+        max_entries: int = 128,
+        backend: Optional[Any] = None,
+        refresh_workers: int = 1
+    ):
+        """
+        Args:
+            ttl: Âge en secondes jusqu'auquel un résultat est frais
+            stale_ttl: Durée supplémentaire pendant laquelle un résultat
+                périmé est servi en attendant son rafraîchissement (0 = jamais)
+            max_entries: Résultats gardés en mémoire (LRU)
+            backend: Second niveau (`SQLiteTTLCache`, `RedisResultBackend`
+                ou tout objet get/set/delete); None = mémoire seule
+            refresh_workers: Rafraîchissements simultanés en arrière-plan
+        """
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self.backend = backend
+        self.stats = ResultCacheStats()
+
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._entries: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._coalescer = RequestCoalescer(ttl=0)
+        self._refreshing: Dict[str, Future] = {}
+        self._executor = ThreadPoolExecutor(max_workers=refresh_workers, thread_name_prefix='result-cache')
+
+    @classmethod
+    def from_config(
+        cls,
+        config: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> 'ResultCache':
+        """
+        Crée un cache depuis integrations.json
+
+        `aggregator.result_cache.backend` choisit le second niveau: "memory"
+        (aucun), "disk" (SQLite, `path`) ou "redis" (bloc `redis`, si activé
+        pour le caching). Redis indisponible: repli sur la mémoire seule.
+
+        Args:
+            config: Configuration déjà chargée (défaut: integrations.json)
+            **kwargs: Autres options de ResultCache
+        """
+        if config is None:
+            config = load_integrations_config()
+
+        section = config.get('aggregator', {}).get('result_cache') or {}
+        redis_config = config.get('redis', {})
+        ttl = redis_config.get('cache_ttl', {}).get('scraping_results', DEFAULT_RESULT_TTL)
+
+        backend = None
+        kind = section.get('backend', 'memory')
+        if kind == 'disk':
+            path = section.get('path') or DEFAULT_CACHE_DIR / 'search_results.db'
+            backend = SQLiteTTLCache(Path(path), table='search_results')
+        elif kind == 'redis':
+            if redis_config.get('enabled') and redis_config.get('use_for', {}).get('caching', True):
+                try:
+                    backend = RedisResultBackend.from_config(config)
+                except ImportError as e:
+                    logger.warning(f"⚠️ Cache de résultats en mémoire seule: {e}")
+            else:
+                logger.warning("⚠️ Redis désactivé pour le caching: cache de résultats en mémoire seule")
+
+        options = {
+            'ttl': float(ttl),
+            'stale_ttl': float(section.get('stale_ttl', DEFAULT_STALE_TTL)),
+            'max_entries': int(section.get('max_entries', 128)),
+            'backend': backend,
+        }
+        options.update(kwargs)
+        return cls(**options)
+
+    @staticmethod
+    def key(
+        query: str,
+        location: str,
+        max_results_per_source: int,
+        sources: Optional[Iterable[str]] = None
+    ) -> str:
+        """
+        Clé d'une recherche: paramètres normalisés (casse, espaces, ordre
+        des sources) puis hachés
+        """
+        params = {
+            'query': ' '.join(query.lower().split()),
+            'location': ' '.join(location.lower().split()),
+            'max_results_per_source': int(max_results_per_source),
+            'sources': sorted(set(sources)) if sources is not None else None,
+        }
+        data = json.dumps(params, sort_keys=True, ensure_ascii=False).encode('utf-8')
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def get_or_search(
+        self,
+        key: str,
+        search: SearchFunction,
+        refresh: Optional[SearchFunction] = None
+    ) -> CachedResult:
+        """
+        Résultat d'une recherche, depuis le cache si possible
+
+        Args:
+            key: Clé de la recherche (`ResultCache.key`)
+            search: Exécute la recherche; retourne les offres sérialisées et
+                True si le résultat est complet (seul cas mis en cache)
+            refresh: Recherche du rafraîchissement en arrière-plan (défaut:
+                `search`), par exemple de moindre priorité
+
+        Returns:
+            Offres sérialisées et provenance ('hit', 'stale' ou 'miss')
+        """
+        entry = self._lookup(key)
+        if entry is not None:
+            age = time.time() - entry['stored_at']
+            if age < self.ttl:
+                self._count(hits=1)
+                return CachedResult(entry['offers'], 'hit', age)
+            if age < self.ttl + self.stale_ttl:
+                self._count(stale_hits=1)
+                self._schedule_refresh(key, refresh or search)
+                return CachedResult(entry['offers'], 'stale', age)
+
+        self._count(misses=1)
+        offers = self._coalescer.run(key, lambda: self._search_and_store(key, search))
+        return CachedResult(offers, 'miss')
+
+    def invalidate(self, key: Optional[str] = None):
+        """Oublie un résultat (ou tous ceux gardés en mémoire si `key` est None)"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                return
+            self._entries.pop(key, None)
+        self._backend_call('delete', key)
+
+    def wait_for_refreshes(self, timeout: Optional[float] = None):
+        """Attend la fin des rafraîchissements en cours (tests, fin de script)"""
+        with self._lock:
+            pending = list(self._refreshing.values())
+        wait(pending, timeout=timeout)
+
+    def close(self):
+        """Attend les rafraîchissements en cours et ferme le second niveau"""
+        self._executor.shutdown(wait=True)
+        close = getattr(self.backend, 'close', None)
+        if close is not None:
+            close()
+
+    def _lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """Entrée en mémoire, sinon au second niveau (remontée en mémoire)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+
+        entry = self._backend_call('get', key)
+        if entry is not None:
+            self._remember(key, entry)
+        return entry
+
+    def _search_and_store(self, key: str, search: SearchFunction) -> List[Dict[str, Any]]:
+        """Lance la recherche et garde le résultat s'il est complet"""
+        offers, complete = search()
+        if complete:
+            entry = {'stored_at': time.time(), 'offers': offers}
+            self._remember(key, entry)
+            self._backend_call('set', key, entry, self.ttl + self.stale_ttl)
+        else:
+            logger.info("⏭️ Résultat partiel: non mis en cache")
+        return offers
+
+    def _schedule_refresh(self, key: str, search: SearchFunction):
+        """Rafraîchit une entrée périmée en arrière-plan (une fois par clé)"""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            future = self._executor.submit(self._refresh, key, search)
+            self._refreshing[key] = future
+
+    def _refresh(self, key: str, search: SearchFunction):
+        try:
+            self._coalescer.run(key, lambda: self._search_and_store(key, search))
+            self._count(refreshes=1)
+            logger.debug(f"🔄 Résultat rafraîchi: {key}")
+        except Exception as e:
+            self._count(refresh_errors=1)
+            logger.warning(f"⚠️ Rafraîchissement du cache de résultats échoué: {e}")
+        finally:
+            with self._lock:
+                self._refreshing.pop(key, None)
+
+    def _count(self, **increments: int):
+        """Incrémente les compteurs (appelé depuis plusieurs threads)"""
+        with self._stats_lock:
+            for name, value in increments.items():
+                setattr(self.stats, name, getattr(self.stats, name) + value)
+
+    def _remember(self, key: str, entry: Dict[str, Any]):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _backend_call(self, method: str, *args: Any) -> Any:
+        """Appel au second niveau; une panne (Redis arrêté) n'échoue pas la recherche"""
+        if self.backend is None:
+            return None
+        try:
+            return getattr(self.backend, method)(*args)
+        except Exception as e:
+            self._count(backend_errors=1)
+            logger.warning(f"⚠️ Second niveau du cache de résultats indisponible ({method}): {e}")
+            return None
@@ -0,0 +1,162 @@
+"""
+Passage de session navigateur -> client HTTP (mode hybride Indeed)
+
+Le navigateur ne sert qu'à obtenir une session valide (challenge Cloudflare
+résolu, cookies posés). Ses cookies et son User-Agent sont ensuite transmis
+à une `requests.Session` qui récupère les pages suivantes en HTML brut, en
+quelques centaines de millisecondes au lieu de plusieurs secondes de rendu.
+Dès qu'une réponse HTTP ressemble à un challenge, l'appelant repasse par le
+navigateur, puis reprend le relais HTTP avec la session rafraîchie.
+"""
+
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Marqueurs d'une page de challenge Cloudflare dans le HTML
+CHALLENGE_MARKERS = (
+    'challenges.cloudflare.com',
+    'cf-challenge',
+    'challenge-form',
+    '<title>just a moment',
+    'cf_chl_opt',
+)
+
+
+class ChallengeDetected(Exception):
+    """La réponse HTTP est une page de challenge (session à rafraîchir)"""
+
+
+def is_challenge_response(response: requests.Response) -> bool:
+    """
+    Détecte une page de challenge Cloudflare
+
+    Args:
+        response: Réponse HTTP
+
+    Returns:
+        True si la réponse est un challenge plutôt que la page demandée
+    """
+    if response.headers.get('cf-mitigated', '').lower() == 'challenge':
+        return True
+
+    if response.status_code in (403, 429, 503):
+        return True
+
+    head = response.text[:20000].lower()
+    return any(marker in head for marker in CHALLENGE_MARKERS)
+
+
+@dataclass
+class BrowserSession:
+    """État d'une session navigateur transférable à un client HTTP"""
+    cookies: List[Dict[str, Any]]
+    user_agent: str
+    accept_language: Optional[str] = None
+    captured_at: float = field(default_factory=time.time)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convertit la session en dictionnaire (sérialisable en JSON)"""
+        return asdict(self)
+
+
+def capture_browser_session(driver: Any) -> BrowserSession:
+    """
+    Capture les cookies et l'identité HTTP du navigateur
+
+    Args:
+        driver: Driver Selenium, sur une page du domaine visé
+
+    Returns:
+        Session transférable
+    """
+    user_agent = driver.execute_script("return navigator.userAgent")
+    languages = driver.execute_script("return navigator.languages") or []
+
+    return BrowserSession(
+        cookies=driver.get_cookies(),
+        user_agent=user_agent,
+        accept_language=','.join(languages) if languages else None
+    )
+
+
+@dataclass
+class HandoffStats:
+    """Répartition des pages entre client HTTP et navigateur"""
+    http_pages: int = 0         # Pages servies par le client HTTP
+    browser_pages: int = 0      # Pages chargées dans le navigateur
+    handoffs: int = 0           # Sessions transférées au client HTTP
+    challenges: int = 0         # Challenges rencontrés en HTTP (retour au navigateur)
+    http_time: float = 0.0      # Temps cumulé des requêtes HTTP (secondes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convertit les compteurs en dictionnaire"""
+        return asdict(self)
+
+
+class HTTPSessionHandoff:
+    """
+    Client HTTP qui réutilise la session d'un navigateur
+    """
+
+    def __init__(self, browser_session: BrowserSession, timeout: float = 30):
+        """
+        Args:
+            browser_session: Cookies et identité capturés dans le navigateur
+            timeout: Timeout des requêtes (secondes)
+        """
+        self.browser_session = browser_session
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        self.session.headers.update({
+            # Même User-Agent que le navigateur: les cookies Cloudflare y sont liés
+            'User-Agent': browser_session.user_agent,
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive',
+        })
+        if browser_session.accept_language:
+            self.session.headers['Accept-Language'] = browser_session.accept_language
+
+        for cookie in browser_session.cookies:
+            self.session.cookies.set(
+                cookie['name'],
+                cookie['value'],
+                domain=cookie.get('domain'),
+                path=cookie.get('path', '/'),
+                secure=cookie.get('secure', False)
+            )
+
+    def fetch(self, url: str, referer: Optional[str] = None) -> str:
+        """
+        Récupère une page en HTTP avec la session du navigateur
+
+        Args:
+            url: URL de la page
+            referer: Page précédente (comme le ferait le navigateur)
+
+        Returns:
+            HTML de la page
+
+        Raises:
+            ChallengeDetected: Si la réponse est un challenge
+            requests.RequestException: En cas d'erreur réseau
+        """
+        headers = {'Referer': referer} if referer else None
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+
+        if is_challenge_response(response):
+            raise ChallengeDetected(f"Challenge sur {url} (HTTP {response.status_code})")
+
+        response.raise_for_status()
+        return response.text
+
+    def close(self):
+        """Ferme la session HTTP"""
+        self.session.close()
@@ -0,0 +1,291 @@
+"""
+Sessions navigateur persistées par pays (cookies, localStorage, profil)
+
+Sans état persisté, chaque run d'`IndeedBypassScraper` repart d'un profil
+vierge: bannière cookies à accepter, challenge Cloudflare à repasser. Le
+store conserve, par pays, les cookies, le localStorage et l'identité HTTP
+du dernier navigateur qui a obtenu une session valide:
+
+- un navigateur neuf (ou emprunté au pool, quel que soit le pays qu'il a
+  servi avant) reçoit ces cookies via CDP avant sa première page
+- en mode hybride, le client HTTP démarre directement avec la session
+  stockée: la première page coûte alors le même prix que les suivantes
+- sans pool, un répertoire de profil Chrome par pays est aussi réutilisé
+
+Chaque session expire au plus tard à l'expiration du cookie de clearance
+Cloudflare (`cf_clearance`), et au plus tard `ttl` secondes après sa
+capture. Les cookies de courte durée (`__cf_bm`, réémis par Cloudflare à
+chaque réponse) ne bornent pas la session: expirés, ils sont simplement
+écartés à la restauration.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from .cache import DEFAULT_CACHE_DIR
+from .session_handoff import BrowserSession
+
+logger = logging.getLogger(__name__)
+
+# Durée de vie maximale d'une session stockée (secondes)
+DEFAULT_SESSION_TTL = 6 * 3600
+
+# Cookies dont l'expiration borne celle de la session
+CLEARANCE_COOKIES = ('cf_clearance',)
+
+
+@dataclass
+class SessionState:
+    """Session navigateur d'un pays"""
+    country: str
+    cookies: List[Dict[str, Any]]
+    user_agent: str
+    origin: str = ''
+    local_storage: Dict[str, str] = field(default_factory=dict)
+    accept_language: Optional[str] = None
+    saved_at: float = field(default_factory=time.time)
+    expires_at: Optional[float] = None
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        """Vérifie si la session a expiré"""
+        now = time.time() if now is None else now
+        return self.expires_at is not None and now >= self.expires_at
+
+    def live_cookies(self, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Cookies non expirés (un `__cf_bm` périmé n'est pas renvoyé)"""
+        now = time.time() if now is None else now
+        return [cookie for cookie in self.cookies if not cookie.get('expiry') or float(cookie['expiry']) > now]
+
+    def browser_session(self) -> BrowserSession:
+        """Session transférable au client HTTP du mode hybride"""
+        return BrowserSession(
+            cookies=self.live_cookies(),
+            user_agent=self.user_agent,
+            accept_language=self.accept_language,
+            captured_at=self.saved_at
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convertit la session en dictionnaire (sérialisable en JSON)"""
+        return asdict(self)
+
+
+def session_expiry(cookies: List[Dict[str, Any]], saved_at: float, ttl: float) -> float:
+    """
+    Expiration d'une session: `ttl` après la capture, ou avant si un cookie
+    de clearance expire plus tôt
+    """
+    expires_at = saved_at + ttl
+    for cookie in cookies:
+        if cookie.get('name') in CLEARANCE_COOKIES and cookie.get('expiry'):
+            expires_at = min(expires_at, float(cookie['expiry']))
+    return expires_at
+
+
+def capture_session_state(driver: Any, country: str, ttl: float = DEFAULT_SESSION_TTL) -> SessionState:
+    """
+    Capture la session du navigateur (page courante du domaine Indeed)
+
+    Args:
+        driver: Driver Selenium
+        country: Code pays de la session
+        ttl: Durée de vie maximale (secondes)
+
+    Returns:
+        Session à enregistrer dans le store
+    """
+    data = driver.execute_script(
+        "return {"
+        "  origin: location.origin,"
+        "  user_agent: navigator.userAgent,"
+        "  languages: navigator.languages || [],"
+        "  local_storage: Object.assign({}, window.localStorage)"
+        "}"
+    ) or {}
+    cookies = driver.get_cookies()
+    now = time.time()
+
+    return SessionState(
+        country=country,
+        cookies=cookies,
+        user_agent=data.get('user_agent', ''),
+        origin=data.get('origin', ''),
+        local_storage=dict(data.get('local_storage') or {}),
+        accept_language=','.join(data.get('languages') or []) or None,
+        saved_at=now,
+        expires_at=session_expiry(cookies, now, ttl)
+    )
+
+
+def restore_session_state(driver: Any, state: SessionState) -> bool:
+    """
+    Injecte une session stockée dans un navigateur, avant toute navigation
+
+    Les cookies passent par CDP (`Network.setCookies`, sans avoir besoin
+    d'être sur le domaine). Le localStorage est restauré par un script
+    exécuté au chargement de chaque document de la même origine.
+
+    Returns:
+        True si les cookies ont été injectés
+    """
+    cookies = []
+    for cookie in state.live_cookies():
+        cdp_cookie = {
+            'name': cookie['name'],
+            'value': cookie['value'],
+            'domain': cookie.get('domain'),
+            'path': cookie.get('path', '/'),
+            'secure': cookie.get('secure', False),
+            'httpOnly': cookie.get('httpOnly', False),
+        }
+        if cookie.get('expiry'):
+            cdp_cookie['expires'] = cookie['expiry']
+        if cookie.get('sameSite'):
+            cdp_cookie['sameSite'] = cookie['sameSite']
+        cookies.append(cdp_cookie)
+
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setCookies', {'cookies': cookies})
+    except Exception as e:
+        logger.warning(f"⚠️ Restauration des cookies impossible (CDP): {e}")
+        return False
+
+    if state.local_storage and state.origin:
+        script = (
+            "(function(origin, items) {"
+            "  if (location.origin !== origin) return;"
+            "  for (const [key, value] of Object.entries(items)) {"
+            "    if (localStorage.getItem(key) === null) localStorage.setItem(key, value);"
+            "  }"
+            f"}})({json.dumps(state.origin)}, {json.dumps(state.local_storage)});"
+        )
+        try:
+            driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': script})
+        except Exception as e:
+            logger.debug(f"localStorage non restauré: {e}")
+
+    logger.info(f"🍪 Session {state.country.upper()} restaurée ({len(cookies)} cookies)")
+    return True
+
+
+class SessionStateStore:
+    """
+    Sessions par pays persistées dans SQLite (thread-safe, partagé par un pool)
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = DEFAULT_CACHE_DIR / 'browser_sessions.db',
+        ttl: float = DEFAULT_SESSION_TTL,
+        profiles_dir: Union[str, Path] = DEFAULT_CACHE_DIR / 'chrome_profiles'
+    ):
+        """
+        Args:
+            path: Chemin du fichier SQLite (":memory:" pour les tests)
+            ttl: Durée de vie maximale d'une session (secondes)
+            profiles_dir: Répertoire des profils Chrome par pays
+        """
+        self.path = str(path)
+        self.ttl = ttl
+        self.profiles_dir = Path(profiles_dir)
+
+        if self.path != ':memory:':
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            "country TEXT PRIMARY KEY, state TEXT NOT NULL, "
+            "saved_at REAL NOT NULL, expires_at REAL)"
+        )
+        self._conn.commit()
+
+    def load(self, country: str) -> Optional[SessionState]:
+        """
+        Retourne la session d'un pays (None si absente ou expirée)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT state FROM sessions WHERE country = ?", (country.lower(),)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        state = SessionState(**json.loads(row[0]))
+        if state.is_expired():
+            logger.debug(f"Session {country.upper()} expirée")
+            self.delete(country)
+            return None
+        return state
+
+    def save(self, state: SessionState):
+        """Enregistre (remplace) la session d'un pays"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sessions (country, state, saved_at, expires_at) "
+                "VALUES (?, ?, ?, ?)",
+                (state.country.lower(), json.dumps(state.to_dict()), state.saved_at, state.expires_at)
+            )
+            self._conn.commit()
+
+    def capture(self, driver: Any, country: str) -> Optional[SessionState]:
+        """
+        Capture et enregistre la session courante d'un navigateur
+
+        Returns:
+            Session enregistrée, ou None si la capture a échoué
+        """
+        try:
+            state = capture_session_state(driver, country, self.ttl)
+        except Exception as e:
+            logger.warning(f"⚠️ Session {country.upper()} non capturée: {e}")
+            return None
+
+        self.save(state)
+        return state
+
+    def delete(self, country: str):
+        """Oublie la session d'un pays (ex: challenge malgré la session)"""
+        with self._lock:
+            self._conn.execute("DELETE FROM sessions WHERE country = ?", (country.lower(),))
+            self._conn.commit()
+
+    def purge_expired(self) -> int:
+        """
+        Supprime les sessions expirées
+
+        Returns:
+            Nombre de sessions supprimées
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM sessions WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (time.time(),)
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def profile_dir(self, country: str) -> Path:
+        """
+        Répertoire de profil Chrome d'un pays (créé si besoin)
+
+        Un profil ne peut être ouvert que par un seul Chrome à la fois: il
+        n'est utilisé que pour les navigateurs dédiés, pas pour ceux du pool.
+        """
+        path = self.profiles_dir / country.lower()
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def close(self):
+        """Ferme la connexion SQLite"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,45 @@
+"""
+Accès à la configuration partagée (config/settings/*.json)
+"""
+
+import json
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Racine du dépôt (src/modules/detection/settings.py -> ../../..)
+ROOT_DIR = Path(__file__).resolve().parents[3]
+
+INTEGRATIONS_PATH = ROOT_DIR / 'config' / 'settings' / 'integrations.json'
+
+
+@lru_cache(maxsize=None)
+def _load_json(path: str) -> Dict[str, Any]:
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_integrations_config(path: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
+    """
+    Charge config/settings/integrations.json
+
+    Le fichier est lu une seule fois par processus. Si il est absent ou
+    invalide, une configuration vide est retournée (les modules appelants
+    utilisent alors leurs valeurs par défaut).
+
+    Args:
+        path: Chemin alternatif du fichier
+
+    Returns:
+        Configuration sous forme de dictionnaire
+    """
+    path = Path(path) if path else INTEGRATIONS_PATH
+
+    try:
+        return _load_json(str(path))
+    except (OSError, ValueError) as e:
+        logger.warning(f"⚠️ Configuration {path} illisible: {e}")
+        return {}
@@ -0,0 +1,184 @@
+"""
+Registre des sources d'offres de l'agrégateur
+
+Chaque source se déclare par un `SourceSpec`: son scraper (désigné par un
+chemin "module:Classe", importé seulement quand une recherche la
+sélectionne), les paquets dont elle dépend, ses capacités et les options
+de l'agrégateur qu'elle reçoit. Une recherche VDAB seule n'importe donc
+ni Selenium ni undetected-chromedriver, et un navigateur absent n'empêche
+plus l'agrégateur de démarrer.
+
+    SOURCES.names()                           # ['vdab', 'indeed']
+    SOURCES.names(capabilities={'api'})       # ['vdab']
+    aggregator.search("Python", sources=SOURCES.names(capabilities={'api'}))
+
+Ajouter une source (StepStone, Jobat, Forem...): enregistrer son
+`SourceSpec` et ajouter à `BelgianJobAggregator` la méthode
+`_iter_<nom>` qui normalise ses offres.
+"""
+
+import importlib
+import importlib.util
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SourceSpec:
+    """Déclaration d'une source d'offres (rien n'est importé à la déclaration)"""
+    name: str                        # Nom court, utilisé dans `sources=[...]`
+    label: str                       # Libellé des logs
+    factory: str                     # Scraper, "module:attribut" (relatif au paquet detection)
+    requires: Tuple[str, ...] = ()   # Paquets importés par le scraper
+    capabilities: FrozenSet[str] = frozenset()  # 'api', 'browser', 'details'...
+    regions: FrozenSet[str] = frozenset()       # Régions couvertes
+    options: Dict[str, str] = field(default_factory=dict)   # Paramètre du scraper -> option de l'agrégateur
+    fixed: Dict[str, Any] = field(default_factory=dict)     # Paramètres constants du scraper
+    default: bool = True             # Interrogée quand `sources` n'est pas précisé
+
+    def missing_requirements(self) -> List[str]:
+        """Paquets requis absents (vérifiés sans les importer)"""
+        return [package for package in self.requires if importlib.util.find_spec(package) is None]
+
+    @property
+    def installed(self) -> bool:
+        """Toutes les dépendances de la source sont installées"""
+        return not self.missing_requirements()
+
+    def load(self) -> Callable[..., Any]:
+        """Importe le module de la source et retourne son scraper"""
+        module_name, _, attribute = self.factory.partition(':')
+        module = importlib.import_module(module_name, package=__package__)
+        return getattr(module, attribute)
+
+    def create(self, options: Dict[str, Any]) -> Any:
+        """
+        Instancie le scraper avec les options de l'agrégateur qui le concernent
+
+        Raises:
+            ImportError: Si une dépendance manque
+        """
+        missing = self.missing_requirements()
+        if missing:
+            raise ImportError(f"modules manquants: {', '.join(missing)}")
+
+        kwargs = dict(self.fixed)
+        kwargs.update({
+            parameter: options[option] for parameter, option in self.options.items() if option in options
+        })
+        return self.load()(**kwargs)
+
+
+class SourceRegistry:
+    """Sources connues, dans leur ordre d'interrogation"""
+
+    def __init__(self, specs: Iterable[SourceSpec] = ()):
+        self._specs: Dict[str, SourceSpec] = {}
+        for spec in specs:
+            self.register(spec)
+
+    def register(self, spec: SourceSpec, replace: bool = False) -> SourceSpec:
+        """
+        Ajoute une source
+
+        Raises:
+            ValueError: Si le nom est déjà pris (sauf `replace=True`)
+        """
+        if spec.name in self._specs and not replace:
+            raise ValueError(f"Source déjà enregistrée: {spec.name}")
+        self._specs[spec.name] = spec
+        return spec
+
+    def unregister(self, name: str):
+        """Retire une source"""
+        self._specs.pop(name, None)
+
+    def get(self, name: str) -> SourceSpec:
+        """
+        Déclaration d'une source
+
+        Raises:
+            KeyError: Si la source est inconnue
+        """
+        try:
+            return self._specs[name]
+        except KeyError:
+            raise KeyError(f"Source inconnue: {name} (connues: {', '.join(self._specs)})") from None
+
+    def names(self, capabilities: Optional[Iterable[str]] = None) -> List[str]:
+        """Noms des sources, éventuellement limitées à celles qui ont toutes ces capacités"""
+        return [spec.name for spec in self.select(list(self._specs), capabilities)]
+
+    def select(
+        self,
+        names: Optional[Iterable[str]] = None,
+        capabilities: Optional[Iterable[str]] = None
+    ) -> List[SourceSpec]:
+        """
+        Sources d'une recherche, dans l'ordre du registre
+
+        Args:
+            names: Sources demandées (None = sources par défaut)
+            capabilities: Capacités exigées de chaque source
+
+        Raises:
+            KeyError: Si une source demandée est inconnue
+        """
+        if names is None:
+            wanted = {spec.name for spec in self._specs.values() if spec.default}
+        else:
+            wanted = set(names)
+            for name in wanted:
+                self.get(name)
+
+        required = frozenset(capabilities or ())
+        return [
+            spec for spec in self._specs.values()
+            if spec.name in wanted and required <= spec.capabilities
+        ]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._specs
+
+    def __iter__(self) -> Iterator[SourceSpec]:
+        return iter(list(self._specs.values()))
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+
+# Sources intégrées
+SOURCES = SourceRegistry([
+    SourceSpec(
+        name='vdab',
+        label="VDAB",
+        factory='.vdab_api:VDABScraper',
+        requires=('requests', 'dotenv'),
+        capabilities=frozenset({'api', 'details', 'bulk_details'}),
+        regions=frozenset({'flanders', 'brussels'}),
+        options={
+            'client_id': 'vdab_client_id',
+            'fixtures': 'fixtures',
+            'quota': 'vdab_quota',
+            'description_store': 'description_store',
+        },
+    ),
+    SourceSpec(
+        name='indeed',
+        label="Indeed",
+        factory='.indeed_bypass:IndeedBypassScraper',
+        requires=('undetected_chromedriver', 'selenium', 'bs4'),
+        capabilities=frozenset({'scraping', 'browser', 'details'}),
+        regions=frozenset({'flanders', 'brussels', 'wallonia'}),
+        options={
+            'headless': 'indeed_headless',
+            'driver_pool': 'driver_pool',
+            'fixtures': 'fixtures',
+            'description_store': 'description_store',
+        },
+        fixed={'country': 'be'},
+    ),
+])
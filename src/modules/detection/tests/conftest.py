@@ -0,0 +1,18 @@
+"""
+Configuration pytest des tests du module detection
+"""
+
+import pytest
+
+from src.modules.detection.http_cache import reset_http_cache, set_http_cache
+from src.modules.detection.quota import reset_quota_ledgers, set_quota_ledger
+
+
+@pytest.fixture(autouse=True)
+def no_shared_state():
+    """Ni cache HTTP ni quota partagés sur disque: chaque test part de zéro"""
+    set_http_cache(None)
+    set_quota_ledger(None)
+    yield
+    reset_http_cache()
+    reset_quota_ledgers()
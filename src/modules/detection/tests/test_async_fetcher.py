@@ -0,0 +1,144 @@
+"""
+Tests unitaires pour le moteur de récupération asynchrone
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from tenacity import wait_none
+
+from src.modules.detection.async_fetcher import (
+    AsyncFetchEngine,
+    FetchRequest,
+    iterate_async,
+    run_sync
+)
+
+
+def make_transport(handler):
+    """Crée un transport httpx qui répond via `handler`"""
+    return httpx.MockTransport(handler)
+
+
+class TestAsyncFetchEngine:
+    """Tests pour AsyncFetchEngine"""
+
+    @pytest.mark.asyncio
+    async def test_fetch_all_preserves_order(self):
+        """Les réponses sont retournées dans l'ordre des requêtes"""
+        async def handler(request):
+            await asyncio.sleep(0.01 if request.url.params['page'] == '0' else 0)
+            return httpx.Response(200, text=f"page {request.url.params['page']}")
+
+        async with AsyncFetchEngine(transport=make_transport(handler)) as engine:
+            responses = await engine.fetch_all([
+                FetchRequest(url="https://example.com/jobs", params={'page': i})
+                for i in range(3)
+            ])
+
+        assert [r.text for r in responses] == ["page 0", "page 1", "page 2"]
+
+    @pytest.mark.asyncio
+    async def test_per_host_limit(self):
+        """Pas plus de `per_host_limit` requêtes en vol par hôte"""
+        in_flight = {'current': 0, 'max': 0}
+
+        async def handler(request):
+            in_flight['current'] += 1
+            in_flight['max'] = max(in_flight['max'], in_flight['current'])
+            await asyncio.sleep(0.01)
+            in_flight['current'] -= 1
+            return httpx.Response(200, text="ok")
+
+        engine = AsyncFetchEngine(per_host_limit=2, transport=make_transport(handler))
+        await engine.fetch_all([f"https://example.com/{i}" for i in range(8)])
+        await engine.aclose()
+
+        assert in_flight['max'] == 2
+
+    @pytest.mark.asyncio
+    async def test_fetch_all_returns_exceptions(self, monkeypatch):
+        """Une erreur HTTP n'annule pas les autres requêtes"""
+        def handler(request):
+            if request.url.path == "/missing":
+                return httpx.Response(404)
+            return httpx.Response(200, text="ok")
+
+        # Pas de backoff dans les tests
+        monkeypatch.setattr(AsyncFetchEngine._request.retry, 'wait', wait_none())
+
+        engine = AsyncFetchEngine(transport=make_transport(handler))
+        responses = await engine.fetch_all(["https://example.com/ok", "https://example.com/missing"])
+        await engine.aclose()
+
+        assert responses[0].text == "ok"
+        assert isinstance(responses[1], Exception)
+
+    def test_engine_reusable_across_loops(self):
+        """Le moteur recrée son client quand la boucle change"""
+        engine = AsyncFetchEngine(
+            transport=make_transport(lambda request: httpx.Response(200, text="ok"))
+        )
+
+        for _ in range(2):
+            response = asyncio.run(engine.fetch("https://example.com/"))
+            assert response.text == "ok"
+
+
+class TestRunSync:
+    """Tests pour le wrapper synchrone"""
+
+    def test_run_sync_without_loop(self):
+        """Exécution directe hors boucle asyncio"""
+        async def compute():
+            return 42
+
+        assert run_sync(compute()) == 42
+
+    @pytest.mark.asyncio
+    async def test_run_sync_inside_running_loop(self):
+        """Exécution dans un thread dédié si une boucle tourne déjà"""
+        async def compute():
+            return "ok"
+
+        assert run_sync(compute()) == "ok"
+
+    def test_run_sync_propagates_errors(self):
+        """Les exceptions de la coroutine sont propagées"""
+        async def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            run_sync(fail())
+
+
+class TestIterateAsync:
+    """Tests pour la consommation d'un itérateur bloquant depuis asyncio"""
+
+    @pytest.mark.asyncio
+    async def test_iterate_async(self):
+        """Tous les éléments sont produits, dans l'ordre"""
+        items = [item async for item in iterate_async(iter(range(5)))]
+
+        assert items == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_iterate_async_closes_generator(self):
+        """Arrêter l'itération ferme le générateur sous-jacent"""
+        closed = []
+
+        def produce():
+            try:
+                yield 1
+                yield 2
+            finally:
+                closed.append(True)
+
+        stream = iterate_async(produce())
+        async for item in stream:
+            break
+        await stream.aclose()
+
+        assert item == 1
+        assert closed == [True]
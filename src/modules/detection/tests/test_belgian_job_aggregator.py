@@ -0,0 +1,300 @@
+"""
+Tests unitaires pour l'agrégateur belge (flux et déduplication)
+"""
+
+import pytest
+
+import threading
+import time
+
+from src.modules.detection.belgian_job_aggregator import (
+    AggregatedJobOffer,
+    BelgianJobAggregator,
+    FanOutSettings,
+    StreamingDeduplicator
+)
+from src.modules.detection.identity import stable_offer_id
+from src.modules.detection.sources import SOURCES
+from src.modules.detection.indeed_bypass import JobOffer as IndeedJobOffer
+from src.modules.detection.vdab_api import VDABJobOffer
+
+
+def make_offer(title, company, source="VDAB"):
+    return AggregatedJobOffer(
+        id=f"{source}_{title}",
+        title=title,
+        company=company,
+        location="Brussel",
+        description="",
+        url=f"https://example.com/{source}/{title}",
+        source=source
+    )
+
+
+class FakeSource:
+    """
+    Source simulée: produit ses offres et note combien ont été consommées
+
+    `gate` bloque la source après `block_after` offres jusqu'à ce qu'il soit
+    levé; `barrier` synchronise les sources avant leur première offre.
+    """
+
+    def __init__(self, offers, fail_after=None, delay=0.0, gate=None, block_after=0, barrier=None):
+        self.offers = offers
+        self.fail_after = fail_after
+        self.delay = delay
+        self.gate = gate
+        self.block_after = block_after
+        self.barrier = barrier
+        self.produced = 0
+        self.closed = False
+
+    def search_iter(self, **kwargs):
+        self.closed = False
+        try:
+            if self.barrier is not None:
+                self.barrier.wait()
+            for offer in self.offers:
+                time.sleep(self.delay)
+                if self.gate is not None and self.produced >= self.block_after:
+                    self.gate.wait(5)
+                if self.fail_after is not None and self.produced >= self.fail_after:
+                    raise RuntimeError("source down")
+                self.produced += 1
+                yield offer
+        finally:
+            self.closed = True
+
+    scrape_iter = search_iter
+
+
+@pytest.fixture
+def aggregator():
+    """Agrégateur sans scrapers réels (ni API, ni navigateur)"""
+    aggregator = BelgianJobAggregator.__new__(BelgianJobAggregator)
+    aggregator.enable_deduplication = True
+    aggregator.fanout = FanOutSettings()
+    aggregator.near_duplicates = None
+    aggregator.last_search_report = None
+    aggregator.registry = SOURCES
+    aggregator._scrapers = {}
+    aggregator._scraper_errors = {}
+    aggregator._scrapers_lock = threading.Lock()
+    aggregator._runs = {}
+    aggregator.result_cache = None
+    aggregator.vdab_scraper = FakeSource([])
+    aggregator.indeed_scraper = FakeSource([])
+    aggregator._normalize_vdab_offer = lambda offer: offer
+    aggregator._normalize_indeed_offer = lambda offer: offer
+    return aggregator
+
+
+class TestStreamingDeduplicator:
+    """Tests de la déduplication incrémentale"""
+
+    def test_filter_keeps_first_occurrence(self):
+        dedup = StreamingDeduplicator()
+        offers = [
+            make_offer("Python Dev", "Acme"),
+            make_offer(" python dev ", "ACME", source="Indeed"),
+            make_offer("Java Dev", "Acme"),
+        ]
+
+        unique = list(dedup.filter(offers))
+
+        assert [o.id for o in unique] == ["VDAB_Python Dev", "VDAB_Java Dev"]
+        assert dedup.duplicates == 1
+        assert dedup.unique_count == 2
+
+    def test_normalized_ids_are_stable(self):
+        vdab = VDABJobOffer(id="42", title="Dev", company="Acme", location="Gent",
+                            description="", url="https://www.vdab.be/vindeenjob/vacatures/42")
+        indeed = IndeedJobOffer(title="Dev", company="Acme", location="Gent", description="",
+                                url="https://be.indeed.com/rc/clk?jk=9f&from=serp")
+
+        assert BelgianJobAggregator._normalize_vdab_offer(None, vdab).id == \
+            stable_offer_id('vdab', natural_key="42")
+        assert BelgianJobAggregator._normalize_indeed_offer(None, indeed).id == \
+            stable_offer_id('indeed', "https://be.indeed.com/viewjob?jk=9f")
+
+    def test_deduplicate_uses_streaming_keys(self, aggregator):
+        offers = [make_offer("A", "X"), make_offer("a", "x"), make_offer("B", "X")]
+
+        assert [o.title for o in aggregator._deduplicate(offers)] == ["A", "B"]
+
+
+class TestSearchIter:
+    """Tests de la recherche agrégée en flux"""
+
+    def test_search_iter_deduplicates_across_sources(self, aggregator):
+        aggregator.vdab_scraper = FakeSource([make_offer("Python Dev", "Acme")])
+        aggregator.indeed_scraper = FakeSource([
+            make_offer("Python Dev", "Acme", source="Indeed"),
+            make_offer("Data Engineer", "Beta", source="Indeed"),
+        ])
+
+        offers = aggregator.search("Python", "Bruxelles")
+
+        assert [(o.source, o.title) for o in offers] == [
+            ("VDAB", "Python Dev"),
+            ("Indeed", "Data Engineer"),
+        ]
+
+    def test_search_iter_is_lazy(self, aggregator):
+        aggregator.vdab_scraper = FakeSource([make_offer(str(i), "Acme") for i in range(10)])
+
+        stream = aggregator.search_iter("Python", "Bruxelles")
+        next(stream)
+        stream.close()
+
+        assert aggregator.vdab_scraper.produced == 1
+        assert aggregator.indeed_scraper.produced == 0
+
+    def test_stream_holds_its_sources(self, aggregator):
+        """Une source en cours de flux n'est pas partagée avec une recherche concurrente"""
+        aggregator.vdab_scraper = FakeSource([make_offer(str(i), "Acme") for i in range(10)])
+
+        stream = aggregator.search_iter("Python", "Bruxelles")
+        next(stream)
+        aggregator.search("Java", "Bruxelles", source_timeout=0.05)
+        assert aggregator.last_search_report.sources['vdab'].status == 'busy'
+        assert list(aggregator.search_iter("Java", "Bruxelles")) == []
+
+        stream.close()
+
+        assert aggregator.vdab_scraper.closed
+        assert not aggregator._source_busy('vdab') and not aggregator._source_busy('indeed')
+        assert aggregator.vdab_scraper.produced == 1
+
+    @pytest.mark.asyncio
+    async def test_async_stream_holds_its_sources(self, aggregator):
+        aggregator.vdab_scraper = FakeSource([make_offer(str(i), "Acme") for i in range(10)])
+
+        stream = aggregator.asearch_iter("Python", "Bruxelles")
+        await stream.__anext__()
+        assert aggregator._source_busy('vdab')
+        await stream.aclose()
+
+        assert aggregator.vdab_scraper.closed
+        assert not aggregator._source_busy('vdab') and not aggregator._source_busy('indeed')
+
+    def test_failing_source_keeps_partial_results(self, aggregator):
+        aggregator.vdab_scraper = FakeSource(
+            [make_offer("A", "X"), make_offer("B", "X")], fail_after=1
+        )
+        aggregator.indeed_scraper = FakeSource([make_offer("C", "Y", source="Indeed")])
+
+        offers = aggregator.search("Python", "Bruxelles")
+
+        assert [o.title for o in offers] == ["A", "C"]
+
+    @pytest.mark.asyncio
+    async def test_asearch_iter_merges_sources(self, aggregator):
+        aggregator.vdab_scraper = FakeSource([make_offer("A", "X"), make_offer("B", "X")])
+        aggregator.indeed_scraper = FakeSource([
+            make_offer("B", "X", source="Indeed"),
+            make_offer("C", "Y", source="Indeed"),
+        ])
+
+        offers = [offer async for offer in aggregator.asearch_iter("Python", "Bruxelles")]
+
+        assert sorted(o.title for o in offers) == ["A", "B", "C"]
+
+
+class TestFanOut:
+    """Tests de la recherche agrégée en parallèle"""
+
+    def test_sources_run_concurrently(self, aggregator):
+        # Chaque source attend l'autre avant de produire: seul un lancement
+        # simultané termine (sinon la barrière expire et les sources échouent)
+        barrier = threading.Barrier(2, timeout=5)
+        aggregator.vdab_scraper = FakeSource([make_offer(str(i), "X") for i in range(4)], barrier=barrier)
+        aggregator.indeed_scraper = FakeSource(
+            [make_offer(str(i), "Y", source="Indeed") for i in range(4)], barrier=barrier
+        )
+
+        offers = aggregator.search("Python", "Bruxelles")
+
+        # Ordre des sources conservé
+        assert [o.source for o in offers] == ["VDAB"] * 4 + ["Indeed"] * 4
+        report = aggregator.last_search_report
+        assert not report.partial
+        assert {name: s.status for name, s in report.sources.items()} == {'vdab': 'ok', 'indeed': 'ok'}
+
+    def test_slow_source_is_cut_with_partial_results(self, aggregator):
+        gate = threading.Event()
+        aggregator.vdab_scraper = FakeSource([make_offer("A", "X")])
+        aggregator.indeed_scraper = FakeSource(
+            [make_offer(str(i), "Y", source="Indeed") for i in range(100)], gate=gate, block_after=3
+        )
+
+        # Rendu alors que la source bloquée n'a pas rendu la main
+        offers = aggregator.search("Python", "Bruxelles", source_timeout=0.2)
+
+        assert not aggregator.indeed_scraper.closed
+        indeed = aggregator.last_search_report.sources['indeed']
+        assert indeed.status == 'timeout' and indeed.partial
+        assert indeed.offers == 3
+        assert len(offers) == 1 + indeed.offers
+        assert aggregator.last_search_report.sources['vdab'].status == 'ok'
+
+        # Le thread de la source coupée s'arrête à l'offre suivante
+        gate.set()
+        assert aggregator._runs['indeed'].wait(5)
+        assert aggregator.indeed_scraper.closed
+        assert aggregator.indeed_scraper.produced == 4
+
+    def test_cut_source_not_reused_while_running(self, aggregator):
+        gate = threading.Event()
+        aggregator.indeed_scraper = FakeSource(
+            [make_offer(str(i), "Y", source="Indeed") for i in range(5)], gate=gate, block_after=1
+        )
+        aggregator.search("Python", "Bruxelles", source_timeout=0.05)
+        live = aggregator._runs['indeed']
+
+        # Thread précédent toujours bloqué: la source est ignorée, pas relancée
+        aggregator.search("Python", "Bruxelles", source_timeout=0.05)
+
+        report = aggregator.last_search_report
+        assert report.sources['indeed'].status == 'busy' and report.partial
+        assert list(report.sources) == ['vdab', 'indeed']
+        assert list(aggregator.search_iter("Python", "Bruxelles", sources=['indeed'])) == []
+
+        gate.set()
+        assert live.wait(5)
+        aggregator.search("Python", "Bruxelles")
+
+        assert aggregator.last_search_report.sources['indeed'].status == 'ok'
+
+    def test_overall_deadline(self, aggregator):
+        aggregator.fanout = FanOutSettings(deadline=0.1, source_timeouts={'indeed': 5})
+        aggregator.indeed_scraper = FakeSource(
+            [make_offer(str(i), "Y", source="Indeed") for i in range(100)], delay=0.03
+        )
+
+        aggregator.search("Python", "Bruxelles")
+
+        status = aggregator.last_search_report.sources['indeed']
+        assert status.status == 'timeout'
+        assert status.timeout == 0.1
+
+    def test_error_status(self, aggregator):
+        aggregator.vdab_scraper = FakeSource([make_offer("A", "X"), make_offer("B", "X")], fail_after=1)
+
+        aggregator.search("Python", "Bruxelles")
+
+        vdab = aggregator.last_search_report.sources['vdab']
+        assert vdab.to_dict() | {'duration': 0} == {
+            'source': 'vdab', 'status': 'error', 'offers': 1, 'duration': 0,
+            'timeout': None, 'error': "source down", 'partial': True
+        }
+
+    def test_settings_from_config(self):
+        settings = FanOutSettings.from_config(
+            {'aggregator': {'fanout': {'deadline': 120, 'source_timeouts': {'indeed': 90}}}}
+        )
+
+        assert settings.timeout_for('indeed') == 90
+        assert settings.timeout_for('vdab') == 120
+        assert settings.timeout_for('indeed', 30) == 30
+        assert FanOutSettings.from_config({}).timeout_for('vdab') is None
@@ -0,0 +1,149 @@
+"""
+Tests unitaires pour les caches persistants et l'identité des offres
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from src.modules.detection.cache import JobDetailCache, SQLiteTTLCache
+from src.modules.detection.identity import (
+    canonical_job_url, is_stable_offer_id, migrate_export_file, migrate_offers, stable_offer_id
+)
+
+
+class TestCanonicalJobUrl:
+    """Tests pour canonical_job_url"""
+
+    def test_indeed_click_and_viewjob_are_equivalent(self):
+        """Les liens /rc/clk et /viewjob d'une même offre ont la même forme"""
+        click = canonical_job_url("https://fr.indeed.com/rc/clk?jk=123abc&from=serp&vjs=3")
+        view = canonical_job_url("https://FR.indeed.com/viewjob?jk=123abc")
+
+        assert click == view == "https://fr.indeed.com/viewjob?jk=123abc"
+
+    def test_generic_url_drops_query_and_fragment(self):
+        """Query, fragment et slash final sont retirés"""
+        url = canonical_job_url("https://www.vdab.be/vindeenjob/vacatures/42/?utm_source=x#top")
+
+        assert url == "https://www.vdab.be/vindeenjob/vacatures/42"
+
+
+class TestStableOfferId:
+    """Tests pour stable_offer_id et la migration des exports"""
+
+    def test_same_offer_same_id(self):
+        click = stable_offer_id('indeed', "https://be.indeed.com/rc/clk?jk=123abc&from=serp")
+        view = stable_offer_id('indeed', "https://be.indeed.com/viewjob?jk=123abc")
+
+        assert click == view
+        assert is_stable_offer_id(click)
+        assert stable_offer_id('vdab', natural_key="42") != stable_offer_id('vdab', natural_key="43")
+
+    def test_stable_across_processes(self):
+        """Contrairement à hash(), indépendant de PYTHONHASHSEED"""
+        code = ("from src.modules.detection.identity import stable_offer_id;"
+                "print(stable_offer_id('indeed', 'https://be.indeed.com/viewjob?jk=1'))")
+        ids = {
+            subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True,
+                           env={**os.environ, 'PYTHONHASHSEED': seed}).stdout.strip()
+            for seed in ('1', '2')
+        }
+
+        assert ids == {stable_offer_id('indeed', 'https://be.indeed.com/viewjob?jk=1')}
+
+    def test_requires_key(self):
+        with pytest.raises(ValueError):
+            stable_offer_id('indeed')
+
+    def test_migrate_offers(self):
+        offers = [
+            {'id': "vdab_42", 'url': "https://www.vdab.be/vindeenjob/vacatures/42"},
+            {'id': "indeed_-815234", 'url': "https://be.indeed.com/rc/clk?jk=9f&from=serp"},
+        ]
+
+        mapping = migrate_offers(offers)
+
+        assert [o['id'] for o in offers] == [
+            stable_offer_id('vdab', natural_key="42"),
+            stable_offer_id('indeed', "https://be.indeed.com/viewjob?jk=9f"),
+        ]
+        assert mapping == {"vdab_42": offers[0]['id'], "indeed_-815234": offers[1]['id']}
+        assert offers[1]['legacy_id'] == "indeed_-815234"
+        # Idempotent
+        assert migrate_offers(offers) == {}
+
+    def test_migrate_keeps_unidentifiable(self):
+        offers = [
+            {'id': "indeed_-815234", 'url': None},
+            {'id': "indeed_17", 'url': "https://be.indeed.com/viewjob?jk=ab"},
+        ]
+        skipped = []
+
+        mapping = migrate_offers(offers, skipped)
+
+        assert list(mapping) == ["indeed_17"]
+        assert skipped == [{'id': "indeed_-815234", 'url': None}]
+        assert offers[0] == {'id': "indeed_-815234", 'url': None}
+
+    def test_migrate_export_file(self, tmp_path):
+        export = tmp_path / "belgium_jobs.json"
+        export.write_text(json.dumps({'metadata': {}, 'offers': [
+            {'id': "indeed_17", 'url': "https://be.indeed.com/viewjob?jk=ab"},
+            {'id': "indeed_18"},
+        ]}))
+        skipped = []
+
+        assert len(migrate_export_file(export, skipped=skipped)) == 1
+        assert [o['id'] for o in skipped] == ["indeed_18"]
+        assert json.loads(export.read_text())['offers'][0]['id'] == \
+            stable_offer_id('indeed', "https://be.indeed.com/viewjob?jk=ab")
+        assert (tmp_path / "belgium_jobs.json.bak").exists()
+        assert migrate_export_file(export) == {}
+
+
+class TestSQLiteTTLCache:
+    """Tests pour SQLiteTTLCache"""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return SQLiteTTLCache(tmp_path / "cache.db", default_ttl=60)
+
+    def test_set_and_get(self, cache):
+        """Aller-retour d'une valeur JSON"""
+        cache.set("key", {'a': 1, 'b': [1, 2]})
+
+        assert cache.get("key") == {'a': 1, 'b': [1, 2]}
+        assert "key" in cache
+        assert len(cache) == 1
+
+    def test_expired_entries_are_ignored(self, cache):
+        """Une entrée expirée n'est plus retournée et peut être purgée"""
+        cache.set("old", "value", ttl=0.01)
+        time.sleep(0.02)
+
+        assert cache.get("old") is None
+        assert cache.purge_expired() == 1
+
+    def test_persistence(self, tmp_path):
+        """Les entrées survivent à la réouverture du fichier"""
+        SQLiteTTLCache(tmp_path / "cache.db").set("key", "value")
+
+        assert SQLiteTTLCache(tmp_path / "cache.db").get("key") == "value"
+
+
+class TestJobDetailCache:
+    """Tests pour JobDetailCache"""
+
+    def test_keyed_by_canonical_url(self, tmp_path):
+        """Les détails sont partagés entre URLs équivalentes"""
+        cache = JobDetailCache(tmp_path / "details.db")
+        cache.set_details("https://fr.indeed.com/rc/clk?jk=1", {'full_description': 'x'})
+
+        assert cache.get_details("https://fr.indeed.com/viewjob?jk=1&from=serp") == {
+            'full_description': 'x'
+        }
@@ -0,0 +1,156 @@
+"""
+Tests du stockage des descriptions complètes
+"""
+
+import copy
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+from src.modules.detection.belgian_job_aggregator import BelgianJobAggregator
+from src.modules.detection.cache import VacancyCache
+from src.modules.detection.description_store import PREVIEW_LENGTH, DescriptionStore
+from src.modules.detection.indeed_bypass import IndeedBypassScraper
+from src.modules.detection.rate_limiter import RateLimiter
+from src.modules.detection.vdab_api import VDABScraper
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+LONG_TEXT = "Je werkt met Python, SQL en Kubernetes in een agile team. " * 40
+
+
+@pytest.fixture
+def store():
+    descriptions = DescriptionStore(':memory:')
+    yield descriptions
+    descriptions.close()
+
+
+class TestDescriptionStore:
+
+    def test_round_trip(self, store):
+        ref = store.put(LONG_TEXT)
+        assert ref.text == LONG_TEXT
+        assert len(ref) == len(LONG_TEXT)
+
+    def test_deduplicated(self, store):
+        first, second = store.put(LONG_TEXT), store.put(LONG_TEXT)
+        store.put("Autre description")
+
+        assert first == second
+        assert len(store) == 2
+
+    def test_compressed(self, store):
+        store.put(LONG_TEXT)
+        stats = store.stats()
+        assert stats['stored_bytes'] * 5 < stats['raw_chars']
+
+    def test_split(self, store):
+        preview, ref = store.split(LONG_TEXT)
+        assert preview == LONG_TEXT[:PREVIEW_LENGTH]
+        assert ref.text == LONG_TEXT
+        assert store.split('') == ('', None)
+        assert store.split(None) == ('', None)
+
+    def test_unknown_digest(self, store):
+        assert store.ref('0' * 32) is None
+        with pytest.raises(KeyError):
+            store.get('0' * 32)
+
+    def test_lru_bounded(self):
+        store = DescriptionStore(':memory:', cache_size=2)
+        refs = [store.put(f"Description {i}") for i in range(5)]
+
+        assert [ref.text for ref in refs] == [f"Description {i}" for i in range(5)]
+        assert len(store._cache) == 2
+
+    def test_known_bounded(self):
+        store = DescriptionStore(':memory:', known_size=2)
+        for i in range(5):
+            store.put(f"Description {i}")
+
+        assert len(store._known) == 2
+        assert len(store) == 5
+
+    def test_batch_single_commit(self, store):
+        with store.batch():
+            refs = [store.put(f"Description {i}") for i in range(3)]
+            # Pas de commit par description
+            assert store._conn.in_transaction
+
+        assert not store._conn.in_transaction
+        assert [ref.text for ref in refs] == [f"Description {i}" for i in range(3)]
+
+    def test_persisted(self, tmp_path):
+        path = tmp_path / 'descriptions.db'
+        digest = DescriptionStore(path).put(LONG_TEXT).digest
+
+        assert DescriptionStore(path).ref(digest).text == LONG_TEXT
+
+    def test_copy_keeps_handle(self, store):
+        ref = store.put(LONG_TEXT)
+        assert copy.deepcopy(ref) is ref
+
+
+class TestVDAB:
+
+    def vacancy(self):
+        return {'id': "42", 'titel': "Developer", 'werkgever': {'naam': "Acme"},
+                'omschrijving': LONG_TEXT + " Thuiswerk mogelijk."}
+
+    def test_without_store_truncates(self):
+        scraper = VDABScraper(client_id='test', rate_limiter=RateLimiter())
+        offer = scraper._parse_vacancy(self.vacancy())
+
+        assert len(offer.description) == PREVIEW_LENGTH
+        assert offer.description_ref is None
+        assert offer.full_description == offer.description
+
+    def test_lossless_with_store(self, store):
+        scraper = VDABScraper(client_id='test', rate_limiter=RateLimiter(), description_store=store)
+        offer = scraper._parse_vacancy(self.vacancy())
+
+        assert offer.description == LONG_TEXT[:PREVIEW_LENGTH]
+        assert offer.full_description == self.vacancy()['omschrijving']
+        assert offer.to_dict()['description_id'] == offer.description_ref.digest
+        # Copie d'une offre: la poignée, pas le texte
+        assert asdict(offer)['description_ref'] is offer.description_ref
+
+    def test_vacancy_cache_keeps_handle(self, store):
+        scraper = VDABScraper(client_id='test', rate_limiter=RateLimiter(),
+                              description_store=store, vacancy_cache=VacancyCache(':memory:'))
+        offer = scraper._parse_vacancy(self.vacancy())
+        scraper.vacancy_cache.set("42", offer.to_dict())
+
+        cached = scraper._cached_vacancy("42")
+
+        assert cached.full_description == offer.full_description
+
+
+class TestIndeed:
+
+    @pytest.mark.parametrize("parser", IndeedBypassScraper.PARSERS)
+    def test_previews_and_full_snippets(self, store, parser):
+        html = (FIXTURES / "indeed_search_be_json.html").read_text(encoding="utf-8")
+        scraper = IndeedBypassScraper(country='be', parser=parser, rate_limiter=RateLimiter(),
+                                      description_store=store)
+
+        offers = scraper._parse_page(html)
+
+        assert offers
+        assert all(len(o.description) <= PREVIEW_LENGTH for o in offers)
+        assert all(o.full_description.startswith(o.description) for o in offers)
+        if parser == 'json':
+            assert any(len(o.full_description) > PREVIEW_LENGTH for o in offers)
+
+    def test_aggregator_keeps_handle(self, store):
+        html = (FIXTURES / "indeed_search_be_json.html").read_text(encoding="utf-8")
+        scraper = IndeedBypassScraper(country='be', parser='json', rate_limiter=RateLimiter(),
+                                      description_store=store)
+        offer = scraper._parse_page(html)[0]
+
+        aggregated = BelgianJobAggregator._normalize_indeed_offer(None, offer)
+
+        assert aggregated.full_description == offer.full_description
+        assert aggregated.to_dict()['description_id'] == offer.description_ref.digest
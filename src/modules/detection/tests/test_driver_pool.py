@@ -0,0 +1,137 @@
+"""
+Tests unitaires pour le pool de navigateurs Chrome
+"""
+
+import os
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from src.modules.detection import driver_pool as driver_pool_module
+from src.modules.detection.driver_pool import ChromeDriverPool, driver_memory, process_tree_memory
+
+
+@pytest.fixture
+def factory():
+    """Fabrique de faux drivers (aucun Chrome démarré)"""
+    created = []
+
+    def create():
+        driver = Mock(name=f"driver{len(created)}")
+        driver.browser_pid = None
+        created.append(driver)
+        return driver
+
+    create.created = created
+    return create
+
+
+class TestChromeDriverPool:
+    """Tests du prêt et du recyclage des navigateurs"""
+
+    def test_driver_is_reused(self, factory):
+        pool = ChromeDriverPool(size=2, driver_factory=factory)
+
+        with pool.lease() as first:
+            pass
+        with pool.lease() as second:
+            pass
+
+        assert first.driver is second.driver
+        assert pool.stats.created == 1
+        assert pool.stats.reuses == 1
+        assert second.leases == 2
+
+    def test_warm_up(self, factory):
+        pool = ChromeDriverPool(size=3, driver_factory=factory)
+        pool.warm_up(2)
+
+        assert len(factory.created) == 2
+        assert pool.idle_count == 2
+
+    def test_recycle_after_max_pages(self, factory):
+        pool = ChromeDriverPool(size=1, max_pages_per_driver=3, driver_factory=factory)
+
+        with pool.lease() as pooled:
+            pooled.record_page(3)
+
+        assert pool.idle_count == 0
+        assert pool.stats.recycled == 1
+        factory.created[0].quit.assert_called_once()
+
+        with pool.lease() as pooled:
+            assert pooled.driver is factory.created[1]
+
+    def test_recycle_over_memory_threshold(self, factory, monkeypatch):
+        monkeypatch.setattr(driver_pool_module, 'driver_memory', lambda driver: 600 * 1024 * 1024)
+        pool = ChromeDriverPool(size=1, max_memory_mb=500, driver_factory=factory)
+
+        with pool.lease():
+            pass
+
+        assert pool.stats.recycled == 1
+
+    def test_dead_driver_is_recycled(self, factory):
+        pool = ChromeDriverPool(size=1, driver_factory=factory)
+
+        pooled = pool.acquire()
+        type(pooled.driver).window_handles = property(Mock(side_effect=RuntimeError("session lost")))
+        pool.release(pooled)
+
+        assert pool.idle_count == 0
+        assert pool.stats.recycled == 1
+
+    def test_acquire_waits_for_release(self, factory):
+        pool = ChromeDriverPool(size=1, driver_factory=factory)
+        first = pool.acquire()
+
+        with pytest.raises(TimeoutError):
+            pool.acquire(timeout=0.01)
+
+        threading.Timer(0.05, pool.release, args=(first,)).start()
+        second = pool.acquire(timeout=5)
+
+        assert second.driver is first.driver
+        assert len(factory.created) == 1
+
+    def test_failed_creation_frees_slot(self, factory):
+        calls = []
+
+        def flaky():
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("chrome crashed")
+            return factory()
+
+        pool = ChromeDriverPool(size=1, driver_factory=flaky)
+        with pytest.raises(RuntimeError):
+            pool.acquire()
+
+        assert pool.acquire(timeout=0.1).driver is factory.created[0]
+
+    def test_close_quits_idle_and_returned_drivers(self, factory):
+        pool = ChromeDriverPool(size=2, driver_factory=factory)
+        pool.warm_up(1)
+        leased = pool.acquire()
+        other = pool.acquire()
+
+        pool.release(other)
+        pool.close()
+        pool.release(leased)
+
+        for driver in factory.created:
+            driver.quit.assert_called_once()
+        with pytest.raises(RuntimeError):
+            pool.acquire()
+
+
+class TestMemory:
+    """Tests de la mesure mémoire"""
+
+    @pytest.mark.skipif(not os.path.isdir('/proc/self'), reason="/proc indisponible")
+    def test_process_tree_memory_of_current_process(self):
+        assert process_tree_memory(os.getpid()) > 0
+
+    def test_unknown_pid(self):
+        assert driver_memory(Mock(browser_pid=None, service=None)) is None
@@ -0,0 +1,205 @@
+"""
+Tests de l'extraction des offres depuis le JSON embarqué des pages Indeed
+"""
+
+import json
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+from src.modules.detection import embedded_json, fast_parser
+from src.modules.detection.indeed_bypass import IndeedBypassScraper
+from src.modules.detection.jobboard_scraper import IndeedScraper
+from src.modules.detection.rate_limiter import RateLimiter
+
+FIXTURES = Path(__file__).parent / "fixtures"
+BASE_URL = "https://be.indeed.com"
+
+
+def load_fixture(name: str) -> str:
+    return (FIXTURES / name).read_text(encoding="utf-8")
+
+
+def page_with(results) -> str:
+    """Page minimale contenant un payload de cartes"""
+    payload = json.dumps({"metaData": {"mosaicProviderJobCardsModel": {"results": results}}})
+    return (
+        "<html><body><script>"
+        f"window.mosaic.providerData['mosaic-provider-jobcards']={payload};"
+        "window.mosaic.providerData['mosaic-provider-rich-media']={};"
+        "</script></body></html>"
+    )
+
+
+def without_timestamp(offer) -> dict:
+    fields = asdict(offer)
+    fields.pop('scraped_at')
+    return fields
+
+
+class TestPayloadExtraction:
+    """Localisation et décodage du payload"""
+
+    def test_missing_payload(self):
+        """Sans payload, None: l'appelant repasse par le DOM"""
+        assert embedded_json.extract_jobcards_payload("") is None
+        assert embedded_json.parse_embedded_cards(load_fixture("indeed_search_fr.html"), BASE_URL) is None
+
+    def test_malformed_payload(self):
+        """Un payload tronqué est ignoré"""
+        html = '<script>window.mosaic.providerData["mosaic-provider-jobcards"]={"metaData": {</script>'
+        assert embedded_json.parse_embedded_cards(html, BASE_URL) is None
+
+    def test_payload_without_results(self):
+        html = '<script>window.mosaic.providerData["mosaic-provider-jobcards"]={"metaData": {}};</script>'
+        assert embedded_json.parse_embedded_cards(html, BASE_URL) is None
+
+    def test_empty_results(self):
+        """Une page sans résultats donne une liste vide (pas de repli DOM)"""
+        assert embedded_json.parse_embedded_cards(page_with([]), BASE_URL) == []
+
+    def test_script_terminator_in_json(self):
+        """Les `<\\/script>` échappés dans le JSON ne coupent pas le décodage"""
+        html = page_with([{"jobkey": "abc", "title": "Dev", "snippet": "<ul><li>a</li></ul>"}])
+        html = html.replace("</li>", "<\\/li>")
+        [offer] = embedded_json.parse_embedded_cards(html, BASE_URL)
+        assert offer['description'] == "a"
+
+
+class TestResultMapping:
+    """Conversion d'un résultat en champs de JobOffer"""
+
+    def test_full_result(self):
+        result = {
+            "jobkey": "0c5c7fd0a6a3a450",
+            "displayTitle": "Senior Backend Engineer (m/v/x)",
+            "company": "Acme NV",
+            "formattedLocation": "Bruxelles",
+            "snippet": "<ul><li>Python &amp; Django</li><li>Horaires flexibles</li></ul>",
+            "salarySnippet": {"text": "€3.500 - €4.200 per maand"},
+            "formattedRelativeTime": "Il y a 2 jours",
+            "jobTypes": ["Temps plein", "CDI"],
+            "remoteWorkModel": {"type": "REMOTE_HYBRID"},
+        }
+
+        fields = embedded_json.result_to_fields(result, BASE_URL)
+
+        assert fields == {
+            'title': "Senior Backend Engineer (m/v/x)",
+            'company': "Acme NV",
+            'location': "Bruxelles",
+            'description': "Python & Django Horaires flexibles",
+            'url': "https://be.indeed.com/viewjob?jk=0c5c7fd0a6a3a450",
+            'posted_date': "Il y a 2 jours",
+            'salary': "€3.500 - €4.200 per maand",
+            'contract_type': "Temps plein, CDI",
+            'remote': True,
+        }
+
+    def test_minimal_result(self):
+        """Champs absents: mêmes valeurs par défaut que le parser DOM"""
+        fields = embedded_json.result_to_fields({"jobkey": "abc", "title": "Dev"}, BASE_URL)
+
+        assert fields['company'] == "N/A"
+        assert fields['location'] == "N/A"
+        assert fields['description'] == ""
+        assert fields['salary'] is None
+        assert fields['contract_type'] is None
+        assert fields['remote'] is False
+
+    def test_extracted_salary_and_taxonomy(self):
+        result = {
+            "jobkey": "abc",
+            "title": "Dev",
+            "extractedSalary": {"min": 3200, "max": 3900, "type": "par mois"},
+            "salarySnippet": {"currency": "EUR"},
+            "taxonomyAttributes": [
+                {"label": "job-types", "attributes": [{"label": "CDD"}]}
+            ],
+        }
+
+        fields = embedded_json.result_to_fields(result, BASE_URL)
+
+        assert fields['salary'] == "3200 - 3900 EUR par mois"
+        assert fields['contract_type'] == "CDD"
+
+    def test_url_from_link_without_jobkey(self):
+        result = {"title": "Dev", "link": "/rc/clk?jk=123&from=vj"}
+        fields = embedded_json.result_to_fields(result, BASE_URL)
+        assert fields['url'] == "https://be.indeed.com/viewjob?jk=123"
+
+    def test_result_without_title_is_skipped(self):
+        html = page_with([{"jobkey": "a"}, {"jobkey": "b", "title": "Dev"}, "garbage"])
+        offers = embedded_json.parse_embedded_cards(html, BASE_URL)
+        assert [o['url'] for o in offers] == ["https://be.indeed.com/viewjob?jk=b"]
+
+
+class TestScraperIntegration:
+    """Parser 'json' des scrapers Indeed"""
+
+    def test_json_page_matches_dom_offers(self):
+        """Mêmes offres que le DOM, avec des champs plus complets"""
+        html = load_fixture("indeed_search_be_json.html")
+        dom = fast_parser.parse_bypass_cards(html, BASE_URL)
+        scraper = IndeedBypassScraper(country='be', parser='json', rate_limiter=RateLimiter())
+
+        offers = scraper._parse_page(html)
+
+        assert [o.title for o in offers] == [d['title'] for d in dom]
+        assert [o.company for o in offers] == [d['company'] for d in dom]
+        # Extraits non tronqués
+        assert any(len(o.description) > 500 for o in offers)
+        assert all(o.posted_date for o in offers)
+        assert any(o.contract_type for o in offers)
+        # Toutes les URLs sont des fiches d'offre canoniques
+        assert all('/viewjob?jk=' in o.url for o in offers)
+
+    def test_json_is_more_complete(self):
+        html = load_fixture("indeed_search_be_json.html")
+        lxml_scraper = IndeedBypassScraper(country='be', parser='lxml', rate_limiter=RateLimiter())
+        json_scraper = IndeedBypassScraper(country='be', parser='json', rate_limiter=RateLimiter())
+
+        dom = embedded_json.field_completeness(lxml_scraper._parse_page(html))
+        embedded = embedded_json.field_completeness(json_scraper._parse_page(html))
+
+        assert all(embedded[name] >= dom[name] for name in embedded_json.OFFER_FIELDS)
+        assert sum(embedded.values()) > sum(dom.values())
+
+    @pytest.mark.parametrize("page", ["indeed_search_fr.html", "indeed_search_be.html"])
+    def test_fallback_to_dom(self, page):
+        """Sans payload, le parser 'json' donne exactement le résultat 'lxml'"""
+        html = load_fixture(page)
+        for scraper_class, method in ((IndeedScraper, '_parse_search_page'),
+                                      (IndeedBypassScraper, '_parse_page')):
+            expected = getattr(scraper_class(parser='lxml', rate_limiter=RateLimiter()), method)(html)
+            actual = getattr(scraper_class(parser='json', rate_limiter=RateLimiter()), method)(html)
+            assert [without_timestamp(o) for o in actual] == [without_timestamp(o) for o in expected]
+
+    def test_indeed_scraper_uses_payload(self):
+        scraper = IndeedScraper(parser='json', rate_limiter=RateLimiter())
+        offers = scraper._parse_search_page(page_with([{"jobkey": "abc", "title": "Dev"}]))
+        assert [(o.title, o.source, o.url) for o in offers] == [
+            ("Dev", "Indeed", "https://fr.indeed.com/viewjob?jk=abc")
+        ]
+
+    def test_unknown_parser(self):
+        with pytest.raises(ValueError):
+            IndeedScraper(parser='regex')
+
+
+class TestFieldCompleteness:
+
+    def test_ratios(self):
+        offers = [
+            {'title': 'a', 'company': 'N/A', 'salary': None, 'remote': True},
+            {'title': 'b', 'company': 'X', 'salary': '', 'remote': False},
+        ]
+        completeness = embedded_json.field_completeness(offers)
+        assert completeness['title'] == 1.0
+        assert completeness['company'] == 0.5
+        assert completeness['salary'] == 0.0
+        assert completeness['remote'] == 0.5
+
+    def test_no_offers(self):
+        assert set(embedded_json.field_completeness([]).values()) == {0.0}
@@ -0,0 +1,91 @@
+"""
+Tests d'équivalence du parser lxml avec les parsers BeautifulSoup
+"""
+
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+from src.modules.detection import fast_parser
+from src.modules.detection.jobboard_scraper import IndeedScraper
+from src.modules.detection.rate_limiter import RateLimiter
+
+FIXTURES = Path(__file__).parent / "fixtures"
+PAGES = ["indeed_search_fr.html", "indeed_search_be.html"]
+
+
+def load_fixture(name: str) -> str:
+    return (FIXTURES / name).read_text(encoding="utf-8")
+
+
+def without_timestamp(offer) -> dict:
+    """Champs d'une offre, hors date de scraping"""
+    fields = asdict(offer)
+    fields.pop('scraped_at')
+    return fields
+
+
+class TestTextExtraction:
+    """Tests des primitives de texte"""
+
+    def test_text_of_matches_get_text_strip(self):
+        """text_of reproduit get_text(strip=True) (commentaires et scripts exclus)"""
+        from bs4 import BeautifulSoup
+        from lxml import etree
+
+        html = "<div> a <b> b </b><!-- c --> d<script>var x;</script>\n<span>é&amp;f</span></div>"
+
+        expected = BeautifulSoup(html, 'lxml').find('div').get_text(strip=True)
+        element = etree.fromstring(html, etree.HTMLParser()).find('.//div')
+
+        assert fast_parser.text_of(element) == expected == "abdé&f"
+
+    def test_empty_page(self):
+        """Une page vide ne produit aucune offre"""
+        assert fast_parser.parse_search_cards("", "https://fr.indeed.com") == []
+        assert fast_parser.parse_bypass_cards("<html></html>", "https://fr.indeed.com") == []
+
+
+class TestIndeedScraperEquivalence:
+    """Le parser lxml produit les mêmes JobOffer que BeautifulSoup"""
+
+    @pytest.mark.parametrize("page", PAGES)
+    def test_same_offers(self, page):
+        html = load_fixture(page)
+        bs4_scraper = IndeedScraper(parser='bs4', rate_limiter=RateLimiter())
+        lxml_scraper = IndeedScraper(parser='lxml', rate_limiter=RateLimiter())
+
+        expected = [without_timestamp(o) for o in bs4_scraper._parse_search_page(html)]
+        actual = [without_timestamp(o) for o in lxml_scraper._parse_search_page(html)]
+
+        assert len(expected) > 10
+        assert actual == expected
+
+    def test_unknown_parser(self):
+        """Un moteur inconnu est refusé"""
+        with pytest.raises(ValueError):
+            IndeedScraper(parser='regex')
+
+
+class TestIndeedBypassScraperEquivalence:
+    """Même vérification pour le scraper Selenium"""
+
+    @pytest.fixture
+    def scrapers(self):
+        indeed_bypass = pytest.importorskip("src.modules.detection.indeed_bypass")
+        return (
+            indeed_bypass.IndeedBypassScraper(country='be', parser='bs4', rate_limiter=RateLimiter()),
+            indeed_bypass.IndeedBypassScraper(country='be', parser='lxml', rate_limiter=RateLimiter())
+        )
+
+    @pytest.mark.parametrize("page", PAGES)
+    def test_same_offers(self, scrapers, page):
+        html = load_fixture(page)
+        bs4_scraper, lxml_scraper = scrapers
+
+        expected = [without_timestamp(o) for o in bs4_scraper._parse_page(html)]
+        actual = [without_timestamp(o) for o in lxml_scraper._parse_page(html)]
+
+        assert len(expected) > 10
+        assert actual == expected
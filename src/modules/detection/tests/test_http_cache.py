@@ -0,0 +1,289 @@
+"""
+Tests unitaires pour le cache HTTP conditionnel
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+import requests
+
+from src.modules.detection import http_cache
+from src.modules.detection.http_cache import HTTPCache, get_http_cache, set_http_cache
+from src.modules.detection.jobboard_scraper import IndeedScraper
+from src.modules.detection.rate_limiter import RateLimiter
+from src.modules.detection.recording import FixtureStore
+from src.modules.detection.vdab_api import VDABScraper
+
+
+def make_response(status=200, body=b"<html>page</html>", headers=None):
+    """Construit une Response requests sans réseau"""
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.headers.update(headers or {})
+    return response
+
+
+class FakeServer:
+    """Serveur simulé qui gère ETag / If-None-Match"""
+
+    def __init__(self, etag='"v1"', body=b"<html>page</html>"):
+        self.etag = etag
+        self.body = body
+        self.requests = []
+
+    def send(self, headers):
+        self.requests.append(dict(headers))
+        if headers.get('If-None-Match') == self.etag:
+            return make_response(304, b"", {'ETag': self.etag})
+        return make_response(200, self.body, {'ETag': self.etag, 'Content-Type': 'text/html'})
+
+
+class TestHTTPCache:
+    """Tests pour HTTPCache"""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return HTTPCache(tmp_path / "http.db", ttls={'scraping_results': 60})
+
+    def test_fresh_entry_served_without_network(self, cache):
+        """Une entrée fraîche ne déclenche aucune requête"""
+        server = FakeServer()
+
+        first = cache.fetch("https://example.com/jobs", {'q': 'python'}, server.send)
+        second = cache.fetch("https://example.com/jobs", {'q': 'python'}, server.send)
+
+        assert len(server.requests) == 1
+        assert first.from_cache is False
+        assert second.from_cache is True
+        assert second.text == "<html>page</html>"
+        assert cache.stats.misses == 1
+        assert cache.stats.hits == 1
+        assert cache.stats.bytes_saved == len(server.body)
+
+    def test_params_are_part_of_the_key(self, cache):
+        """Deux pages de résultats différentes ne se partagent pas l'entrée"""
+        server = FakeServer()
+
+        cache.fetch("https://example.com/jobs", {'start': 0}, server.send)
+        cache.fetch("https://example.com/jobs", {'start': 10}, server.send)
+
+        assert len(server.requests) == 2
+
+    def test_stale_entry_is_revalidated(self, tmp_path):
+        """Après expiration, un GET conditionnel est envoyé et un 304 réutilise le corps"""
+        cache = HTTPCache(tmp_path / "http.db", ttls={'scraping_results': 0})
+        server = FakeServer()
+
+        cache.fetch("https://example.com/jobs", None, server.send)
+        response = cache.fetch("https://example.com/jobs", None, server.send)
+
+        assert server.requests[1] == {'If-None-Match': '"v1"'}
+        assert response.status_code == 200
+        assert response.text == "<html>page</html>"
+        assert cache.stats.revalidations == 1
+
+    def test_changed_resource_is_replaced(self, tmp_path):
+        """Si la ressource a changé, la nouvelle version est stockée"""
+        cache = HTTPCache(tmp_path / "http.db", ttls={'scraping_results': 0})
+        server = FakeServer()
+        cache.fetch("https://example.com/jobs", None, server.send)
+
+        server.etag, server.body = '"v2"', b"<html>new</html>"
+        response = cache.fetch("https://example.com/jobs", None, server.send)
+
+        assert response.text == "<html>new</html>"
+        assert cache.stats.misses == 2
+
+    def test_ttl_per_kind(self, tmp_path):
+        """Les pages d'offres utilisent le TTL job_offers"""
+        cache = HTTPCache(tmp_path / "http.db", ttls={'scraping_results': 0, 'job_offers': 60})
+        server = FakeServer()
+
+        for _ in range(2):
+            cache.fetch("https://example.com/job/1", None, server.send, kind='job_offers')
+
+        assert len(server.requests) == 1
+
+    def test_lru_eviction(self, tmp_path):
+        """Les entrées les moins récemment utilisées sont évincées au-delà de la taille max"""
+        import os
+
+        cache = HTTPCache(tmp_path / "http.db", max_size_bytes=2500)
+
+        def send_random(headers):
+            # Corps incompressible (~1 Ko stocké)
+            return make_response(200, os.urandom(1000))
+
+        cache.fetch("https://example.com/a", None, send_random)
+        time.sleep(0.01)
+        cache.fetch("https://example.com/b", None, send_random)
+        time.sleep(0.01)
+        cache.fetch("https://example.com/a", None, send_random)  # a redevient récent
+        time.sleep(0.01)
+        cache.fetch("https://example.com/c", None, send_random)
+
+        assert cache.stats.evictions == 1
+        assert cache._load(cache.cache_key("https://example.com/b")) is None
+        assert cache._load(cache.cache_key("https://example.com/a")) is not None
+        assert cache.size_bytes <= 2500
+
+    def test_no_store_is_respected(self, cache):
+        """Cache-Control: no-store empêche le stockage"""
+        def send(headers):
+            return make_response(200, b"secret", {'Cache-Control': 'no-store'})
+
+        cache.fetch("https://example.com/private", None, send)
+        cache.fetch("https://example.com/private", None, send)
+
+        assert cache.stats.misses == 2
+        assert cache.stats.stores == 0
+
+    def test_from_config(self):
+        """Les TTL viennent du bloc cache_ttl"""
+        cache = HTTPCache.from_config(
+            {'redis': {'cache_ttl': {'scraping_results': 120, 'job_offers': 600}}},
+            path=':memory:'
+        )
+
+        assert cache.ttl_for('scraping_results') == 120
+        assert cache.ttl_for('job_offers') == 600
+
+    def test_ttl_per_source(self, tmp_path):
+        """Le bloc cache_ttl d'un job board surcharge les TTL globaux pour cette source"""
+        cache = HTTPCache.from_config({
+            'redis': {'cache_ttl': {'scraping_results': 120, 'job_offers': 600}},
+            'job_boards': {'vdab': {'cache_ttl': {'scraping_results': 30}}},
+            'http_cache': {'path': str(tmp_path / "http.db"), 'max_size_mb': 1},
+        })
+
+        assert cache.ttl_for('scraping_results', 'vdab') == 30
+        assert cache.ttl_for('job_offers', 'VDAB') == 600
+        assert cache.ttl_for('scraping_results', 'Indeed') == 120
+        assert cache.path == str(tmp_path / "http.db")
+        assert cache.max_size_bytes == 1024 * 1024
+
+        server = FakeServer()
+        cache.source_ttls['vdab']['scraping_results'] = 0
+        for _ in range(2):
+            cache.fetch("https://example.com/jobs", None, server.send, source='vdab')
+        assert cache.stats.revalidations == 1
+
+    def test_concurrent_stats(self, cache):
+        """Les compteurs restent exacts avec des appels simultanés"""
+        server = FakeServer()
+        cache.fetch("https://example.com/jobs", None, server.send)
+
+        def hammer():
+            for _ in range(50):
+                cache.fetch("https://example.com/jobs", None, server.send)
+
+        threads = [threading.Thread(target=hammer) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert cache.stats.hits == 200
+        assert cache.stats.bytes_saved == 200 * len(server.body)
+
+
+class TestAsyncHTTPCache:
+    """Le cache sert aussi les récupérations asynchrones"""
+
+    @pytest.mark.asyncio
+    async def test_afetch_hit_and_revalidation(self, tmp_path):
+        cache = HTTPCache(tmp_path / "http.db", ttls={'scraping_results': 60})
+        server = FakeServer()
+
+        async def send(headers):
+            response = server.send(headers)
+            return httpx.Response(response.status_code, headers=dict(response.headers),
+                                  content=response.content)
+
+        first = await cache.afetch("https://example.com/jobs", None, send)
+        second = await cache.afetch("https://example.com/jobs", None, send)
+
+        assert len(server.requests) == 1
+        assert (first.from_cache, second.from_cache) == (False, True)
+        assert second.text == "<html>page</html>"
+
+        cache.ttls['scraping_results'] = 0
+        third = await cache.afetch("https://example.com/jobs", None, send)
+        assert server.requests[1] == {'If-None-Match': '"v1"'}
+        assert third.status_code == 200 and third.text == "<html>page</html>"
+        assert cache.stats.revalidations == 1
+
+    @pytest.mark.asyncio
+    async def test_afetch_page_uses_cache(self, tmp_path):
+        """_afetch_page envoie le GET conditionnel et accepte le 304"""
+        received = []
+
+        def handler(request):
+            received.append(request.headers.get('If-None-Match'))
+            if request.headers.get('If-None-Match') == '"v1"':
+                return httpx.Response(304, headers={'ETag': '"v1"'})
+            return httpx.Response(200, headers={'ETag': '"v1"'}, text="<html>page</html>")
+
+        scraper = IndeedScraper(
+            rate_limiter=RateLimiter(),
+            http_cache=HTTPCache(tmp_path / "http.db", ttls={'scraping_results': 0})
+        )
+        scraper._get_fetch_engine().transport = httpx.MockTransport(handler)
+
+        await scraper._afetch_page("https://fr.indeed.com/jobs", params={'q': 'python'})
+        response = await scraper._afetch_page("https://fr.indeed.com/jobs", params={'q': 'python'})
+        await scraper._get_fetch_engine().aclose()
+
+        assert received == [None, '"v1"']
+        assert response.from_cache is True
+        assert response.text == "<html>page</html>"
+
+
+class TestScraperIntegration:
+    """Le cache est branché sous _fetch_page"""
+
+    def test_fetch_page_uses_cache(self, tmp_path):
+        """Deux récupérations de la même page = une seule requête réseau"""
+        scraper = IndeedScraper(
+            rate_limiter=RateLimiter(),
+            http_cache=HTTPCache(tmp_path / "http.db")
+        )
+
+        with patch.object(scraper.session, 'get', return_value=make_response()) as mock_get:
+            scraper._fetch_page("https://fr.indeed.com/jobs", params={'q': 'python'})
+            response = scraper._fetch_page("https://fr.indeed.com/jobs", params={'q': 'python'})
+
+        assert mock_get.call_count == 1
+        assert response.from_cache is True
+
+
+class TestSharedCache:
+    """Le cache partagé du processus est branché par défaut"""
+
+    def test_enabled_from_config(self, tmp_path, monkeypatch):
+        config = {'http_cache': {'enabled': True, 'path': str(tmp_path / "http.db")}}
+        monkeypatch.setattr(http_cache, 'load_integrations_config', lambda: config)
+        http_cache.reset_http_cache()
+
+        shared = get_http_cache()
+
+        assert shared is not None and shared is get_http_cache()
+        assert IndeedScraper(rate_limiter=RateLimiter()).http_cache is shared
+        assert VDABScraper(client_id="abc", rate_limiter=RateLimiter()).http_cache is shared
+        shared.close()
+
+    def test_disabled_from_config(self, monkeypatch):
+        monkeypatch.setattr(http_cache, 'load_integrations_config', lambda: {'http_cache': {'enabled': False}})
+        http_cache.reset_http_cache()
+
+        assert get_http_cache() is None
+
+    def test_opt_out_and_fixtures(self, tmp_path):
+        set_http_cache(HTTPCache(tmp_path / "http.db"))
+
+        assert IndeedScraper(rate_limiter=RateLimiter(), http_cache=False).http_cache is None
+        assert IndeedScraper(fixtures=FixtureStore(tmp_path / "recorded")).http_cache is None
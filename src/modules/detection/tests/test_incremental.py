@@ -0,0 +1,135 @@
+"""
+Tests unitaires pour le scraping incrémental
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.modules.detection.incremental import IncrementalTracker, SeenOfferStore
+from src.modules.detection.jobboard_scraper import IndeedScraper, JobOffer
+from src.modules.detection.rate_limiter import RateLimiter
+
+
+def make_page(job_keys):
+    """Page de résultats Indeed avec une carte par clé"""
+    cards = "".join(f"""
+        <div class="job_seen_beacon">
+            <h2 class="jobTitle"><a href="/rc/clk?jk={jk}&from=serp">Job {jk}</a></h2>
+            <span class="companyName">Company</span>
+        </div>""" for jk in job_keys)
+    response = Mock()
+    response.text = f"<html><body>{cards}</body></html>"
+    return response
+
+
+def make_offer(jk):
+    return JobOffer(
+        title=f"Job {jk}", company="Company", location="Paris", description="",
+        url=f"https://fr.indeed.com/viewjob?jk={jk}", source="Indeed"
+    )
+
+
+class TestSeenOfferStore:
+    """Tests pour SeenOfferStore"""
+
+    def test_scope_is_normalized(self):
+        assert SeenOfferStore.scope("Indeed", " Python ", "PARIS") == "indeed|python|paris"
+
+    def test_mark_and_query(self, tmp_path):
+        """Les offres vues et le watermark sont persistés"""
+        store = SeenOfferStore(tmp_path / "seen.db")
+        store.mark_seen("scope", ["a", "b"])
+
+        reopened = SeenOfferStore(tmp_path / "seen.db")
+        assert reopened.seen_keys("scope", ["a", "c"]) == {"a"}
+        assert reopened.seen_keys("other", ["a"]) == set()
+        assert reopened.get_watermark("scope")['newest_offer_key'] == "a"
+
+
+class TestIncrementalTracker:
+    """Tests pour IncrementalTracker"""
+
+    def test_without_store_everything_passes(self):
+        tracker = IncrementalTracker(None, "Indeed", "q", "l", max_pages=5)
+
+        offers, stop = tracker.filter_page([make_offer(1), make_offer(2)])
+
+        assert len(offers) == 2
+        assert stop is False
+
+    def test_stop_when_mostly_seen(self):
+        store = SeenOfferStore(":memory:")
+        store.mark_seen(SeenOfferStore.scope("Indeed", "q", "l"), [
+            f"https://fr.indeed.com/viewjob?jk={i}" for i in (2, 3)
+        ])
+        tracker = IncrementalTracker(store, "Indeed", "q", "l", max_pages=5)
+
+        tracker.page_fetched()
+        offers, stop = tracker.filter_page([make_offer(1), make_offer(2), make_offer(3)])
+        stats = tracker.finish()
+
+        assert [o.title for o in offers] == ["Job 1"]
+        assert stop is True
+        assert stats.pages_skipped == 4
+        assert stats.requests_skipped == 4
+        assert stats.offers_seen == 2
+
+    def test_stop_at_watermark(self):
+        """L'offre la plus récente du run précédent arrête la pagination, même sous le ratio"""
+        store = SeenOfferStore(":memory:")
+        scope = SeenOfferStore.scope("Indeed", "q", "l")
+        store.mark_seen(scope, [f"https://fr.indeed.com/viewjob?jk={i}" for i in (4, 5)])
+        tracker = IncrementalTracker(store, "Indeed", "q", "l", max_pages=5, stop_ratio=0.9)
+
+        offers, stop = tracker.filter_page([make_offer(i) for i in (1, 2, 3, 4, 5)])
+        tracker.finish()
+
+        assert len(offers) == 3
+        assert stop is True
+        assert tracker.stats.reached_watermark is True
+        assert store.get_watermark(scope)['newest_offer_key'] == "https://fr.indeed.com/viewjob?jk=1"
+
+    def test_pinned_watermark_does_not_stop(self):
+        """Un watermark épinglé en tête, suivi d'offres nouvelles, n'arrête pas la pagination"""
+        store = SeenOfferStore(":memory:")
+        store.mark_seen(SeenOfferStore.scope("Indeed", "q", "l"), ["https://fr.indeed.com/viewjob?jk=9"])
+        tracker = IncrementalTracker(store, "Indeed", "q", "l", max_pages=5)
+
+        offers, stop = tracker.filter_page([make_offer(i) for i in (9, 1, 2, 3)])
+
+        assert len(offers) == 3
+        assert stop is False
+
+
+class TestIncrementalIndeedScrape:
+    """Le scrape Indeed s'arrête dès qu'il atteint des offres déjà vues"""
+
+    @pytest.fixture
+    def scraper(self):
+        return IndeedScraper(seen_store=SeenOfferStore(":memory:"), rate_limiter=RateLimiter())
+
+    def test_second_run_stops_after_first_page(self, scraper):
+        pages_run1 = [make_page(range(p * 10, p * 10 + 10)) for p in range(5)]
+        with patch.object(IndeedScraper, '_fetch_page', side_effect=pages_run1) as mock_fetch:
+            first = scraper.scrape("Python", "Paris", max_pages=5)
+        assert len(first) == 50
+        assert mock_fetch.call_count == 5
+
+        # Deux nouvelles offres publiées depuis, en tête (tri par date)
+        page_run2 = make_page(["new1", "new2"] + list(range(0, 8)))
+        with patch.object(IndeedScraper, '_fetch_page', return_value=page_run2) as mock_fetch:
+            second = scraper.scrape("Python", "Paris", max_pages=5)
+
+        assert [o.title for o in second] == ["Job new1", "Job new2"]
+        assert mock_fetch.call_count == 1
+        assert scraper.last_scrape_stats.pages_skipped == 4
+        assert scraper.last_scrape_stats.stopped_early is True
+
+    def test_scopes_are_independent(self, scraper):
+        """Une autre localisation n'est pas impactée par les offres vues"""
+        with patch.object(IndeedScraper, '_fetch_page', return_value=make_page(range(10))):
+            scraper.scrape("Python", "Paris", max_pages=1)
+            other = scraper.scrape("Python", "Lyon", max_pages=1)
+
+        assert len(other) == 10
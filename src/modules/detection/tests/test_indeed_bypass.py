@@ -0,0 +1,197 @@
+"""
+Tests unitaires pour IndeedBypassScraper (navigateur simulé, sans Chrome)
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from src.modules.detection.indeed_bypass import IndeedBypassScraper
+from src.modules.detection.rate_limiter import RateLimiter
+from src.modules.detection.readiness import ReadinessPolicy
+from src.modules.detection.session_store import SessionState, SessionStateStore
+
+FIXTURES = Path(__file__).parent / "fixtures"
+SEARCH_HTML = (FIXTURES / "indeed_search_be.html").read_text(encoding="utf-8")
+CHALLENGE_HTML = "<html><head><title>Just a moment...</title></head><body>cf-challenge</body></html>"
+
+
+class FakeDriver:
+    """Navigateur simulé: pages de résultats prêtes immédiatement"""
+
+    def __init__(self):
+        self.visited = []
+        self.page_source = SEARCH_HTML
+        self.cdp_commands = []
+        self.cookie_banner_checks = 0
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def execute_script(self, script, *args):
+        if 'querySelectorAll' in script:
+            return {'challenge': False, 'cards': 15, 'no_results': False}
+        if 'localStorage' in script:
+            return {
+                'origin': 'https://be.indeed.com',
+                'user_agent': "Mozilla/5.0 (X11; Linux x86_64) Chrome/120.0",
+                'languages': ["fr-BE", "fr"],
+                'local_storage': {}
+            }
+        if 'navigator.userAgent' in script:
+            return "Mozilla/5.0 (X11; Linux x86_64) Chrome/120.0"
+        if 'navigator.languages' in script:
+            return ["fr-BE", "fr"]
+        return None
+
+    def get_cookies(self):
+        return [{'name': 'cf_clearance', 'value': 'token', 'domain': '.indeed.com', 'path': '/'}]
+
+    def find_element(self, *args):
+        self.cookie_banner_checks += 1
+        raise Exception("pas de bannière")
+
+    def execute_cdp_cmd(self, command, params):
+        self.cdp_commands.append(command)
+
+    def quit(self):
+        pass
+
+
+def http_response(status, text):
+    response = requests.Response()
+    response.status_code = status
+    response._content = text.encode("utf-8")
+    response.encoding = "utf-8"
+    return response
+
+
+@pytest.fixture
+def scraper():
+    scraper = IndeedBypassScraper(
+        country='be',
+        rate_limiter=RateLimiter(),
+        readiness=ReadinessPolicy(stable_checks=1),
+        hybrid=True
+    )
+    scraper.driver = FakeDriver()
+    return scraper
+
+
+def test_apply_stealth_wrapper(scraper):
+    """`_apply_stealth` (utilisé par test_bypass_debug.py) délègue à driver_pool"""
+    scraper._apply_stealth()
+
+    assert scraper.driver.cdp_commands == ['Page.addScriptToEvaluateOnNewDocument']
+
+
+class TestHybridMode:
+    """Tests du passage de session navigateur -> HTTP"""
+
+    def test_follow_up_pages_use_http(self, scraper):
+        with patch.object(requests.Session, 'get', return_value=http_response(200, SEARCH_HTML)) as http_get:
+            offers = scraper.scrape("Python", "Bruxelles", max_pages=3)
+
+        assert len(scraper.driver.visited) == 1
+        assert http_get.call_count == 2
+        assert scraper.handoff_stats.http_pages == 2
+        assert scraper.handoff_stats.browser_pages == 1
+        assert len(offers) == 3 * len(scraper._parse_page(SEARCH_HTML))
+
+    def test_browser_cookies_are_handed_off(self, scraper):
+        with patch.object(requests.Session, 'get', return_value=http_response(200, SEARCH_HTML)):
+            scraper.scrape("Python", "Bruxelles", max_pages=2)
+
+        session = scraper._http.session
+        assert session.cookies.get('cf_clearance') == 'token'
+        assert session.headers['User-Agent'] == "Mozilla/5.0 (X11; Linux x86_64) Chrome/120.0"
+        assert session.headers['Accept-Language'] == "fr-BE,fr"
+
+    def test_challenge_falls_back_to_browser(self, scraper):
+        responses = [http_response(200, SEARCH_HTML), http_response(403, CHALLENGE_HTML)]
+        with patch.object(requests.Session, 'get', side_effect=responses):
+            offers = scraper.scrape("Python", "Bruxelles", max_pages=3)
+
+        # Page 1: navigateur, page 2: HTTP, page 3: challenge HTTP -> navigateur
+        assert len(scraper.driver.visited) == 2
+        assert scraper.handoff_stats.challenges == 1
+        assert scraper.handoff_stats.handoffs == 2
+        assert len(offers) == 3 * len(scraper._parse_page(SEARCH_HTML))
+
+    def test_without_hybrid_every_page_uses_browser(self, scraper):
+        scraper.hybrid = False
+
+        with patch.object(requests.Session, 'get') as http_get:
+            scraper.scrape("Python", "Bruxelles", max_pages=2)
+
+        assert len(scraper.driver.visited) == 2
+        assert not http_get.called
+
+    def test_job_details_over_http(self, scraper):
+        detail = '<html><div id="jobDescriptionText"><p>Python, Django</p></div></html>'
+        with patch.object(requests.Session, 'get', side_effect=[
+            http_response(200, SEARCH_HTML), http_response(200, detail)
+        ]):
+            scraper.scrape("Python", "Bruxelles", max_pages=2)
+            details = scraper.get_job_details("https://be.indeed.com/viewjob?jk=abc")
+
+        assert details['full_description'] == "Python, Django"
+        assert len(scraper.driver.visited) == 1
+
+
+class TestSessionStore:
+    """Tests de la reprise de session persistée"""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        store = SessionStateStore(':memory:', profiles_dir=tmp_path)
+        store.save(SessionState(
+            country='be',
+            cookies=[{'name': 'cf_clearance', 'value': 'stored', 'domain': '.indeed.com', 'path': '/'}],
+            user_agent="Stored UA"
+        ))
+        return store
+
+    def test_hybrid_first_page_uses_stored_session(self, scraper, store):
+        scraper.session_store = store
+
+        with patch.object(requests.Session, 'get', return_value=http_response(200, SEARCH_HTML)):
+            scraper.scrape("Python", "Bruxelles", max_pages=2)
+
+        assert scraper.driver.visited == []
+        assert scraper.handoff_stats.http_pages == 2
+        assert scraper._http.session.cookies.get('cf_clearance') == 'stored'
+
+    def test_stored_session_restored_into_browser(self, scraper, store):
+        scraper.hybrid = False
+        scraper.session_store = store
+        scraper.driver = None
+        driver = FakeDriver()
+        scraper._init_driver = lambda: setattr(scraper, 'driver', driver)
+
+        scraper.scrape("Python", "Bruxelles", max_pages=1)
+
+        assert 'Network.setCookies' in driver.cdp_commands
+        assert driver.cookie_banner_checks == 0  # Bannière déjà acceptée dans la session
+
+    def test_session_captured_once_per_browser(self, scraper, store):
+        scraper.hybrid = False
+        scraper.session_store = store
+
+        with patch.object(store, 'capture', wraps=store.capture) as capture:
+            scraper.scrape("Python", "Bruxelles", max_pages=3)
+
+        assert len(scraper.driver.visited) == 3
+        assert capture.call_count == 1
+
+    def test_challenge_invalidates_stored_session(self, scraper, store):
+        scraper.session_store = store
+
+        with patch.object(requests.Session, 'get', return_value=http_response(403, CHALLENGE_HTML)):
+            scraper.scrape("Python", "Bruxelles", max_pages=1)
+
+        # Challenge en HTTP -> navigateur, dont la session remplace l'ancienne
+        assert len(scraper.driver.visited) == 1
+        assert store.load('be').user_agent != "Stored UA"
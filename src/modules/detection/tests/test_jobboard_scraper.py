@@ -277,6 +277,192 @@ class TestIndeedScraper:
         # Should return empty list without crashing
         assert offers == []
 
+    @patch('src.modules.detection.jobboard_scraper.IndeedScraper._fetch_page')
+    def test_scrape_iter_is_lazy(self, mock_fetch, scraper, mock_html):
+        """Les offres arrivent page par page, sans récupérer les pages suivantes"""
+        mock_response = Mock()
+        mock_response.text = mock_html
+        mock_fetch.return_value = mock_response
+
+        stream = scraper.scrape_iter(query="Python", location="Paris", max_pages=3)
+        first = next(stream)
+
+        assert first.title == "Python Developer"
+        assert mock_fetch.call_count == 1
+
+        stream.close()
+        assert mock_fetch.call_count == 1
+
+
+class TestIndeedScraperConcurrent:
+    """Tests du mode concurrent (moteur async)"""
+
+    @pytest.fixture
+    def scraper(self):
+        """Scraper Indeed branché sur un transport httpx simulé"""
+        import httpx
+        from src.modules.detection.async_fetcher import AsyncFetchEngine
+
+        def handler(request):
+            start = int(request.url.params['start'])
+            query = request.url.params['q']
+            if start >= 20:
+                return httpx.Response(200, text="<html><body></body></html>")
+            return httpx.Response(200, text=f"""
+                <div class="job_seen_beacon">
+                    <h2 class="jobTitle"><a href="/rc/clk?jk={query}{start}">{query} {start}</a></h2>
+                    <span class="companyName">TechCorp</span>
+                </div>
+            """)
+
+        scraper = IndeedScraper()
+        scraper._fetch_engine = AsyncFetchEngine(transport=httpx.MockTransport(handler))
+        return scraper
+
+    def test_scrape_concurrent(self, scraper):
+        """Les pages sont récupérées en parallèle et l'ordre est conservé"""
+        offers = scraper.scrape(query="Python", location="Paris", max_pages=5, concurrent=True)
+
+        # Arrêt à la première page vide (start=20)
+        assert [o.title for o in offers] == ["Python 0", "Python 10"]
+
+    def test_scrape_many(self, scraper):
+        """Plusieurs recherches en parallèle, résultats dans l'ordre"""
+        results = scraper.scrape_many([
+            {'query': 'Python', 'location': 'Paris', 'max_pages': 1},
+            {'query': 'Java', 'location': 'Lyon', 'max_pages': 2},
+        ])
+
+        assert [o.title for o in results[0]] == ["Python 0"]
+        assert [o.title for o in results[1]] == ["Java 0", "Java 10"]
+
+    def test_scrape_iter_concurrent(self, scraper):
+        """Flux synchrone alimenté par le moteur async, dans l'ordre des pages"""
+        stream = scraper.scrape_iter(query="Python", location="Paris", max_pages=5, concurrent=True)
+
+        assert [o.title for o in stream] == ["Python 0", "Python 10"]
+
+    @pytest.mark.asyncio
+    async def test_ascrape_iter_stops_early(self, scraper):
+        """Arrêter le flux async annule les requêtes restantes"""
+        titles = []
+        async for offer in scraper.ascrape_iter(query="Python", location="Paris", max_pages=5):
+            titles.append(offer.title)
+            break
+
+        assert titles == ["Python 0"]
+        await scraper._get_fetch_engine().aclose()
+
+
+class TestJobDetailsMany:
+    """Tests de la récupération groupée des détails d'offres"""
+
+    @pytest.fixture
+    def requested(self):
+        return []
+
+    @pytest.fixture
+    def scraper(self, tmp_path, requested):
+        """Scraper avec cache de détails et transport httpx simulé"""
+        import httpx
+        from src.modules.detection.async_fetcher import AsyncFetchEngine
+        from src.modules.detection.cache import JobDetailCache
+
+        def handler(request):
+            requested.append(str(request.url))
+            job_key = request.url.params['jk']
+            return httpx.Response(
+                200, text=f'<div id="jobDescriptionText">Description {job_key}</div>'
+            )
+
+        scraper = IndeedScraper(detail_cache=JobDetailCache(tmp_path / "details.db"))
+        scraper._fetch_engine = AsyncFetchEngine(transport=httpx.MockTransport(handler))
+        return scraper
+
+    def test_get_job_details_many(self, scraper, requested):
+        """Chaque offre est récupérée une fois (dédupliquée par URL canonique)"""
+        urls = [
+            "https://fr.indeed.com/viewjob?jk=a",
+            "https://fr.indeed.com/rc/clk?jk=a&from=serp",
+            "https://fr.indeed.com/viewjob?jk=b",
+        ]
+
+        results = dict(scraper.get_job_details_many(urls))
+
+        assert set(results) == {urls[0], urls[2]}
+        assert results[urls[0]]['full_description'] == "Description a"
+        assert results[urls[2]]['full_description'] == "Description b"
+        assert len(requested) == 2
+
+    def test_cached_details_skip_network(self, scraper, requested):
+        """Une deuxième passe est servie entièrement par le cache"""
+        urls = ["https://fr.indeed.com/viewjob?jk=a", "https://fr.indeed.com/viewjob?jk=b"]
+
+        list(scraper.get_job_details_many(urls))
+        second = dict(scraper.get_job_details_many(urls))
+
+        assert len(requested) == 2
+        assert second[urls[1]]['full_description'] == "Description b"
+
+    def test_cache_calls_off_event_loop(self, scraper):
+        """Les accès SQLite du cache ne bloquent pas la boucle d'événements"""
+        import threading
+
+        threads = set()
+        cache = scraper.detail_cache
+        for name in ('get_details', 'set_details'):
+            method = getattr(cache, name)
+
+            def recording(*args, _method=method):
+                threads.add(threading.current_thread().name)
+                return _method(*args)
+            setattr(cache, name, recording)
+
+        list(scraper.get_job_details_many(["https://fr.indeed.com/viewjob?jk=a"]))
+
+        assert threads and "run-sync" not in threads and threading.main_thread().name not in threads
+
+    @pytest.mark.asyncio
+    async def test_fetch_runs_while_cached_consumed(self, tmp_path):
+        """Les récupérations réseau démarrent sans attendre que les offres en cache soient consommées"""
+        import asyncio
+
+        import httpx
+        from src.modules.detection.async_fetcher import AsyncFetchEngine
+        from src.modules.detection.cache import JobDetailCache
+
+        fetching = asyncio.Event()
+
+        async def handler(request):
+            fetching.set()
+            return httpx.Response(200, text='<div id="jobDescriptionText">Description b</div>')
+
+        scraper = IndeedScraper(detail_cache=JobDetailCache(tmp_path / "details.db"))
+        scraper._fetch_engine = AsyncFetchEngine(transport=httpx.MockTransport(handler))
+        cached_url = "https://fr.indeed.com/viewjob?jk=a"
+        scraper.detail_cache.set_details(cached_url, {'full_description': "Description a"})
+
+        results = {}
+        async for url, details in scraper.aget_job_details_many([cached_url, "https://fr.indeed.com/viewjob?jk=b"]):
+            if url == cached_url:
+                # L'appelant traite l'offre en cache: le réseau travaille déjà
+                await asyncio.wait_for(fetching.wait(), 5)
+            results[url] = details
+
+        assert results[cached_url]['full_description'] == "Description a"
+        assert results["https://fr.indeed.com/viewjob?jk=b"]['full_description'] == "Description b"
+        await scraper._get_fetch_engine().aclose()
+
+    def test_get_job_details_uses_cache(self, scraper, requested):
+        """get_job_details lit le cache alimenté par le mode groupé"""
+        list(scraper.get_job_details_many(["https://fr.indeed.com/viewjob?jk=a"]))
+
+        with patch.object(IndeedScraper, '_fetch_page') as mock_fetch:
+            details = scraper.get_job_details("https://fr.indeed.com/rc/clk?jk=a")
+
+        assert not mock_fetch.called
+        assert details['full_description'] == "Description a"
+
 
 class TestIntegration:
     """Tests d'intégration (nécessitent une connexion réseau)"""
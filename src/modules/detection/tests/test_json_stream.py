@@ -0,0 +1,129 @@
+"""
+Tests du décodage JSON en flux
+"""
+
+import json
+import tracemalloc
+
+import pytest
+
+from src.modules.detection.json_stream import iter_json_array
+from src.modules.detection.rate_limiter import RateLimiter
+from src.modules.detection.vdab_api import PageStream, VDABScraper
+
+DOCUMENT = {
+    'totaal': 1234567,
+    'meta': {'pagina': [1, 2, {'x': "]}"}]},
+    'vacatures': [
+        {'id': "1", 'titel': "Ontwikkelaar \"C++\" [senior]", 'score': 12.75e-3},
+        {'id': "2", 'titel': "Développeur — télétravail ✓", 'tags': [], 'leeg': {}},
+        {'id': "3", 'titel': "Data engineer", 'actief': True, 'loon': None, 'n': -42},
+    ],
+    'volgende': None,
+}
+
+
+def chunked(data: bytes, size: int):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestIterJsonArray:
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 100000])
+    def test_matches_json_loads(self, size):
+        """Même résultat que json.loads, quelle que soit la découpe (UTF-8 multi-octets compris)"""
+        body = json.dumps(DOCUMENT, ensure_ascii=False).encode('utf-8')
+        fields = {}
+
+        items = list(iter_json_array(chunked(body, size), ('vacatures',), fields))
+
+        assert items == DOCUMENT['vacatures']
+        assert fields == {k: v for k, v in DOCUMENT.items() if k != 'vacatures'}
+
+    def test_number_split_across_chunks(self):
+        """Un nombre coupé en fin de morceau n'est pas tronqué"""
+        items = list(iter_json_array(['{"totaal": 12', '34, "items": [5', '67]}'], ('items',)))
+        assert items == [567]
+
+    def test_str_chunks_and_pretty_printed(self):
+        text = json.dumps(DOCUMENT, indent=4)
+        assert list(iter_json_array([text], ('vacatures',))) == DOCUMENT['vacatures']
+
+    def test_alternative_key(self):
+        assert list(iter_json_array([b'{"items": [{"id": 1}]}'], ('vacatures', 'items'))) == [{'id': 1}]
+
+    def test_empty_array_and_object(self):
+        fields = {}
+        assert list(iter_json_array([b'{"vacatures": [], "totaal": 0}'], ('vacatures',), fields)) == []
+        assert fields == {'vacatures': [], 'totaal': 0}
+        assert list(iter_json_array([b' { } '], ('vacatures',))) == []
+
+    def test_missing_array(self):
+        fields = {}
+        assert list(iter_json_array([b'{"message": "geen resultaten"}'], ('vacatures',), fields)) == []
+        assert fields == {'message': "geen resultaten"}
+
+    def test_stream_read_to_the_end(self):
+        """Les morceaux sont consommés jusqu'au dernier (blancs finaux compris)"""
+        chunks = iter([b'{"vacatures": [1], ', b'"totaal": 1}', b'\n', b'  '])
+        assert list(iter_json_array(chunks, ('vacatures',))) == [1]
+        assert next(chunks, None) is None
+
+    @pytest.mark.parametrize("body", [
+        b'[1, 2]',
+        b'{"vacatures": [{"id": 1}',
+        b'{"vacatures": [{"id": 1} {"id": 2}]}',
+        b'{"vacatures": [1], "totaal": }',
+        b'{"vacatures": [1]} []',
+        b'',
+    ])
+    def test_invalid_json(self, body):
+        with pytest.raises(ValueError):
+            list(iter_json_array(chunked(body, 4), ('vacatures',)))
+
+
+class TestVDABStreaming:
+
+    def vacancies(self, count):
+        description = "Je werkt met Python, SQL en cloud. " * 100
+        return {
+            'vacatures': [
+                {'id': str(i), 'titel': f"Developer {i}", 'werkgever': {'naam': "Acme"},
+                 'omschrijving': description, 'competenties': [{'code': c} for c in range(30)]}
+                for i in range(count)
+            ],
+            'totaal': count,
+        }
+
+    def test_same_offers_as_materialized_path(self):
+        scraper = VDABScraper(client_id='test', rate_limiter=RateLimiter())
+        data = self.vacancies(20)
+        body = json.dumps(data).encode('utf-8')
+        page = PageStream()
+
+        streamed = list(scraper._iter_stream(chunked(body, 1000), page))
+        materialized = scraper._parse_response(data)
+
+        assert [o.to_dict() | {'scraped_at': None} for o in streamed] == \
+            [o.to_dict() | {'scraped_at': None} for o in materialized]
+        assert page.vacancies == 20
+        assert page.fields == {'totaal': 20}
+
+    def test_lower_peak_memory(self):
+        """Pic mémoire bien inférieur à json.loads + parsing (corps exclu des deux côtés)"""
+        scraper = VDABScraper(client_id='test', rate_limiter=RateLimiter())
+        body = json.dumps(self.vacancies(200)).encode('utf-8')
+        chunks = chunked(body, 64 * 1024)
+
+        def peak(decode):
+            tracemalloc.start()
+            try:
+                decode()
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        materialized = peak(lambda: sum(1 for _ in scraper._iter_response(json.loads(body))))
+        streamed = peak(lambda: sum(1 for _ in scraper._iter_stream(iter(chunks))))
+
+        assert streamed * 4 < materialized
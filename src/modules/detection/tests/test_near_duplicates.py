@@ -0,0 +1,205 @@
+"""
+Tests de la détection des quasi-doublons (MinHash + LSH)
+"""
+
+import pytest
+
+from src.modules.detection.belgian_job_aggregator import AggregatedJobOffer, StreamingDeduplicator
+from src.modules.detection.near_duplicates import (
+    MinHasher, MinHashSettings, NearDuplicateIndex, normalize_words, offer_features
+)
+
+DESCRIPTION = ("Voor ons data team in Gent zoeken we een ervaren Python ontwikkelaar "
+               "met kennis van SQL, Docker en cloud platformen.")
+
+
+@pytest.fixture
+def index():
+    near = NearDuplicateIndex(':memory:', settings=MinHashSettings())
+    yield near
+    near.close()
+
+
+def make_offer(offer_id, title, company, description=DESCRIPTION, source="VDAB"):
+    return AggregatedJobOffer(
+        id=offer_id, title=title, company=company, location="Gent",
+        description=description, url=f"https://example.com/{offer_id}", source=source
+    )
+
+
+class TestFeatures:
+
+    def test_normalize_words(self):
+        assert normalize_words("Développeur Python (H/F) - Télétravail") == \
+            ["developpeur", "python", "teletravail"]
+        assert normalize_words("Python Developer m/v/x") == ["python", "developer"]
+        assert normalize_words("Acme NV", drop=frozenset({'nv'})) == ["acme"]
+
+    def test_variants_have_same_features(self):
+        assert offer_features("Python Developer (m/v/x)", "Acme NV", DESCRIPTION) == \
+            offer_features("Python developer", "ACME", DESCRIPTION)
+
+    def test_description_window(self):
+        settings = MinHashSettings(description_chars=0)
+        assert offer_features("Dev", "Acme", DESCRIPTION, settings) == offer_features("Dev", "Acme")
+
+
+class TestMinHasher:
+
+    def test_similarity_estimate(self):
+        hasher = MinHasher(MinHashSettings(num_perm=256, bands=64))
+        first = {f"f{i}" for i in range(100)}
+        second = {f"f{i}" for i in range(50, 150)}  # Jaccard = 50 / 150
+
+        estimate = hasher.similarity(hasher.signature(first), hasher.signature(second))
+
+        assert abs(estimate - 1 / 3) < 0.1
+        assert hasher.signature(set()) is None
+
+    def test_deterministic_and_dense(self):
+        """Mêmes valeurs d'un processus à l'autre (graine), aucune case vide"""
+        features = offer_features("Python Developer", "Acme", DESCRIPTION)
+        signature = MinHasher().signature(features)
+
+        assert signature == MinHasher().signature(features)
+        assert signature != MinHasher(MinHashSettings(seed=2)).signature(features)
+        assert len(signature) == 64 and all(0 <= value < 2 ** 32 for value in signature)
+        # Une seule caractéristique: toutes les cases densifiées
+        assert MinHasher().signature({"t:python"}) == [MinHasher().signature({"t:python"})[0]] * 64
+
+    def test_settings(self):
+        with pytest.raises(ValueError):
+            MinHashSettings(num_perm=64, bands=10)
+
+        settings = MinHashSettings.from_config({'aggregator': {'near_duplicates': {'threshold': 0.8}}})
+        assert settings.threshold == 0.8
+        assert settings.rows == 4
+
+
+class TestNearDuplicateIndex:
+
+    def test_cross_source_variant(self, index):
+        assert index.find_or_add("vdab-1", "Python Developer (m/v/x)", "Acme NV", DESCRIPTION) is None
+
+        # Description réécrite (ou absente) par l'autre source: titre et entreprise suffisent
+        match = index.find_or_add("indeed-1", "Python developer", "ACME", "Solliciteer nu bij Acme!")
+
+        assert match == ("vdab-1", 1.0)
+
+    def test_same_description_different_title(self, index):
+        """Un texte commun (agence d'intérim) ne fait pas un doublon"""
+        index.add("vdab-1", "Python Developer", "Randstad", DESCRIPTION)
+
+        assert index.query("Java Developer", "Randstad", DESCRIPTION) == []
+        assert index.query("Python Developer", "Proximus", DESCRIPTION) == []
+
+    def test_title_only_negative(self, index):
+        index.add("vdab-1", "Senior Python Developer", "Acme")
+
+        assert index.query("Python Developer", "Acme") == []
+
+    def test_description_breaks_ties(self, index):
+        index.add("vdab-1", "Python Developer", "Acme", "Boekhouding en fiscaliteit voor KMO's in Leuven")
+        index.add("vdab-2", "Python Developer (m/v/x)", "Acme NV", DESCRIPTION)
+
+        assert [match[0] for match in index.query("Python developer", "ACME", DESCRIPTION)] == \
+            ["vdab-2", "vdab-1"]
+
+    def test_different_offers(self, index):
+        index.add("vdab-1", "Python Developer", "Acme", DESCRIPTION)
+
+        assert index.query("Boekhouder", "Fiduciaire Janssens", "Boekhouding en fiscaliteit voor KMO's") == []
+        assert len(index) == 1
+
+    def test_same_verdict_on_every_run(self, index):
+        """Une offre revue n'est pas son propre doublon; la première d'un groupe reste unique"""
+        index.find_or_add("vdab-1", "Python Developer", "Acme NV", DESCRIPTION)
+        index.find_or_add("indeed-1", "Python developer", "ACME", DESCRIPTION)
+
+        assert index.find_or_add("vdab-1", "Python Developer", "Acme NV", DESCRIPTION) is None
+        assert index.find_or_add("indeed-1", "Python developer", "ACME", DESCRIPTION)[0] == "vdab-1"
+        assert len(index) == 2
+
+    def test_persisted(self, tmp_path):
+        path = tmp_path / "near.db"
+        first = NearDuplicateIndex(path, settings=MinHashSettings())
+        first.add("vdab-1", "Python Developer", "Acme NV", DESCRIPTION)
+        first.close()
+
+        reopened = NearDuplicateIndex(path, settings=MinHashSettings())
+        assert reopened.query("Python developer (m/v/x)", "ACME", DESCRIPTION)[0][0] == "vdab-1"
+
+    def test_settings_mismatch(self, tmp_path):
+        path = tmp_path / "near.db"
+        NearDuplicateIndex(path, settings=MinHashSettings()).close()
+
+        with pytest.raises(ValueError):
+            NearDuplicateIndex(path, settings=MinHashSettings(num_perm=128))
+        # Le seuil ne change pas les signatures: modifiable sur un index existant
+        NearDuplicateIndex(path, settings=MinHashSettings(threshold=0.9)).close()
+
+    def test_scales_sublinearly(self, index):
+        """Une requête ne compare que les candidats LSH, pas tout l'index"""
+        for i in range(500):
+            index.add(f"offer-{i}", f"Functie {i}", f"Bedrijf {i}", f"Unieke omschrijving nummer {i} " * 3)
+
+        candidates = index._conn.execute(
+            f"SELECT COUNT(DISTINCT entry) FROM buckets WHERE key IN ({','.join('?' * 16)})",
+            index.band_keys("Functie 7", "Bedrijf 7")
+        ).fetchone()[0]
+
+        assert candidates < 25
+
+
+    def test_duplicates_stay_out_of_buckets(self, index):
+        """Un groupe de doublons ne pèse qu'une offre par bande: coût constant par copie"""
+        index.find_or_add("vdab-1", "Python Developer", "Acme NV", DESCRIPTION)
+        for i in range(200):
+            assert index.find_or_add(f"copy-{i}", "Python developer (m/v/x)", "ACME", DESCRIPTION) == ("vdab-1", 1.0)
+
+        assert len(index) == 201
+        assert index._conn.execute("SELECT COUNT(DISTINCT entry) FROM buckets").fetchone()[0] == 1
+        # Revu à un autre run: même représentant, sans recherche
+        assert index.find_or_add("copy-7", "Python developer (m/v/x)", "ACME", DESCRIPTION) == ("vdab-1", 1.0)
+
+    def test_bucket_limit(self):
+        index = NearDuplicateIndex(':memory:', settings=MinHashSettings(bucket_limit=3))
+        for i in range(10):
+            index.add(f"offer-{i}", "Python Developer", "Acme")
+
+        # Les 3 plus récents; pour une offre revue, les 3 plus récents avant elle
+        assert sorted(m[0] for m in index.query("Python Developer", "Acme")) == ["offer-7", "offer-8", "offer-9"]
+        assert index.find_or_add("offer-5", "Python Developer", "Acme") == ("offer-2", 1.0)
+
+    def test_purge(self, index):
+        index.add("vdab-1", "Python Developer", "Acme")
+        index._conn.execute("UPDATE signatures SET added_at = added_at - 200 * 86400")
+        index.add("vdab-2", "Data Engineer", "Acme")
+
+        assert index.purge() == 1
+        assert len(index) == 1
+        assert index.query("Python Developer", "Acme") == []
+        assert index._conn.execute("SELECT COUNT(DISTINCT entry) FROM buckets").fetchone()[0] == 1
+
+
+class TestStreamingDeduplicator:
+
+    def test_near_duplicates_removed(self, index):
+        dedup = StreamingDeduplicator(index)
+        offers = [
+            make_offer("vdab-1", "Python Developer (m/v/x)", "Acme NV"),
+            make_offer("indeed-1", "Python developer", "ACME", source="Indeed"),
+            make_offer("indeed-2", "Data Engineer", "Beta", "Spark en Kafka pipelines", source="Indeed"),
+        ]
+
+        unique = list(dedup.filter(offers))
+
+        assert [o.id for o in unique] == ["vdab-1", "indeed-2"]
+        assert dedup.near_duplicate_count == 1
+        assert dedup.unique_count == 2
+
+    def test_exact_only_without_index(self):
+        offers = [make_offer("vdab-1", "Python Developer (m/v/x)", "Acme NV"),
+                  make_offer("indeed-1", "Python developer", "ACME")]
+
+        assert len(list(StreamingDeduplicator().filter(offers))) == 2
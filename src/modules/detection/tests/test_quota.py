@@ -0,0 +1,307 @@
+"""
+Tests du quota journalier et du regroupement des requêtes
+"""
+
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from src.modules.detection import quota
+from src.modules.detection.quota import QuotaExceeded, QuotaLedger, RequestCoalescer, get_quota_ledger
+from src.modules.detection.recording import FixtureStore
+from src.modules.detection.rate_limiter import RateLimiter
+from src.modules.detection.tests.test_vdab_api import FakeAPI
+from src.modules.detection.vdab_api import VDABPagination, VDABScraper
+
+
+class Clock:
+    """Heure locale réglable"""
+
+    def __init__(self, now: datetime):
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def make_ledger(daily_limit=10, **kwargs) -> QuotaLedger:
+    kwargs.setdefault('path', ':memory:')
+    kwargs.setdefault('clock', Clock(datetime(2026, 3, 2, 9, 0)))
+    return QuotaLedger(daily_limit=daily_limit, **kwargs)
+
+
+def make_scraper(api: FakeAPI, **kwargs) -> VDABScraper:
+    scraper = VDABScraper(
+        client_id='test',
+        rate_limiter=RateLimiter(),
+        pagination=VDABPagination(),
+        **kwargs
+    )
+    scraper.session.mount('https://', api)
+    return scraper
+
+
+class TestQuotaLedger:
+
+    def test_priorities(self):
+        """low jusqu'à 80 %, normal jusqu'à 95 %, high jusqu'à 100 %"""
+        ledger = make_ledger(daily_limit=20)
+
+        for _ in range(16):
+            ledger.acquire('low')
+        with pytest.raises(QuotaExceeded) as exc:
+            ledger.acquire('low')
+        assert exc.value.dropped
+
+        for _ in range(3):
+            ledger.acquire('normal')
+        with pytest.raises(QuotaExceeded) as exc:
+            ledger.acquire('normal')
+        assert not exc.value.dropped
+        assert exc.value.retry_at == datetime(2026, 3, 3)
+
+        ledger.acquire('high')
+        with pytest.raises(QuotaExceeded):
+            ledger.acquire('high')
+        assert ledger.used() == 20
+        assert ledger.remaining() == 0
+
+    def test_new_day_resets(self):
+        clock = Clock(datetime(2026, 3, 2, 23, 59))
+        ledger = make_ledger(daily_limit=2, clock=clock)
+        ledger.acquire('high')
+        ledger.acquire('high')
+
+        clock.now = datetime(2026, 3, 3, 0, 1)
+        assert ledger.acquire('high') == 1
+        assert ledger.history() == {'2026-03-02': 2, '2026-03-03': 1}
+
+    def test_persisted(self, tmp_path):
+        path = tmp_path / 'quota.db'
+        make_ledger(path=path).acquire()
+        make_ledger(path=path).acquire()
+        assert make_ledger(path=path).used() == 2
+
+    def test_scopes_are_independent(self, tmp_path):
+        path = tmp_path / 'quota.db'
+        make_ledger(path=path, scope='vdab').acquire()
+        assert make_ledger(path=path, scope='forem').used() == 0
+
+    def test_concurrent_acquire_never_exceeds_limit(self):
+        ledger = make_ledger(daily_limit=50)
+        granted = []
+
+        def worker():
+            for _ in range(20):
+                try:
+                    granted.append(ledger.acquire('high'))
+                except QuotaExceeded:
+                    pass
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(granted) == 50
+        assert ledger.used() == 50
+
+    def test_unknown_priority(self):
+        with pytest.raises(ValueError):
+            make_ledger().acquire('urgent')
+
+    def test_from_config(self):
+        config = {'job_boards': {'vdab': {'quota': {'daily_limit': 200, 'thresholds': {'low': 0.5}}}}}
+        ledger = QuotaLedger.from_config(config, path=':memory:')
+        assert ledger.limit_for('low') == 100
+        assert ledger.limit_for('normal') == 190
+
+
+class TestRequestCoalescer:
+
+    def test_concurrent_calls_share_one_execution(self):
+        coalescer = RequestCoalescer(ttl=0)
+        calls = []
+        release = threading.Event()
+
+        def fetch():
+            calls.append(1)
+            release.wait(1)
+            return "réponse"
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(coalescer.run('k', fetch)))
+                   for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert results == ["réponse"] * 5
+        assert len(calls) == 1
+        assert coalescer.stats.to_dict() == {'upstream': 1, 'joined': 4, 'reused': 0, 'saved': 4}
+
+    def test_recent_result_reused(self):
+        coalescer = RequestCoalescer(ttl=60)
+        assert coalescer.run('k', lambda: 1) == 1
+        assert coalescer.run('k', lambda: 2) == 1
+        assert coalescer.run('other', lambda: 3) == 3
+        assert coalescer.stats.reused == 1
+
+    def test_expired_result(self):
+        coalescer = RequestCoalescer(ttl=0.01)
+        coalescer.run('k', lambda: 1)
+        time.sleep(0.02)
+        assert coalescer.run('k', lambda: 2) == 2
+
+    def test_errors_are_shared_but_not_remembered(self):
+        coalescer = RequestCoalescer(ttl=60)
+
+        def failing():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            coalescer.run('k', failing)
+        assert coalescer.run('k', lambda: "ok") == "ok"
+
+    def test_bounded(self):
+        coalescer = RequestCoalescer(ttl=60, max_entries=2)
+        for key in 'abc':
+            coalescer.run(key, lambda: key)
+        assert coalescer.run('a', lambda: "nouveau") == "nouveau"
+
+
+class GatedLedger(QuotaLedger):
+    """Décompte dont les appels 'low' attendent un signal avant d'être évalués"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.low_waiting = threading.Event()
+        self.gate = threading.Event()
+
+    def acquire(self, priority='normal'):
+        if priority == 'low':
+            self.low_waiting.set()
+            self.gate.wait(5)
+        return super().acquire(priority)
+
+
+class TestSharedLedger:
+
+    def test_wired_from_config(self, tmp_path, monkeypatch):
+        config = {'job_boards': {'vdab': {'quota': {'daily_limit': 200, 'path': str(tmp_path / "quota.db")}}}}
+        monkeypatch.setattr(quota, 'load_integrations_config', lambda: config)
+        quota.reset_quota_ledgers()
+
+        scraper = make_scraper(FakeAPI(available=30))
+
+        assert scraper.quota is get_quota_ledger() and scraper.quota.daily_limit == 200
+        assert make_scraper(FakeAPI(available=30), quota=False).quota is None
+
+    def test_disabled_in_config(self, monkeypatch):
+        config = {'job_boards': {'vdab': {'quota': {'enabled': False}}}}
+        monkeypatch.setattr(quota, 'load_integrations_config', lambda: config)
+        quota.reset_quota_ledgers()
+
+        assert get_quota_ledger() is None
+
+    def test_no_quota_when_replaying(self, tmp_path):
+        quota.set_quota_ledger(make_ledger())
+
+        assert make_scraper(FakeAPI(available=0), fixtures=FixtureStore(tmp_path)).quota is None
+
+
+class TestVDABQuota:
+
+    def test_duplicate_searches_use_one_request(self):
+        api = FakeAPI(available=30)
+        ledger = make_ledger()
+        scraper = make_scraper(api, quota=ledger)
+
+        first = scraper.search("Python", "Brussel")
+        second = scraper.search("Python", "Brussel")
+
+        assert [o.id for o in first] == [o.id for o in second]
+        assert len(api.calls) == 1
+        assert ledger.used() == 1
+
+    def test_concurrent_duplicates_coalesced(self):
+        api = FakeAPI(available=30, delay=0.05)
+        scraper = make_scraper(api, quota=make_ledger(), coalescer=RequestCoalescer(ttl=0))
+
+        threads = [threading.Thread(target=scraper.search, args=("Python",)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(api.calls) == 1
+        assert scraper.coalescer.stats.joined == 3
+
+    def test_low_priority_dropped(self):
+        api = FakeAPI(available=30)
+        ledger = make_ledger(daily_limit=10)
+        for _ in range(8):
+            ledger.acquire()
+        scraper = make_scraper(api, quota=ledger)
+
+        assert scraper.search("Python", priority='low') == []
+        assert scraper.get_vacancy_by_id("123", priority='low') is None
+        assert api.calls == []
+
+    def test_low_priority_partial_results(self):
+        """Quota atteint en cours de pagination: offres déjà lues conservées"""
+        api = FakeAPI(available=500)
+        ledger = make_ledger(daily_limit=4)
+        ledger.acquire()
+        scraper = make_scraper(api, quota=ledger, coalescer=RequestCoalescer(ttl=0))
+        scraper.pagination.max_concurrency = 1
+
+        offers = scraper.search("Python", max_results=None, priority='low')
+
+        assert len(offers) == 200
+        assert not scraper.last_search_stats.complete
+
+    def test_dropped_low_call_not_shared_with_normal_caller(self):
+        """Un appel 'normal' regroupé avec un appel 'low' abandonné obtient ses offres"""
+        api = FakeAPI(available=30)
+        ledger = GatedLedger(path=':memory:', daily_limit=10, clock=Clock(datetime(2026, 3, 2, 9, 0)))
+        for _ in range(8):
+            ledger.acquire('high')
+        scraper = make_scraper(api, quota=ledger, coalescer=RequestCoalescer(ttl=0))
+        results = {}
+
+        low = threading.Thread(target=lambda: results.update(low=scraper.search("Python", priority='low')))
+        low.start()
+        assert ledger.low_waiting.wait(5)
+        normal = threading.Thread(target=lambda: results.update(normal=scraper.search("Python")))
+        normal.start()
+        while scraper.coalescer.stats.joined < 1:
+            time.sleep(0.001)
+        ledger.gate.set()
+        low.join(5)
+        normal.join(5)
+
+        assert results['low'] == []
+        assert len(results['normal']) == 30
+        assert ledger.used() == 9
+
+    def test_normal_priority_deferred(self):
+        ledger = make_ledger(daily_limit=10)
+        for _ in range(9):
+            ledger.acquire('high')
+        scraper = make_scraper(FakeAPI(available=30), quota=ledger)
+
+        with pytest.raises(QuotaExceeded) as exc:
+            scraper.search("Python")
+        assert exc.value.retry_at == datetime(2026, 3, 3)
+
+        with pytest.raises(QuotaExceeded):
+            scraper.get_vacancy_by_id("123")
+
+        assert len(scraper.search("Python", priority='high')) == 30
@@ -0,0 +1,154 @@
+"""
+Tests unitaires pour le rate limiter partagé
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.modules.detection.rate_limiter import (
+    RateLimiter,
+    RateLimitRule,
+    TokenBucket,
+    get_rate_limiter,
+    set_rate_limiter
+)
+
+
+class TestTokenBucket:
+    """Tests pour TokenBucket"""
+
+    def test_burst_is_immediate(self):
+        """Les `burst` premières requêtes ne sont pas retardées"""
+        bucket = TokenBucket(rate=1, burst=3)
+
+        waits = [bucket._reserve() for _ in range(3)]
+
+        assert waits == [0, 0, 0]
+
+    def test_reservations_are_spaced_at_rate(self):
+        """Au-delà du burst, les requêtes sont espacées de 1/rate"""
+        bucket = TokenBucket(rate=10, burst=1)
+
+        waits = [bucket._reserve() for _ in range(4)]
+
+        assert waits[0] == 0
+        assert waits[1:] == pytest.approx([0.1, 0.2, 0.3], abs=0.01)
+        assert bucket.wait_time == pytest.approx(0.6, abs=0.03)
+        assert bucket.acquisitions == 4
+
+    def test_thread_safety(self):
+        """Des threads concurrents sont servis au débit exact"""
+        bucket = TokenBucket(rate=100, burst=1)
+        start = time.monotonic()
+
+        threads = [threading.Thread(target=bucket.acquire) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # 5 intervalles de 10 ms après le premier jeton
+        assert time.monotonic() - start >= 0.045
+        assert bucket.acquisitions == 6
+
+    def test_acquire_async(self):
+        """Les coroutines concurrentes sont espacées sans bloquer la boucle"""
+        bucket = TokenBucket(rate=100, burst=1)
+
+        async def main():
+            start = time.monotonic()
+            await asyncio.gather(*(bucket.acquire_async() for _ in range(5)))
+            return time.monotonic() - start
+
+        assert asyncio.run(main()) >= 0.035
+
+    def test_cancelled_wait_refunds_token(self):
+        """Une attente annulée rend son jeton: la requête suivante n'attend pas pour elle"""
+        bucket = TokenBucket(rate=1, burst=1)
+        bucket._reserve()
+
+        async def main():
+            task = asyncio.ensure_future(bucket.acquire_async())
+            await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(main())
+
+        assert bucket.acquisitions == 1
+        assert bucket._reserve() == pytest.approx(1.0, abs=0.05)
+
+
+class TestRateLimiter:
+    """Tests pour RateLimiter"""
+
+    @pytest.fixture
+    def config(self):
+        return {
+            'job_boards': {
+                'indeed': {
+                    'base_url': 'https://www.indeed.fr',
+                    'hosts': ['indeed.com', 'indeed.fr'],
+                    'rate_limiting': {'requests_per_minute': 10, 'delay_between_requests': 3}
+                },
+                'apec': {
+                    'base_url': 'https://www.apec.fr',
+                    'rate_limiting': {'requests_per_minute': 8}
+                },
+                'linkedin': {'rate_limiting': {'requests_per_hour': 100}}
+            }
+        }
+
+    def test_from_config(self, config):
+        """Les débits et hôtes viennent de la section job_boards"""
+        limiter = RateLimiter.from_config(config)
+
+        assert limiter.bucket_for("https://fr.indeed.com/jobs").rate == pytest.approx(10 / 60)
+        assert limiter.bucket_for("https://be.indeed.com/jobs").rate == pytest.approx(10 / 60)
+        # Hôte déduit de base_url (sans www.)
+        assert limiter.bucket_for("https://www.apec.fr/offres").rate == pytest.approx(8 / 60)
+        # Pas de règle: pas de limite
+        assert limiter.bucket_for("https://example.com/") is None
+
+    def test_delay_between_requests_caps_rate(self):
+        """delay_between_requests impose un intervalle minimum"""
+        rule = RateLimiter._rule_from_board('board', {
+            'hosts': ['example.com'],
+            'rate_limiting': {'requests_per_minute': 60, 'delay_between_requests': 2}
+        })
+
+        assert rule.rate == pytest.approx(0.5)
+
+    def test_buckets_are_per_host(self):
+        """Deux hôtes couverts par la même règle ont chacun leur bucket"""
+        limiter = RateLimiter([RateLimitRule('indeed', ['indeed.com'], rate=1)])
+
+        assert limiter.bucket_for("https://fr.indeed.com/a") is limiter.bucket_for("https://fr.indeed.com/b")
+        assert limiter.bucket_for("https://fr.indeed.com/a") is not limiter.bucket_for("https://be.indeed.com/a")
+
+    def test_stats_report_wait_time(self):
+        """Le temps passé à attendre est exposé par hôte"""
+        limiter = RateLimiter([RateLimitRule('test', ['example.com'], rate=50)])
+
+        for _ in range(3):
+            limiter.acquire("https://example.com/page")
+
+        stats = limiter.stats()["example.com"]
+        assert stats['acquisitions'] == 3
+        assert stats['wait_time'] == pytest.approx(0.04, abs=0.015)
+        assert limiter.total_wait_time == stats['wait_time']
+
+    def test_shared_limiter(self):
+        """get_rate_limiter retourne une instance unique par processus"""
+        custom = RateLimiter()
+        set_rate_limiter(custom)
+        try:
+            assert get_rate_limiter() is custom
+        finally:
+            set_rate_limiter(None)
+
+        assert get_rate_limiter() is get_rate_limiter()
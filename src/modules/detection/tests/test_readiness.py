@@ -0,0 +1,143 @@
+"""
+Tests unitaires pour l'attente de page pilotée par le DOM
+"""
+
+import pytest
+
+from src.modules.detection.readiness import (
+    AdaptiveTimeout,
+    PageTimings,
+    ReadinessPolicy,
+    summarize_timings
+)
+
+
+class FakeClock:
+    """Horloge simulée: `sleep` avance le temps sans attendre"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class FakeDriver:
+    """Driver dont les relevés successifs sont scriptés"""
+
+    def __init__(self, states):
+        self.states = list(states)
+        self.probes = 0
+
+    def execute_script(self, script, *args):
+        self.probes += 1
+        state = self.states[min(self.probes, len(self.states)) - 1]
+        return {'challenge': False, 'cards': 0, 'no_results': False, **state}
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def policy(clock):
+    return ReadinessPolicy(poll_interval=0.5, clock=clock, sleep=clock.sleep)
+
+
+class TestReadinessPolicy:
+    """Tests des conditions d'attente"""
+
+    def test_ready_when_cards_already_stable(self, policy):
+        driver = FakeDriver([{'cards': 15}])
+
+        timings = policy.wait_until_ready(driver)
+
+        assert timings.cards_ready
+        assert timings.card_count == 15
+        assert timings.cards == 0.5  # Un seul intervalle pour confirmer la stabilité
+        assert not timings.challenge_detected
+
+    def test_waits_for_card_count_to_stabilize(self, policy):
+        driver = FakeDriver([{'cards': 0}, {'cards': 5}, {'cards': 12}, {'cards': 15}, {'cards': 15}])
+
+        timings = policy.wait_until_ready(driver)
+
+        assert timings.cards_ready
+        assert timings.card_count == 15
+        assert timings.cards == 2.0
+
+    def test_waits_for_challenge_to_clear(self, policy):
+        driver = FakeDriver([{'challenge': True}, {'challenge': True}, {'cards': 10}])
+
+        timings = policy.wait_until_ready(driver)
+
+        assert timings.challenge_detected
+        assert timings.challenge_cleared
+        assert timings.challenge == 1.0
+        assert timings.cards_ready
+
+    def test_challenge_timeout(self, policy):
+        policy.challenge_timeout = AdaptiveTimeout(initial=2, minimum=1, maximum=5)
+        policy.cards_timeout = AdaptiveTimeout(initial=1, minimum=1, maximum=5)
+        driver = FakeDriver([{'challenge': True}])
+
+        timings = policy.wait_until_ready(driver)
+
+        assert not timings.challenge_cleared
+        assert not timings.cards_ready
+        assert timings.challenge == 2.0
+
+    def test_no_results_page_is_ready(self, policy):
+        driver = FakeDriver([{'no_results': True}])
+
+        timings = policy.wait_until_ready(driver)
+
+        assert timings.no_results
+        assert timings.cards == 0.0
+
+    def test_cards_timeout_is_learned(self, policy):
+        for _ in range(5):
+            policy.wait_until_ready(FakeDriver([{'cards': 10}]))
+
+        # 0.5s observées * marge 2 = 1s, remonté au minimum de 2s
+        assert policy.cards_timeout.value == 2
+
+
+class TestAdaptiveTimeout:
+    """Tests du timeout adaptatif"""
+
+    def test_initial_value_without_history(self):
+        timeout = AdaptiveTimeout(initial=10, minimum=1, maximum=20)
+        timeout.observe(1.0)
+
+        assert timeout.value == 10
+
+    def test_bounded_percentile(self):
+        timeout = AdaptiveTimeout(initial=10, minimum=1, maximum=20, margin=2, min_samples=3)
+        for duration in (1.0, 2.0, 3.0):
+            timeout.observe(duration)
+        assert timeout.value == 6.0
+
+        for _ in range(20):
+            timeout.observe(30.0)
+        assert timeout.value == 20
+
+
+def test_summarize_timings():
+    timings = [
+        PageTimings(navigation=1.0, cards=0.5, cards_ready=True),
+        PageTimings(navigation=2.0, challenge=4.0, challenge_detected=True, cards=1.5, cards_ready=True),
+        PageTimings(navigation=1.0, cards=10.0),
+    ]
+
+    summary = summarize_timings(timings)
+
+    assert summary['pages'] == 3
+    assert summary['navigation']['avg'] == pytest.approx(4 / 3)
+    assert summary['challenge']['max'] == 4.0
+    assert summary['challenges'] == 1
+    assert summary['timeouts'] == 1
@@ -0,0 +1,194 @@
+"""
+Tests de l'enregistrement et du rejeu des réponses (fixtures compressées)
+"""
+
+import asyncio
+import gzip
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+from src.modules.detection.async_fetcher import AsyncFetchEngine
+from src.modules.detection.indeed_bypass import IndeedBypassScraper
+from src.modules.detection.jobboard_scraper import IndeedScraper
+from src.modules.detection.rate_limiter import RateLimiter
+from src.modules.detection.recording import (
+    FixtureAdapter, FixtureNotFound, FixtureStore, default_rate_limiter, normalize_url
+)
+from src.modules.detection.vdab_api import VDABScraper
+
+RECORDED = Path(__file__).resolve().parents[4] / "tests" / "fixtures" / "recorded"
+
+
+class FakeAdapter(BaseAdapter):
+    """Adaptateur réseau simulé (réponses gzip décodées par requests)"""
+
+    def __init__(self, body: bytes, status: int = 200):
+        super().__init__()
+        self.body = body
+        self.status = status
+        self.calls = 0
+
+    def send(self, request, **kwargs):
+        self.calls += 1
+        response = requests.Response()
+        response.status_code = self.status
+        response.headers = requests.structures.CaseInsensitiveDict({
+            'Content-Type': 'text/html; charset=utf-8',
+            'Content-Encoding': 'gzip',
+            'ETag': '"v1"',
+        })
+        response._content = self.body
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+class TestFixtureStore:
+
+    def test_normalize_url_sorts_params(self):
+        assert normalize_url("HTTPS://Fr.Indeed.com/jobs?start=10&q=Python") == \
+            normalize_url("https://fr.indeed.com/jobs?q=Python&start=10")
+
+    def test_save_and_load(self, tmp_path):
+        store = FixtureStore(tmp_path, mode='record')
+        path = store.save("https://fr.indeed.com/jobs?q=a&l=b", "<html>é</html>")
+
+        assert path.name.endswith(".json.gz")
+        assert path.parent.name == "fr.indeed.com"
+        with gzip.open(path) as gz:
+            assert json.loads(gz.read())['body'] == "<html>é</html>"
+
+        fixture = FixtureStore(tmp_path).load("https://fr.indeed.com/jobs?l=b&q=a")
+        assert fixture.status == 200
+        assert fixture.text == "<html>é</html>"
+
+    def test_binary_body(self, tmp_path):
+        store = FixtureStore(tmp_path, mode='record')
+        store.save("https://example.com/logo", b"\x89PNG\xff\x00", headers={'Content-Type': 'image/png'})
+        assert store.load("https://example.com/logo").body == b"\x89PNG\xff\x00"
+
+    def test_unknown_mode(self, tmp_path):
+        with pytest.raises(ValueError):
+            FixtureStore(tmp_path, mode='live')
+
+    def test_replay_page_missing(self, tmp_path):
+        with pytest.raises(FixtureNotFound):
+            FixtureStore(tmp_path).replay_page("https://be.indeed.com/jobs?q=x")
+
+    def test_record_page_only_in_record_mode(self, tmp_path):
+        assert FixtureStore(tmp_path).record_page("https://be.indeed.com/jobs", "<html/>") is None
+        store = FixtureStore(tmp_path, mode='record')
+        store.record_page("https://be.indeed.com/jobs", "<html/>")
+        assert FixtureStore(tmp_path).replay_page("https://be.indeed.com/jobs") == "<html/>"
+
+    def test_default_rate_limiter(self, tmp_path):
+        """Pas de limite de débit en rejeu"""
+        assert default_rate_limiter(FixtureStore(tmp_path)).rules == []
+
+
+class TestRequestsAdapter:
+
+    def test_record_then_replay(self, tmp_path):
+        network = FakeAdapter(b"<html>page</html>")
+        session = requests.Session()
+        session.mount('https://', FixtureAdapter(FixtureStore(tmp_path, mode='record'), inner=network))
+
+        recorded = session.get("https://fr.indeed.com/jobs", params={'q': 'Python', 'start': 0})
+        assert recorded.text == "<html>page</html>"
+
+        replay = FixtureStore(tmp_path)
+        session = replay.mount(requests.Session())
+        response = session.get("https://fr.indeed.com/jobs", params={'start': 0, 'q': 'Python'})
+
+        assert network.calls == 1
+        assert response.status_code == 200
+        assert response.text == "<html>page</html>"
+        assert response.headers['ETag'] == '"v1"'
+        # Le corps est stocké décompressé: plus de Content-Encoding
+        assert 'Content-Encoding' not in response.headers
+
+    def test_replayed_error_status(self, tmp_path):
+        store = FixtureStore(tmp_path, mode='record')
+        store.save("https://fr.indeed.com/jobs", "blocked", status=403)
+
+        response = FixtureStore(tmp_path).mount(requests.Session()).get("https://fr.indeed.com/jobs")
+        with pytest.raises(requests.HTTPError):
+            response.raise_for_status()
+
+    def test_missing_fixture(self, tmp_path):
+        session = FixtureStore(tmp_path).mount(requests.Session())
+        with pytest.raises(requests.ConnectionError):
+            session.get("https://fr.indeed.com/jobs")
+
+
+class TestAsyncTransport:
+
+    def test_record_then_replay(self, tmp_path):
+        def handler(request):
+            return httpx.Response(200, json={'page': request.url.params['start']})
+
+        store = FixtureStore(tmp_path, mode='record')
+        transport = store.async_transport()
+        transport.inner = httpx.MockTransport(handler)
+
+        async def fetch(engine):
+            try:
+                return (await engine.fetch("https://fr.indeed.com/jobs", params={'start': 10})).json()
+            finally:
+                await engine.aclose()
+
+        assert asyncio.run(fetch(AsyncFetchEngine(transport=transport))) == {'page': '10'}
+
+        replay = AsyncFetchEngine(transport=FixtureStore(tmp_path).async_transport())
+        assert asyncio.run(fetch(replay)) == {'page': '10'}
+
+
+class TestScraperReplay:
+    """Scrapers servis hors ligne par le corpus enregistré"""
+
+    def test_indeed_scraper(self):
+        scraper = IndeedScraper(fixtures=FixtureStore(RECORDED), parser='lxml')
+        offers = scraper.scrape("Python", "Bruxelles", max_pages=2)
+        assert len(offers) > 14
+        assert scraper.rate_limiter.rules == []
+
+    def test_indeed_scraper_concurrent(self):
+        scraper = IndeedScraper(fixtures=FixtureStore(RECORDED), parser='lxml')
+        sequential = scraper.scrape("Python", "Bruxelles", max_pages=2)
+        concurrent = scraper.scrape("Python", "Bruxelles", max_pages=2, concurrent=True)
+        assert [o.url for o in concurrent] == [o.url for o in sequential]
+
+    def test_indeed_bypass_without_browser(self):
+        scraper = IndeedBypassScraper(country='be', parser='json', fixtures=FixtureStore(RECORDED))
+        offers = scraper.scrape("Python", "Bruxelles", max_pages=2)
+
+        assert len(offers) == 28
+        assert scraper.driver is None
+        assert scraper.handoff_stats.browser_pages == 0
+
+    def test_indeed_bypass_records_browser_pages(self, tmp_path):
+        scraper = IndeedBypassScraper(country='be', fixtures=FixtureStore(tmp_path, mode='record'),
+                                      rate_limiter=RateLimiter())
+        driver = type('Driver', (), {'page_source': '<html>rendu</html>'})()
+        driver.get = lambda url: None
+        # Relevé de la page: aucun résultat, pas d'attente
+        driver.execute_script = lambda *args: {'challenge': False, 'cards': 0, 'no_results': True}
+        scraper.driver = driver
+
+        scraper._load_in_browser("https://be.indeed.com/jobs?q=x")
+
+        assert FixtureStore(tmp_path).replay_page("https://be.indeed.com/jobs?q=x") == "<html>rendu</html>"
+
+    def test_vdab(self):
+        scraper = VDABScraper(client_id='replay', fixtures=FixtureStore(RECORDED))
+        offers = scraper.search("Python", "Brussel", max_results=32)
+        assert len(offers) == 32
+        assert all(o.id for o in offers)
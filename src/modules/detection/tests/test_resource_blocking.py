@@ -0,0 +1,108 @@
+"""
+Tests unitaires pour le blocage de ressources et la mesure du trafic
+"""
+
+from unittest.mock import Mock
+
+from src.modules.detection.resource_blocking import (
+    PageTransfer,
+    ResourceBlockingConfig,
+    TransferLog,
+    apply_resource_blocking,
+    measure_page_transfer
+)
+
+
+class TestResourceBlockingConfig:
+    """Tests de la configuration du blocage"""
+
+    def test_url_patterns_from_types_and_patterns(self):
+        config = ResourceBlockingConfig(block_types=['font', 'stylesheet'], block_url_patterns=['*hotjar.com*'])
+
+        patterns = config.url_patterns()
+
+        assert '*.woff2*' in patterns
+        assert '*.css*' in patterns
+        assert '*hotjar.com*' in patterns
+        assert '*.png*' not in patterns
+
+    def test_disabled_blocks_nothing(self):
+        config = ResourceBlockingConfig(enabled=False)
+
+        assert config.url_patterns() == []
+        assert config.chrome_prefs() == {}
+
+    def test_image_blocking_sets_chrome_pref(self):
+        prefs = ResourceBlockingConfig(block_types=['image']).chrome_prefs()
+
+        assert prefs == {'profile.managed_default_content_settings.images': 2}
+
+    def test_from_config(self):
+        config = {'job_boards': {'indeed': {'scraping_config': {'resource_blocking': {
+            'enabled': True, 'block_types': ['media'], 'block_url_patterns': []
+        }}}}}
+
+        blocking = ResourceBlockingConfig.from_config(config)
+
+        assert blocking.block_types == ['media']
+        assert blocking.block_url_patterns == []
+
+    def test_from_config_defaults(self):
+        assert ResourceBlockingConfig.from_config({}) == ResourceBlockingConfig()
+
+
+class TestDriverIntegration:
+    """Tests des appels CDP et de la mesure (driver simulé)"""
+
+    def test_apply_resource_blocking(self):
+        driver = Mock()
+        config = ResourceBlockingConfig(block_types=['font'], block_url_patterns=[])
+
+        assert apply_resource_blocking(driver, config) is True
+        driver.execute_cdp_cmd.assert_called_with('Network.setBlockedURLs', {'urls': config.url_patterns()})
+
+    def test_apply_none_clears_blocking(self):
+        driver = Mock()
+
+        assert apply_resource_blocking(driver, None) is False
+        driver.execute_cdp_cmd.assert_called_with('Network.setBlockedURLs', {'urls': []})
+
+    def test_cdp_failure_is_not_fatal(self):
+        driver = Mock()
+        driver.execute_cdp_cmd.side_effect = Exception("not chromium")
+
+        assert apply_resource_blocking(driver, ResourceBlockingConfig()) is False
+
+    def test_measure_page_transfer(self):
+        driver = Mock()
+        driver.execute_script.return_value = {
+            'document_bytes': 50000, 'resource_bytes': 150000, 'resource_count': 40, 'load_ms': 900.0
+        }
+
+        transfer = measure_page_transfer(driver, "https://be.indeed.com/jobs", blocking=False)
+
+        assert transfer.total_bytes == 200000
+        assert transfer.resource_count == 40
+
+
+class TestTransferLog:
+    """Tests du résumé avant / après blocage"""
+
+    def test_summary_compares_modes(self):
+        log = TransferLog()
+        log.record(PageTransfer(url="a", blocking=False, document_bytes=100, resource_bytes=900))
+        log.record(PageTransfer(url="b", blocking=True, document_bytes=100, resource_bytes=150))
+        log.record(None)
+
+        summary = log.summary()
+
+        assert summary['unblocked']['avg_bytes'] == 1000
+        assert summary['blocked']['avg_bytes'] == 250
+        assert summary['bytes_saved_ratio'] == 0.75
+
+    def test_log_is_bounded(self):
+        log = TransferLog(max_pages=2)
+        for i in range(5):
+            log.record(PageTransfer(url=str(i), blocking=True))
+
+        assert [p.url for p in log.pages] == ['3', '4']
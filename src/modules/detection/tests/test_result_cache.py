@@ -0,0 +1,293 @@
+"""
+Tests du cache des résultats de recherche agrégée
+"""
+
+import threading
+
+import pytest
+
+from src.modules.detection import result_cache
+from src.modules.detection.belgian_job_aggregator import BelgianJobAggregator, FanOutSettings
+from src.modules.detection.cache import SQLiteTTLCache
+from src.modules.detection.result_cache import ResultCache
+from src.modules.detection.sources import SourceRegistry, SourceSpec
+from src.modules.detection.vdab_api import VDABJobOffer
+
+KEY = ResultCache.key("Python", "Gent", 50)
+
+
+class CountingSearch:
+    """Recherche simulée: compte ses appels, peut attendre un signal"""
+
+    def __init__(self, complete=True, gate=None, prefix="vdab"):
+        self.calls = 0
+        self.prefix = prefix
+        self.complete = complete
+        self.gate = gate
+
+    def __call__(self):
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.calls += 1
+        return [{'id': f"{self.prefix}-{self.calls}"}], self.complete
+
+
+class BrokenBackend:
+    def get(self, key):
+        raise ConnectionError("redis down")
+
+    set = delete = get
+
+
+@pytest.fixture
+def cache():
+    results = ResultCache(ttl=60, stale_ttl=60)
+    yield results
+    results.close()
+
+
+class TestResultCache:
+
+    def test_key_normalized(self):
+        assert ResultCache.key(" python  ", "GENT", 50, ['indeed', 'vdab']) == \
+            ResultCache.key("Python", "gent", 50, ['vdab', 'indeed'])
+        assert ResultCache.key("Python", "Gent", 50) != ResultCache.key("Python", "Gent", 20)
+        assert ResultCache.key("Python", "Gent", 50) != ResultCache.key("Python", "Gent", 50, ['vdab'])
+
+    def test_fresh_hit(self, cache):
+        search = CountingSearch()
+
+        first = cache.get_or_search(KEY, search)
+        second = cache.get_or_search(KEY, search)
+
+        assert (first.status, second.status) == ('miss', 'hit')
+        assert second.offers == first.offers
+        assert search.calls == 1
+
+    def test_stale_served_while_refreshing(self):
+        cache = ResultCache(ttl=0, stale_ttl=60)
+        cache.get_or_search(KEY, CountingSearch())
+        gate = threading.Event()
+        refresh = CountingSearch(gate=gate, prefix="refreshed")
+
+        stale = cache.get_or_search(KEY, refresh)
+        # Servie sans attendre la recherche, un seul rafraîchissement par clé
+        assert stale.status == 'stale' and stale.offers == [{'id': "vdab-1"}]
+        assert cache.get_or_search(KEY, refresh).status == 'stale'
+
+        gate.set()
+        cache.wait_for_refreshes(5)
+
+        assert refresh.calls == 1
+        assert cache.get_or_search(KEY, refresh).offers == [{'id': "refreshed-1"}]
+        assert cache.stats.refreshes == 1
+        cache.close()
+
+    def test_expired(self):
+        cache = ResultCache(ttl=0, stale_ttl=0)
+        search = CountingSearch()
+
+        cache.get_or_search(KEY, search)
+        assert cache.get_or_search(KEY, search).status == 'miss'
+        assert search.calls == 2
+
+    def test_partial_not_cached(self, cache):
+        search = CountingSearch(complete=False)
+
+        cache.get_or_search(KEY, search)
+        cache.get_or_search(KEY, search)
+
+        assert search.calls == 2
+
+    def test_concurrent_misses_coalesced(self, cache):
+        gate = threading.Event()
+        search = CountingSearch(gate=gate)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get_or_search(KEY, search)))
+                   for _ in range(4)]
+
+        for thread in threads:
+            thread.start()
+        gate.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert search.calls == 1
+        assert len(results) == 4
+
+    def test_counters_thread_safe(self, cache):
+        cache.get_or_search(KEY, CountingSearch())
+        threads = [threading.Thread(target=lambda: [cache.get_or_search(KEY, CountingSearch()) for _ in range(500)])
+                   for _ in range(8)]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        assert cache.stats.hits == 4000
+
+    def test_refresh_function(self):
+        cache = ResultCache(ttl=0, stale_ttl=60)
+        cache.get_or_search(KEY, CountingSearch())
+        search, refresh = CountingSearch(), CountingSearch(prefix="refreshed")
+
+        cache.get_or_search(KEY, search, refresh=refresh)
+        cache.wait_for_refreshes(5)
+
+        assert (search.calls, refresh.calls) == (0, 1)
+        cache.close()
+
+    def test_lru_bounded(self):
+        cache = ResultCache(max_entries=2)
+        for i in range(5):
+            cache.get_or_search(ResultCache.key(f"q{i}", "Gent", 50), CountingSearch())
+
+        assert len(cache._entries) == 2
+
+    def test_disk_tier_shared(self, tmp_path):
+        path = tmp_path / "results.db"
+        ResultCache(backend=SQLiteTTLCache(path, table='search_results')).get_or_search(KEY, CountingSearch())
+
+        other = ResultCache(backend=SQLiteTTLCache(path, table='search_results'))
+        search = CountingSearch()
+
+        assert other.get_or_search(KEY, search).status == 'hit'
+        assert search.calls == 0
+
+    def test_backend_failure_ignored(self):
+        cache = ResultCache(backend=BrokenBackend())
+        search = CountingSearch()
+
+        assert cache.get_or_search(KEY, search).offers == [{'id': "vdab-1"}]
+        assert cache.get_or_search(KEY, search).status == 'hit'  # niveau mémoire
+        assert cache.stats.backend_errors == 2
+
+    def test_from_config(self, tmp_path, monkeypatch):
+        config = {
+            'aggregator': {'result_cache': {'backend': 'disk', 'path': str(tmp_path / "r.db"),
+                                            'stale_ttl': 30}},
+            'redis': {'enabled': True, 'cache_ttl': {'scraping_results': 600}},
+        }
+        cache = ResultCache.from_config(config)
+        assert (cache.ttl, cache.stale_ttl) == (600, 30)
+        assert isinstance(cache.backend, SQLiteTTLCache)
+
+        monkeypatch.setattr(result_cache, 'redis', None)
+        config['aggregator']['result_cache']['backend'] = 'redis'
+        assert ResultCache.from_config(config).backend is None
+
+
+class FakeVDAB:
+    """Scraper VDAB simulé: compte les recherches"""
+
+    searches = 0
+
+    def __init__(self, **kwargs):
+        pass
+
+    def search_iter(self, query, location, max_results):
+        FakeVDAB.searches += 1
+        yield VDABJobOffer(id="42", title="Python Developer", company="Acme", location=location,
+                           description="", url="https://www.vdab.be/vindeenjob/vacatures/42")
+
+    def close(self):
+        pass
+
+
+class EndlessVDAB(FakeVDAB):
+    """
+    Scraper VDAB simulé: avec `endless` levé, la recherche "Python" produit
+    une offre par milliseconde jusqu'à `release` (5 s au plus)
+    """
+
+    endless = threading.Event()
+    release = threading.Event()
+    producing = threading.Event()
+
+    def search_iter(self, query, location, max_results):
+        if query != "Python" or not self.endless.is_set():
+            yield from super().search_iter(query, location, max_results)
+            return
+        for i in range(5000):
+            self.producing.set()
+            if self.release.wait(0.001):
+                return
+            yield VDABJobOffer(id=str(i), title=f"Job {i}", company="Acme", location=location,
+                               description="", url=f"https://www.vdab.be/vindeenjob/vacatures/{i}")
+
+
+class TestAggregatorCache:
+
+    @pytest.fixture
+    def aggregator(self, cache):
+        FakeVDAB.searches = 0
+        registry = SourceRegistry([SourceSpec(name='vdab', label="VDAB", factory=f"{__name__}:FakeVDAB")])
+        return BelgianJobAggregator(fanout=FanOutSettings(), registry=registry, result_cache=cache)
+
+    def test_unavailable_source_does_not_block_cache(self, cache):
+        """Une source indisponible le reste: le résultat des autres est mis en cache"""
+        FakeVDAB.searches = 0
+        registry = SourceRegistry([
+            SourceSpec(name='vdab', label="VDAB", factory=f"{__name__}:FakeVDAB"),
+            SourceSpec(name='indeed', label="Indeed", factory=f"{__name__}:FakeVDAB",
+                       requires=('paquet_absent_de_test',)),
+        ])
+        aggregator = BelgianJobAggregator(fanout=FanOutSettings(), registry=registry, result_cache=cache)
+
+        aggregator.search("Python", "Gent")
+        report = aggregator.last_search_report
+        assert report.sources['indeed'].status == 'unavailable'
+        assert report.partial and report.complete
+        aggregator.search("Python", "Gent")
+
+        assert aggregator.last_search_report.cache == 'hit'
+        assert FakeVDAB.searches == 1
+
+    def test_foreground_preempts_refresh(self):
+        cache = ResultCache(ttl=0, stale_ttl=60)
+        registry = SourceRegistry([SourceSpec(name='vdab', label="VDAB", factory=f"{__name__}:EndlessVDAB")])
+        aggregator = BelgianJobAggregator(fanout=FanOutSettings(), registry=registry, result_cache=cache)
+        aggregator.search("Python", "Gent")
+        EndlessVDAB.producing.clear()
+        EndlessVDAB.release.clear()
+        EndlessVDAB.endless.set()
+
+        try:
+            # Périmée: servie, rafraîchie en arrière-plan par une recherche sans fin
+            assert aggregator.search("Python", "Gent") and aggregator.last_search_report.cache == 'stale'
+            assert EndlessVDAB.producing.wait(5)
+
+            # Le premier plan coupe le rafraîchissement au lieu de l'attendre
+            offers = aggregator.search("Java", "Gent")
+            stopped = EndlessVDAB.release.is_set()
+        finally:
+            EndlessVDAB.endless.clear()
+            EndlessVDAB.release.set()
+
+        assert not stopped
+
+        assert [offer.title for offer in offers] == ["Python Developer"]
+        assert aggregator.last_search_report.sources['vdab'].status == 'ok'
+        cache.wait_for_refreshes(5)
+        # Rafraîchissement interrompu: partiel, l'entrée périmée est gardée
+        assert cache.get_or_search(ResultCache.key("Python", "Gent", 50), CountingSearch()).offers[0]['title'] == \
+            "Python Developer"
+        cache.close()
+
+    def test_second_search_served_by_cache(self, aggregator):
+        first = aggregator.search("Python", "Gent")
+        assert aggregator.last_search_report.cache == 'miss'
+
+        second = aggregator.search("python", "gent")
+
+        assert FakeVDAB.searches == 1
+        assert aggregator.last_search_report.cache == 'hit'
+        assert [offer.to_dict() for offer in second] == [offer.to_dict() for offer in first]
+
+    def test_forced_search(self, aggregator):
+        aggregator.search("Python", "Gent")
+        aggregator.search("Python", "Gent", use_cache=False)
+
+        assert FakeVDAB.searches == 2
+        assert aggregator.last_search_report.cache == 'miss'
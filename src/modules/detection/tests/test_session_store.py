@@ -0,0 +1,132 @@
+"""
+Tests unitaires pour le store de sessions navigateur
+"""
+
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from src.modules.detection.session_store import (
+    SessionState,
+    SessionStateStore,
+    capture_session_state,
+    restore_session_state,
+    session_expiry
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SessionStateStore(':memory:', ttl=3600, profiles_dir=tmp_path / 'profiles')
+    yield store
+    store.close()
+
+
+def make_state(country='be', **kwargs):
+    return SessionState(
+        country=country,
+        cookies=[{'name': 'cf_clearance', 'value': 'token', 'domain': '.indeed.com', 'path': '/'}],
+        user_agent="Mozilla/5.0 Chrome/120.0",
+        origin="https://be.indeed.com",
+        **kwargs
+    )
+
+
+class TestSessionStateStore:
+    """Tests de la persistance par pays"""
+
+    def test_save_and_load(self, store):
+        store.save(make_state(local_storage={'consent': 'yes'}))
+
+        state = store.load('BE')
+
+        assert state.cookies[0]['value'] == 'token'
+        assert state.local_storage == {'consent': 'yes'}
+        assert store.load('fr') is None
+
+    def test_expired_session_is_dropped(self, store):
+        store.save(make_state(expires_at=time.time() - 1))
+
+        assert store.load('be') is None
+        assert store.purge_expired() == 0  # Déjà supprimée au chargement
+
+    def test_purge_expired(self, store):
+        store.save(make_state('be', expires_at=time.time() - 1))
+        store.save(make_state('fr', expires_at=time.time() + 60))
+
+        assert store.purge_expired() == 1
+        assert store.load('fr') is not None
+
+    def test_profile_dir_per_country(self, store):
+        assert store.profile_dir('BE').name == 'be'
+        assert store.profile_dir('be').is_dir()
+
+    def test_persisted_across_instances(self, tmp_path):
+        path = tmp_path / 'sessions.db'
+        first = SessionStateStore(path)
+        first.save(make_state())
+        first.close()
+
+        second = SessionStateStore(path)
+        assert second.load('be').user_agent == "Mozilla/5.0 Chrome/120.0"
+        second.close()
+
+
+class TestCaptureAndRestore:
+    """Tests de la capture et de l'injection dans un navigateur"""
+
+    def test_expiry_bounded_by_clearance_cookie(self):
+        cookies = [{'name': 'cf_clearance', 'value': 'x', 'expiry': 1000}]
+
+        assert session_expiry(cookies, saved_at=0, ttl=3600) == 1000
+        assert session_expiry([], saved_at=0, ttl=3600) == 3600
+
+    def test_expiry_ignores_short_lived_bot_cookie(self):
+        # __cf_bm est réémis à chaque réponse: il ne doit pas tuer la session
+        cookies = [
+            {'name': 'cf_clearance', 'value': 'x', 'expiry': 5000},
+            {'name': '__cf_bm', 'value': 'y', 'expiry': 1800}
+        ]
+
+        assert session_expiry(cookies, saved_at=0, ttl=3600) == 3600
+
+    def test_capture_session_state(self):
+        driver = Mock()
+        driver.execute_script.return_value = {
+            'origin': 'https://be.indeed.com',
+            'user_agent': 'UA',
+            'languages': ['fr-BE', 'fr'],
+            'local_storage': {'consent': 'yes'}
+        }
+        driver.get_cookies.return_value = [{'name': 'CTK', 'value': 'abc'}]
+
+        state = capture_session_state(driver, 'be', ttl=60)
+
+        assert state.accept_language == 'fr-BE,fr'
+        assert state.local_storage == {'consent': 'yes'}
+        assert state.expires_at == pytest.approx(state.saved_at + 60)
+
+    def test_restore_injects_cookies_and_storage(self):
+        driver = Mock()
+        state = make_state(local_storage={'consent': 'yes'})
+        state.cookies[0]['expiry'] = 2000000000
+
+        assert restore_session_state(driver, state) is True
+
+        calls = {call.args[0]: call.args[1] for call in driver.execute_cdp_cmd.call_args_list}
+        cookie = calls['Network.setCookies']['cookies'][0]
+        assert cookie['name'] == 'cf_clearance'
+        assert cookie['expires'] == 2000000000
+        assert 'consent' in calls['Page.addScriptToEvaluateOnNewDocument']['source']
+
+    def test_restore_drops_expired_cookies(self):
+        driver = Mock()
+        state = make_state()
+        state.cookies.append({'name': '__cf_bm', 'value': 'stale', 'expiry': time.time() - 60})
+
+        restore_session_state(driver, state)
+
+        calls = {call.args[0]: call.args[1] for call in driver.execute_cdp_cmd.call_args_list}
+        assert [c['name'] for c in calls['Network.setCookies']['cookies']] == ['cf_clearance']
+        assert [c['name'] for c in state.browser_session().cookies] == ['cf_clearance']
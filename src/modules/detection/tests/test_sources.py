@@ -0,0 +1,124 @@
+"""
+Tests du registre des sources (import et création à la demande)
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+from src.modules.detection.belgian_job_aggregator import BelgianJobAggregator, FanOutSettings
+from src.modules.detection.sources import SOURCES, SourceRegistry, SourceSpec
+from src.modules.detection.vdab_api import VDABJobOffer
+
+
+class FakeVDAB:
+    """Scraper VDAB simulé: note ses paramètres et s'il a été fermé"""
+
+    instances = []
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.closed = False
+        FakeVDAB.instances.append(self)
+
+    def search_iter(self, query, location, max_results):
+        yield VDABJobOffer(id="42", title="Python Developer", company="Acme", location=location,
+                           description="", url="https://www.vdab.be/vindeenjob/vacatures/42")
+
+    def close(self):
+        self.closed = True
+
+
+def make_registry(indeed_requires=('paquet_absent_de_test',)):
+    return SourceRegistry([
+        SourceSpec(name='vdab', label="VDAB", factory=f"{__name__}:FakeVDAB",
+                   capabilities=frozenset({'api'}), options={'client_id': 'vdab_client_id'},
+                   fixed={'timeout': 5}),
+        SourceSpec(name='indeed', label="Indeed", factory=f"{__name__}:FakeVDAB",
+                   requires=indeed_requires, capabilities=frozenset({'browser'})),
+    ])
+
+
+@pytest.fixture
+def aggregator():
+    FakeVDAB.instances = []
+    return BelgianJobAggregator(vdab_client_id="abc", fanout=FanOutSettings(), registry=make_registry())
+
+
+class TestSourceRegistry:
+
+    def test_builtin_sources(self):
+        assert SOURCES.names() == ['vdab', 'indeed']
+        assert SOURCES.names(capabilities={'api'}) == ['vdab']
+        assert SOURCES.get('indeed').fixed == {'country': 'be'}
+
+    def test_select(self):
+        registry = make_registry()
+        registry.register(SourceSpec(name='jobat', label="Jobat", factory='.jobat:JobatScraper', default=False))
+
+        assert [spec.name for spec in registry.select()] == ['vdab', 'indeed']
+        assert [spec.name for spec in registry.select(['jobat', 'vdab'])] == ['vdab', 'jobat']
+        assert [spec.name for spec in registry.select(capabilities={'browser'})] == ['indeed']
+        with pytest.raises(KeyError):
+            registry.select(['stepstone'])
+
+    def test_register_twice(self):
+        registry = make_registry()
+        with pytest.raises(ValueError):
+            registry.register(SourceSpec(name='vdab', label="VDAB", factory='.vdab_api:VDABScraper'))
+        registry.register(SourceSpec(name='vdab', label="VDAB 2", factory='.vdab_api:VDABScraper'), replace=True)
+        assert registry.get('vdab').label == "VDAB 2"
+
+    def test_create_passes_declared_options(self):
+        scraper = make_registry().get('vdab').create({'vdab_client_id': "abc", 'indeed_headless': True})
+        assert scraper.kwargs == {'client_id': "abc", 'timeout': 5}
+
+    def test_missing_requirements(self):
+        spec = make_registry().get('indeed')
+        assert spec.missing_requirements() == ['paquet_absent_de_test']
+        with pytest.raises(ImportError):
+            spec.create({})
+
+
+class TestLazyAggregator:
+
+    def test_nothing_created_at_init(self, aggregator):
+        assert FakeVDAB.instances == []
+
+    def test_only_selected_sources_created(self, aggregator):
+        offers = aggregator.search("Python", "Gent", sources=['vdab'])
+
+        assert [offer.title for offer in offers] == ["Python Developer"]
+        assert len(FakeVDAB.instances) == 1
+        assert 'indeed' not in aggregator._scrapers
+
+    def test_unavailable_source_skipped(self, aggregator):
+        offers = aggregator.search("Python", "Gent")
+
+        assert len(offers) == 1
+        assert aggregator._scrapers['indeed'] is None
+        report = aggregator.last_search_report
+        assert list(report.sources) == ['vdab', 'indeed']
+        indeed = report.sources['indeed']
+        assert indeed.status == 'unavailable' and 'paquet_absent_de_test' in indeed.error
+        assert report.partial
+
+    def test_empty_registry_kept(self):
+        """Un registre vide n'est pas remplacé par les sources intégrées"""
+        aggregator = BelgianJobAggregator(fanout=FanOutSettings(), registry=SourceRegistry())
+
+        assert aggregator.registry is not SOURCES
+        assert aggregator.search("Python", "Gent") == []
+
+    def test_close_only_created(self, aggregator):
+        aggregator.search("Python", "Gent", sources=['vdab', 'stepstone'])
+        aggregator.close()
+
+        assert [scraper.closed for scraper in FakeVDAB.instances] == [True]
+
+    def test_import_does_not_load_selenium(self):
+        code = ("import sys, src.modules.detection.belgian_job_aggregator; "
+                "print(any(m.split('.')[0] in ('selenium', 'undetected_chromedriver') for m in sys.modules))")
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "False"
@@ -0,0 +1,322 @@
+"""
+Tests de la pagination des recherches VDAB
+"""
+
+import io
+import json
+import threading
+import time
+from urllib.parse import parse_qsl, urlsplit
+
+from unittest.mock import PropertyMock, patch
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+from src.modules.detection.cache import VacancyCache
+from src.modules.detection.http_cache import HTTPCache
+from src.modules.detection.quota import RequestCoalescer
+from src.modules.detection.rate_limiter import RateLimiter
+from src.modules.detection.vdab_api import PageStream, VDABPagination, VDABScraper
+
+
+def vacancy(index: int) -> dict:
+    return {
+        'id': str(index),
+        'titel': f"Développeur {index}",
+        'werkgever': {'naam': "Acme"},
+        'plaats': {'gemeente': "Brussel"},
+    }
+
+
+class FakeAPI(BaseAdapter):
+    """API VDAB simulée: `available` vacatures paginées par limit/offset"""
+
+    def __init__(self, available: int, announce_total: bool = True, delay: float = 0.0, total=None):
+        super().__init__()
+        self.available = available
+        self.announce_total = announce_total
+        self.total = available if total is None else total
+        self.delay = delay
+        self.calls = []
+        self.streamed = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        params = {k: int(v) if v.isdigit() else v for k, v in parse_qsl(urlsplit(request.url).query)}
+        with self.lock:
+            self.calls.append(params)
+            self.streamed.append(kwargs.get('stream'))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            offset = params.get('offset', 0)
+            end = min(offset + params['limit'], self.available)
+            data = {'vacatures': self.page(offset, end)}
+            if self.announce_total:
+                data['totaal'] = self.total
+            response = requests.Response()
+            response.status_code = 200
+            response.raw = io.BytesIO(json.dumps(data).encode('utf-8'))
+            response.url = request.url
+            response.request = request
+            return response
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+    def page(self, start: int, end: int) -> list:
+        """Vacatures d'indices [start, end)"""
+        return [vacancy(i) for i in range(start, end)]
+
+    def close(self):
+        pass
+
+
+class VacancyAPI(FakeAPI):
+    """Endpoint /vacatures/{id} simulé; les identifiants `missing` répondent 404"""
+
+    def __init__(self, missing=(), delay: float = 0.0):
+        super().__init__(available=0, delay=delay)
+        self.missing = set(missing)
+
+    def send(self, request, **kwargs):
+        vacancy_id = urlsplit(request.url).path.rsplit('/', 1)[-1]
+        with self.lock:
+            self.calls.append(vacancy_id)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            response = requests.Response()
+            response.url = request.url
+            response.request = request
+            if vacancy_id in self.missing:
+                response.status_code = 404
+                response.raw = io.BytesIO(b'{"message": "Not found"}')
+            else:
+                response.status_code = 200
+                response.raw = io.BytesIO(json.dumps(vacancy(int(vacancy_id))).encode('utf-8'))
+            return response
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+def make_scraper(api: FakeAPI, vacancy_cache=None, **pagination) -> VDABScraper:
+    scraper = VDABScraper(
+        client_id='test',
+        rate_limiter=RateLimiter(),
+        pagination=VDABPagination(**pagination),
+        vacancy_cache=vacancy_cache
+    )
+    scraper.session.mount('https://', api)
+    return scraper
+
+
+class TestPagination:
+
+    def test_single_page(self):
+        """Une seule requête, sans offset (clé compatible avec les fixtures)"""
+        api = FakeAPI(available=32)
+        offers = make_scraper(api).search("Python", max_results=50)
+
+        assert len(offers) == 32
+        assert api.calls == [{'limit': 50, 'q': 'Python', 'sorteer': 'publicatiedatum:desc'}]
+
+    def test_beyond_first_page(self):
+        api = FakeAPI(available=250)
+        scraper = make_scraper(api)
+
+        offers = scraper.search("Python", max_results=None)
+
+        assert [o.id for o in offers] == [str(i) for i in range(250)]
+        assert sorted((c.get('offset', 0), c['limit']) for c in api.calls) == [
+            (0, 100), (100, 100), (200, 50)
+        ]
+        stats = scraper.last_search_stats
+        assert stats.to_dict() == {
+            'total': 250, 'requested': 250, 'pages': 3, 'offers': 250,
+            'complete': True, 'truncated': False
+        }
+
+    def test_pages_fetched_concurrently(self):
+        api = FakeAPI(available=1000, delay=0.05)
+        offers = make_scraper(api, max_concurrency=4).search("Python", max_results=None)
+
+        assert len(offers) == 1000
+        assert 1 < api.max_in_flight <= 4
+
+    def test_bounded_by_max_results(self):
+        api = FakeAPI(available=5000)
+        scraper = make_scraper(api, max_results=300)
+
+        offers = scraper.search("Python", max_results=None)
+        assert len(offers) == 300
+        assert scraper.last_search_stats.total == 5000
+        assert scraper.last_search_stats.truncated
+
+        offers = scraper.search("Python", max_results=120)
+        assert len(offers) == 120
+        assert api.calls[-1] == {'limit': 20, 'offset': 100, 'q': 'Python',
+                                 'sorteer': 'publicatiedatum:desc'}
+
+    def test_short_page_stops(self):
+        """Total surestimé par l'API: arrêt à la première page incomplète"""
+        api = FakeAPI(available=150, total=400)
+        scraper = make_scraper(api, max_concurrency=1)
+
+        offers = scraper.search("Python", max_results=None)
+
+        assert len(offers) == 150
+        assert scraper.last_search_stats.pages == 2
+        assert scraper.last_search_stats.complete
+
+    def test_unknown_total_is_sequential(self):
+        api = FakeAPI(available=230, announce_total=False)
+        scraper = make_scraper(api)
+
+        offers = scraper.search("Python", max_results=None)
+
+        assert len(offers) == 230
+        assert [c.get('offset', 0) for c in api.calls] == [0, 100, 200]
+        assert api.max_in_flight == 1
+        assert scraper.last_search_stats.total is None
+
+    def test_early_stop_by_consumer(self):
+        api = FakeAPI(available=2000, delay=0.01)
+        scraper = make_scraper(api, max_concurrency=2)
+
+        iterator = scraper.search_iter("Python", max_results=None)
+        first = [next(iterator) for _ in range(150)]
+        iterator.close()
+
+        assert len(first) == 150
+        # Les pages pas encore lancées sont annulées
+        assert len(api.calls) < 20
+        assert not scraper.last_search_stats.complete
+
+    def test_error_propagates(self):
+        scraper = make_scraper(FakeAPI(available=0))
+
+        def failing(url, params=None, **kwargs):
+            raise requests.ConnectionError("boom")
+
+        scraper._get = failing
+        with pytest.raises(requests.ConnectionError):
+            scraper.search("Python")
+
+
+
+class TestStreamedPages:
+
+    def test_pages_streamed_and_not_retained(self):
+        """Pages demandées en flux; le coalescer garde les offres parsées, pas les réponses"""
+        api = FakeAPI(available=150)
+        scraper = make_scraper(api)
+
+        with patch.object(requests.Response, 'content', new_callable=PropertyMock) as content:
+            offers = scraper.search("Python", max_results=None)
+
+        assert len(offers) == 150
+        assert api.streamed == [True, True]
+        content.assert_not_called()
+        assert all(isinstance(result, PageStream) for _, result in scraper.coalescer._recent.values())
+
+    def test_streamed_pages_stored_in_http_cache(self, tmp_path):
+        """Avec le cache HTTP, la page est stockée au fil de la lecture, sans `content`"""
+        api = FakeAPI(available=150)
+        scraper = make_scraper(api)
+        scraper.http_cache = HTTPCache(tmp_path / "http.db")
+
+        with patch.object(requests.Response, 'content', new_callable=PropertyMock) as content:
+            first = scraper.search("Python", max_results=None)
+        content.assert_not_called()
+        assert scraper.http_cache.stats.stores == 2
+
+        scraper.coalescer = RequestCoalescer(ttl=0)
+        second = scraper.search("Python", max_results=None)
+
+        assert len(api.calls) == 2
+        assert scraper.http_cache.stats.hits == 2
+        assert [o.id for o in second] == [o.id for o in first]
+
+    def test_invalid_json_is_request_exception(self):
+        class BrokenAPI(FakeAPI):
+            def send(self, request, **kwargs):
+                response = super().send(request, **kwargs)
+                response.raw = io.BytesIO(b'{"vacatures": [{"id": ')
+                return response
+
+        with pytest.raises(requests.RequestException, match="illisible"):
+            make_scraper(BrokenAPI(available=10)).search("Python")
+
+    def test_outstanding_pages_bounded(self):
+        """Au plus max_concurrency pages demandées d'avance quand le consommateur est lent"""
+        api = FakeAPI(available=1000)
+        scraper = make_scraper(api, max_concurrency=2, max_results=1000)
+
+        stream = scraper.search_iter("Python", max_results=None)
+        for _ in range(101):
+            next(stream)
+        time.sleep(0.05)
+
+        assert len(api.calls) <= 1 + 3
+        stream.close()
+
+
+class TestBulkLookup:
+
+    def test_dedupes_and_keeps_order(self):
+        api = VacancyAPI()
+        lookup = make_scraper(api).get_vacancies_by_ids(["3", "1", "3", " 2 ", "1"])
+
+        assert list(lookup.vacancies) == ["3", "1", "2"]
+        assert sorted(api.calls) == ["1", "2", "3"]
+        assert lookup.fetched == 3
+        assert lookup.errors == {}
+
+    def test_per_id_errors(self):
+        api = VacancyAPI(missing={"2"})
+        lookup = make_scraper(api).get_vacancies_by_ids(["1", "2", "3"])
+
+        assert list(lookup.vacancies) == ["1", "3"]
+        assert isinstance(lookup.errors["2"], requests.HTTPError)
+        assert lookup.to_dict()['errors'] == {"2": str(lookup.errors["2"])}
+
+    def test_cached_entries_not_fetched(self, tmp_path):
+        cache = VacancyCache(tmp_path / 'details.db')
+        make_scraper(VacancyAPI(), vacancy_cache=cache).get_vacancies_by_ids(["1", "2"])
+
+        api = VacancyAPI()
+        scraper = make_scraper(api, vacancy_cache=cache)
+        lookup = scraper.get_vacancies_by_ids(["1", "2", "3"])
+
+        assert api.calls == ["3"]
+        assert (lookup.cached, lookup.fetched) == (2, 1)
+        assert lookup.vacancies["1"].title == "Développeur 1"
+        # get_vacancy_by_id partage le cache
+        assert scraper.get_vacancy_by_id("2").id == "2"
+        assert api.calls == ["3"]
+
+    def test_bounded_concurrency(self):
+        api = VacancyAPI(delay=0.02)
+        lookup = make_scraper(api).get_vacancies_by_ids([str(i) for i in range(40)], max_concurrency=5)
+
+        assert len(lookup.vacancies) == 40
+        assert 1 < api.max_in_flight <= 5
+
+
+class TestPaginationConfig:
+
+    def test_from_config(self):
+        config = {'job_boards': {'vdab': {'pagination': {'page_size': 50, 'max_results': 500}}}}
+        pagination = VDABPagination.from_config(config)
+        assert (pagination.page_size, pagination.max_results, pagination.max_concurrency) == (50, 500, 4)
+
+    def test_defaults_without_section(self):
+        assert VDABPagination.from_config({}) == VDABPagination()
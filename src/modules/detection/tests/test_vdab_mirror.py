@@ -0,0 +1,219 @@
+"""
+Tests du miroir local VDAB et de la synchronisation par delta
+"""
+
+from datetime import date, timedelta
+
+import sqlite3
+
+import pytest
+
+from src.modules.detection.description_store import DescriptionStore
+from src.modules.detection.quota import RequestCoalescer
+from src.modules.detection.rate_limiter import RateLimiter
+from src.modules.detection.tests.test_vdab_api import FakeAPI
+from src.modules.detection.vdab_api import VDABPagination, VDABScraper
+from src.modules.detection.vdab_mirror import SyncSettings, VacancyMirror
+
+TODAY = date.today()
+
+
+def dated_vacancy(number: int, days_ago: int, title: str = "Python developer") -> dict:
+    return {
+        'id': str(number),
+        'titel': f"{title} {number}",
+        'werkgever': {'naam': "Acme"},
+        'werklocatie': {'gemeente': "Gent" if number % 2 else "Antwerpen"},
+        'omschrijving': "Thuiswerk mogelijk" if number % 3 == 0 else "Op kantoor",
+        'publicatiedatum': (TODAY - timedelta(days=days_ago)).isoformat(),
+    }
+
+
+class DatedAPI(FakeAPI):
+    """API simulée triée par publicatiedatum décroissante"""
+
+    def __init__(self, vacancies, **kwargs):
+        super().__init__(available=len(vacancies), **kwargs)
+        self.vacancies = vacancies
+
+    def publish(self, *vacancies):
+        self.vacancies = sorted(
+            [*vacancies, *self.vacancies], key=lambda v: v['publicatiedatum'], reverse=True
+        )
+        self.available = self.total = len(self.vacancies)
+
+    def withdraw(self, vacancy_id: str):
+        self.vacancies = [v for v in self.vacancies if v['id'] != vacancy_id]
+        self.available = self.total = len(self.vacancies)
+
+    def page(self, start, end):
+        return self.vacancies[start:end]
+
+
+def make_scraper(api: FakeAPI, mirror: VacancyMirror, description_store=None, max_concurrency=1,
+                 **settings) -> VDABScraper:
+    scraper = VDABScraper(
+        client_id='test',
+        description_store=description_store,
+        rate_limiter=RateLimiter(),
+        pagination=VDABPagination(page_size=10, max_concurrency=max_concurrency),
+        coalescer=RequestCoalescer(ttl=0),
+        mirror=mirror,
+        sync_settings=SyncSettings(**settings)
+    )
+    scraper.session.mount('https://', api)
+    return scraper
+
+
+@pytest.fixture
+def api():
+    # 45 vacatures, une par jour, la plus récente publiée aujourd'hui
+    return DatedAPI([dated_vacancy(n, days_ago=45 - n) for n in range(45, 0, -1)])
+
+
+@pytest.fixture
+def mirror():
+    store = VacancyMirror(':memory:')
+    yield store
+    store.close()
+
+
+class TestSync:
+
+    def test_first_sync_is_full(self, api, mirror):
+        stats = make_scraper(api, mirror).sync()
+
+        assert stats.full
+        assert stats.inserted == 45
+        assert stats.requests == 5
+        assert stats.watermark == TODAY.isoformat()
+        assert mirror.count() == 45
+
+    def test_delta_only_fetches_new_pages(self, api, mirror):
+        scraper = make_scraper(api, mirror)
+        scraper.sync()
+        api.calls.clear()
+
+        api.publish(dated_vacancy(100, days_ago=0), dated_vacancy(101, days_ago=0))
+        stats = scraper.sync()
+
+        assert not stats.full
+        assert stats.reached_watermark
+        assert stats.inserted == 2
+        assert len(api.calls) == 1
+        assert mirror.count() == 47
+
+    def test_delta_pages_fetched_sequentially(self, api, mirror):
+        scraper = make_scraper(api, mirror, max_concurrency=4)
+        assert scraper.sync().requests == 5
+        api.calls.clear()
+
+        # Watermark atteint sur la page 2: pas de pages lancées au-delà
+        api.publish(*(dated_vacancy(100 + n, days_ago=0) for n in range(15)))
+        stats = scraper.sync()
+
+        assert stats.reached_watermark
+        assert stats.inserted == 15
+        assert len(api.calls) == 2
+
+    def test_delta_updates_changed_vacancies(self, api, mirror):
+        scraper = make_scraper(api, mirror)
+        scraper.sync()
+
+        api.vacancies[0]['titel'] = "Senior Python developer"
+        stats = scraper.sync()
+
+        assert stats.updated == 1
+        assert scraper.search_local("Senior")[0].id == api.vacancies[0]['id']
+
+    def test_full_sync_expires_withdrawn(self, api, mirror):
+        scraper = make_scraper(api, mirror)
+        scraper.sync()
+
+        api.withdraw('30')
+        assert scraper.sync().expired == 0  # Delta: pas de réconciliation
+
+        stats = scraper.sync(full=True)
+        assert stats.expired == 1
+        assert mirror.count() == 44
+        assert mirror.count(include_expired=True) == 45
+
+    def test_full_sync_due_after_interval(self, api, mirror):
+        scraper = make_scraper(api, mirror, full_sync_hours=0)
+        scraper.sync()
+        assert scraper.sync().full
+
+    def test_truncated_full_sync_does_not_expire(self, api, mirror):
+        scraper = make_scraper(api, mirror)
+        scraper.sync()
+
+        scraper.sync_settings.max_results = 20
+        stats = scraper.sync(full=True)
+
+        assert stats.fetched == 20
+        assert stats.expired == 0
+
+    def test_old_vacancies_expire(self, api, mirror):
+        stats = make_scraper(api, mirror, max_age_days=30).sync()
+        assert stats.expired == 14
+        assert mirror.count() == 31
+
+    def test_requires_mirror(self, api):
+        scraper = make_scraper(api, None)
+        with pytest.raises(ValueError):
+            scraper.sync()
+
+
+class TestSearchLocal:
+
+    def test_no_api_request(self, api, mirror):
+        scraper = make_scraper(api, mirror)
+        scraper.sync()
+        api.calls.clear()
+
+        offers = scraper.search_local("python developer", location="Gent", max_results=5)
+
+        assert api.calls == []
+        assert len(offers) == 5
+        assert all(o.location == "Gent" for o in offers)
+        # Plus récentes d'abord
+        assert [o.posted_date for o in offers] == sorted((o.posted_date for o in offers), reverse=True)
+
+    def test_remote_filter(self, api, mirror):
+        make_scraper(api, mirror).sync()
+        remote = mirror.search(remote=True, max_results=100)
+        assert remote and all(v['remote'] for v in remote)
+
+    def test_persisted(self, api, tmp_path):
+        path = tmp_path / 'mirror.db'
+        make_scraper(api, VacancyMirror(path)).sync()
+
+        reopened = VacancyMirror(path)
+        assert reopened.count() == 45
+        assert reopened.get_state(VacancyMirror.scope())['watermark'] == TODAY.isoformat()
+
+    def test_full_description_kept(self, api, mirror):
+        descriptions = DescriptionStore(':memory:')
+        make_scraper(api, mirror, description_store=descriptions).sync()
+        # Nouvelle instance: seul le miroir relie l'offre à sa description
+        scraper = make_scraper(api, mirror, description_store=descriptions)
+
+        offer = scraper.search_local("python developer", max_results=1)[0]
+
+        assert offer.description_ref is not None
+        assert offer.full_description == offer.description
+        assert offer.to_dict()['description_id'] == offer.description_ref.digest
+
+    def test_legacy_mirror_migrated(self, tmp_path):
+        path = tmp_path / 'mirror.db'
+        VacancyMirror(path).close()
+        # Miroir créé avant la colonne description_id
+        conn = sqlite3.connect(path)
+        conn.execute("ALTER TABLE vacancies DROP COLUMN description_id")
+        conn.commit()
+        conn.close()
+
+        VacancyMirror(path).close()
+
+        columns = {row[1] for row in sqlite3.connect(path).execute("PRAGMA table_info(vacancies)")}
+        assert 'description_id' in columns
@@ -12,14 +12,30 @@ Pour commencer:
 
 import os
 import logging
+import time
 import requests
-from typing import List, Optional, Dict, Any
-from dataclasses import dataclass
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import AsyncIterator, Callable, Iterable, Iterator, List, Optional, Dict, Any, Tuple, TypeVar, Union
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from dotenv import load_dotenv
 
+from .async_fetcher import iterate_async
+from .cache import SQLiteTTLCache
+from .description_store import PREVIEW_LENGTH, DescriptionRef, DescriptionStore, full_text
+from .http_cache import HTTPCache, default_http_cache
+from .json_stream import CHUNK_SIZE, iter_json_array
+from .quota import QuotaExceeded, QuotaLedger, RequestCoalescer, default_quota_ledger
+from .rate_limiter import RateLimiter
+from .recording import FixtureStore, default_rate_limiter
+from .settings import load_integrations_config
+from .vdab_mirror import VACANCY_FIELDS, SyncSettings, SyncStats, VacancyMirror
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
 
 @dataclass
 class VDABJobOffer:
@@ -42,10 +58,18 @@ class VDABJobOffer:
     study_level: Optional[str] = None
     experience_required: Optional[str] = None
 
+    # Description complète (si le scraper a un DescriptionStore)
+    description_ref: Optional[DescriptionRef] = None
+
     def __post_init__(self):
         if self.scraped_at is None:
             self.scraped_at = datetime.now()
 
+    @property
+    def full_description(self) -> str:
+        """Description complète (chargée à la demande), sinon l'aperçu"""
+        return full_text(self.description, self.description_ref)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convertit l'offre en dictionnaire"""
         return {
@@ -63,7 +87,90 @@ class VDABJobOffer:
             'scraped_at': self.scraped_at.isoformat() if self.scraped_at else None,
             'number_of_positions': self.number_of_positions,
             'study_level': self.study_level,
-            'experience_required': self.experience_required
+            'experience_required': self.experience_required,
+            'description_id': self.description_ref.digest if self.description_ref else None
+        }
+
+
+@dataclass
+class VDABPagination:
+    """
+    Pagination des recherches VDAB (section `job_boards.vdab.pagination`
+    d'integrations.json)
+    """
+    page_size: int = 100        # Résultats par requête (plafond de l'API)
+    max_results: int = 2000     # Plafond d'une recherche, toutes pages confondues
+    max_concurrency: int = 4    # Pages récupérées en parallèle
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]] = None) -> 'VDABPagination':
+        """
+        Lit la pagination depuis integrations.json
+
+        Args:
+            config: Configuration déjà chargée (défaut: integrations.json)
+
+        Returns:
+            Réglages de pagination (valeurs par défaut si la section est absente)
+        """
+        if config is None:
+            config = load_integrations_config()
+
+        section = config.get('job_boards', {}).get('vdab', {}).get('pagination') or {}
+        defaults = cls()
+        return cls(
+            page_size=int(section.get('page_size', defaults.page_size)),
+            max_results=int(section.get('max_results', defaults.max_results)),
+            max_concurrency=int(section.get('max_concurrency', defaults.max_concurrency))
+        )
+
+
+@dataclass
+class VDABSearchStats:
+    """Bilan de la dernière recherche paginée"""
+    total: Optional[int] = None     # Nombre de résultats annoncé par l'API
+    requested: int = 0              # Résultats visés (max_results, total, plafond)
+    pages: int = 0                  # Requêtes envoyées
+    offers: int = 0                 # Offres produites
+    complete: bool = False          # Toutes les pages visées ont été lues
+
+    @property
+    def truncated(self) -> bool:
+        """L'API annonce plus de résultats que ceux récupérés"""
+        return self.total is not None and self.offers < self.total
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convertit le bilan en dictionnaire"""
+        data = asdict(self)
+        data['truncated'] = self.truncated
+        return data
+
+
+@dataclass
+class PageStream:
+    """Page de résultats lue en flux"""
+    fields: Dict[str, Any] = field(default_factory=dict)  # Champs hors tableau (totaal...)
+    vacancies: int = 0                                     # Vacatures brutes lues
+    offers: List['VDABJobOffer'] = field(default_factory=list)  # Offres parsées
+
+
+@dataclass
+class VacancyLookup:
+    """Résultat d'une récupération de vacatures par identifiants"""
+    vacancies: Dict[str, VDABJobOffer] = field(default_factory=dict)  # Dans l'ordre demandé
+    errors: Dict[str, Exception] = field(default_factory=dict)         # Par identifiant
+    cached: int = 0             # Servies par le cache
+    fetched: int = 0            # Récupérées sur l'API
+    duration: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Bilan sérialisable (offres en dictionnaires, erreurs en messages)"""
+        return {
+            'vacancies': {vid: offer.to_dict() for vid, offer in self.vacancies.items()},
+            'errors': {vid: str(error) for vid, error in self.errors.items()},
+            'cached': self.cached,
+            'fetched': self.fetched,
+            'duration': self.duration
         }
 
 
@@ -87,11 +194,24 @@ class VDABScraper:
     # Endpoints API v4
     VACATURES_ENDPOINT = "/vacature/v4/vacatures"
 
+    # Champs possibles du nombre total de résultats dans une réponse
+    TOTAL_FIELDS = ('totaal', 'aantalResultaten', 'total', 'totalCount', 'count')
+
     def __init__(
         self,
         client_id: Optional[str] = None,
         use_test_env: bool = False,
-        timeout: int = 30
+        timeout: int = 30,
+        rate_limiter: Optional[RateLimiter] = None,
+        http_cache: Union[HTTPCache, bool, None] = None,
+        fixtures: Optional[FixtureStore] = None,
+        pagination: Optional[VDABPagination] = None,
+        quota: Union[QuotaLedger, bool, None] = None,
+        coalescer: Optional[RequestCoalescer] = None,
+        mirror: Optional[VacancyMirror] = None,
+        sync_settings: Optional[SyncSettings] = None,
+        vacancy_cache: Optional[SQLiteTTLCache] = None,
+        description_store: Optional[DescriptionStore] = None
     ):
         """
         Initialise le scraper VDAB
@@ -100,6 +220,27 @@ class VDABScraper:
             client_id: Client ID VDAB (ou via variable d'environnement VDAB_CLIENT_ID)
             use_test_env: Utiliser l'environnement de test au lieu de production
             timeout: Timeout des requêtes HTTP (secondes)
+            rate_limiter: Limiteur de débit par hôte (défaut: limiteur partagé
+                du processus, configuré par integrations.json)
+            http_cache: Cache HTTP sur disque (défaut: cache partagé du
+                processus, configuré par integrations.json; False = pas de cache)
+            fixtures: Enregistrement (mode record) ou rejeu hors ligne
+                (mode replay) des réponses de l'API
+            pagination: Taille de page, plafond et concurrence des
+                recherches (défaut: integrations.json)
+            quota: Décompte journalier des requêtes envoyées (défaut:
+                décompte partagé, configuré par `job_boards.vdab.quota`;
+                False = pas de quota)
+            coalescer: Regroupement des requêtes identiques (défaut: réponses
+                réutilisées pendant `quota.coalesce_ttl` secondes)
+            mirror: Miroir local des vacatures, alimenté par `sync()` et
+                interrogé par `search_local()`
+            sync_settings: Réglages de synchronisation (défaut: integrations.json)
+            vacancy_cache: Cache des vacatures lues par identifiant (ex:
+                `VacancyCache()`, None = pas de cache)
+            description_store: Stockage des descriptions complètes; les
+                offres gardent un aperçu et une poignée `description_ref`
+                (None = descriptions tronquées à 500 caractères)
         """
         # Charger les credentials depuis .env si disponible
         load_dotenv('config/credentials/vdab_credentials.env')
@@ -115,6 +256,17 @@ class VDABScraper:
         # Sélectionner l'environnement
         self.base_url = self.BASE_URL_TEST if use_test_env else self.BASE_URL_PROD
         self.timeout = timeout
+        self.rate_limiter = rate_limiter or default_rate_limiter(fixtures)
+        self.http_cache = default_http_cache(http_cache, fixtures)
+        self.pagination = pagination or VDABPagination.from_config()
+        self.last_search_stats: Optional[VDABSearchStats] = None
+        self.quota = default_quota_ledger(quota, fixtures)
+        self.coalescer = coalescer or RequestCoalescer.from_config()
+        self.mirror = mirror
+        self.sync_settings = sync_settings or SyncSettings.from_config()
+        self.last_sync_stats: Optional[SyncStats] = None
+        self.vacancy_cache = vacancy_cache
+        self.description_store = description_store
 
         # Configuration de la session
         self.session = requests.Session()
@@ -123,6 +275,9 @@ class VDABScraper:
             'Accept': 'application/json',
             'Content-Type': 'application/json'
         })
+        self.fixtures = fixtures
+        if fixtures is not None:
+            fixtures.mount(self.session)
 
         logger.info(f"VDAB Scraper initialisé (env: {'TEST' if use_test_env else 'PROD'})")
 
@@ -130,19 +285,27 @@ class VDABScraper:
         self,
         query: Optional[str] = None,
         location: Optional[str] = None,
-        max_results: int = 50,
+        max_results: Optional[int] = 50,
         sort_by: str = "date",
-        filters: Optional[Dict[str, Any]] = None
+        filters: Optional[Dict[str, Any]] = None,
+        priority: str = 'normal'
     ) -> List[VDABJobOffer]:
         """
         Recherche d'offres d'emploi via l'API VDAB
 
+        Au-delà d'une page (100 résultats), les pages suivantes sont
+        récupérées en parallèle. Bilan (dont le total annoncé par l'API)
+        dans `last_search_stats`.
+
         Args:
             query: Mots-clés de recherche (ex: "Python Developer")
             location: Localisation (ex: "Brussel", "Antwerpen", "Vlaanderen")
-            max_results: Nombre maximum de résultats (défaut: 50)
+            max_results: Nombre maximum de résultats (défaut: 50; None =
+                tous, dans la limite de `pagination.max_results`)
             sort_by: Tri des résultats ("date", "relevance")
             filters: Filtres additionnels (dict)
+            priority: Priorité face au quota journalier ('low', 'normal',
+                'high'); une recherche 'low' refusée ne retourne rien
 
         Returns:
             Liste d'offres VDAB
@@ -151,6 +314,44 @@ class VDABScraper:
             ValueError: Si aucun Client ID n'est configuré
             requests.RequestException: En cas d'erreur API
         """
+        offers = list(self.search_iter(query, location, max_results, sort_by, filters, priority))
+        logger.info(f"✅ {len(offers)} offres VDAB trouvées")
+        return offers
+
+    def search_iter(
+        self,
+        query: Optional[str] = None,
+        location: Optional[str] = None,
+        max_results: Optional[int] = 50,
+        sort_by: str = "date",
+        filters: Optional[Dict[str, Any]] = None,
+        priority: str = 'normal',
+        max_concurrency: Optional[int] = None
+    ) -> Iterator[VDABJobOffer]:
+        """
+        Recherche d'offres d'emploi via l'API VDAB, en flux
+
+        Mêmes paramètres que `search`; les offres sont produites une par une
+        au fur et à mesure du parsing des pages, dans l'ordre de l'API.
+
+        La première page donne le total annoncé; les pages restantes (jusqu'à
+        `max_results`, au plus `pagination.max_results`) sont alors lancées
+        en parallèle, par `max_concurrency` (défaut:
+        `pagination.max_concurrency`). Une page incomplète termine la
+        pagination. Sans total annoncé, ou avec `max_concurrency=1` (lecteur
+        qui s'arrêtera tôt), les pages sont demandées l'une après l'autre.
+
+        Si le quota refuse une page à un appel 'low', la recherche s'arrête
+        sans erreur avec les offres déjà produites.
+
+        Yields:
+            Offres VDAB
+
+        Raises:
+            ValueError: Si aucun Client ID n'est configuré
+            QuotaExceeded: Si le quota reporte l'appel ('normal', 'high')
+            requests.RequestException: En cas d'erreur API
+        """
         if not self.client_id:
             raise ValueError(
                 "Client ID VDAB manquant. "
@@ -160,36 +361,102 @@ class VDABScraper:
 
         logger.info(f"🔍 Recherche VDAB: '{query}' à {location or 'Flandre'}")
 
+        page_size = self.pagination.page_size
+        wanted = self.pagination.max_results
+        if max_results is not None:
+            wanted = min(max_results, wanted)
+
+        stats = VDABSearchStats(requested=wanted)
+        self.last_search_stats = stats
+
         # Construire les paramètres de recherche
         params = self._build_search_params(
             query=query,
             location=location,
-            max_results=max_results,
+            max_results=wanted,
             sort_by=sort_by,
             filters=filters
         )
 
+        # Première page: résultats et total annoncé
+        try:
+            page = self._fetch_search_page(params, 0, params['limit'], priority)
+        except QuotaExceeded as e:
+            if not e.dropped:
+                raise
+            return
+        stats.pages = 1
+
+        yield from self._count(stats, iter(page.offers))
+        stats.total = self._extract_total(page.fields)
+        if stats.total is not None:
+            stats.requested = min(wanted, stats.total)
+
+        if page.vacancies < params['limit']:
+            stats.complete = True
+            return
+
+        # Pages suivantes
+        offsets = range(params['limit'], stats.requested, page_size)
+        workers = max_concurrency or self.pagination.max_concurrency
+        if stats.total is None or workers <= 1:
+            pages = self._iter_pages_sequentially(params, offsets, stats.requested, priority)
+        else:
+            pages = self._iter_pages_concurrently(params, offsets, stats.requested, priority, workers)
+
+        try:
+            for limit, page in pages:
+                stats.pages += 1
+                yield from self._count(stats, iter(page.offers))
+                if page.vacancies < limit:
+                    # Page incomplète: plus rien au-delà
+                    break
+        except QuotaExceeded as e:
+            if not e.dropped:
+                raise
+            # Appel 'low': résultats partiels
+            return
+        finally:
+            # Annule les pages en attente (arrêt anticipé ou erreur)
+            pages.close()
+
+        stats.complete = True
+        if stats.truncated:
+            logger.info(f"ℹ️ {stats.offers}/{stats.total} offres VDAB récupérées (plafond atteint)")
+
+    def _fetch_search_page(
+        self,
+        params: Dict[str, Any],
+        offset: int,
+        limit: int,
+        priority: str = 'normal'
+    ) -> PageStream:
+        """
+        Récupère et parse une page de résultats
+
+        Le corps est lu en flux (`stream=True`): ni le corps complet ni
+        l'arbre JSON de la page ne sont gardés en mémoire, seulement les
+        offres parsées (partagées par les appels regroupés).
+
+        Raises:
+            QuotaExceeded: Si le quota journalier refuse la requête
+            requests.RequestException: En cas d'erreur API
+        """
+        page_params = dict(params, limit=limit)
+        if offset:
+            page_params['offset'] = offset
+
         try:
             # Appel API
             url = f"{self.base_url}{self.VACATURES_ENDPOINT}"
 
             logger.debug(f"GET {url}")
-            logger.debug(f"Params: {params}")
+            logger.debug(f"Params: {page_params}")
 
-            response = self.session.get(
-                url,
-                params=params,
-                timeout=self.timeout
-            )
+            return self._get(url, params=page_params, priority=priority, parse=self._read_search_page)
 
-            response.raise_for_status()
-            data = response.json()
-
-            # Parser les résultats
-            offers = self._parse_response(data)
-
-            logger.info(f"✅ {len(offers)} offres VDAB trouvées")
-            return offers
+        except QuotaExceeded:
+            raise
 
         except requests.RequestException as e:
             logger.error(f"❌ Erreur API VDAB: {e}")
@@ -200,31 +467,427 @@ class VDABScraper:
 
             raise
 
-    def get_vacancy_by_id(self, vacancy_id: str) -> Optional[VDABJobOffer]:
+    def _iter_pages_sequentially(
+        self,
+        params: Dict[str, Any],
+        offsets: range,
+        end: int,
+        priority: str = 'normal'
+    ) -> Iterator[Tuple[int, PageStream]]:
+        """Pages suivantes (taille demandée, page), une requête à la fois"""
+        for offset in offsets:
+            limit = min(offsets.step, end - offset)
+            yield limit, self._fetch_search_page(params, offset, limit, priority)
+
+    def _iter_pages_concurrently(
+        self,
+        params: Dict[str, Any],
+        offsets: range,
+        end: int,
+        priority: str = 'normal',
+        max_concurrency: Optional[int] = None
+    ) -> Iterator[Tuple[int, PageStream]]:
+        """
+        Pages suivantes (taille demandée, page), lancées en parallèle et
+        livrées dans l'ordre
+
+        Au plus `max_concurrency` (défaut: `pagination.max_concurrency`) pages sont en cours ou en attente d'être
+        livrées: une nouvelle page n'est demandée qu'après la livraison
+        d'une autre (pas de pages parsées qui s'accumulent). Si l'appelant
+        arrête l'itération (page incomplète, consommateur satisfait), les
+        pages pas encore parties sont annulées.
+        """
+        if not offsets:
+            return
+
+        workers = max(1, min(max_concurrency or self.pagination.max_concurrency, len(offsets)))
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="vdab-page")
+        remaining = ((offset, min(offsets.step, end - offset)) for offset in offsets)
+        pending = deque()
+
+        def submit_next():
+            for offset, limit in remaining:
+                pending.append((limit, executor.submit(self._fetch_search_page, params, offset, limit, priority)))
+                return
+
+        try:
+            for _ in range(workers):
+                submit_next()
+            while pending:
+                limit, future = pending.popleft()
+                page = future.result()
+                submit_next()
+                yield limit, page
+        finally:
+            for _, future in pending:
+                future.cancel()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def _count(stats: VDABSearchStats, offers: Iterator[VDABJobOffer]) -> Iterator[VDABJobOffer]:
+        """Compte les offres produites dans le bilan"""
+        for offer in offers:
+            stats.offers += 1
+            yield offer
+
+    @staticmethod
+    def _vacancies(data: Dict[str, Any]) -> List[Any]:
+        """Vacatures brutes d'une page (pour détecter une page incomplète)"""
+        return data.get('vacatures') or data.get('items') or []
+
+    def _extract_total(self, data: Dict[str, Any]) -> Optional[int]:
+        """Nombre total de résultats annoncé par l'API (None si absent)"""
+        for name in self.TOTAL_FIELDS:
+            value = data.get(name)
+            if isinstance(value, int) and not isinstance(value, bool):
+                return value
+        return None
+
+    async def asearch_iter(self, *args, **kwargs) -> AsyncIterator[VDABJobOffer]:
+        """
+        Version itérateur async de `search_iter` (mêmes paramètres)
+
+        Les requêtes bloquantes s'exécutent dans un thread dédié.
+        """
+        async for offer in iterate_async(self.search_iter(*args, **kwargs)):
+            yield offer
+
+    def sync(
+        self,
+        query: Optional[str] = None,
+        location: Optional[str] = None,
+        full: Optional[bool] = None,
+        priority: str = 'normal'
+    ) -> SyncStats:
+        """
+        Synchronise le miroir local avec l'API (delta depuis le dernier passage)
+
+        Les vacatures sont lues par `publicatiedatum` décroissante. En mode
+        delta, la lecture s'arrête à la première vacature antérieure au
+        watermark de la portée: seules les pages nouvelles sont demandées.
+        Les pages d'un delta sont demandées l'une après l'autre: les lancer
+        en parallèle paierait des pages au-delà du watermark.
+        Une synchronisation complète lit toute la portée (dans la limite de
+        `pagination.max_results`) et marque expirées les vacatures absentes.
+        Dans les deux cas, les vacatures trop anciennes (`max_age_days`)
+        sont expirées.
+
+        Args:
+            query: Mots-clés de la portée (None = toutes les vacatures)
+            location: Localisation de la portée
+            full: Forcer (True) ou exclure (False) une synchronisation
+                complète (défaut: complète toutes les `full_sync_hours`)
+            priority: Priorité face au quota journalier
+
+        Returns:
+            Bilan de la synchronisation (aussi dans `last_sync_stats`)
+
+        Raises:
+            ValueError: Si aucun miroir n'est configuré
+            QuotaExceeded: Si le quota reporte la synchronisation
+        """
+        if self.mirror is None:
+            raise ValueError("Aucun miroir configuré: VDABScraper(mirror=VacancyMirror())")
+
+        scope = VacancyMirror.scope(query, location)
+        state = self.mirror.get_state(scope) or {}
+        previous = state.get('watermark')
+        if full is None:
+            last_full = state.get('last_full_sync_at')
+            full = last_full is None or time.time() - last_full >= self.sync_settings.full_sync_hours * 3600
+
+        stats = SyncStats(scope=scope, full=full, previous_watermark=previous)
+        self.last_sync_stats = stats
+        start = time.perf_counter()
+
+        logger.info(f"🔄 Synchronisation VDAB {'complète' if full else 'delta'}: {scope}")
+
+        vacancies = []
+        newest = previous
+        offers = self.search_iter(
+            query, location,
+            max_results=self.sync_settings.max_results,
+            sort_by='date',
+            priority=priority,
+            max_concurrency=None if full else 1
+        )
+        try:
+            for offer in offers:
+                if not full and previous and offer.posted_date and offer.posted_date < previous:
+                    # Tri décroissant: tout ce qui suit est déjà dans le miroir
+                    stats.reached_watermark = True
+                    break
+                vacancies.append(offer.to_dict())
+                if offer.posted_date and (newest is None or offer.posted_date > newest):
+                    newest = offer.posted_date
+        finally:
+            # Arrêt au watermark: les pages en attente sont annulées
+            offers.close()
+
+        search_stats = self.last_search_stats
+        stats.requests = search_stats.pages if search_stats else 0
+        stats.fetched = len(vacancies)
+        stats.inserted, stats.updated, stats.unchanged = self.mirror.upsert(scope, vacancies)
+
+        # Lecture interrompue (quota): le watermark n'avance pas, le
+        # prochain delta relira ce qui manque
+        read_all = stats.reached_watermark or (search_stats is not None and search_stats.complete)
+        if full and read_all and not search_stats.truncated:
+            stats.expired += self.mirror.expire_missing(scope, {v['id'] for v in vacancies})
+        stats.expired += self.mirror.expire_older_than(self.sync_settings.max_age_days)
+
+        stats.watermark = newest if read_all else previous
+        self.mirror.save_state(scope, stats.watermark, full=full and read_all)
+        stats.duration = time.perf_counter() - start
+
+        logger.info(
+            f"✅ Miroir VDAB: {stats.inserted} nouvelles, {stats.updated} modifiées, "
+            f"{stats.expired} expirées ({stats.requests} requêtes)"
+        )
+        return stats
+
+    def search_local(
+        self,
+        query: Optional[str] = None,
+        location: Optional[str] = None,
+        max_results: int = 50,
+        remote: Optional[bool] = None
+    ) -> List[VDABJobOffer]:
+        """
+        Recherche dans le miroir local, sans requête à l'API
+
+        Args:
+            query: Mots-clés (tous présents dans le titre, l'entreprise ou la description)
+            location: Localisation (sous-chaîne)
+            max_results: Nombre maximum de résultats
+            remote: Filtrer sur le télétravail (None = indifférent)
+
+        Returns:
+            Vacatures actives, plus récentes d'abord
+
+        Raises:
+            ValueError: Si aucun miroir n'est configuré
+        """
+        if self.mirror is None:
+            raise ValueError("Aucun miroir configuré: VDABScraper(mirror=VacancyMirror())")
+
+        offers = []
+        for vacancy in self.mirror.search(query, location, remote=remote, max_results=max_results):
+            digest = vacancy.pop('description_id', None)
+            offer = VDABJobOffer(**vacancy)
+            if self.description_store is not None and digest:
+                offer.description_ref = self.description_store.ref(digest)
+            offers.append(offer)
+        return offers
+
+    def get_vacancy_by_id(self, vacancy_id: str, priority: str = 'normal') -> Optional[VDABJobOffer]:
         """
         Récupère une offre spécifique par son ID
 
         Args:
             vacancy_id: ID de la vacature VDAB
+            priority: Priorité face au quota journalier ('low', 'normal', 'high')
 
         Returns:
-            L'offre VDAB ou None si non trouvée
+            L'offre VDAB ou None si non trouvée (ou appel 'low' refusé par le quota)
+
+        Raises:
+            QuotaExceeded: Si le quota reporte l'appel ('normal', 'high')
         """
         if not self.client_id:
             raise ValueError("Client ID VDAB manquant")
 
+        cached = self._cached_vacancy(vacancy_id)
+        if cached is not None:
+            return cached
+
         try:
-            url = f"{self.base_url}{self.VACATURES_ENDPOINT}/{vacancy_id}"
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
+            return self._fetch_vacancy(vacancy_id, priority)
 
-            data = response.json()
-            return self._parse_vacancy(data)
+        except QuotaExceeded as e:
+            if not e.dropped:
+                raise
+            return None
 
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             logger.error(f"Erreur lors de la récupération de la vacature {vacancy_id}: {e}")
             return None
 
+    def get_vacancies_by_ids(
+        self,
+        vacancy_ids: Iterable[str],
+        priority: str = 'normal',
+        max_concurrency: Optional[int] = None
+    ) -> VacancyLookup:
+        """
+        Récupère plusieurs vacatures par identifiant
+
+        Les identifiants sont dédupliqués, les vacatures en cache
+        (`vacancy_cache`) servies sans requête, les autres récupérées en
+        parallèle. Une erreur sur une vacature n'interrompt pas les autres:
+        elle est rapportée dans `errors` (dont `QuotaExceeded`, avec son
+        `retry_at`).
+
+        Args:
+            vacancy_ids: Identifiants des vacatures (ex: candidatures suivies)
+            priority: Priorité face au quota journalier
+            max_concurrency: Requêtes simultanées (défaut: `pagination.max_concurrency`)
+
+        Returns:
+            Vacatures trouvées (dans l'ordre demandé) et erreurs par identifiant
+
+        Raises:
+            ValueError: Si aucun Client ID n'est configuré
+        """
+        if not self.client_id:
+            raise ValueError("Client ID VDAB manquant")
+
+        start = time.perf_counter()
+        ids = list(dict.fromkeys(str(vid).strip() for vid in vacancy_ids if str(vid).strip()))
+        lookup = VacancyLookup()
+        found: Dict[str, VDABJobOffer] = {}
+
+        to_fetch = []
+        for vacancy_id in ids:
+            cached = self._cached_vacancy(vacancy_id)
+            if cached is not None:
+                found[vacancy_id] = cached
+                lookup.cached += 1
+            else:
+                to_fetch.append(vacancy_id)
+
+        if to_fetch:
+            workers = max(1, min(max_concurrency or self.pagination.max_concurrency, len(to_fetch)))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="vdab-lookup") as executor:
+                futures = {
+                    executor.submit(self._fetch_vacancy, vacancy_id, priority): vacancy_id
+                    for vacancy_id in to_fetch
+                }
+                for future in as_completed(futures):
+                    vacancy_id = futures[future]
+                    try:
+                        offer = future.result()
+                    except (requests.RequestException, ValueError) as e:
+                        lookup.errors[vacancy_id] = e
+                        continue
+                    found[vacancy_id] = offer
+                    lookup.fetched += 1
+
+        lookup.vacancies = {vid: found[vid] for vid in ids if vid in found}
+        lookup.duration = time.perf_counter() - start
+
+        logger.info(
+            f"✅ {len(lookup.vacancies)}/{len(ids)} vacatures VDAB "
+            f"({lookup.cached} en cache, {lookup.fetched} récupérées, {len(lookup.errors)} erreurs)"
+        )
+        return lookup
+
+    def _cached_vacancy(self, vacancy_id: str) -> Optional[VDABJobOffer]:
+        """Vacature en cache (None si absente, expirée ou sans cache)"""
+        if self.vacancy_cache is None:
+            return None
+
+        fields = self.vacancy_cache.get(str(vacancy_id))
+        if fields is None:
+            return None
+
+        offer = VDABJobOffer(**{name: fields.get(name) for name in VACANCY_FIELDS})
+        if self.description_store is not None and fields.get('description_id'):
+            offer.description_ref = self.description_store.ref(fields['description_id'])
+        return offer
+
+    def _fetch_vacancy(self, vacancy_id: str, priority: str = 'normal') -> VDABJobOffer:
+        """
+        Récupère une vacature sur l'API et la met en cache
+
+        Raises:
+            QuotaExceeded: Si le quota journalier refuse la requête
+            requests.RequestException: En cas d'erreur API (404 compris)
+            ValueError: Si la réponse n'est pas une vacature lisible
+        """
+        url = f"{self.base_url}{self.VACATURES_ENDPOINT}/{vacancy_id}"
+        data = self._get(url, cache_kind='job_offers', priority=priority, parse=self._read_json)
+
+        offer = self._parse_vacancy(data)
+        if offer is None:
+            raise ValueError(f"Vacature {vacancy_id} illisible")
+
+        if self.vacancy_cache is not None:
+            self.vacancy_cache.set(str(vacancy_id), offer.to_dict())
+        return offer
+
+    def _get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        cache_kind: str = 'scraping_results',
+        priority: str = 'normal',
+        parse: Optional[Callable[[requests.Response], T]] = None
+    ) -> Union[requests.Response, T]:
+        """
+        GET sur l'API, via le cache HTTP s'il est configuré
+
+        Les appels identiques en cours ou récents partagent une seule
+        requête (`coalescer`). Seules les requêtes réellement envoyées
+        (ni regroupées, ni servies fraîches par le cache) consomment du quota.
+
+        Avec `parse`, la réponse est demandée en flux (`stream=True`),
+        parsée puis fermée: le coalescer partage et réutilise le résultat
+        du parsing, jamais la réponse elle-même.
+
+        Args:
+            url: URL de l'endpoint
+            params: Paramètres de requête
+            cache_kind: Type de contenu pour le TTL du cache
+            priority: Priorité face au quota journalier
+            parse: Lecture de la réponse (ex: `_read_json`)
+
+        Returns:
+            Résultat de `parse`, ou la Response (statut 2xx) sans `parse`
+
+        Raises:
+            QuotaExceeded: Si le quota journalier refuse la requête
+            requests.RequestException: En cas d'erreur API
+        """
+        def send(headers: Optional[Dict[str, str]] = None) -> requests.Response:
+            if self.quota is not None:
+                self.quota.acquire(priority)
+            self.rate_limiter.acquire(url)
+            response = self.session.get(
+                url,
+                params=params,
+                headers=headers,
+                timeout=self.timeout,
+                stream=parse is not None
+            )
+            try:
+                response.raise_for_status()
+            except requests.HTTPError:
+                # Corps d'erreur (court) lu avant de libérer la connexion: il reste lisible pour les logs
+                response.content
+                raise
+            return response
+
+        def fetch() -> Union[requests.Response, T]:
+            if self.http_cache is not None:
+                response = self.http_cache.fetch(url, params, send=send, kind=cache_kind, source='vdab')
+            else:
+                response = send()
+            if parse is None:
+                return response
+            with response:
+                return parse(response)
+
+        key = HTTPCache.cache_key(url, params)
+        try:
+            return self.coalescer.run(key, fetch)
+        except QuotaExceeded as e:
+            if e.priority == priority:
+                raise
+            # Refus d'un appel regroupé d'une autre priorité (ex: 'low'
+            # abandonné): le quota est réévalué pour la priorité de cet appel
+            return self.coalescer.run((key, priority), fetch)
+
     def _build_search_params(
         self,
         query: Optional[str],
@@ -235,7 +898,8 @@ class VDABScraper:
     ) -> Dict[str, Any]:
         """Construit les paramètres de recherche pour l'API"""
         params: Dict[str, Any] = {
-            'limit': min(max_results, 100)  # VDAB limite généralement à 100
+            # Taille de la première page (VDAB plafonne chaque requête à 100)
+            'limit': min(max_results, self.pagination.page_size)
         }
 
         # Recherche par mots-clés
@@ -260,21 +924,91 @@ class VDABScraper:
 
     def _parse_response(self, data: Dict[str, Any]) -> List[VDABJobOffer]:
         """Parse la réponse JSON de l'API VDAB"""
-        offers = []
+        return list(self._iter_response(data))
 
-        # Structure typique: { "vacatures": [...] } ou { "items": [...] }
-        vacancies = data.get('vacatures') or data.get('items') or []
+    @staticmethod
+    def _body_chunks(response: requests.Response) -> Iterator[bytes]:
+        """
+        Corps d'une réponse par morceaux, lus sur la connexion au fil du
+        parsing (réponse `stream=True`; un corps déjà lu, ex: servi par le
+        cache HTTP, est découpé sur place)
+        """
+        return response.iter_content(CHUNK_SIZE)
+
+    def _read_search_page(self, response: requests.Response) -> PageStream:
+        """
+        Parse une page de résultats en flux
+
+        Raises:
+            requests.RequestException: Si le corps n'est pas du JSON valide
+        """
+        page = PageStream()
+        try:
+            if self.description_store is None:
+                page.offers = list(self._iter_stream(self._body_chunks(response), page))
+            else:
+                # Descriptions de la page stockées en une transaction
+                with self.description_store.batch():
+                    page.offers = list(self._iter_stream(self._body_chunks(response), page))
+        except ValueError as e:
+            raise requests.RequestException(f"Réponse VDAB illisible: {e}") from e
+        return page
+
+    @staticmethod
+    def _read_json(response: requests.Response) -> Any:
+        """
+        Décode une réponse JSON
 
-        for vacancy in vacancies:
+        Raises:
+            requests.RequestException: Si le corps n'est pas du JSON valide
+        """
+        try:
+            return response.json()
+        except ValueError as e:
+            raise requests.RequestException(f"Réponse VDAB illisible: {e}") from e
+
+    def _iter_stream(
+        self,
+        chunks: Iterable[bytes],
+        page: Optional['PageStream'] = None
+    ) -> Iterator[VDABJobOffer]:
+        """
+        Parse une réponse de recherche en flux, une vacature à la fois
+
+        Seule la vacature en cours est décodée: pas d'arbre complet de la
+        réponse en mémoire (voir `json_stream`).
+
+        Args:
+            chunks: Corps de la réponse par morceaux
+            page: Reçoit les champs de premier niveau (`totaal`...) et le
+                nombre de vacatures brutes lues
+        """
+        page = page if page is not None else PageStream()
+        for vacancy in iter_json_array(chunks, ('vacatures', 'items'), page.fields):
+            page.vacancies += 1
+            if not isinstance(vacancy, dict):
+                continue
             try:
                 offer = self._parse_vacancy(vacancy)
-                if offer:
-                    offers.append(offer)
             except Exception as e:
                 logger.debug(f"Erreur parsing vacature: {e}")
                 continue
 
-        return offers
+            if offer:
+                yield offer
+
+    def _iter_response(self, data: Dict[str, Any]) -> Iterator[VDABJobOffer]:
+        """Parse la réponse JSON de l'API VDAB, une vacature à la fois"""
+        # Structure typique: { "vacatures": [...] } ou { "items": [...] }
+        for vacancy in self._vacancies(data):
+            try:
+                offer = self._parse_vacancy(vacancy)
+            except Exception as e:
+                logger.debug(f"Erreur parsing vacature: {e}")
+                continue
+
+            if offer:
+                yield offer
 
     def _parse_vacancy(self, vacancy: Dict[str, Any]) -> Optional[VDABJobOffer]:
         """Parse une vacature individuelle"""
@@ -334,12 +1068,17 @@ class VDABScraper:
             if not vacancy_id or not title:
                 return None
 
+            # Texte complet dans le store, aperçu dans l'offre
+            description_ref = None
+            if self.description_store is not None:
+                description, description_ref = self.description_store.split(description)
+
             return VDABJobOffer(
                 id=vacancy_id,
                 title=title,
                 company=company,
                 location=location,
-                description=description[:500],  # Limiter la taille
+                description=description[:PREVIEW_LENGTH],  # Limiter la taille
                 url=url,
                 posted_date=posted_date,
                 salary=salary,
@@ -347,7 +1086,8 @@ class VDABScraper:
                 remote=remote,
                 number_of_positions=number_of_positions,
                 study_level=study_level,
-                experience_required=experience_required
+                experience_required=experience_required,
+                description_ref=description_ref
             )
 
         except Exception as e:
@@ -0,0 +1,327 @@
+"""
+Miroir local des vacatures VDAB (synchronisation par delta)
+
+Plutôt que de relancer toutes les recherches par mots-clés sur l'API toutes
+les 2 heures, `VDABScraper.sync` ne récupère que les vacatures publiées
+depuis le dernier passage: les résultats sont triés par `publicatiedatum`
+décroissante et la lecture s'arrête au watermark (date de publication la
+plus récente déjà vue). Les vacatures sont insérées ou mises à jour dans
+SQLite, et les recherches sont ensuite servies par le miroir, en quelques
+millisecondes, sans requête:
+
+    mirror = VacancyMirror()                  # cache/vdab_mirror.db
+    vdab = VDABScraper(mirror=mirror)
+    vdab.sync()                               # quelques requêtes par cycle
+    offers = vdab.search_local("Python", "Gent")
+
+Les vacatures disparaissent du miroir actif de deux façons:
+- synchronisation complète périodique (`full_sync_hours`): toute vacature
+  de la portée absente des résultats est marquée expirée;
+- âge: au-delà de `max_age_days` après publication.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from .cache import DEFAULT_CACHE_DIR
+from .settings import load_integrations_config
+
+logger = logging.getLogger(__name__)
+
+# Champs d'une vacature conservés dans le miroir (VDABJobOffer.to_dict)
+VACANCY_FIELDS = (
+    'id', 'title', 'company', 'location', 'description', 'url', 'posted_date',
+    'salary', 'contract_type', 'remote', 'number_of_positions', 'study_level',
+    'experience_required'
+)
+
+# Colonnes du miroir: champs de l'offre et empreinte de la description
+# complète (`DescriptionStore`), que l'aperçu seul ne permet pas de retrouver
+STORED_FIELDS = VACANCY_FIELDS + ('description_id',)
+
+# Champs comparés pour détecter une vacature modifiée
+_CONTENT_FIELDS = STORED_FIELDS[1:]
+
+
+@dataclass
+class SyncSettings:
+    """
+    Réglages de synchronisation (section `job_boards.vdab.sync`
+    d'integrations.json)
+    """
+    full_sync_hours: float = 24     # Intervalle entre deux synchronisations complètes
+    max_age_days: float = 60        # Vacatures expirées au-delà de cet âge
+    max_results: Optional[int] = None  # Plafond d'une synchronisation (défaut: pagination)
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]] = None) -> 'SyncSettings':
+        """
+        Lit les réglages depuis integrations.json
+
+        Args:
+            config: Configuration déjà chargée (défaut: integrations.json)
+        """
+        if config is None:
+            config = load_integrations_config()
+
+        section = config.get('job_boards', {}).get('vdab', {}).get('sync') or {}
+        defaults = cls()
+        return cls(
+            full_sync_hours=float(section.get('full_sync_hours', defaults.full_sync_hours)),
+            max_age_days=float(section.get('max_age_days', defaults.max_age_days)),
+            max_results=section.get('max_results', defaults.max_results)
+        )
+
+
+@dataclass
+class SyncStats:
+    """Bilan d'une synchronisation (exposé via `scraper.last_sync_stats`)"""
+    scope: str
+    full: bool = False
+    fetched: int = 0
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    expired: int = 0
+    requests: int = 0                    # Pages demandées à l'API
+    previous_watermark: Optional[str] = None
+    watermark: Optional[str] = None
+    reached_watermark: bool = False      # Lecture arrêtée au watermark (delta)
+    duration: float = 0.0
+    started_at: float = field(default_factory=time.time)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convertit le bilan en dictionnaire"""
+        return asdict(self)
+
+
+class VacancyMirror:
+    """
+    Vacatures VDAB et watermarks de synchronisation, persistés dans SQLite
+    """
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_CACHE_DIR / 'vdab_mirror.db'):
+        """
+        Args:
+            path: Chemin du fichier SQLite (":memory:" pour les tests)
+        """
+        self.path = str(path)
+        if self.path != ':memory:':
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS vacancies ("
+            "  id TEXT PRIMARY KEY, title TEXT, company TEXT, location TEXT, description TEXT,"
+            "  url TEXT, posted_date TEXT, salary TEXT, contract_type TEXT, remote INTEGER,"
+            "  number_of_positions INTEGER, study_level TEXT, experience_required TEXT,"
+            "  description_id TEXT,"
+            "  first_seen REAL NOT NULL, last_seen REAL NOT NULL, updated_at REAL NOT NULL,"
+            "  expired_at REAL);"
+            "CREATE INDEX IF NOT EXISTS vacancies_active ON vacancies (expired_at, posted_date);"
+            "CREATE TABLE IF NOT EXISTS scope_members ("
+            "  scope TEXT NOT NULL, id TEXT NOT NULL, last_seen REAL NOT NULL,"
+            "  PRIMARY KEY (scope, id));"
+            "CREATE TABLE IF NOT EXISTS sync_state ("
+            "  scope TEXT PRIMARY KEY, watermark TEXT, last_sync_at REAL, last_full_sync_at REAL);"
+        )
+        # Miroirs créés avant la colonne description_id
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(vacancies)")}
+        if 'description_id' not in columns:
+            self._conn.execute("ALTER TABLE vacancies ADD COLUMN description_id TEXT")
+        self._conn.commit()
+
+    @staticmethod
+    def scope(query: Optional[str] = None, location: Optional[str] = None) -> str:
+        """Clé de portée normalisée d'une synchronisation"""
+        return '|'.join((part or '').strip().lower() for part in ('vdab', query, location))
+
+    def upsert(self, scope: str, vacancies: Iterable[Dict[str, Any]]) -> Tuple[int, int, int]:
+        """
+        Insère ou met à jour des vacatures
+
+        Une vacature expirée qui réapparaît redevient active.
+
+        Args:
+            scope: Portée de la synchronisation qui les a lues
+            vacancies: Champs de chaque vacature (`VDABJobOffer.to_dict()`)
+
+        Returns:
+            (insérées, modifiées, inchangées)
+        """
+        now = time.time()
+        inserted = updated = unchanged = 0
+
+        with self._lock:
+            for vacancy in vacancies:
+                values = {name: vacancy.get(name) for name in STORED_FIELDS}
+                values['remote'] = int(bool(values['remote']))
+
+                row = self._conn.execute(
+                    f"SELECT {', '.join(_CONTENT_FIELDS)}, expired_at FROM vacancies WHERE id = ?",
+                    (values['id'],)
+                ).fetchone()
+
+                if row is None:
+                    self._conn.execute(
+                        f"INSERT INTO vacancies ({', '.join(STORED_FIELDS)}, first_seen, last_seen, updated_at) "
+                        f"VALUES ({', '.join('?' * len(STORED_FIELDS))}, ?, ?, ?)",
+                        [*values.values(), now, now, now]
+                    )
+                    inserted += 1
+                elif any(row[name] != values[name] for name in _CONTENT_FIELDS) or row['expired_at']:
+                    self._conn.execute(
+                        f"UPDATE vacancies SET {', '.join(f'{name} = ?' for name in _CONTENT_FIELDS)}, "
+                        "last_seen = ?, updated_at = ?, expired_at = NULL WHERE id = ?",
+                        [*(values[name] for name in _CONTENT_FIELDS), now, now, values['id']]
+                    )
+                    updated += 1
+                else:
+                    self._conn.execute("UPDATE vacancies SET last_seen = ? WHERE id = ?", (now, values['id']))
+                    unchanged += 1
+
+                self._conn.execute(
+                    "INSERT INTO scope_members (scope, id, last_seen) VALUES (?, ?, ?) "
+                    "ON CONFLICT(scope, id) DO UPDATE SET last_seen = excluded.last_seen",
+                    (scope, values['id'], now)
+                )
+            self._conn.commit()
+
+        return inserted, updated, unchanged
+
+    def expire_missing(self, scope: str, seen_ids: Set[str]) -> int:
+        """
+        Marque expirées les vacatures actives de la portée absentes d'une
+        synchronisation complète
+
+        Returns:
+            Nombre de vacatures expirées
+        """
+        now = time.time()
+        with self._lock:
+            members = {row[0] for row in self._conn.execute(
+                "SELECT m.id FROM scope_members m JOIN vacancies v ON v.id = m.id "
+                "WHERE m.scope = ? AND v.expired_at IS NULL", (scope,)
+            )}
+            missing = members - seen_ids
+            self._conn.executemany(
+                "UPDATE vacancies SET expired_at = ? WHERE id = ?", [(now, i) for i in missing]
+            )
+            self._conn.executemany(
+                "DELETE FROM scope_members WHERE scope = ? AND id = ?", [(scope, i) for i in missing]
+            )
+            self._conn.commit()
+        return len(missing)
+
+    def expire_older_than(self, max_age_days: float, today: Optional[date] = None) -> int:
+        """
+        Marque expirées les vacatures publiées il y a plus de `max_age_days` jours
+
+        Returns:
+            Nombre de vacatures expirées
+        """
+        cutoff = ((today or date.today()) - timedelta(days=max_age_days)).isoformat()
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE vacancies SET expired_at = ? "
+                "WHERE expired_at IS NULL AND posted_date IS NOT NULL AND posted_date < ?",
+                (time.time(), cutoff)
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def get_state(self, scope: str) -> Optional[Dict[str, Any]]:
+        """Watermark et dates de synchronisation d'une portée (None si jamais synchronisée)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT watermark, last_sync_at, last_full_sync_at FROM sync_state WHERE scope = ?",
+                (scope,)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def save_state(self, scope: str, watermark: Optional[str], full: bool):
+        """Enregistre la fin d'une synchronisation"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO sync_state (scope, watermark, last_sync_at, last_full_sync_at) "
+                "VALUES (?, ?, ?, ?) ON CONFLICT(scope) DO UPDATE SET "
+                "watermark = COALESCE(excluded.watermark, watermark), "
+                "last_sync_at = excluded.last_sync_at, "
+                "last_full_sync_at = COALESCE(excluded.last_full_sync_at, last_full_sync_at)",
+                (scope, watermark, now, now if full else None)
+            )
+            self._conn.commit()
+
+    def search(
+        self,
+        query: Optional[str] = None,
+        location: Optional[str] = None,
+        remote: Optional[bool] = None,
+        max_results: int = 50,
+        include_expired: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Recherche dans le miroir, plus récentes d'abord
+
+        Args:
+            query: Mots-clés, tous présents dans le titre, l'entreprise ou
+                la description (insensible à la casse)
+            location: Sous-chaîne de la localisation
+            remote: Filtrer sur le télétravail (None = indifférent)
+            max_results: Nombre maximum de résultats
+            include_expired: Inclure les vacatures expirées
+
+        Returns:
+            Champs de chaque vacature (`STORED_FIELDS`: ceux de l'offre et
+            `description_id`)
+        """
+        clauses, params = [], []
+        if not include_expired:
+            clauses.append("expired_at IS NULL")
+        for word in (query or '').split():
+            clauses.append(
+                "(COALESCE(title, '') || ' ' || COALESCE(company, '') || ' ' || "
+                "COALESCE(description, '')) LIKE ?"
+            )
+            params.append(f"%{word}%")
+        if location:
+            clauses.append("location LIKE ?")
+            params.append(f"%{location.strip()}%")
+        if remote is not None:
+            clauses.append("remote = ?")
+            params.append(int(remote))
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(STORED_FIELDS)} FROM vacancies {where} "
+                "ORDER BY posted_date DESC, id LIMIT ?",
+                [*params, max_results]
+            ).fetchall()
+
+        results = []
+        for row in rows:
+            vacancy = dict(row)
+            vacancy['remote'] = bool(vacancy['remote'])
+            results.append(vacancy)
+        return results
+
+    def count(self, include_expired: bool = False) -> int:
+        """Nombre de vacatures du miroir"""
+        where = "" if include_expired else "WHERE expired_at IS NULL"
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM vacancies {where}").fetchone()[0]
+
+    def close(self):
+        """Ferme la connexion SQLite"""
+        with self._lock:
+            self._conn.close()
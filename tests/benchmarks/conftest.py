@@ -0,0 +1,55 @@
+"""
+Fixtures des benchmarks: pages et réponses enregistrées, rejouées hors ligne
+
+Lancer: pytest tests/benchmarks --benchmark-only
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.modules.detection.belgian_job_aggregator import BelgianJobAggregator
+from src.modules.detection.recording import FixtureStore
+
+ROOT = Path(__file__).resolve().parents[2]
+RECORDED = ROOT / "tests" / "fixtures" / "recorded"
+PAGES = ROOT / "src" / "modules" / "detection" / "tests" / "fixtures"
+
+# Recherche couverte par le corpus enregistré
+QUERY = "Python"
+LOCATION = "Bruxelles"
+VDAB_URL = "https://openservices.vdab.be/vacature/v4/vacatures"
+VDAB_PARAMS = {'limit': 32, 'q': QUERY, 'plaats': 'Brussel', 'sorteer': 'publicatiedatum:desc'}
+
+
+@pytest.fixture(scope="session")
+def recorded() -> FixtureStore:
+    """Corpus enregistré, en rejeu (aucune requête réseau)"""
+    return FixtureStore(RECORDED, mode='replay')
+
+
+@pytest.fixture(scope="session")
+def search_pages():
+    """Pages de résultats Indeed sauvegardées, par nom"""
+    return {
+        path.stem: path.read_text(encoding="utf-8")
+        for path in sorted(PAGES.glob("indeed_search_*.html"))
+    }
+
+
+@pytest.fixture(scope="session")
+def vdab_payload(recorded):
+    """Réponse JSON enregistrée de l'API VDAB"""
+    from urllib.parse import urlencode
+
+    fixture = recorded.load(f"{VDAB_URL}?{urlencode(VDAB_PARAMS)}")
+    return json.loads(fixture.text)
+
+
+@pytest.fixture
+def aggregator(recorded):
+    """Agrégateur VDAB + Indeed BE servi par le corpus enregistré"""
+    with BelgianJobAggregator(vdab_client_id="replay", fixtures=recorded) as aggregator:
+        aggregator.indeed_scraper.parser = 'json'
+        yield aggregator
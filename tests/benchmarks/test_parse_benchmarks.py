@@ -0,0 +1,58 @@
+"""
+Benchmarks de parsing des pages de résultats (BeautifulSoup, lxml, JSON embarqué)
+"""
+
+import json
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from src.modules.detection.indeed_bypass import IndeedBypassScraper  # noqa: E402
+from src.modules.detection.jobboard_scraper import IndeedScraper  # noqa: E402
+from src.modules.detection.rate_limiter import RateLimiter  # noqa: E402
+from src.modules.detection.vdab_api import VDABScraper  # noqa: E402
+
+
+@pytest.mark.benchmark(group="parse-indeed")
+@pytest.mark.parametrize("parser", IndeedScraper.PARSERS)
+def test_indeed_search_page(benchmark, search_pages, parser):
+    scraper = IndeedScraper(parser=parser, rate_limiter=RateLimiter())
+    html = search_pages["indeed_search_fr"]
+
+    offers = benchmark(scraper._parse_search_page, html)
+
+    assert len(offers) == 14
+    benchmark.extra_info['offers'] = len(offers)
+
+
+@pytest.mark.benchmark(group="parse-indeed-bypass")
+@pytest.mark.parametrize("parser", IndeedBypassScraper.PARSERS)
+def test_indeed_bypass_page(benchmark, search_pages, parser):
+    scraper = IndeedBypassScraper(country='be', parser=parser, rate_limiter=RateLimiter())
+    html = search_pages["indeed_search_be_json"]
+
+    offers = benchmark(scraper._parse_page, html)
+
+    assert len(offers) == 14
+    benchmark.extra_info['offers'] = len(offers)
+
+
+@pytest.mark.benchmark(group="parse-vdab")
+def test_vdab_response(benchmark, vdab_payload):
+    scraper = VDABScraper(client_id="replay", rate_limiter=RateLimiter())
+
+    offers = benchmark(scraper._parse_response, vdab_payload)
+
+    assert len(offers) == 32
+
+
+@pytest.mark.benchmark(group="parse-vdab")
+def test_vdab_response_streamed(benchmark, vdab_payload):
+    """Décodage en flux du corps brut (json.loads compris côté test_vdab_response)"""
+    scraper = VDABScraper(client_id="replay", rate_limiter=RateLimiter())
+    body = json.dumps(vdab_payload).encode('utf-8')
+
+    offers = benchmark(lambda: list(scraper._iter_stream([body])))
+
+    assert len(offers) == 32
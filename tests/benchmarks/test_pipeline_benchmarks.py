@@ -0,0 +1,84 @@
+"""
+Benchmarks de la chaîne d'agrégation: normalisation, déduplication, agrégation complète
+
+L'agrégation est rejouée depuis le corpus enregistré (tests/fixtures/recorded):
+aucun réseau ni navigateur, le temps mesuré est celui du code.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from src.modules.detection.belgian_job_aggregator import StreamingDeduplicator  # noqa: E402
+from src.modules.detection.near_duplicates import MinHashSettings, NearDuplicateIndex  # noqa: E402
+
+from .conftest import LOCATION, QUERY  # noqa: E402
+
+
+@pytest.fixture
+def source_offers(aggregator):
+    """Offres brutes des deux sources, telles que parsées"""
+    vdab = list(aggregator.vdab_scraper.search_iter(QUERY, "Brussel", max_results=32))
+    indeed = list(aggregator.indeed_scraper.scrape_iter(QUERY, LOCATION, max_pages=2))
+    return vdab, indeed
+
+
+@pytest.mark.benchmark(group="normalize")
+def test_normalize(benchmark, aggregator, source_offers):
+    vdab, indeed = source_offers
+
+    def normalize():
+        return (
+            [aggregator._normalize_vdab_offer(o) for o in vdab]
+            + [aggregator._normalize_indeed_offer(o) for o in indeed]
+        )
+
+    offers = benchmark(normalize)
+    assert len(offers) == len(vdab) + len(indeed)
+
+
+@pytest.mark.benchmark(group="dedupe")
+def test_dedupe(benchmark, aggregator, source_offers):
+    vdab, indeed = source_offers
+    normalized = (
+        [aggregator._normalize_vdab_offer(o) for o in vdab]
+        + [aggregator._normalize_indeed_offer(o) for o in indeed]
+    )
+    # Volume d'un run quotidien: le même lot vu plusieurs fois
+    offers = normalized * 50
+
+    unique = benchmark(lambda: list(StreamingDeduplicator().filter(offers)))
+
+    assert len(unique) == len(list(StreamingDeduplicator().filter(normalized)))
+    benchmark.extra_info['offers'] = len(offers)
+
+
+@pytest.mark.benchmark(group="dedupe")
+def test_dedupe_near_duplicates(benchmark, aggregator, source_offers):
+    vdab, indeed = source_offers
+    normalized = (
+        [aggregator._normalize_vdab_offer(o) for o in vdab]
+        + [aggregator._normalize_indeed_offer(o) for o in indeed]
+    )
+
+    def dedupe():
+        # Index vide à chaque tour: signatures, requêtes LSH et ajouts mesurés
+        index = NearDuplicateIndex(':memory:', settings=MinHashSettings())
+        try:
+            return list(StreamingDeduplicator(index).filter(normalized))
+        finally:
+            index.close()
+
+    unique = benchmark(dedupe)
+
+    assert 0 < len(unique) <= len(list(StreamingDeduplicator().filter(normalized)))
+    benchmark.extra_info['offers'] = len(normalized)
+
+
+@pytest.mark.benchmark(group="aggregate")
+def test_aggregate_search(benchmark, aggregator):
+    offers = benchmark(aggregator.search, QUERY, LOCATION, max_results_per_source=32)
+
+    assert offers
+    assert aggregator.indeed_scraper.driver is None
+    benchmark.extra_info['offers'] = len(offers)
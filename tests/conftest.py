@@ -10,6 +10,19 @@ from pathlib import Path
 root_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(root_dir))
 
+from src.modules.detection.http_cache import reset_http_cache, set_http_cache  # noqa: E402
+from src.modules.detection.quota import reset_quota_ledgers, set_quota_ledger  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def no_shared_state():
+    """Ni cache HTTP ni quota partagés sur disque: chaque test part de zéro"""
+    set_http_cache(None)
+    set_quota_ledger(None)
+    yield
+    reset_http_cache()
+    reset_quota_ledgers()
+
 
 def pytest_configure(config):
     """Configuration globale de pytest"""